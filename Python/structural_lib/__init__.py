@@ -12,7 +12,7 @@ Use api.get_library_version() to get the current version.
 from __future__ import annotations
 
 import importlib
-from types import ModuleType as _ModuleType
+from typing import TYPE_CHECKING, Any
 
 from .core.version import get_runtime_version as _get_runtime_version
 
@@ -20,227 +20,270 @@ from .core.version import get_runtime_version as _get_runtime_version
 # resolver prevents unrelated installed metadata from relabelling source code.
 __version__ = _get_runtime_version(__file__)
 
-# Expose key modules
-from . import (
-    api,
-    compliance,
-    detailing,
-    flexure,
-    imports,
-    inputs,
-    models,
-    rebar,
-    result_base,
-    serviceability,
-    shear,
-    types,
-)
+if TYPE_CHECKING:
+    # Expose key modules
+    from . import (
+        adapters,
+        api,
+        audit,
+        batch,
+        compliance,
+        costing,
+        detailing,
+        etabs_import,
+        flexure,
+        imports,
+        inputs,
+        models,
+        rebar,
+        reports,
+        result_base,
+        serialization,
+        serviceability,
+        shear,
+        testing_strategies,
+        types,
+    )
 
-# Import EndCondition enum (needed for calculate_effective_length_is456)
-from .core.data_types import EndCondition
+    # Stage timers, exposed so the API layer need not import core
+    from .core import instrumentation
 
-# Import geometry and frame types from core.models
-from .core.models import BeamGeometry, DesignDefaults, FrameType
+    # Import EndCondition enum (needed for calculate_effective_length_is456)
+    from .core.data_types import EndCondition
 
-# Import all public API functions from services.api
-from .services.api import (  # Audit & Verification; Input dataclasses; Calculation Report; Self-validation (TASK-724); Return types (for type annotations); Load Analysis; ETABS Integration; Multi-objective optimization; Torsion Design; Column Design; Serviceability; Outputs; Core design functions; Shear; Version; Smart features; Diagnostics (TASK-725); Footing Design (IS 456 Cl 34); Validation
-    AuditLogEntry,
-    AuditTrail,
-    BeamGeometryInput,
-    BeamInput,
-    BearingPressureCheckResult,
-    BearingStressEnhancementResult,
-    BracedWallDesignInput,
-    BracedWallDesignProvenance,
-    BracedWallDesignResult,
-    CalculationHash,
-    CalculationReport,
-    CheckCodeReport,
-    CompleteOneWaySlabDesignResult,
-    ComplianceCaseResult,
-    ComplianceReport,
-    ConcentricIsolatedFootingInput,
-    ConcentricIsolatedFootingResult,
-    ContinuousOneWaySlabDesignResult,
-    CostProfile,
-    CriticalPoint,
-    DesignAndDetailResult,
-    DetailingConfigInput,
-    EffectiveDepthBasisV1,
-    EffectiveDepthResolutionV1,
-    ETABSEnvelopeResult,
-    ETABSForceRow,
-    FlangedBeamDesignResult,
-    FootingBearingResult,
-    FootingDepthCandidate,
-    FootingDirectionalReinforcementDemand,
-    FootingFlexureResult,
-    FootingOneWayShearResult,
-    FootingProvenance,
-    FootingPunchingResult,
-    InputSection,
-    IS456Capability,
-    LoadCaseInput,
-    LoadDefinition,
-    LoadDiagramResult,
-    LoadsInput,
-    LoadTransferResult,
-    LoadType,
-    MaterialsInput,
-    OneWaySlabDesignResult,
-    ParetoCandidate,
-    ParetoOptimizationResult,
-    ProjectInfo,
-    PropertyLineStrapFootingDesignInput,
-    PropertyLineStrapFootingDesignProvenance,
-    PropertyLineStrapFootingDesignResult,
-    PropertyLineStrapFootingDesignStatus,
-    RegularInteriorFlatSlabDesignInput,
-    RegularInteriorFlatSlabDesignProvenance,
-    RegularInteriorFlatSlabDesignResult,
-    RegularInteriorFlatSlabDesignStatus,
-    ResultSection,
-    SimplySupportedDeepBeamDesignInput,
-    SimplySupportedDeepBeamDesignProvenance,
-    SimplySupportedDeepBeamDesignResult,
-    StraightFlightStaircaseInput,
-    StraightFlightStaircaseProvenance,
-    StraightFlightStaircaseResult,
-    SymmetricCombinedFootingDesignInput,
-    SymmetricCombinedFootingDesignProvenance,
-    SymmetricCombinedFootingDesignResult,
-    SymmetricCombinedFootingDesignStatus,
-    TorsionResult,
-    TwoWaySlabPanelWorkflowResult,
-    ValidationReport,
-    VersionInfo,
-    WorkflowCatalog,
-    bearing_stress_enhancement,
-    biaxial_bending_check_is456,
-    build_detailing_input,
-    calculate_additional_moment_is456,
-    calculate_development_length,
-    calculate_effective_length_is456,
-    calculate_equivalent_moment,
-    calculate_equivalent_shear,
-    calculate_longitudinal_torsion_steel,
-    calculate_torsion_shear_stress,
-    calculate_torsion_stirrup_area,
-    check_anchorage_at_simple_support,
-    check_beam_ductility,
-    check_beam_is456,
-    check_beam_slenderness,
-    check_bearing_pressure,
-    check_code,
-    check_column_ductility_is13920,
-    check_compliance_report,
-    check_crack_width,
-    check_deflection_span_depth,
-    check_helical_reinforcement_is456,
-    check_isolated_footing_load_transfer,
-    classify_column_is456,
-    compute_bbs,
-    compute_bmd_sfd,
-    compute_critical,
-    compute_detailing,
-    compute_dxf,
-    compute_hash,
-    compute_report,
-    create_calculation_certificate,
-    create_job_from_etabs,
-    create_jobs_from_etabs_csv,
-    design_and_detail_beam_is456,
-    design_beam_is456,
-    design_braced_wall_is456,
-    design_column_axial_is456,
-    design_column_is456,
-    design_complete_one_way_slab_is456,
-    design_concentric_isolated_footing_is456,
-    design_continuous_one_way_slab_builtin_is456,
-    design_continuous_one_way_slab_is456,
-    design_flanged_beam_is456,
-    design_from_input,
-    design_long_column_is456,
-    design_one_way_slab_is456,
-    design_property_line_strap_footing_is456,
-    design_regular_interior_flat_slab_is456,
-    design_short_column_uniaxial_is456,
-    design_simply_supported_deep_beam_is456,
-    design_straight_flight_staircase_is456,
-    design_symmetric_combined_footing_is456,
-    design_torsion,
-    design_two_way_slab_is456,
-    design_two_way_slab_panel_builtin_is456,
-    design_two_way_slab_panel_is456,
-    detail_beam_is456,
-    detail_column_is456,
-    enhanced_shear_strength_is456,
-    export_bbs,
-    footing_flexure,
-    footing_one_way_shear,
-    footing_punching_shear,
-    generate_calculation_report,
-    get_library_version,
-    get_supported_is456_capabilities,
-    get_supported_is456_capability_document,
-    get_supported_is456_semantic_contract,
-    get_workflow_catalog,
-    get_workflow_catalog_document,
-    load_etabs_csv,
-    min_eccentricity_is456,
-    normalize_etabs_forces,
-    optimize_beam_cost,
-    optimize_pareto_front,
-    pm_interaction_curve_is456,
-    serialize_workflow_catalog,
-    show_versions,
-    size_footing,
-    smart_analyze_design,
-    suggest_beam_design_improvements,
-    validate_design_results,
-    validate_etabs_csv,
-    validate_job_spec,
-    verify_calculation,
-)
+    # Import geometry and frame types from core.models
+    from .core.models import BeamGeometry, DesignDefaults, FrameType
+    from .services import dxf_export
 
-# Import 3D visualization from visualization.geometry_3d
-from .visualization.geometry_3d import (
-    Beam3DGeometry,
-    Point3D,
-    RebarPath,
-    RebarSegment,
-    StirrupLoop,
-    beam_to_3d_geometry,
-    compute_beam_outline,
-    compute_rebar_positions,
-    compute_stirrup_path,
-    compute_stirrup_positions,
-)
+    # Import all public API functions from services.api
+    from .services.api import (  # Audit & Verification; Input dataclasses; Calculation Report; Self-validation (TASK-724); Return types (for type annotations); Load Analysis; ETABS Integration; Multi-objective optimization; Torsion Design; Column Design; Serviceability; Outputs; Core design functions; Shear; Version; Smart features; Diagnostics (TASK-725); Footing Design (IS 456 Cl 34); Validation
+        AuditLogEntry,
+        AuditTrail,
+        BeamGeometryInput,
+        BeamInput,
+        BearingPressureCheckResult,
+        BearingStressEnhancementResult,
+        BracedWallDesignInput,
+        BracedWallDesignProvenance,
+        BracedWallDesignResult,
+        CalculationHash,
+        CalculationReport,
+        CheckCodeReport,
+        CompleteOneWaySlabDesignResult,
+        ComplianceCaseResult,
+        ComplianceReport,
+        ConcentricIsolatedFootingInput,
+        ConcentricIsolatedFootingResult,
+        ContinuousOneWaySlabDesignResult,
+        CostProfile,
+        CriticalPoint,
+        DesignAndDetailResult,
+        DetailingConfigInput,
+        EffectiveDepthBasisV1,
+        EffectiveDepthResolutionV1,
+        ETABSEnvelopeResult,
+        ETABSForceRow,
+        FlangedBeamDesignResult,
+        FootingBearingResult,
+        FootingDepthCandidate,
+        FootingDirectionalReinforcementDemand,
+        FootingFlexureResult,
+        FootingOneWayShearResult,
+        FootingProvenance,
+        FootingPunchingResult,
+        InputSection,
+        IS456Capability,
+        LoadCaseInput,
+        LoadDefinition,
+        LoadDiagramResult,
+        LoadsInput,
+        LoadTransferResult,
+        LoadType,
+        MaterialsInput,
+        OneWaySlabDesignResult,
+        ParetoCandidate,
+        ParetoOptimizationResult,
+        ProjectInfo,
+        PropertyLineStrapFootingDesignInput,
+        PropertyLineStrapFootingDesignProvenance,
+        PropertyLineStrapFootingDesignResult,
+        PropertyLineStrapFootingDesignStatus,
+        RegularInteriorFlatSlabDesignInput,
+        RegularInteriorFlatSlabDesignProvenance,
+        RegularInteriorFlatSlabDesignResult,
+        RegularInteriorFlatSlabDesignStatus,
+        ResultSection,
+        SimplySupportedDeepBeamDesignInput,
+        SimplySupportedDeepBeamDesignProvenance,
+        SimplySupportedDeepBeamDesignResult,
+        StraightFlightStaircaseInput,
+        StraightFlightStaircaseProvenance,
+        StraightFlightStaircaseResult,
+        SymmetricCombinedFootingDesignInput,
+        SymmetricCombinedFootingDesignProvenance,
+        SymmetricCombinedFootingDesignResult,
+        SymmetricCombinedFootingDesignStatus,
+        TorsionResult,
+        TwoWaySlabPanelWorkflowResult,
+        ValidationReport,
+        VersionInfo,
+        WorkflowCatalog,
+        bearing_stress_enhancement,
+        biaxial_bending_check_is456,
+        build_detailing_input,
+        calculate_additional_moment_is456,
+        calculate_development_length,
+        calculate_effective_length_is456,
+        calculate_equivalent_moment,
+        calculate_equivalent_shear,
+        calculate_longitudinal_torsion_steel,
+        calculate_torsion_shear_stress,
+        calculate_torsion_stirrup_area,
+        check_anchorage_at_simple_support,
+        check_beam_ductility,
+        check_beam_is456,
+        check_beam_slenderness,
+        check_bearing_pressure,
+        check_code,
+        check_column_ductility_is13920,
+        check_compliance_report,
+        check_crack_width,
+        check_deflection_span_depth,
+        check_helical_reinforcement_is456,
+        check_isolated_footing_load_transfer,
+        classify_column_is456,
+        compute_bbs,
+        compute_bmd_sfd,
+        compute_critical,
+        compute_detailing,
+        compute_dxf,
+        compute_hash,
+        compute_report,
+        create_calculation_certificate,
+        create_job_from_etabs,
+        create_jobs_from_etabs_csv,
+        design_and_detail_beam_is456,
+        design_beam_is456,
+        design_braced_wall_is456,
+        design_column_axial_is456,
+        design_column_is456,
+        design_complete_one_way_slab_is456,
+        design_concentric_isolated_footing_is456,
+        design_continuous_one_way_slab_builtin_is456,
+        design_continuous_one_way_slab_is456,
+        design_flanged_beam_is456,
+        design_from_input,
+        design_long_column_is456,
+        design_one_way_slab_is456,
+        design_property_line_strap_footing_is456,
+        design_regular_interior_flat_slab_is456,
+        design_short_column_uniaxial_is456,
+        design_simply_supported_deep_beam_is456,
+        design_straight_flight_staircase_is456,
+        design_symmetric_combined_footing_is456,
+        design_torsion,
+        design_two_way_slab_is456,
+        design_two_way_slab_panel_builtin_is456,
+        design_two_way_slab_panel_is456,
+        detail_beam_is456,
+        detail_column_is456,
+        enhanced_shear_strength_is456,
+        export_bbs,
+        footing_flexure,
+        footing_one_way_shear,
+        footing_punching_shear,
+        generate_calculation_report,
+        get_library_version,
+        get_supported_is456_capabilities,
+        get_supported_is456_capability_document,
+        get_supported_is456_semantic_contract,
+        get_workflow_catalog,
+        get_workflow_catalog_document,
+        load_etabs_csv,
+        min_eccentricity_is456,
+        normalize_etabs_forces,
+        optimize_beam_cost,
+        optimize_pareto_front,
+        pm_interaction_curve_is456,
+        serialize_workflow_catalog,
+        show_versions,
+        size_footing,
+        smart_analyze_design,
+        suggest_beam_design_improvements,
+        validate_design_results,
+        validate_etabs_csv,
+        validate_job_spec,
+        verify_calculation,
+    )
 
-# Lazy-loaded modules (imported on first access, not at package load)
+    # Import 3D visualization from visualization.geometry_3d
+    from .visualization.geometry_3d import (
+        Beam3DGeometry,
+        Point3D,
+        RebarPath,
+        RebarSegment,
+        StirrupLoop,
+        beam_to_3d_geometry,
+        compute_beam_outline,
+        compute_rebar_positions,
+        compute_stirrup_path,
+        compute_stirrup_positions,
+    )
+
+# Public names are resolved on first access (PEP 562). ``import structural_lib``
+# and every ``import structural_lib.<submodule>`` run this file, so it must not
+# pull in the design, report or drawing stacks itself.
 _LAZY_MODULES = {
-    "adapters",
-    "etabs_import",
-    "batch",
-    "costing",
-    "testing_strategies",
-    "audit",
-    "serialization",
+    "adapters": ".adapters",
+    "api": ".api",
+    "audit": ".audit",
+    "batch": ".batch",
+    "compliance": ".compliance",
+    "costing": ".costing",
+    "detailing": ".detailing",
+    "dxf_export": ".services.dxf_export",
+    "etabs_import": ".etabs_import",
+    "flexure": ".flexure",
+    "imports": ".imports",
+    "inputs": ".inputs",
+    "instrumentation": ".core.instrumentation",
+    "models": ".models",
+    "rebar": ".rebar",
+    "reports": ".reports",
+    "result_base": ".result_base",
+    "serialization": ".serialization",
+    "serviceability": ".serviceability",
+    "shear": ".shear",
+    "testing_strategies": ".testing_strategies",
+    "types": ".types",
 }
 
-# DXF export is optional (requires ezdxf)
-dxf_export: _ModuleType | None
-try:
-    dxf_export = importlib.import_module(f"{__name__}.services.dxf_export")
-except ImportError:
-    dxf_export = None
+# Optional stacks resolve to None when their dependency is missing:
+# dxf_export requires ezdxf, reports requires jinja2.
+_OPTIONAL_MODULES = frozenset({"dxf_export", "reports"})
 
-# Reports module is optional (requires jinja2)
-reports: _ModuleType | None
-try:
-    reports = importlib.import_module(f"{__name__}.reports")
-except ImportError:
-    reports = None
+# Public names not defined by services.api, keyed to their defining module.
+_ATTRIBUTE_MODULES = {
+    "EndCondition": ".core.data_types",
+    "BeamGeometry": ".core.models",
+    "DesignDefaults": ".core.models",
+    "FrameType": ".core.models",
+    **dict.fromkeys(
+        (
+            "Beam3DGeometry",
+            "Point3D",
+            "RebarPath",
+            "RebarSegment",
+            "StirrupLoop",
+            "beam_to_3d_geometry",
+            "compute_beam_outline",
+            "compute_rebar_positions",
+            "compute_stirrup_path",
+            "compute_stirrup_positions",
+        ),
+        ".visualization.geometry_3d",
+    ),
+}
 
 __all__ = [
     "__version__",
@@ -257,6 +300,7 @@ __all__ = [
     "flexure",
     "imports",
     "inputs",
+    "instrumentation",
     "models",
     "rebar",
     "reports",
@@ -471,9 +515,28 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> _ModuleType:
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
     if name in _LAZY_MODULES:
-        mod = importlib.import_module(f".{name}", __name__)
-        globals()[name] = mod
-        return mod
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value: Any
+        try:
+            value = importlib.import_module(_LAZY_MODULES[name], __name__)
+        except ImportError:
+            if name not in _OPTIONAL_MODULES:
+                raise
+            value = None
+    elif name in _PUBLIC_NAMES:
+        module = importlib.import_module(
+            _ATTRIBUTE_MODULES.get(name, ".services.api"), __name__
+        )
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -9,6 +9,7 @@ Usage:
     python -m structural_lib detail results.json -o detailing.json
     python -m structural_lib dxf results.json -o drawings.dxf
     python -m structural_lib job job.json -o output/
+    python -m structural_lib job run-dir jobs/ -o output/ --workers 4
     python -m structural_lib validate job.json
     python -m structural_lib report ./output/ --format=html
     python -m structural_lib critical ./output/ --top=10 --format=csv
@@ -17,7 +18,11 @@ Usage:
     python -m structural_lib excel-v1 definition
     python -m structural_lib excel-v1 preview workbook-table.json
     python -m structural_lib excel-v1 run workbook-table.json --mapping-hash HASH
+    python -m structural_lib excel-v1 run table.json --mapping-hash HASH --previous result.json
     python -m structural_lib mark-diff --bbs schedule.csv --dxf drawings.dxf
+    python -m structural_lib --profile design input.csv -o results.json
+    python -m structural_lib serve --socket /tmp/structural_lib.sock
+    python -m structural_lib --worker /tmp/structural_lib.sock design input.csv -o results.json
 
 This module provides a unified command-line interface with subcommands
 for beam design, bar bending schedules, DXF generation, job processing,
@@ -31,15 +36,115 @@ import csv
 import importlib.util
 import json
 import sys
+from collections.abc import Sequence
 from pathlib import Path
-from typing import cast
+from types import ModuleType
+from typing import TYPE_CHECKING, cast
 
-from . import (
-    beam_pipeline,
-    detailing,
-)
-from .core.data_types import CrackWidthParams, ValidationReport
-from .services import api, cli_design, dxf_export, job_runner, report
+
+def _print_error(message: str, hint: str | None = None) -> None:
+    print(f"Error: {message}", file=sys.stderr)
+    if hint:
+        print(f"Hint: {hint}", file=sys.stderr)
+
+
+def _worker_request(argv: list[str]) -> tuple[str, list[str]] | None:
+    """Split a global ``--worker ADDRESS`` off ``argv``.
+
+    Returns:
+        The worker address and the arguments to forward, or None when the
+        command runs here (no ``--worker``, or ``serve`` itself)
+    """
+    for index, arg in enumerate(argv):
+        if arg == "--worker" and index + 1 < len(argv):
+            address, forwarded = argv[index + 1], argv[:index] + argv[index + 2 :]
+        elif arg.startswith("--worker="):
+            address, forwarded = arg.partition("=")[2], argv[:index] + argv[index + 1 :]
+        elif arg.startswith("-"):
+            continue
+        else:
+            return None  # Subcommand reached; --worker is a global option
+        return None if _command_of(forwarded) == "serve" else (address, forwarded)
+    return None
+
+
+def _command_of(argv: Sequence[str]) -> str | None:
+    """The subcommand ``argv`` runs, skipping global options and their values."""
+    args = iter(argv)
+    for arg in args:
+        # argparse accepts any unambiguous prefix of --worker
+        if len(arg) > 2 and "--worker".startswith(arg.partition("=")[0]):
+            if "=" not in arg:
+                next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _forward_to_worker(address: str, argv: list[str]) -> int:
+    """Run ``argv`` in the worker at ``address`` and replay its output."""
+    from .services import worker
+
+    try:
+        return worker.forward_cli(address, argv)
+    except worker.WorkerError as e:
+        _print_error(str(e), hint=f"Start one with: serve --socket {address}")
+        return 1
+
+
+if __name__ == "__main__":
+    # Forward before the CLI loads anything else; skipping that import cost
+    # is the point of --worker.
+    _worker_call = _worker_request(sys.argv[1:])
+    if _worker_call is not None:
+        sys.exit(_forward_to_worker(*_worker_call))
+
+from .core import instrumentation  # noqa: E402
+from .core.instrumentation import stage  # noqa: E402
+
+
+def _lazy_module(name: str) -> ModuleType:
+    """Return module ``name``, deferring its execution to first attribute use.
+
+    Each subcommand needs a different slice of the library, so the design,
+    report and DXF stacks load only when a command actually touches them.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, module)
+    return module
+
+
+if TYPE_CHECKING:
+    from . import beam_pipeline, detailing
+    from .core.data_types import CrackWidthParams, ValidationReport
+    from .services import (
+        api,
+        capabilities,
+        cli_design,
+        dxf_export,
+        job_runner,
+        report,
+    )
+else:
+    beam_pipeline = _lazy_module("structural_lib.beam_pipeline")
+    detailing = _lazy_module("structural_lib.detailing")
+    api = _lazy_module("structural_lib.services.api")
+    capabilities = _lazy_module("structural_lib.services.capabilities")
+    cli_design = _lazy_module("structural_lib.services.cli_design")
+    dxf_export = _lazy_module("structural_lib.services.dxf_export")
+    job_runner = _lazy_module("structural_lib.services.job_runner")
+    report = _lazy_module("structural_lib.services.report")
 
 
 def _fmt_cell(v: object) -> str:
@@ -61,12 +166,6 @@ def _write_csv(path: Path, rows: list[dict], fieldnames: list[str]) -> None:
             writer.writerow({k: _fmt_cell(row.get(k)) for k in fieldnames})
 
 
-def _print_error(message: str, hint: str | None = None) -> None:
-    print(f"Error: {message}", file=sys.stderr)
-    if hint:
-        print(f"Hint: {hint}", file=sys.stderr)
-
-
 def _format_validation_text(report: ValidationReport) -> str:
     status = "OK" if report.ok else "FAIL"
     lines = [f"Validation: {status}"]
@@ -139,6 +238,7 @@ def cmd_excel_v1(args: argparse.Namespace) -> int:
         from structural_lib.core.excel_workbook import (
             ExcelWorkbookPreviewRequestV1,
             ExcelWorkbookRunRequestV1,
+            ExcelWorkbookRunResultV1,
         )
         from structural_lib.services.excel_workbench import (
             build_excel_mapping_preview_v1,
@@ -202,7 +302,14 @@ def cmd_excel_v1(args: argparse.Namespace) -> int:
                 rows=preview_request.rows,
                 confirmed_mapping_hash=args.mapping_hash,
             )
-            result = run_excel_workbook_v1(run_request)
+            previous = None
+            if args.previous:
+                previous = ExcelWorkbookRunResultV1.model_validate_json(
+                    Path(args.previous).read_text(encoding="utf-8")
+                )
+            result = run_excel_workbook_v1(
+                run_request, previous=previous, max_workers=args.workers
+            )
             output = (
                 render_excel_review_bundle_markdown_v1(result)
                 if args.format == "markdown"
@@ -299,7 +406,7 @@ def cmd_design(args: argparse.Namespace) -> int:
                     hint='Example: {"acr_mm": 120, "cmin_mm": 25, "h_mm": 500}',
                 )
                 return 1
-            crack_width_params = cast(CrackWidthParams, loaded_params)
+            crack_width_params = cast("CrackWidthParams", loaded_params)
             # Warn if applying global params to multiple beams
             if len(beams) > 1:
                 print(
@@ -400,7 +507,7 @@ def cmd_design(args: argparse.Namespace) -> int:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with output_path.open("w", encoding="utf-8") as f:
+            with stage("cli.serialize"), output_path.open("w", encoding="utf-8") as f:
                 json.dump(output.to_dict(), f, indent=2)
 
             print(f"Design results written to {output_path}", file=sys.stderr)
@@ -413,7 +520,9 @@ def cmd_design(args: argparse.Namespace) -> int:
                 print(f"Insights written to {insights_path}", file=sys.stderr)
         else:
             # Print to stdout
-            print(json.dumps(output.to_dict(), indent=2))
+            with stage("cli.serialize"):
+                payload = json.dumps(output.to_dict(), indent=2)
+            print(payload)
 
             # Print insights to stderr if available (don't mix with main output)
             if insights_output:
@@ -766,8 +875,29 @@ def cmd_dxf(args: argparse.Namespace) -> int:
                 title_block_width_mm=args.title_block_width,
                 title_block_height_mm=args.title_block_height,
             )
+        elif args.sheet_size and len(detailing_list) > args.sheet_size:
+            # Large schedules - parallel sheets, an index sheet and a zip
+            sheet_set = dxf_export.generate_multi_beam_dxf_sheets(
+                detailing_list,
+                output_path.parent,
+                stem=output_path.stem,
+                beams_per_sheet=args.sheet_size,
+                max_workers=args.workers,
+                include_title_block=args.title_block or args.title is not None,
+                title_block=title_block,
+                sheet_margin_mm=args.sheet_margin,
+                title_block_width_mm=args.title_block_width,
+                title_block_height_mm=args.title_block_height,
+            )
+            print(
+                f"DXF sheets written: {len(sheet_set.sheets)} sheet(s), "
+                f"index {sheet_set.index_path}, bundle {sheet_set.bundle_path}",
+                file=sys.stderr,
+            )
+            print(f"DXF complete: {len(detailing_list)} beam(s) drawn", file=sys.stderr)
+            return 0
         else:
-            # Multiple beams - use multi-beam layout
+            # Multiple beams - use multi-beam layout, one BLOCK per beam type
             dxf_export.generate_multi_beam_dxf(
                 detailing_list,
                 str(output_path),
@@ -776,6 +906,7 @@ def cmd_dxf(args: argparse.Namespace) -> int:
                 sheet_margin_mm=args.sheet_margin,
                 title_block_width_mm=args.title_block_width,
                 title_block_height_mm=args.title_block_height,
+                use_blocks=True,
             )
 
         print(f"DXF drawings written to {output_path}", file=sys.stderr)
@@ -1011,6 +1142,28 @@ def cmd_job(args: argparse.Namespace) -> int:
     Executes a full job including design calculations, BBS generation,
     and optional DXF drawing generation.
     """
+    if args.input == "run-dir":
+        return _cmd_job_run_dir(args)
+
+    # Folder-run options mean nothing to a single job; refuse them rather
+    # than silently ignoring them.
+    unused = [
+        option
+        for option, given in (
+            (repr(args.jobs_dir), args.jobs_dir is not None),
+            ("--workers", args.workers is not None),
+            ("--force", args.force),
+        )
+        if given
+    ]
+    if unused:
+        _print_error(
+            f"{', '.join(unused)} only apply to run-dir.",
+            hint="Use: job <job.json> -o <output_dir>, "
+            "or job run-dir <jobs/> -o <output_dir> --workers N --force",
+        )
+        return 1
+
     input_path = Path(args.input)
 
     if not input_path.exists():
@@ -1041,10 +1194,42 @@ def cmd_job(args: argparse.Namespace) -> int:
         return 1
 
 
+def _cmd_job_run_dir(args: argparse.Namespace) -> int:
+    """Run every job file of a folder; see ``job_runner.run_job_dir``."""
+    if not args.jobs_dir:
+        _print_error(
+            "run-dir needs a folder of job files.",
+            hint="Use: job run-dir <jobs/> -o <output_dir>",
+        )
+        return 1
+
+    try:
+        print(f"Running jobs from {args.jobs_dir}...", file=sys.stderr)
+        summary = job_runner.run_job_dir(
+            jobs_dir=args.jobs_dir,
+            out_dir=args.output,
+            max_workers=args.workers,
+            force=args.force,
+        )
+    except FileNotFoundError as e:
+        _print_error(str(e))
+        return 1
+
+    for name, entry in sorted(summary["jobs"].items()):
+        if entry["status"] == "failed":
+            print(f"  FAILED {name}: {entry['error']}", file=sys.stderr)
+    print(
+        f"Jobs complete: {summary['ran']} ran, {summary['skipped']} skipped "
+        f"(unchanged), {summary['failed']} failed. Manifest: {summary['manifest']}",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
 def cmd_report(args: argparse.Namespace) -> int:
     """Generate report from job output folder or design results JSON.
 
-    Generates human-readable reports (JSON or HTML).
+    Generates human-readable reports (JSON, HTML or PDF).
     """
     output_dir = Path(args.output_dir)
     is_file_input = output_dir.is_file()
@@ -1075,10 +1260,30 @@ def cmd_report(args: argparse.Namespace) -> int:
                     print(output)
                 return 0
 
+            if fmt == "pdf":
+                if not args.output:
+                    _print_error(
+                        "PDF report requires --output",
+                        hint="Use -o report.pdf (one document) or -o pdfs/",
+                    )
+                    return 1
+
+                def show_progress(completed: int, total: int) -> None:
+                    print(f"Rendered {completed}/{total} reports", file=sys.stderr)
+
+                written = report.write_design_report_pdfs(
+                    design_results,
+                    output_path=Path(args.output),
+                    max_workers=args.workers,
+                    progress=show_progress,
+                )
+                print(f"Report written to {written[0]}", file=sys.stderr)
+                return 0
+
             if fmt != "html":
                 _print_error(
                     f"Unknown format: {fmt}",
-                    hint="Use --format=json or --format=html",
+                    hint="Use --format=json, --format=html or --format=pdf",
                 )
                 return 1
 
@@ -1101,6 +1306,7 @@ def cmd_report(args: argparse.Namespace) -> int:
                 design_results,
                 output_path=out_path,
                 batch_threshold=args.batch_threshold,
+                max_workers=args.workers,
             )
             if written:
                 print(f"Report written to {written[0]}", file=sys.stderr)
@@ -1117,6 +1323,15 @@ def cmd_report(args: argparse.Namespace) -> int:
             output = report.export_json(data)
         elif fmt == "html":
             output = report.export_html(data)
+        elif fmt == "pdf":
+            if not args.output:
+                _print_error("PDF report requires --output", hint="Use -o report.pdf")
+                return 1
+            out_path = Path(args.output)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_bytes(report.export_pdf(data))
+            print(f"Report written to {out_path}", file=sys.stderr)
+            return 0
         else:
             _print_error(
                 f"Unknown format: {fmt}",
@@ -1135,7 +1350,7 @@ def cmd_report(args: argparse.Namespace) -> int:
 
         return 0
 
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ImportError) as e:
         _print_error(str(e))
         return 1
     except ValueError as e:
@@ -1226,7 +1441,7 @@ def cmd_critical(args: argparse.Namespace) -> int:
 
 def cmd_capabilities(args: argparse.Namespace) -> int:
     """Print the canonical supported/held IS 456 capability contract."""
-    document = api.get_supported_is456_capability_document()
+    document = capabilities.get_supported_is456_capability_document()
     if args.as_json:
         json.dump(document, sys.stdout, indent=2, sort_keys=True)
         sys.stdout.write("\n")
@@ -1296,6 +1511,23 @@ def cmd_install_preflight(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Run the resident worker until it is shut down."""
+    from .services import worker
+
+    def _ready() -> None:
+        print(f"Worker listening on {args.socket}", file=sys.stderr, flush=True)
+
+    try:
+        worker.serve(args.socket, preload=args.preload, ready=_ready)
+    except worker.WorkerError as e:
+        _print_error(str(e), hint="Stop the running worker or pick another socket")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
 def _build_parser() -> argparse.ArgumentParser:
     """Build the main argument parser with subcommands."""
 
@@ -1304,6 +1536,16 @@ def _build_parser() -> argparse.ArgumentParser:
         description="IS 456 RC Beam Design Library - Unified CLI",
         epilog='Use "python -m structural_lib <command> --help" for command-specific help',
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings (parse, design, evidence, serialize) to stderr",
+    )
+    parser.add_argument(
+        "--worker",
+        metavar="ADDRESS",
+        help="Run the command in a resident worker started with `serve`",
+    )
 
     subparsers = parser.add_subparsers(
         dest="command", required=True, help="Available commands"
@@ -1373,6 +1615,16 @@ def _build_parser() -> argparse.ArgumentParser:
         "--mapping-hash",
         help="Exact mapping hash emitted by the preview phase",
     )
+    excel_parser.add_argument(
+        "--previous",
+        help="Prior run result JSON; unchanged rows keep their ledger entries",
+    )
+    excel_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for row design (default: CPU count)",
+    )
     excel_parser.add_argument(
         "--format",
         choices=["json", "markdown"],
@@ -1497,6 +1749,7 @@ Examples:
         Examples:
           python -m structural_lib dxf results.json -o drawings.dxf
           python -m structural_lib dxf design_output.json -o beam_details.dxf
+          python -m structural_lib dxf results.json -o sheets/beams.dxf --sheet-size 100
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -1531,6 +1784,21 @@ Examples:
         default=250.0,
         help="Title block height in mm (default: 250).",
     )
+    dxf_parser.add_argument(
+        "--sheet-size",
+        type=int,
+        default=0,
+        help=(
+            "Split schedules larger than N beams into sheets named after the "
+            "output, with an index sheet and a zip bundle (default: one file)."
+        ),
+    )
+    dxf_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --sheet-size (default: CPU count).",
+    )
     dxf_parser.set_defaults(func=cmd_dxf)
 
     # Validate subcommand
@@ -1667,16 +1935,37 @@ Examples:
         description="""
         Run a complete job from JSON specification and write outputs to a folder.
 
+        With run-dir, every *.json job of a folder runs in worker processes.
+        Each job writes to <output>/<job file stem>/, and job-manifest.json
+        records input hashes so unchanged jobs are skipped on re-runs.
+
         Examples:
           python -m structural_lib job job.json -o output/
           python -m structural_lib job project_spec.json -o results/
+          python -m structural_lib job run-dir jobs/ -o results/ --workers 4
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    job_parser.add_argument("input", help="Input JSON job specification file")
+    job_parser.add_argument(
+        "input", help="Input JSON job specification file, or run-dir"
+    )
+    job_parser.add_argument(
+        "jobs_dir", nargs="?", help="Folder of job files (with run-dir)"
+    )
     job_parser.add_argument(
         "-o", "--output", required=True, help="Output directory for job results"
     )
+    job_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for run-dir (default: CPU count)",
+    )
+    job_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With run-dir, run unchanged jobs again",
+    )
     job_parser.set_defaults(func=cmd_job)
 
     # Report subcommand
@@ -1684,13 +1973,14 @@ Examples:
         "report",
         help="Generate report from job output folder or design results JSON",
         description="""
-        Generate human-readable reports (JSON or HTML).
+        Generate human-readable reports (JSON, HTML or PDF).
 
         Examples:
           python -m structural_lib report ./output/ --format=json
           python -m structural_lib report ./output/ --format=html -o report.html
           python -m structural_lib report ./output/ --job custom_job.json --format=json
           python -m structural_lib report design_results.json -o report/ --batch-threshold 80
+          python -m structural_lib report design_results.json --format=pdf -o submission.pdf
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -1701,8 +1991,8 @@ Examples:
     report_parser.add_argument(
         "--format",
         default="json",
-        choices=["json", "html"],
-        help="Output format (default: json)",
+        choices=["json", "html", "pdf"],
+        help="Output format (default: json; pdf needs weasyprint)",
     )
     report_parser.add_argument(
         "-o", "--output", help="Output file path (if omitted, prints to stdout)"
@@ -1721,6 +2011,12 @@ Examples:
         default=80,
         help="Batch threshold for design results HTML packaging",
     )
+    report_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch beam pages and PDFs (default: CPU count)",
+    )
     report_parser.set_defaults(func=cmd_report)
 
     # Critical subcommand
@@ -1763,16 +2059,61 @@ Examples:
     )
     critical_parser.set_defaults(func=cmd_critical)
 
+    # Serve subcommand
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a resident worker for Excel and CLI callers",
+        description="""
+        Keep the library loaded and answer calls over a local socket, so
+        Excel UDFs and repeated CLI calls skip the import cost. Stop it
+        with Ctrl+C or a shutdown request.
+
+        Examples:
+          python -m structural_lib serve --socket /tmp/structural_lib.sock
+          python -m structural_lib serve --socket \\\\.\\pipe\\structural_lib
+          python -m structural_lib --worker /tmp/structural_lib.sock bbs results.json -o bbs.csv
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    serve_parser.add_argument(
+        "--socket",
+        required=True,
+        help="Unix socket path or Windows named pipe to listen on",
+    )
+    serve_parser.add_argument(
+        "--no-preload",
+        dest="preload",
+        action="store_false",
+        help="Load library modules on first use instead of at startup",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
+    worker_call = _worker_request(sys.argv[1:] if argv is None else argv)
+    if worker_call is not None:
+        return _forward_to_worker(*worker_call)
+
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    if args.profile:
+        instrumentation.reset()
+        instrumentation.enable()
+
     # Call the appropriate command function
-    exit_code: int = args.func(args)
+    try:
+        exit_code: int = args.func(args)
+    finally:
+        if args.profile:
+            instrumentation.disable()
+            print(
+                instrumentation.format_table(instrumentation.snapshot()),
+                file=sys.stderr,
+            )
     return exit_code
 
 
@@ -53,6 +53,7 @@ __all__ = [
     "format_bar_callout",
     "format_stirrup_callout",
     "create_beam_detailing",
+    "group_similar_beams",
     # Constants
     "BOND_STRESS_DEFORMED",
     "STANDARD_BAR_DIAMETERS",
@@ -1250,3 +1251,68 @@ def create_beam_detailing(
         is_valid=is_valid,
         remarks="; ".join(remarks_parts),
     )
+
+
+# =============================================================================
+# Beam Type Grouping
+# =============================================================================
+
+
+def _get_beam_type_key(detailing: BeamDetailingResult) -> str:
+    """
+    Generate a type key for grouping similar beams.
+
+    Beams with same size, span (±100mm), and reinforcement are grouped.
+    """
+    # Round span to nearest 100mm for grouping tolerance
+    span_rounded = round(detailing.span / 100) * 100
+
+    # Get bottom bar summary (primary identifier)
+    if detailing.bottom_bars:
+        mid_idx = len(detailing.bottom_bars) // 2
+        bot = detailing.bottom_bars[mid_idx]
+        bot_str = f"{bot.count}T{int(bot.diameter)}"
+    else:
+        bot_str = "0T0"
+
+    # Get top bar summary
+    if detailing.top_bars:
+        mid_idx = len(detailing.top_bars) // 2
+        top = detailing.top_bars[mid_idx]
+        top_str = f"{top.count}T{int(top.diameter)}"
+    else:
+        top_str = "0T0"
+
+    # Get stirrup summary
+    if detailing.stirrups:
+        stir = detailing.stirrups[0]
+        stir_str = f"{int(stir.diameter)}@{int(stir.spacing)}"
+    else:
+        stir_str = "0@0"
+
+    return f"{int(detailing.b)}x{int(detailing.D)}_{span_rounded}_{bot_str}_{top_str}_{stir_str}"
+
+
+def group_similar_beams(
+    detailings: list[BeamDetailingResult],
+) -> dict[str, list[BeamDetailingResult]]:
+    """
+    Group beams by type (size + span + reinforcement).
+
+    Industry standard: Similar beams are shown once with references to all
+    beam IDs that use the same detail. Used by the DXF beam schedule and by
+    instanced 3D rebar geometry.
+
+    Args:
+        detailings: List of beam detailing results
+
+    Returns:
+        Dict mapping type_key to list of beams with that type
+    """
+    groups: dict[str, list[BeamDetailingResult]] = {}
+    for detailing in detailings:
+        type_key = _get_beam_type_key(detailing)
+        if type_key not in groups:
+            groups[type_key] = []
+        groups[type_key].append(detailing)
+    return groups
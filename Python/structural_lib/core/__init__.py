@@ -11,57 +11,69 @@ All code-specific implementations (IS 456, ACI 318, EC2) inherit from these base
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from structural_lib.core.base import (
     DesignCode,
     DetailingRules,
     FlexureDesigner,
     ShearDesigner,
 )
-from structural_lib.core.building_gravity import (
-    BuildingModelV1,
-    BuildingSourceRecordV1,
-    ExcludedGravityActionV1,
-    GravityActionCategoryV1,
-    GravityApprovedExclusionV1,
-    GravityCombinationFactorV1,
-    GravityCombinationV1,
-    GravityFootingDestinationV1,
-    GravityInclusionDispositionV1,
-    GravityInclusionRuleV1,
-    GravityLoadCaseV1,
-    GravityLoadStateV1,
-    GravityMaterialV1,
-    GravityMemberKindV1,
-    GravityMemberV1,
-    GravityNodeV1,
-    GravityPanelV1,
-    GravitySectionKindV1,
-    GravitySectionV1,
-    GravitySourceReferenceV1,
-    GravitySupportIdealizationV1,
-    LoadModelV1,
-    SourceDispositionV1,
-    canonical_building_model_hash_v1,
-    canonical_load_model_hash_v1,
-)
 from structural_lib.core.geometry import LSection, RectangularSection, Section, TSection
-from structural_lib.core.gravity_workflow import (
-    ComponentApplicabilityMatrixV1,
-    GravityBeamDesignBasisV1,
-    GravityColumnDesignBasisV1,
-    GravityComponentApplicabilityV1,
-    GravityComponentKindV1,
-    GravityComponentResultV1,
-    GravityFootingDesignBasisV1,
-    GravityMemberActionV1,
-    GravityPrerequisiteDispositionV1,
-    GravitySlabDesignBasisV1,
-    GravityWorkflowRequestV1,
-    GravityWorkflowResultV1,
-)
 from structural_lib.core.materials import Concrete, MaterialFactory, Steel
 from structural_lib.core.registry import CodeRegistry
 
+if TYPE_CHECKING:
+    from structural_lib.core.building_gravity import (
+        BuildingModelV1,
+        BuildingSourceRecordV1,
+        ExcludedGravityActionV1,
+        GravityActionCategoryV1,
+        GravityApprovedExclusionV1,
+        GravityCombinationFactorV1,
+        GravityCombinationV1,
+        GravityFootingDestinationV1,
+        GravityInclusionDispositionV1,
+        GravityInclusionRuleV1,
+        GravityLoadCaseV1,
+        GravityLoadStateV1,
+        GravityMaterialV1,
+        GravityMemberKindV1,
+        GravityMemberV1,
+        GravityNodeV1,
+        GravityPanelV1,
+        GravitySectionKindV1,
+        GravitySectionV1,
+        GravitySourceReferenceV1,
+        GravitySupportIdealizationV1,
+        LoadModelV1,
+        SourceDispositionV1,
+        canonical_building_model_hash_v1,
+        canonical_load_model_hash_v1,
+    )
+    from structural_lib.core.gravity_workflow import (
+        ComponentApplicabilityMatrixV1,
+        GravityBeamDesignBasisV1,
+        GravityColumnDesignBasisV1,
+        GravityComponentApplicabilityV1,
+        GravityComponentKindV1,
+        GravityComponentResultV1,
+        GravityFootingDesignBasisV1,
+        GravityMemberActionV1,
+        GravityPrerequisiteDispositionV1,
+        GravitySlabDesignBasisV1,
+        GravityWorkflowRequestV1,
+        GravityWorkflowResultV1,
+    )
+
+# The building gravity contracts are large pydantic models. They load on first
+# access (PEP 562) so importing any ``structural_lib.core`` module stays cheap.
+_LAZY_SUBMODULES = (
+    "structural_lib.core.building_gravity",
+    "structural_lib.core.gravity_workflow",
+)
+
 __all__ = [
     # Base classes
     "DesignCode",
@@ -119,3 +131,20 @@ __all__ = [
     "GravityWorkflowRequestV1",
     "GravityWorkflowResultV1",
 ]
+
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PUBLIC_NAMES:
+        for module_name in _LAZY_SUBMODULES:
+            module = importlib.import_module(module_name)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
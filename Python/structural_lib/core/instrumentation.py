@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""
+Module:       instrumentation
+Description:  Opt-in per-stage wall-clock timers for library hot paths.
+
+Library code marks its stages with :func:`stage`. While timing is disabled
+(the default) ``stage()`` returns one shared no-op context manager, so an
+instrumented call costs a global lookup and nothing else. Once enabled,
+each stage accumulates call count, total and maximum duration in a
+process-wide, thread-safe registry that the CLI (``--profile``) and the
+API ``/metrics`` endpoint read with :func:`snapshot`.
+
+Usage:
+    from structural_lib.core.instrumentation import stage
+    with stage("beam.compliance"):
+        result = check_compliance_case(...)
+
+    from structural_lib.core import instrumentation
+    instrumentation.enable()
+    ...
+    print(instrumentation.format_table(instrumentation.snapshot()))
+
+Environment Variables:
+    STRUCTURAL_LIB_PROFILE: Enable timing at import when set to 1/true/yes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from time import perf_counter
+from types import TracebackType
+
+_enabled = os.environ.get("STRUCTURAL_LIB_PROFILE", "").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+_lock = threading.Lock()
+# name -> [calls, total_seconds, max_seconds]
+_stages: dict[str, list[float]] = {}
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Accumulated timings for one named stage.
+
+    Attributes:
+        calls: Completed entries into the stage
+        total_seconds: Wall-clock time summed over all calls
+        max_seconds: Longest single call
+    """
+
+    calls: int
+    total_seconds: float
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean wall-clock time per call."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Return a JSON-compatible view in milliseconds."""
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_seconds * 1000.0, 3),
+            "mean_ms": round(self.mean_seconds * 1000.0, 3),
+            "max_ms": round(self.max_seconds * 1000.0, 3),
+        }
+
+
+class _NullStage:
+    """Shared no-op returned by :func:`stage` while timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _TimedStage:
+    """Times one entry into a stage and records it on exit."""
+
+    __slots__ = ("_name", "_started")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        record(self._name, perf_counter() - self._started)
+
+
+def stage(name: str) -> _NullStage | _TimedStage:
+    """Return a context manager that times the enclosed block as ``name``.
+
+    Stages may nest; each records its own inclusive wall-clock time. Calls
+    that raise are recorded too.
+
+    Args:
+        name: Dotted stage name, e.g. ``"beam.evidence"``.
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _TimedStage(name)
+
+
+def record(name: str, seconds: float) -> None:
+    """Add one measured call of ``seconds`` to stage ``name``."""
+    with _lock:
+        entry = _stages.get(name)
+        if entry is None:
+            _stages[name] = [1, seconds, seconds]
+            return
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+
+
+def enable() -> None:
+    """Start recording stage timings in this process."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording; accumulated timings are kept until :func:`reset`."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True while stage timings are being recorded."""
+    return _enabled
+
+
+def reset() -> None:
+    """Discard all accumulated stage timings."""
+    with _lock:
+        _stages.clear()
+
+
+def snapshot() -> dict[str, StageTiming]:
+    """Return a consistent copy of every stage's timings, sorted by name."""
+    with _lock:
+        return {
+            name: StageTiming(int(calls), total, peak)
+            for name, (calls, total, peak) in sorted(_stages.items())
+        }
+
+
+def format_table(timings: Mapping[str, StageTiming]) -> str:
+    """Render ``timings`` as a fixed-width text table, slowest total first."""
+    rows = sorted(timings.items(), key=lambda item: -item[1].total_seconds)
+    width = max([len("stage"), *(len(name) for name, _ in rows)])
+    lines = [
+        f"{'stage':<{width}}  {'calls':>7}  {'total ms':>10}  "
+        f"{'mean ms':>9}  {'max ms':>9}"
+    ]
+    for name, timing in rows:
+        lines.append(
+            f"{name:<{width}}  {timing.calls:>7}  "
+            f"{timing.total_seconds * 1000.0:>10.3f}  "
+            f"{timing.mean_seconds * 1000.0:>9.3f}  "
+            f"{timing.max_seconds * 1000.0:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "StageTiming",
+    "disable",
+    "enable",
+    "format_table",
+    "is_enabled",
+    "record",
+    "reset",
+    "snapshot",
+    "stage",
+]
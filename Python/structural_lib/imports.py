@@ -6,6 +6,10 @@ Prefer importing directly from structural_lib.services.imports."""
 
 from __future__ import annotations
 
+from structural_lib.services.compact_ledger import (  # noqa: F401, E402
+    CompactLosslessImport,
+    CompactRowLedger,
+)
 from structural_lib.services.import_ledger import (  # noqa: F401, E402
     AdapterSelectionV1,
     ImportArtifactV1,
@@ -24,7 +28,10 @@ from structural_lib.services.imports import (  # noqa: F401, E402
     LosslessImportBlockedError,
     merge_geometry_forces,
     parse_dual_csv,
+    parse_dual_csv_compact,
     parse_dual_csv_lossless,
+    parse_project_exports,
+    parse_single_csv_compact,
     parse_single_csv_lossless,
     validate_import,
 )
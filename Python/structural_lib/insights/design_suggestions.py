@@ -16,12 +16,14 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ..beam_pipeline import BeamDesignOutput
 from ..costing import CostProfile
 from ..detailing import BeamDetailingResult
 
+if TYPE_CHECKING:
+    from ..beam_pipeline import BeamDesignOutput
+
 
 class SuggestionCategory(Enum):
     """Categories of design suggestions."""
@@ -39,12 +39,14 @@ Example:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ..beam_pipeline import BeamDesignOutput
 from ..costing import CostProfile
 from . import cost_optimization, design_suggestions, sensitivity
 
+if TYPE_CHECKING:
+    from ..beam_pipeline import BeamDesignOutput
+
 
 @dataclass
 class SmartAnalysisSummary:
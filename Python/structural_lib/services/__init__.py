@@ -1,29 +1,43 @@
 """Application-layer public workflow exports."""
 
-from structural_lib.services.combined_footing_api import (
-    SymmetricCombinedFootingDesignInput,
-    SymmetricCombinedFootingDesignProvenance,
-    SymmetricCombinedFootingDesignResult,
-    SymmetricCombinedFootingDesignStatus,
-    design_symmetric_combined_footing_is456,
-)
-from structural_lib.services.gravity_loads import (
-    GravityBalanceBoundaryV1,
-    GravityBalanceV1,
-    GravityCombinationActionV1,
-    GravityCombinationContributionV1,
-    GravityLedgerEntryV1,
-    GravityLedgerStageV1,
-    GravityLoadLedgerError,
-    GravityLoadLedgerV1,
-    build_gravity_load_ledger_v1,
-)
-from structural_lib.services.strap_footing_api import (
-    PropertyLineStrapFootingDesignInput,
-    PropertyLineStrapFootingDesignProvenance,
-    PropertyLineStrapFootingDesignResult,
-    PropertyLineStrapFootingDesignStatus,
-    design_property_line_strap_footing_is456,
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from structural_lib.services.combined_footing_api import (
+        SymmetricCombinedFootingDesignInput,
+        SymmetricCombinedFootingDesignProvenance,
+        SymmetricCombinedFootingDesignResult,
+        SymmetricCombinedFootingDesignStatus,
+        design_symmetric_combined_footing_is456,
+    )
+    from structural_lib.services.gravity_loads import (
+        GravityBalanceBoundaryV1,
+        GravityBalanceV1,
+        GravityCombinationActionV1,
+        GravityCombinationContributionV1,
+        GravityLedgerEntryV1,
+        GravityLedgerStageV1,
+        GravityLoadLedgerError,
+        GravityLoadLedgerV1,
+        build_gravity_load_ledger_v1,
+    )
+    from structural_lib.services.strap_footing_api import (
+        PropertyLineStrapFootingDesignInput,
+        PropertyLineStrapFootingDesignProvenance,
+        PropertyLineStrapFootingDesignResult,
+        PropertyLineStrapFootingDesignStatus,
+        design_property_line_strap_footing_is456,
+    )
+
+# Loaded on first access (PEP 562): every ``structural_lib.services.<module>``
+# import runs this file, and these workflows pull in most of the code stack.
+_LAZY_SUBMODULES = (
+    "structural_lib.services.combined_footing_api",
+    "structural_lib.services.gravity_loads",
+    "structural_lib.services.strap_footing_api",
 )
 
 __all__ = [
@@ -47,3 +61,20 @@ __all__ = [
     "PropertyLineStrapFootingDesignStatus",
     "design_property_line_strap_footing_is456",
 ]
+
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PUBLIC_NAMES:
+        for module_name in _LAZY_SUBMODULES:
+            module = importlib.import_module(module_name)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -118,6 +118,26 @@ class InputAdapter(ABC):
             List of BeamForces models (envelope values)
         """
 
+    def load_forces_columnar(
+        self,
+        source: Path | str,
+    ) -> list[BeamForces]:
+        """Load beam forces through the NumPy columnar fast path.
+
+        Returns the same records as :meth:`load_forces` but parses numeric
+        columns in bulk, which is much faster for large station exports.
+        Requires the optional ``columnar`` extra (NumPy).
+
+        Args:
+            source: Path to forces file
+
+        Returns:
+            List of BeamForces models (envelope values)
+        """
+        from .columnar_import import load_forces_columnar
+
+        return load_forces_columnar(self, source)
+
 
 # =============================================================================
 # ETABS Adapter
@@ -464,6 +484,48 @@ class ETABSAdapter(InputAdapter):
 
         return beams
 
+    def _is_envelope_forces(self, column_map: Mapping[str, str]) -> bool:
+        """Detect the forces layout and check its required columns.
+
+        Args:
+            column_map: Logical field to actual column name mapping
+
+        Returns:
+            True for the VBA envelope export, False for raw station data
+
+        Raises:
+            ValueError: If neither layout is recognised or columns are missing
+        """
+        # Detect format: VBA envelope vs raw ETABS
+        is_vba_envelope = "mu_max" in column_map or "vu_max" in column_map
+        is_raw_etabs = "m3" in column_map and "v2" in column_map
+
+        if is_vba_envelope:
+            # VBA envelope format - pre-computed envelope values
+            required = ["beam_id"]
+            # mu_max or vu_max must exist (at least one)
+            if "mu_max" not in column_map and "vu_max" not in column_map:
+                raise ValueError(
+                    "VBA envelope format requires Mu_max_kNm or Vu_max_kN column"
+                )
+        elif is_raw_etabs:
+            # Raw ETABS format with station data
+            required = ["beam_id", "case_id", "station", "m3", "v2"]
+        else:
+            raise ValueError(
+                "Could not detect format. Need either M3/V2 columns "
+                "(raw ETABS) or Mu_max_kNm/Vu_max_kN columns (VBA envelope). "
+                f"Available: {list(column_map.keys())}"
+            )
+
+        missing = [r for r in required if r not in column_map]
+        if missing:
+            raise ValueError(
+                f"Missing required columns: {missing}. "
+                f"Available: {list(column_map.keys())}"
+            )
+        return is_vba_envelope
+
     def load_forces(
         self,
         source: Path | str,
@@ -497,35 +559,7 @@ class ETABSAdapter(InputAdapter):
             reader = csv.DictReader(f)
             headers = reader.fieldnames or []
             column_map = self._build_column_map(headers, self.FORCES_COLUMNS)
-
-            # Detect format: VBA envelope vs raw ETABS
-            is_vba_envelope = "mu_max" in column_map or "vu_max" in column_map
-            is_raw_etabs = "m3" in column_map and "v2" in column_map
-
-            if is_vba_envelope:
-                # VBA envelope format - pre-computed envelope values
-                required = ["beam_id"]
-                # mu_max or vu_max must exist (at least one)
-                if "mu_max" not in column_map and "vu_max" not in column_map:
-                    raise ValueError(
-                        "VBA envelope format requires Mu_max_kNm or Vu_max_kN column"
-                    )
-            elif is_raw_etabs:
-                # Raw ETABS format with station data
-                required = ["beam_id", "case_id", "station", "m3", "v2"]
-            else:
-                raise ValueError(
-                    "Could not detect format. Need either M3/V2 columns "
-                    "(raw ETABS) or Mu_max_kNm/Vu_max_kN columns (VBA envelope). "
-                    f"Available: {list(column_map.keys())}"
-                )
-
-            missing = [r for r in required if r not in column_map]
-            if missing:
-                raise ValueError(
-                    f"Missing required columns: {missing}. "
-                    f"Available: {list(column_map.keys())}"
-                )
+            is_vba_envelope = self._is_envelope_forces(column_map)
 
             input_rows = 0
             for row_number, row in enumerate(reader, start=2):
@@ -1015,6 +1049,33 @@ class SAFEAdapter(InputAdapter):
 
         return beams
 
+    def _is_envelope_forces(self, column_map: Mapping[str, str]) -> bool:
+        """Detect envelope vs station layout and check its required columns.
+
+        Raises:
+            ValueError: If neither layout is recognised or columns are missing
+        """
+        is_envelope = "mu_max" in column_map or "vu_max" in column_map
+        is_station_data = "m3" in column_map and "v2" in column_map
+
+        if is_envelope:
+            required = ["beam_id"]
+        elif is_station_data:
+            required = ["beam_id", "case_id", "m3", "v2"]
+        else:
+            raise ValueError(
+                "Missing force columns. Expected M22/V23 or Mu_max/Vu_max. "
+                f"Available: {list(column_map.keys())}"
+            )
+
+        missing = [r for r in required if r not in column_map]
+        if missing:
+            raise ValueError(
+                f"Missing required columns: {missing}. "
+                f"Available: {list(column_map.keys())}"
+            )
+        return is_envelope
+
     def load_forces(
         self,
         source: Path | str,
@@ -1044,27 +1105,7 @@ class SAFEAdapter(InputAdapter):
             reader = csv.DictReader(f)
             headers = reader.fieldnames or []
             column_map = self._build_column_map(headers, self.FORCES_COLUMNS)
-
-            # Detect format: envelope vs station data
-            is_envelope = "mu_max" in column_map or "vu_max" in column_map
-            is_station_data = "m3" in column_map and "v2" in column_map
-
-            if is_envelope:
-                required = ["beam_id"]
-            elif is_station_data:
-                required = ["beam_id", "case_id", "m3", "v2"]
-            else:
-                raise ValueError(
-                    "Missing force columns. Expected M22/V23 or Mu_max/Vu_max. "
-                    f"Available: {list(column_map.keys())}"
-                )
-
-            missing = [r for r in required if r not in column_map]
-            if missing:
-                raise ValueError(
-                    f"Missing required columns: {missing}. "
-                    f"Available: {list(column_map.keys())}"
-                )
+            is_envelope = self._is_envelope_forces(column_map)
 
             for row in reader:
                 try:
@@ -1448,6 +1489,34 @@ class STAADAdapter(InputAdapter):
 
         return beams
 
+    def _is_envelope_forces(
+        self, column_map: Mapping[str, str], headers: Sequence[str]
+    ) -> bool:
+        """Detect envelope vs station layout and check its required columns.
+
+        Raises:
+            ValueError: If neither layout is recognised or columns are missing
+        """
+        is_envelope = "mu_max" in column_map or "vu_max" in column_map
+        is_station_data = "m3" in column_map and "v2" in column_map
+
+        if is_envelope:
+            required = ["beam_id"]
+        elif is_station_data:
+            required = ["beam_id", "m3", "v2"]
+        else:
+            raise ValueError(
+                "Missing force columns. Expected My/Fy or My_max/Fy_max. "
+                f"Available: {list(column_map.keys())}"
+            )
+
+        missing = [r for r in required if r not in column_map]
+        if missing:
+            raise ValueError(
+                f"Missing required columns: {missing}. Available: {headers}"
+            )
+        return is_envelope
+
     def load_forces(
         self,
         source: Path | str,
@@ -1478,26 +1547,7 @@ class STAADAdapter(InputAdapter):
             reader = csv.DictReader(f)
             headers = reader.fieldnames or []
             column_map = self._build_column_map(headers, self.FORCES_COLUMNS)
-
-            # Detect format
-            is_envelope = "mu_max" in column_map or "vu_max" in column_map
-            is_station_data = "m3" in column_map and "v2" in column_map
-
-            if is_envelope:
-                required = ["beam_id"]
-            elif is_station_data:
-                required = ["beam_id", "m3", "v2"]
-            else:
-                raise ValueError(
-                    "Missing force columns. Expected My/Fy or My_max/Fy_max. "
-                    f"Available: {list(column_map.keys())}"
-                )
-
-            missing = [r for r in required if r not in column_map]
-            if missing:
-                raise ValueError(
-                    f"Missing required columns: {missing}. Available: {headers}"
-                )
+            is_envelope = self._is_envelope_forces(column_map, headers)
 
             for row in reader:
                 try:
@@ -1988,6 +2038,29 @@ class GenericCSVAdapter(InputAdapter):
 
         return beams
 
+    def _check_forces_columns(
+        self, column_map: Mapping[str, str], headers: Sequence[str]
+    ) -> None:
+        """Check that a forces file carries an identifier and a force column.
+
+        Raises:
+            ValueError: If the identifier or every force column is missing
+        """
+        if "beam_id" not in column_map:
+            raise ValueError(
+                f"Missing beam identifier column. Expected one of: "
+                f"{self.FORCES_COLUMNS['beam_id']}. "
+                f"Available: {headers}"
+            )
+
+        # Need at least mu or vu
+        has_forces = "mu_knm" in column_map or "vu_kn" in column_map
+        if not has_forces:
+            raise ValueError(
+                "Missing force columns. Expected Mu (kN-m) or Vu (kN). "
+                f"Available: {headers}"
+            )
+
     def load_forces(
         self,
         source: Path | str,
@@ -2017,21 +2090,7 @@ class GenericCSVAdapter(InputAdapter):
             reader = csv.DictReader(f)
             headers = reader.fieldnames or []
             column_map = self._build_column_map(headers, self.FORCES_COLUMNS)
-
-            if "beam_id" not in column_map:
-                raise ValueError(
-                    f"Missing beam identifier column. Expected one of: "
-                    f"{self.FORCES_COLUMNS['beam_id']}. "
-                    f"Available: {headers}"
-                )
-
-            # Need at least mu or vu
-            has_forces = "mu_knm" in column_map or "vu_kn" in column_map
-            if not has_forces:
-                raise ValueError(
-                    "Missing force columns. Expected Mu (kN-m) or Vu (kN). "
-                    f"Available: {headers}"
-                )
+            self._check_forces_columns(column_map, headers)
 
             for row_number, row in enumerate(reader, start=2):
                 try:
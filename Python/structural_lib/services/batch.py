@@ -5,8 +5,9 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from copy import deepcopy
+from functools import partial
 from typing import Any
 
 from . import api
@@ -31,6 +32,8 @@ __all__ = [
     "design_beams_iter",
     "design_project_beams_iter_v1",
     "design_project_beams_v1",
+    "prepare_project_beam_member_v1",
+    "prepare_project_beam_members_v1",
     "validate_project_beam_batch_v1",
 ]
 
@@ -194,43 +197,45 @@ def _validate_batch(
             for validation, extra in zip(validations, additional_issues, strict=True)
         ]
 
-    member_ids = [
-        (
-            validation.value.member_id
-            if validation.value is not None
-            else validation.member_id_hint
-        )
-        for validation in validations
-    ]
+    member_ids = [_member_identity(validation) for validation in validations]
     counts = Counter(member_id for member_id in member_ids if member_id is not None)
     duplicate_ids = {member_id for member_id, count in counts.items() if count > 1}
     if not duplicate_ids:
         return validations
 
-    duplicate_issue = {
-        member_id: _issue(
-            "PROJECT_BEAM_DUPLICATE_MEMBER_ID",
-            "member_id",
-            f"Member identity {member_id!r} occurs more than once in the batch.",
-        )
-        for member_id in duplicate_ids
-    }
     blocked: list[ProjectBeamInputValidationV1] = []
     for validation, member_id in zip(validations, member_ids, strict=True):
         if member_id not in duplicate_ids:
             blocked.append(validation)
             continue
         assert member_id is not None  # narrowed by membership in set[str]
-        blocked.append(
-            ProjectBeamInputValidationV1(
-                value=None,
-                issues=validation.issues + (duplicate_issue[member_id],),
-                member_id_hint=member_id,
-            )
-        )
+        blocked.append(_blocked_duplicate(validation, member_id))
     return blocked
 
 
+def _member_identity(validation: ProjectBeamInputValidationV1) -> str | None:
+    if validation.value is not None:
+        return validation.value.member_id
+    return validation.member_id_hint
+
+
+def _blocked_duplicate(
+    validation: ProjectBeamInputValidationV1, member_id: str
+) -> ProjectBeamInputValidationV1:
+    return ProjectBeamInputValidationV1(
+        value=None,
+        issues=validation.issues
+        + (
+            _issue(
+                "PROJECT_BEAM_DUPLICATE_MEMBER_ID",
+                "member_id",
+                f"Member identity {member_id!r} occurs more than once in the batch.",
+            ),
+        ),
+        member_id_hint=member_id,
+    )
+
+
 def _calculation_payload(
     beam: ProjectBeamDesignInputV1,
     *,
@@ -462,6 +467,17 @@ def _prepare_validations(
     return validations
 
 
+def _validated_member(
+    validation: ProjectBeamInputValidationV1,
+    index: int,
+    *,
+    units: str,
+) -> ProjectBeamMemberResultV1:
+    if validation.value is None:
+        return _blocked_member(validation, index)
+    return _calculated_member(validation.value, index, units=units)
+
+
 def _iter_validated_members(
     validations: Sequence[ProjectBeamInputValidationV1],
     *,
@@ -470,11 +486,7 @@ def _iter_validated_members(
     """Calculate accepted members only as their result is requested."""
 
     for index, validation in enumerate(validations):
-        yield (
-            _blocked_member(validation, index)
-            if validation.value is None
-            else _calculated_member(validation.value, index, units=units)
-        )
+        yield _validated_member(validation, index, units=units)
 
 
 def _design_project_batch(
@@ -523,6 +535,50 @@ def design_project_beams_iter_v1(
     return _iter_validated_members(validations, units=units)
 
 
+def prepare_project_beam_members_v1(
+    beams: Iterable[Mapping[str, Any] | ProjectBeamDesignInputV1],
+    *,
+    units: str = "IS456",
+) -> list[Callable[[], ProjectBeamMemberResultV1]]:
+    """Validate the whole batch and return one deferred calculation per member.
+
+    Each callable is independent and picklable, so callers may run them on a
+    thread or process pool in any order. Calling them in order yields the
+    same members as :func:`design_project_beams_iter_v1`.
+    """
+
+    validations = _prepare_validations(list(beams), units=units)
+    return [
+        partial(_validated_member, validation, index, units=units)
+        for index, validation in enumerate(validations)
+    ]
+
+
+def prepare_project_beam_member_v1(
+    beam: Mapping[str, Any] | ProjectBeamDesignInputV1 | None,
+    index: int,
+    *,
+    seen_member_ids: set[str],
+    units: str = "IS456",
+) -> Callable[[], ProjectBeamMemberResultV1]:
+    """Validate one member of a stream whose length is not known up front.
+
+    ``seen_member_ids`` carries member identities between calls and is
+    updated in place. Unlike whole-batch validation, which blocks every
+    occurrence of a duplicate identity, only repeats after the first are
+    blocked: the first member's result may already have been sent. A
+    ``beam`` that is not an object yields a blocked member.
+    """
+
+    (validation,) = _prepare_validations([beam], units=units)  # type: ignore[list-item]
+    member_id = _member_identity(validation)
+    if member_id is not None:
+        if member_id in seen_member_ids:
+            validation = _blocked_duplicate(validation, member_id)
+        seen_member_ids.add(member_id)
+    return partial(_validated_member, validation, index, units=units)
+
+
 def _prepare_legacy_validations(
     beams: Iterable[Any],
     *,
@@ -0,0 +1,585 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Columnar bar bending schedule for whole projects.
+
+:func:`~structural_lib.services.bbs.generate_bbs_from_detailing` builds a
+``BBSLineItem`` per bar group, computing each cut length and weight with
+scalar calls and sorting each beam's items to assign its bar marks. Project
+schedules then loop over beams to concatenate items and rebuild totals.
+
+This module reads every beam's bar arrangements once into typed NumPy
+columns, nine slots per beam (bottom, top and stirrups at start, mid and
+end), and computes the schedule over the columns:
+
+- cut lengths and stirrup hooks as array expressions of the scalar rules
+- weights once per distinct (diameter, length), so every value matches the
+  scalar rounding exactly
+- bar marks from one stable ``lexsort`` over the whole project
+- totals by diameter, storey, member or bar location with ``bincount``
+
+Rows, marks and totals are the same as the per-beam functions produce. CSV
+rows are written straight from the columns; ``BBSLineItem`` objects are only
+created when asked for.
+
+NumPy is an optional dependency: ``pip install structural-lib-is456[columnar]``.
+
+Example:
+    >>> schedule = ProjectBBS.from_detailings(detailing_list)
+    >>> schedule.write_bbs_csv("bbs.csv")
+    >>> schedule.summaries_by("story")["GF"].total_weight_kg
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+try:
+    import numpy as np
+except ModuleNotFoundError as exc:  # pragma: no cover - exercised without numpy
+    raise ModuleNotFoundError(
+        "Columnar BBS requires the optional 'columnar' extra. "
+        "Install structural-lib-is456[columnar]."
+    ) from exc
+
+from structural_lib.codes.is456.beam.detailing import BeamDetailingResult
+
+from .bbs import (
+    LENGTH_ROUND_MM,
+    WEIGHT_ROUND_DECIMALS,
+    BBSDocument,
+    BBSLineItem,
+    BBSummary,
+    _bar_mark_loc_code,
+    _bar_mark_zone_code,
+    _normalize_member_id,
+    calculate_bar_weight,
+    export_bom_summary_csv,
+)
+
+__all__ = [
+    "BBS_CSV_FIELDS",
+    "LOCATIONS",
+    "ZONES",
+    "ProjectBBS",
+]
+
+# Slot order within a beam, as generate_bbs_from_detailing emits items
+LOCATIONS = ("bottom", "top", "stirrup")
+ZONES = ("start", "mid", "end")
+_SLOTS = len(LOCATIONS) * len(ZONES)
+_STIRRUP = LOCATIONS.index("stirrup")
+
+# Columns of export_bbs_to_csv
+BBS_CSV_FIELDS = (
+    "bar_mark",
+    "member_id",
+    "location",
+    "zone",
+    "shape_code",
+    "diameter_mm",
+    "no_of_bars",
+    "cut_length_mm",
+    "total_length_mm",
+    "unit_weight_kg",
+    "total_weight_kg",
+    "remarks",
+)
+
+GroupKey = Literal["diameter", "story", "member_id", "location"]
+
+
+def _rank(codes: Iterable[str]) -> np.ndarray:
+    """Sort rank of each code letter, matching string comparison."""
+    letters = list(codes)
+    order = sorted(range(len(letters)), key=letters.__getitem__)
+    rank = np.empty(len(letters), dtype=np.int64)
+    rank[order] = np.arange(len(letters))
+    return rank
+
+
+# Bar mark sort ranks of each location and zone by their mark letter
+_LOC_RANK = _rank(_bar_mark_loc_code(loc) for loc in LOCATIONS)
+_ZONE_RANK = _rank(_bar_mark_zone_code(zone) for zone in ZONES)
+
+
+def _round_length(length_mm: np.ndarray) -> np.ndarray:
+    return (np.round(length_mm / LENGTH_ROUND_MM) * LENGTH_ROUND_MM).astype(np.int64)
+
+
+class _EmptySlot:
+    """Zone a detailing leaves without bars or stirrups."""
+
+    diameter = count = legs = spacing = zone_length = 0
+
+
+_EMPTY_SLOT = _EmptySlot()
+
+
+def _three(arrangements: list[Any]) -> list[Any]:
+    """Start, mid and end arrangements, as the per-beam schedule zips them."""
+    if len(arrangements) == len(ZONES):
+        return arrangements
+    return [*arrangements[: len(ZONES)]] + [_EMPTY_SLOT] * (
+        len(ZONES) - len(arrangements)
+    )
+
+
+def _pair_weights(
+    diameters: np.ndarray, lengths: np.ndarray, *, round_weight: bool
+) -> np.ndarray:
+    """``calculate_bar_weight`` per row, evaluated once per distinct pair."""
+    dias, dia_code = np.unique(diameters, return_inverse=True)
+    # Lengths are whole millimetres, so one integer keys each pair
+    stride = int(lengths.max(initial=0)) + 1
+    pairs, inverse = np.unique(
+        dia_code.reshape(-1) * stride + lengths, return_inverse=True
+    )
+    dia_of_pair, length_of_pair = np.divmod(pairs, stride)
+    weights = np.array(
+        [
+            calculate_bar_weight(dia, length, round_weight=round_weight)
+            for dia, length in zip(
+                dias[dia_of_pair].tolist(), length_of_pair.tolist(), strict=True
+            )
+        ]
+    )
+    if not round_weight:
+        weights = np.array([round(w, WEIGHT_ROUND_DECIMALS) for w in weights])
+    return weights[inverse.reshape(-1)] if len(weights) else np.zeros(0)
+
+
+@dataclass(frozen=True)
+class ProjectBBS:
+    """Bar bending schedule of a project as typed columns, one row per item.
+
+    Rows follow beam order, then the per-beam item order of
+    :func:`~structural_lib.services.bbs.generate_bbs_from_detailing`.
+
+    Attributes:
+        member_ids: Beam ID of each member
+        stories: Storey of each member
+        member_index: Index into ``member_ids`` per row
+        location: Index into ``LOCATIONS`` per row
+        zone: Index into ``ZONES`` per row
+        diameter_mm: Bar diameter per row
+        no_of_bars: Bars (or stirrups) per row
+        cut_length_mm: Cut length per bar, rounded to ``LENGTH_ROUND_MM``
+        total_length_mm: ``no_of_bars`` × ``cut_length_mm``
+        unit_weight_kg: Weight of one bar, rounded
+        total_weight_kg: Weight of all bars of the row, rounded
+        a_mm: Shape dimension 'a' per row
+        b_mm: Shape dimension 'b' per row (stirrup inner height)
+        legs: Stirrup legs per row; 0 for main bars
+        spacing_mm: Stirrup spacing per row; 0 for main bars
+        mark_seq: Bar mark sequence number per row, counted per beam
+        diameter_values: Diameter per row as the detailing gave it, for output
+    """
+
+    member_ids: tuple[str, ...]
+    stories: tuple[str, ...]
+    member_index: np.ndarray
+    location: np.ndarray
+    zone: np.ndarray
+    diameter_mm: np.ndarray
+    no_of_bars: np.ndarray
+    cut_length_mm: np.ndarray
+    total_length_mm: np.ndarray
+    unit_weight_kg: np.ndarray
+    total_weight_kg: np.ndarray
+    a_mm: np.ndarray
+    b_mm: np.ndarray
+    legs: np.ndarray
+    spacing_mm: np.ndarray
+    mark_seq: np.ndarray
+    diameter_values: tuple[Any, ...]
+
+    @classmethod
+    def from_detailings(cls, detailings: Iterable[BeamDetailingResult]) -> ProjectBBS:
+        """Build the schedule of all beams, reading ``detailings`` once.
+
+        ``detailings`` may be a generator; only the bar arrangement numbers
+        of each beam are kept. Beams whose IDs normalize to the same mark
+        prefix share one mark sequence, so marks stay project-unique.
+        """
+        member_ids: list[str] = []
+        stories: list[str] = []
+        diameters: list[Any] = []
+        numbers: list[tuple[float, ...]] = []
+        for detailing in detailings:
+            b0, b1, b2 = _three(detailing.bottom_bars)
+            t0, t1, t2 = _three(detailing.top_bars)
+            s0, s1, s2 = _three(detailing.stirrups)
+            member_ids.append(detailing.beam_id)
+            stories.append(detailing.story)
+            diameters.extend(
+                (
+                    b0.diameter,
+                    b1.diameter,
+                    b2.diameter,
+                    t0.diameter,
+                    t1.diameter,
+                    t2.diameter,
+                    s0.diameter,
+                    s1.diameter,
+                    s2.diameter,
+                )
+            )
+            numbers.append(
+                (
+                    detailing.span,
+                    detailing.b,
+                    detailing.D,
+                    detailing.cover,
+                    detailing.ld_tension,
+                    detailing.ld_compression,
+                    b0.count,
+                    b1.count,
+                    b2.count,
+                    t0.count,
+                    t1.count,
+                    t2.count,
+                    s0.legs,
+                    s1.legs,
+                    s2.legs,
+                    s0.spacing,
+                    s1.spacing,
+                    s2.spacing,
+                    s0.zone_length,
+                    s1.zone_length,
+                    s2.zone_length,
+                )
+            )
+
+        n_members = len(member_ids)
+        table = np.asarray(numbers, dtype=np.float64).reshape(n_members, 21)
+        span, b, D, cover, ld_tension, ld_compression = table[:, :6].T
+        slots = np.zeros((4, n_members, _SLOTS))
+        slots[0, :, :6] = table[:, 6:12]
+        slots[1:, :, 6:] = table[:, 12:].reshape(n_members, 3, 3).transpose(1, 0, 2)
+        count, legs, spacing, zone_length = slots.reshape(4, -1)
+        location = np.tile(np.repeat(np.arange(len(LOCATIONS)), len(ZONES)), n_members)
+        zone = np.tile(np.arange(len(ZONES)), len(LOCATIONS) * n_members)
+        member_index = np.repeat(np.arange(n_members), _SLOTS)
+        dia = np.asarray(diameters, dtype=np.float64)
+        stirrup = location == _STIRRUP
+
+        # Main bars with bars; stirrup zones with a spacing and a length
+        keep = np.where(stirrup, (spacing > 0) & (zone_length > 0), count > 0)
+        rows = np.flatnonzero(keep)
+        member_index = member_index[rows]
+        location, zone, stirrup = location[rows], zone[rows], stirrup[rows]
+        dia, count, legs = dia[rows], count[rows], legs[rows]
+        spacing, zone_length = spacing[rows], zone_length[rows]
+        span, b, D, cover = (
+            span[member_index],
+            b[member_index],
+            D[member_index],
+            cover[member_index],
+        )
+
+        # calculate_straight_bar_length: bottom bars anchor with the tension
+        # development length, top bars with the compression one
+        ld = np.where(
+            location == 0, ld_tension[member_index], ld_compression[member_index]
+        )
+        main_cut = np.where(
+            zone == ZONES.index("mid"),
+            0.6 * span + 2 * ld,
+            span / 2 + ld + 100,
+        )
+        # calculate_stirrup_cut_length with 135° hooks (calculate_hook_length)
+        inner = 2 * (cover + 0.5 * dia)
+        hook = np.maximum(10 * dia, 75)
+        stirrup_cut = 2 * ((b - inner) + (D - inner)) + 2 * hook
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stirrups = np.floor(zone_length / np.where(stirrup, spacing, 1)) + 1
+        no_of_bars = np.where(stirrup, stirrups, count).astype(np.int64)
+        cut_length = _round_length(np.where(stirrup, stirrup_cut, main_cut))
+        total_length = cut_length * no_of_bars
+
+        # Bar marks: one stable sort by the assign_bar_marks key
+        prefixes = [_normalize_member_id(member_id) for member_id in member_ids]
+        _, prefix_rank = np.unique(
+            np.asarray(prefixes, dtype=object), return_inverse=True
+        )
+        row_prefix = prefix_rank.reshape(-1)[member_index]
+        order = np.lexsort(
+            (
+                cut_length,
+                stirrup,  # shape code: "A" main bar, "E" stirrup
+                np.round(dia).astype(np.int64),
+                _ZONE_RANK[zone],
+                _LOC_RANK[location],
+                row_prefix,
+            )
+        )
+        sorted_prefix = row_prefix[order]
+        first = np.searchsorted(sorted_prefix, sorted_prefix, side="left")
+        mark_seq = np.empty(len(rows), dtype=np.int64)
+        mark_seq[order] = np.arange(len(rows)) - first + 1
+
+        return cls(
+            member_ids=tuple(member_ids),
+            stories=tuple(stories),
+            member_index=member_index,
+            location=location,
+            zone=zone,
+            diameter_mm=dia,
+            no_of_bars=no_of_bars,
+            cut_length_mm=cut_length,
+            total_length_mm=total_length,
+            unit_weight_kg=_pair_weights(dia, cut_length, round_weight=True),
+            total_weight_kg=_pair_weights(dia, total_length, round_weight=False),
+            a_mm=np.where(stirrup, b - 2 * cover, cut_length),
+            b_mm=np.where(stirrup, D - 2 * cover, 0.0),
+            legs=legs.astype(np.int64),
+            spacing_mm=spacing,
+            mark_seq=mark_seq,
+            diameter_values=tuple(np.array(diameters, dtype=object)[rows].tolist()),
+        )
+
+    def __len__(self) -> int:
+        return len(self.member_index)
+
+    # -------------------------------------------------------------------------
+    # Rows
+    # -------------------------------------------------------------------------
+
+    def bar_marks(self, start: int = 0, stop: int | None = None) -> list[str]:
+        """Bar mark per row, formatted as ``assign_bar_marks`` does."""
+        rows = slice(start, stop)
+        prefixes = [_normalize_member_id(member_id) for member_id in self.member_ids]
+        loc_codes = [_bar_mark_loc_code(loc) for loc in LOCATIONS]
+        zone_codes = [_bar_mark_zone_code(zone) for zone in ZONES]
+        return [
+            f"{prefixes[m]}-{loc_codes[loc]}-{zone_codes[z]}-D{dia}-{seq:02d}"
+            for m, loc, z, dia, seq in zip(
+                self.member_index[rows].tolist(),
+                self.location[rows].tolist(),
+                self.zone[rows].tolist(),
+                np.round(self.diameter_mm[rows]).astype(np.int64).tolist(),
+                self.mark_seq[rows].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _remarks(self, rows: slice) -> list[str]:
+        remarks: dict[tuple[int, int, float, int, float], str] = {}
+        out = []
+        for key in zip(
+            self.location[rows].tolist(),
+            self.zone[rows].tolist(),
+            self.diameter_mm[rows].tolist(),
+            np.where(
+                self.location[rows] == _STIRRUP,
+                self.legs[rows],
+                self.no_of_bars[rows],
+            ).tolist(),
+            self.spacing_mm[rows].tolist(),
+            strict=True,
+        ):
+            remark = remarks.get(key)
+            if remark is None:
+                loc, z, dia, count, spacing = key
+                if loc == _STIRRUP:
+                    callout = f"{count}L-{int(dia)}φ@{int(spacing)}"
+                else:
+                    callout = f"{count}-{int(dia)}φ"
+                remark = f"{LOCATIONS[loc].capitalize()} {ZONES[z]} - {callout}"
+                remarks[key] = remark
+            out.append(remark)
+        return out
+
+    def iter_rows(self, block_size: int = 8192) -> Iterator[tuple[Any, ...]]:
+        """Yield ``BBS_CSV_FIELDS`` values per row, without line item objects.
+
+        Rows are formatted ``block_size`` at a time from the columns.
+        """
+        member_ids = np.array(self.member_ids, dtype=object)
+        locations = np.array(LOCATIONS, dtype=object)
+        zones = np.array(ZONES, dtype=object)
+        shapes = np.array(["A"] * _STIRRUP + ["E"], dtype=object)
+        for start in range(0, len(self), block_size):
+            rows = slice(start, start + block_size)
+            yield from zip(
+                self.bar_marks(start, start + block_size),
+                member_ids[self.member_index[rows]].tolist(),
+                locations[self.location[rows]].tolist(),
+                zones[self.zone[rows]].tolist(),
+                shapes[self.location[rows]].tolist(),
+                self.diameter_values[rows],
+                self.no_of_bars[rows].tolist(),
+                self.cut_length_mm[rows].tolist(),
+                self.total_length_mm[rows].tolist(),
+                self.unit_weight_kg[rows].tolist(),
+                self.total_weight_kg[rows].tolist(),
+                self._remarks(rows),
+                strict=True,
+            )
+
+    def iter_items(self) -> Iterator[BBSLineItem]:
+        """Yield the rows as ``BBSLineItem`` objects, one at a time."""
+        for values, a_mm, b_mm in zip(
+            self.iter_rows(), self.a_mm.tolist(), self.b_mm.tolist(), strict=True
+        ):
+            row = dict(zip(BBS_CSV_FIELDS, values, strict=True))
+            yield BBSLineItem(**row, a_mm=a_mm, b_mm=b_mm)
+
+    def to_document(self, project_name: str = "Beam BBS") -> BBSDocument:
+        """Materialize a ``BBSDocument``, as ``generate_bbs_document`` returns."""
+        return BBSDocument(
+            project_name=project_name,
+            member_ids=list(self.member_ids),
+            items=list(self.iter_items()),
+            summary=self.summary("PROJECT"),
+        )
+
+    # -------------------------------------------------------------------------
+    # Totals
+    # -------------------------------------------------------------------------
+
+    def _group_codes(self, by: GroupKey) -> tuple[np.ndarray, list[Any]]:
+        if by in ("member_id", "story"):
+            names = self.member_ids if by == "member_id" else self.stories
+            labels, codes = np.unique(
+                np.asarray(names, dtype=object), return_inverse=True
+            )
+            return codes.reshape(-1)[self.member_index], labels.tolist()
+        if by == "location":
+            return self.location, list(LOCATIONS)
+        if by == "diameter":
+            labels, codes = np.unique(self.diameter_mm, return_inverse=True)
+            return codes.reshape(-1), labels.tolist()
+        raise ValueError(
+            f"Unknown group key {by!r}; use diameter, story, member_id or location"
+        )
+
+    def _summaries(self, codes: np.ndarray, labels: list[Any]) -> dict[Any, BBSummary]:
+        """``calculate_bbs_summary`` of each group of rows, in label order."""
+        n_groups = len(labels)
+        diameters, dia_code = np.unique(self.diameter_mm, return_inverse=True)
+        pair = codes * len(diameters) + dia_code.reshape(-1)
+        pairs, first, inverse = np.unique(pair, return_index=True, return_inverse=True)
+        pair_length = np.bincount(inverse, weights=self.total_length_mm)
+        pair_count = np.bincount(inverse, weights=self.no_of_bars)
+
+        length_by_dia: list[dict[float, float]] = [{} for _ in range(n_groups)]
+        count_by_dia: list[dict[float, int]] = [{} for _ in range(n_groups)]
+        # Diameters in first-row order, so totals add up in the scalar order
+        for p in np.argsort(first, kind="stable").tolist():
+            group, d = divmod(int(pairs[p]), len(diameters))
+            dia = float(diameters[d])
+            length_by_dia[group][dia] = float(pair_length[p])
+            count_by_dia[group][dia] = int(pair_count[p])
+
+        items = np.bincount(codes, minlength=n_groups)
+        summaries: dict[Any, BBSummary] = {}
+        for group, label in enumerate(labels):
+            if not items[group]:
+                continue
+            weight_by_dia = {
+                dia: calculate_bar_weight(dia, length, round_weight=False)
+                for dia, length in length_by_dia[group].items()
+            }
+            total_weight = 0.0
+            for weight in weight_by_dia.values():
+                total_weight += weight
+            total_length = sum(length_by_dia[group].values())
+            summaries[label] = BBSummary(
+                member_id=str(label),
+                total_items=int(items[group]),
+                total_bars=sum(count_by_dia[group].values()),
+                total_length_m=round(total_length / 1000, 2),
+                total_weight_kg=round(total_weight, WEIGHT_ROUND_DECIMALS),
+                weight_by_diameter={
+                    k: round(v, WEIGHT_ROUND_DECIMALS)
+                    for k, v in sorted(weight_by_dia.items())
+                },
+                length_by_diameter={
+                    k: round(v / 1000, 2)
+                    for k, v in sorted(length_by_dia[group].items())
+                },
+                count_by_diameter=dict(sorted(count_by_dia[group].items())),
+            )
+        return summaries
+
+    def summary(self, member_id: str = "PROJECT") -> BBSummary:
+        """Project totals, equal to ``calculate_bbs_summary`` of all items."""
+        if not len(self):
+            return BBSummary(
+                member_id=member_id,
+                total_items=0,
+                total_bars=0,
+                total_length_m=0.0,
+                total_weight_kg=0.0,
+            )
+        summary = self._summaries(np.zeros(len(self), dtype=np.int64), [member_id])
+        return summary[member_id]
+
+    def summaries_by(self, by: GroupKey) -> dict[Any, BBSummary]:
+        """Totals per diameter, storey, member or bar location.
+
+        Each summary equals ``calculate_bbs_summary`` of the group's items,
+        with ``member_id`` set to the group label.
+
+        Args:
+            by: ``"diameter"``, ``"story"``, ``"member_id"`` or ``"location"``
+
+        Returns:
+            Summary per group label; locations in ``LOCATIONS`` order, other
+            labels sorted
+        """
+        return self._summaries(*self._group_codes(by))
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+
+    def write_bbs_csv(
+        self, output_path: str | Path, include_summary: bool = True
+    ) -> str:
+        """Write the schedule as ``export_bbs_to_csv`` would, row by row.
+
+        Args:
+            output_path: Output file path
+            include_summary: Whether to append the total row
+
+        Returns:
+            Path to the created file
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(BBS_CSV_FIELDS)
+            writer.writerows(self.iter_rows())
+            if include_summary:
+                summary = self.summary("TOTAL")
+                writer.writerow([""] * len(BBS_CSV_FIELDS))
+                writer.writerow(
+                    [
+                        "TOTAL",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        summary.total_bars,
+                        "",
+                        summary.total_length_m * 1000,
+                        "",
+                        summary.total_weight_kg,
+                        f"{summary.total_items} line items",
+                    ]
+                )
+        return str(path)
+
+    def write_bom_summary_csv(
+        self, output_path: str | Path, member_id: str = "PROJECT"
+    ) -> str:
+        """Write the project bill of materials via ``export_bom_summary_csv``."""
+        return export_bom_summary_csv(self.summary(member_id), str(output_path))
@@ -27,6 +27,7 @@ from structural_lib.core.data_types import (
     DeflectionParams,
 )
 from structural_lib.core.inputs import BeamInput
+from structural_lib.core.instrumentation import stage
 from structural_lib.insights import cost_optimization, design_suggestions
 from structural_lib.services import bbs, beam_pipeline, report
 from structural_lib.services.common_api import (
@@ -553,6 +554,7 @@ def compute_dxf(
             sheet_margin_mm=sheet_margin_mm,
             title_block_width_mm=title_block_width_mm,
             title_block_height_mm=title_block_height_mm,
+            use_blocks=True,
         )
     else:
         _dxf_export.generate_beam_dxf(
@@ -1176,97 +1178,99 @@ def design_beam_is456(
         )
     """
 
-    _require_is456_units(units)
-    depth_resolution = resolve_effective_depth_v1(
-        D_mm=D_mm,
-        d_mm=d_mm,
-        effective_depth_basis=effective_depth_basis,
-    )
-    d_mm = depth_resolution.d_mm
-    if d_dash_mm is None:
-        d_dash_mm = D_mm - d_mm if effective_depth_basis is not None else 50.0
-
-    for name, value in (
-        ("mu_knm", mu_knm),
-        ("vu_kn", vu_kn),
-        ("b_mm", b_mm),
-        ("D_mm", D_mm),
-        ("d_mm", d_mm),
-        ("fck_nmm2", fck_nmm2),
-        ("fy_nmm2", fy_nmm2),
-        ("d_dash_mm", d_dash_mm),
-        ("asv_mm2", asv_mm2),
-        ("tu_knm", tu_knm),
-    ):
-        _require_finite_real(name, value)
-
-    if tu_knm < 0:
-        raise ValueError("tu_knm must be >= 0.")
-
-    if tu_knm > 0:
-        if cover_mm is None:
-            raise ValueError(
-                "TORSION_SCOPE_HOLD: cover_mm is required when tu_knm > 0."
-            )
-        _require_finite_real("cover_mm", cover_mm)
-        _require_finite_real("stirrup_dia_mm", stirrup_dia_mm)
-        if not 15 <= fck_nmm2 <= 40:
-            raise ValueError(
-                "TORSION_SCOPE_HOLD: primary-route torsion is limited to "
-                "fck_nmm2 from 15 to 40 N/mm²."
-            )
-        if fy_nmm2 > 500:
-            raise ValueError(
-                "TORSION_SCOPE_HOLD: primary-route torsion is limited to "
-                "fy_nmm2 <= 500 N/mm²."
-            )
-        if cover_mm <= 0 or stirrup_dia_mm <= 0:
-            raise ValueError(
-                "TORSION_SCOPE_HOLD: cover_mm and stirrup_dia_mm must be positive."
-            )
-        b1_mm = b_mm - 2 * (cover_mm + stirrup_dia_mm / 2)
-        d1_mm = D_mm - 2 * (cover_mm + stirrup_dia_mm / 2)
-        if b1_mm <= 0 or d1_mm <= 0:
-            raise ValueError(
-                "TORSION_SCOPE_HOLD: cover and stirrup diameter leave no positive "
-                "closed-stirrup core."
-            )
-
-    # Unit plausibility guards (catch common mistakes)
-    _validate_plausibility(
-        fck_nmm2=fck_nmm2,
-        fy_nmm2=fy_nmm2,
-        b_mm=b_mm,
-        d_mm=d_mm,
-        D_mm=D_mm,
-        mu_knm=mu_knm,
-        vu_kn=vu_kn,
-        d_dash_mm=d_dash_mm,
-        asv_mm2=asv_mm2,
-        pt_percent=pt_percent,
-        ast_mm2_for_shear=ast_mm2_for_shear,
-    )
-    _require_table_19_concrete_domain(fck_nmm2)
+    with stage("beam.validate"):
+        _require_is456_units(units)
+        depth_resolution = resolve_effective_depth_v1(
+            D_mm=D_mm,
+            d_mm=d_mm,
+            effective_depth_basis=effective_depth_basis,
+        )
+        d_mm = depth_resolution.d_mm
+        if d_dash_mm is None:
+            d_dash_mm = D_mm - d_mm if effective_depth_basis is not None else 50.0
+
+        for name, value in (
+            ("mu_knm", mu_knm),
+            ("vu_kn", vu_kn),
+            ("b_mm", b_mm),
+            ("D_mm", D_mm),
+            ("d_mm", d_mm),
+            ("fck_nmm2", fck_nmm2),
+            ("fy_nmm2", fy_nmm2),
+            ("d_dash_mm", d_dash_mm),
+            ("asv_mm2", asv_mm2),
+            ("tu_knm", tu_knm),
+        ):
+            _require_finite_real(name, value)
+
+        if tu_knm < 0:
+            raise ValueError("tu_knm must be >= 0.")
+
+        if tu_knm > 0:
+            if cover_mm is None:
+                raise ValueError(
+                    "TORSION_SCOPE_HOLD: cover_mm is required when tu_knm > 0."
+                )
+            _require_finite_real("cover_mm", cover_mm)
+            _require_finite_real("stirrup_dia_mm", stirrup_dia_mm)
+            if not 15 <= fck_nmm2 <= 40:
+                raise ValueError(
+                    "TORSION_SCOPE_HOLD: primary-route torsion is limited to "
+                    "fck_nmm2 from 15 to 40 N/mm²."
+                )
+            if fy_nmm2 > 500:
+                raise ValueError(
+                    "TORSION_SCOPE_HOLD: primary-route torsion is limited to "
+                    "fy_nmm2 <= 500 N/mm²."
+                )
+            if cover_mm <= 0 or stirrup_dia_mm <= 0:
+                raise ValueError(
+                    "TORSION_SCOPE_HOLD: cover_mm and stirrup_dia_mm must be positive."
+                )
+            b1_mm = b_mm - 2 * (cover_mm + stirrup_dia_mm / 2)
+            d1_mm = D_mm - 2 * (cover_mm + stirrup_dia_mm / 2)
+            if b1_mm <= 0 or d1_mm <= 0:
+                raise ValueError(
+                    "TORSION_SCOPE_HOLD: cover and stirrup diameter leave no positive "
+                    "closed-stirrup core."
+                )
 
-    result = compliance.check_compliance_case(
-        case_id=case_id,
-        mu_knm=mu_knm,
-        vu_kn=vu_kn,
-        b_mm=b_mm,
-        D_mm=D_mm,
-        d_mm=d_mm,
-        fck_nmm2=fck_nmm2,
-        fy_nmm2=fy_nmm2,
-        d_dash_mm=d_dash_mm,
-        asv_mm2=asv_mm2,
-        pt_percent=pt_percent,
-        ast_mm2_for_shear=ast_mm2_for_shear,
-        deflection_params=deflection_params,
-        crack_width_params=crack_width_params,
-        tu_knm=tu_knm,
-        cover_mm=cover_mm,
-        stirrup_dia_mm=stirrup_dia_mm,
-    )
+        # Unit plausibility guards (catch common mistakes)
+        _validate_plausibility(
+            fck_nmm2=fck_nmm2,
+            fy_nmm2=fy_nmm2,
+            b_mm=b_mm,
+            d_mm=d_mm,
+            D_mm=D_mm,
+            mu_knm=mu_knm,
+            vu_kn=vu_kn,
+            d_dash_mm=d_dash_mm,
+            asv_mm2=asv_mm2,
+            pt_percent=pt_percent,
+            ast_mm2_for_shear=ast_mm2_for_shear,
+        )
+        _require_table_19_concrete_domain(fck_nmm2)
+
+    with stage("beam.compliance"):
+        result = compliance.check_compliance_case(
+            case_id=case_id,
+            mu_knm=mu_knm,
+            vu_kn=vu_kn,
+            b_mm=b_mm,
+            D_mm=D_mm,
+            d_mm=d_mm,
+            fck_nmm2=fck_nmm2,
+            fy_nmm2=fy_nmm2,
+            d_dash_mm=d_dash_mm,
+            asv_mm2=asv_mm2,
+            pt_percent=pt_percent,
+            ast_mm2_for_shear=ast_mm2_for_shear,
+            deflection_params=deflection_params,
+            crack_width_params=crack_width_params,
+            tu_knm=tu_knm,
+            cover_mm=cover_mm,
+            stirrup_dia_mm=stirrup_dia_mm,
+        )
     result.effective_depth_resolution = depth_resolution.to_dict()
     from structural_lib.services.evidence import (
         build_beam_evidence_envelope,
@@ -1285,38 +1289,40 @@ def design_beam_is456(
             return dict(value)
         raise TypeError("Serviceability parameters must expose a mapping contract.")
 
-    evidence = build_beam_evidence_envelope(
-        inputs={
-            "units": units,
-            "case_id": case_id,
-            "mu_knm": mu_knm,
-            "vu_kn": vu_kn,
-            "b_mm": b_mm,
-            "D_mm": D_mm,
-            "d_mm": d_mm,
-            "fck_nmm2": fck_nmm2,
-            "fy_nmm2": fy_nmm2,
-            "d_dash_mm": d_dash_mm,
-            "asv_mm2": asv_mm2,
-            "pt_percent": pt_percent,
-            "ast_mm2_for_shear": ast_mm2_for_shear,
-            "tu_knm": tu_knm,
-            "cover_mm": cover_mm,
-            "stirrup_dia_mm": stirrup_dia_mm,
-            "include_serviceability": (
-                deflection_params is not None or crack_width_params is not None
-            ),
-            "deflection_params": _parameter_mapping(deflection_params),
-            "crack_width_params": _parameter_mapping(crack_width_params),
-        },
-        is_ok=result.is_ok,
-        governing_utilization=result.governing_utilization,
-        utilizations=result.utilizations,
-    )
-    result.result_envelope = build_beam_result_envelope(
-        is_ok=result.is_ok,
-        evidence=evidence,
-    ).to_dict()
+    with stage("beam.evidence"):
+        evidence = build_beam_evidence_envelope(
+            inputs={
+                "units": units,
+                "case_id": case_id,
+                "mu_knm": mu_knm,
+                "vu_kn": vu_kn,
+                "b_mm": b_mm,
+                "D_mm": D_mm,
+                "d_mm": d_mm,
+                "fck_nmm2": fck_nmm2,
+                "fy_nmm2": fy_nmm2,
+                "d_dash_mm": d_dash_mm,
+                "asv_mm2": asv_mm2,
+                "pt_percent": pt_percent,
+                "ast_mm2_for_shear": ast_mm2_for_shear,
+                "tu_knm": tu_knm,
+                "cover_mm": cover_mm,
+                "stirrup_dia_mm": stirrup_dia_mm,
+                "include_serviceability": (
+                    deflection_params is not None or crack_width_params is not None
+                ),
+                "deflection_params": _parameter_mapping(deflection_params),
+                "crack_width_params": _parameter_mapping(crack_width_params),
+            },
+            is_ok=result.is_ok,
+            governing_utilization=result.governing_utilization,
+            utilizations=result.utilizations,
+        )
+    with stage("beam.envelope"):
+        result.result_envelope = build_beam_result_envelope(
+            is_ok=result.is_ok,
+            evidence=evidence,
+        ).to_dict()
     return result
 
 
@@ -37,8 +37,6 @@ from structural_lib.services.project_beam import (
     resolve_effective_depth_v1,
 )
 
-from . import api
-
 # =============================================================================
 # Schema Version
 # =============================================================================
@@ -392,7 +390,10 @@ def design_single_beam(
             support_condition=support_condition,
         )
 
-    # Run design via existing API
+    # Run design via existing API. Imported here: the api facade imports this
+    # module, so a module-level import is circular.
+    from . import api
+
     case_result = api.design_beam_is456(
         units=validated_units,
         case_id=case_id,
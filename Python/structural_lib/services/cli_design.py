@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from structural_lib.core.data_types import CrackWidthParams, DeflectionParams
+from structural_lib.core.instrumentation import stage
 
 from . import beam_pipeline
 from .batch import validate_project_beam_batch_v1
@@ -525,9 +526,11 @@ def load_cli_design_input_v1(
     input_path = Path(path)
     suffix = input_path.suffix.lower()
     if suffix == ".csv":
-        return _load_csv(input_path, input_format=input_format)
+        with stage("cli.parse"):
+            return _load_csv(input_path, input_format=input_format)
     if suffix == ".json":
-        return _load_json(input_path)
+        with stage("cli.parse"):
+            return _load_json(input_path)
     raise CLIDesignBlockedError(
         [
             _issue(
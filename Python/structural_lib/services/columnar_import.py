@@ -0,0 +1,795 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Columnar fast path for large analysis-export CSV files.
+
+The row adapters parse one ``csv.DictReader`` row at a time with a ``float()``
+and finiteness check per cell. Station-level force exports from ETABS, SAFE
+and STAAD routinely reach hundreds of thousands of rows, so this module maps
+the detected columns once, converts numeric columns to typed NumPy arrays in
+bulk and dictionary-encodes the identity columns (story, label, case).
+
+Bad cells are flagged through vectorized masks, and the adapter entry points
+raise or skip exactly where their row-by-row counterparts do, so both paths
+return the same canonical ``BeamForces`` records. Only the force records come
+from the masks: the lossless import ledger is still built row by row, also
+when ``columnar=True``.
+
+NumPy is an optional dependency: ``pip install structural-lib-is456[columnar]``.
+
+Example:
+    >>> from structural_lib.services.adapters import ETABSAdapter
+    >>> forces = ETABSAdapter().load_forces_columnar("beam_forces.csv")
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from operator import methodcaller
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np
+except ModuleNotFoundError as exc:  # pragma: no cover - exercised without numpy
+    raise ModuleNotFoundError(
+        "Columnar CSV import requires the optional 'columnar' extra. "
+        "Install structural-lib-is456[columnar]."
+    ) from exc
+
+from structural_lib.core.models import BeamForces
+
+from .adapters import (
+    ETABSAdapter,
+    GenericCSVAdapter,
+    InputAdapter,
+    SAFEAdapter,
+    STAADAdapter,
+)
+
+__all__ = [
+    "CategoricalColumn",
+    "ColumnarFrame",
+    "NumericColumn",
+    "load_forces_columnar",
+    "read_columnar_csv",
+]
+
+_ETABS_RAW_BASIS = "independent_absolute_extrema_with_concurrent_values"
+_ETABS_ENVELOPE_BASIS = "source_precomputed_extrema_provenance_unavailable"
+
+
+# =============================================================================
+# Columnar containers
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class NumericColumn:
+    """One numeric source column parsed in bulk.
+
+    Attributes:
+        header: Actual CSV header the column was read from
+        values: float64 values; NaN wherever the cell is missing or malformed
+        missing: True where the stripped cell is empty
+        padded: True where a missing cell is whitespace rather than empty
+        malformed: True where the cell is not a number
+        non_finite: True where the cell parses to NaN or +/-inf
+        bad_text: Raw text of the malformed and non-finite cells by row index
+    """
+
+    header: str
+    values: np.ndarray
+    missing: np.ndarray
+    padded: np.ndarray
+    malformed: np.ndarray
+    non_finite: np.ndarray
+    bad_text: Mapping[int, str]
+
+    @property
+    def invalid(self) -> np.ndarray:
+        """Mask of cells that cannot be used as a finite number."""
+        mask: np.ndarray = self.missing | self.malformed | self.non_finite
+        return mask
+
+    def filled(self, default: float) -> np.ndarray:
+        """Return the values with missing cells replaced by ``default``."""
+        return np.where(self.missing, default, self.values)
+
+
+@dataclass(frozen=True)
+class CategoricalColumn:
+    """One dictionary-encoded string column.
+
+    Categories are stored in first-seen order so group codes follow the source
+    row order, which keeps envelope output deterministic.
+
+    Attributes:
+        header: Actual CSV header the column was read from
+        codes: int32 index into ``categories`` per row
+        categories: Distinct stripped values
+    """
+
+    header: str
+    codes: np.ndarray
+    categories: tuple[str, ...]
+
+    @property
+    def empty(self) -> np.ndarray:
+        """Mask of rows whose stripped value is empty."""
+        if "" not in self.categories:
+            return np.zeros(len(self.codes), dtype=bool)
+        mask: np.ndarray = self.codes == self.categories.index("")
+        return mask
+
+    def value(self, row_index: int) -> str:
+        """Decode the value of one row."""
+        return self.categories[int(self.codes[row_index])]
+
+
+@dataclass(frozen=True)
+class ColumnarFrame:
+    """Typed columns of one CSV artifact, keyed by logical field name.
+
+    Attributes:
+        headers: Source header row
+        column_map: Logical field name to actual header
+        row_count: Number of non-blank data rows
+        numeric: Numeric columns by logical field
+        categorical: Dictionary-encoded columns by logical field
+    """
+
+    headers: tuple[str, ...]
+    column_map: dict[str, str]
+    row_count: int
+    numeric: dict[str, NumericColumn]
+    categorical: dict[str, CategoricalColumn]
+
+
+# =============================================================================
+# Bulk parsing
+# =============================================================================
+
+
+def _parse_numeric(header: str, cells: Sequence[str]) -> NumericColumn:
+    count = len(cells)
+    try:
+        # Clean columns convert in one C-level pass with the same ``float()``
+        # the row adapters apply per cell. ``float("")`` raises, so success
+        # also proves no cell is empty.
+        values = np.fromiter(map(float, cells), dtype=np.float64, count=count)
+    except ValueError:
+        return _parse_numeric_masked(header, cells)
+    clean = np.zeros(count, dtype=bool)
+    non_finite = ~np.isfinite(values)
+    return NumericColumn(
+        header=header,
+        values=values,
+        missing=clean,
+        padded=clean,
+        malformed=clean,
+        non_finite=non_finite,
+        bad_text={index: cells[index] for index in np.flatnonzero(non_finite).tolist()},
+    )
+
+
+def _parse_numeric_masked(header: str, cells: Sequence[str]) -> NumericColumn:
+    raw = np.asarray(cells, dtype=np.str_)
+    text = np.strings.strip(raw)
+    missing = text == ""
+    malformed = np.zeros(len(text), dtype=bool)
+    try:
+        values = np.where(missing, "nan", text).astype(np.float64)
+    except ValueError:
+        # At least one malformed cell: fall back to a per-cell parse for this
+        # column only and record which cells failed.
+        values = np.full(len(text), np.nan)
+        for index in np.flatnonzero(~missing).tolist():
+            try:
+                values[index] = float(text[index])
+            except ValueError:
+                malformed[index] = True
+    non_finite = ~missing & ~malformed & ~np.isfinite(values)
+    return NumericColumn(
+        header=header,
+        values=values,
+        missing=missing,
+        padded=missing & (raw != ""),
+        malformed=malformed,
+        non_finite=non_finite,
+        bad_text={
+            index: cells[index]
+            for index in np.flatnonzero(malformed | non_finite).tolist()
+        },
+    )
+
+
+def _first_seen_codes(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Encode values as dense codes numbered in order of first appearance."""
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int32), values[:0]
+    unique, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(order), dtype=np.int32)
+    rank[order] = np.arange(len(order), dtype=np.int32)
+    return rank[inverse.reshape(-1)], unique[order]
+
+
+def _parse_categorical(header: str, cells: Sequence[str]) -> CategoricalColumn:
+    # Encode the raw cells first, then strip only the distinct values and
+    # merge any that collapse to the same stripped text.
+    raw_index = {value: code for code, value in enumerate(dict.fromkeys(cells))}
+    raw_codes = np.fromiter(
+        map(raw_index.__getitem__, cells), dtype=np.int32, count=len(cells)
+    )
+    stripped = [value.strip() for value in raw_index]
+    category_index = {value: code for code, value in enumerate(dict.fromkeys(stripped))}
+    remap = np.fromiter(
+        map(category_index.__getitem__, stripped), dtype=np.int32, count=len(stripped)
+    )
+    return CategoricalColumn(
+        header=header, codes=remap[raw_codes], categories=tuple(category_index)
+    )
+
+
+def _split_columns(text: str) -> tuple[list[str], list[Sequence[str]], int]:
+    """Split CSV text into its header row and one cell sequence per column.
+
+    Unquoted exports where every line has the header's width are split with
+    a single ``str.split`` and strided slices, without materializing a list
+    per row. Anything else (quoting, bare ``\\r``, blank or ragged lines) goes
+    through ``csv.reader``, skipping blank lines and padding short rows with
+    empty cells as ``csv.DictReader`` does.
+    """
+    unified = text.replace("\r\n", "\n")
+    if '"' not in unified and "\r" not in unified:
+        lines = unified.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        if lines:
+            headers = lines[0].split(",")
+            body = lines[1:]
+            width = len(headers)
+            if "" not in body and set(map(methodcaller("count", ","), body)) <= {
+                width - 1
+            }:
+                flat = ",".join(body).split(",") if body else []
+                columns: list[Sequence[str]] = [
+                    flat[index::width] for index in range(width)
+                ]
+                return headers, columns, len(body)
+
+    reader = csv.reader(io.StringIO(text))
+    headers = next(reader, [])
+    rows = [row for row in reader if row]
+    width = len(headers)
+    if any(len(row) < width for row in rows):
+        rows = [row + [""] * (width - len(row)) for row in rows]
+    columns = list(zip(*rows, strict=False)) if rows else [() for _ in headers]
+    return headers, columns, len(rows)
+
+
+def read_columnar_csv(
+    source: Path | str,
+    *,
+    column_map: Mapping[str, str] | Callable[[Sequence[str]], Mapping[str, str]],
+    numeric_fields: Iterable[str],
+    categorical_fields: Iterable[str] = (),
+) -> ColumnarFrame:
+    """Read the mapped columns of a CSV file into typed arrays.
+
+    Columns are detected once from the header row. Blank lines are skipped and
+    short rows are padded with empty cells, as ``csv.DictReader`` does.
+
+    Args:
+        source: Path to the CSV file
+        column_map: Logical field to header mapping, or a callable building it
+            from the header row (e.g. an adapter's ``_build_column_map``)
+        numeric_fields: Logical fields parsed as float64 arrays
+        categorical_fields: Logical fields kept as dictionary-encoded strings
+
+    Returns:
+        ColumnarFrame with only the requested fields that are present
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    headers, columns, row_count = _split_columns(path.read_text(encoding="utf-8-sig"))
+    mapping = dict(column_map(headers) if callable(column_map) else column_map)
+    index_of = {header: index for index, header in enumerate(headers)}
+
+    def cells(field: str) -> Sequence[str]:
+        return columns[index_of[mapping[field]]]
+
+    numeric = {
+        field: _parse_numeric(mapping[field], cells(field))
+        for field in dict.fromkeys(numeric_fields)
+        if field in mapping
+    }
+    categorical = {
+        field: _parse_categorical(mapping[field], cells(field))
+        for field in dict.fromkeys(categorical_fields)
+        if field in mapping
+    }
+    return ColumnarFrame(
+        headers=tuple(headers),
+        column_map=mapping,
+        row_count=row_count,
+        numeric=numeric,
+        categorical=categorical,
+    )
+
+
+# =============================================================================
+# Group-by reductions
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Groups:
+    """Rows grouped by key, groups numbered in order of first appearance."""
+
+    rows: np.ndarray
+    order: np.ndarray
+    starts: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def of(cls, rows: np.ndarray, keys: Sequence[np.ndarray]) -> _Groups:
+        combined = np.zeros(len(rows), dtype=np.int64)
+        for key in keys:
+            key = key[rows].astype(np.int64)
+            combined, _ = _first_seen_codes(combined * (int(key.max()) + 1) + key)
+            combined = combined.astype(np.int64)
+        order = np.argsort(combined, kind="stable")
+        ordered = combined[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        counts = np.diff(np.r_[starts, len(ordered)])
+        return cls(rows=rows, order=order, starts=starts, counts=counts)
+
+    @property
+    def first(self) -> np.ndarray:
+        """Source row index of each group's first row."""
+        rows: np.ndarray = self.rows[self.order[self.starts]]
+        return rows
+
+    @property
+    def last(self) -> np.ndarray:
+        """Source row index of each group's last row."""
+        rows: np.ndarray = self.rows[self.order[self.starts + self.counts - 1]]
+        return rows
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        """Per-group maximum of ``values`` (indexed by source row)."""
+        return np.maximum.reduceat(values[self.rows][self.order], self.starts)
+
+    def first_argmax(self, values: np.ndarray) -> np.ndarray:
+        """Source row of the first strict maximum in each group.
+
+        Mirrors the row adapters, which only replace an extremum on ``>``.
+        """
+        ordered = values[self.rows][self.order]
+        peak = np.maximum.reduceat(ordered, self.starts)
+        hits = np.flatnonzero(ordered == np.repeat(peak, self.counts))
+        rows: np.ndarray = self.rows[
+            self.order[hits[np.searchsorted(hits, self.starts)]]
+        ]
+        return rows
+
+
+def _raise_first_bad_row(
+    checks: Sequence[tuple[np.ndarray, Callable[[int], str]]],
+    *,
+    prefix: str,
+) -> None:
+    """Raise for the first row failing any check, in row-adapter order."""
+    first_rows = [
+        int(np.argmax(mask)) for mask, _message in checks if mask.size and mask.any()
+    ]
+    if not first_rows:
+        return
+    row_index = min(first_rows)
+    for mask, message in checks:
+        if mask.size and mask[row_index]:
+            raise ValueError(f"{prefix} row {row_index + 2}: {message(row_index)}")
+
+
+def _float_error(text: str) -> str:
+    """The message ``float()`` raises for one malformed cell."""
+    try:
+        float(text)
+    except ValueError as exc:
+        return str(exc)
+    return f"could not convert string to float: {text!r}"
+
+
+def _strict_number_checks(
+    column: NumericColumn | None,
+) -> list[tuple[np.ndarray, Callable[[int], str]]]:
+    """Missing/malformed/non-finite checks matching ``finite_value`` helpers."""
+    if column is None:
+        return []
+    header = column.header
+    return [
+        (column.missing, lambda _row: f"{header} is missing"),
+        (column.malformed, lambda row: _float_error(column.bad_text[row])),
+        (column.non_finite, lambda _row: f"{header} must be finite"),
+    ]
+
+
+def _tolist(values: np.ndarray, rows: np.ndarray) -> list[Any]:
+    items: list[Any] = values[rows].tolist()
+    return items
+
+
+# =============================================================================
+# Adapter fast paths
+# =============================================================================
+
+
+_FORCE_NUMERIC_FIELDS = (
+    "station",
+    "m3",
+    "v2",
+    "p",
+    "mu_max",
+    "mu_min",
+    "vu_max",
+    "mu_knm",
+    "vu_kn",
+    "pu_kn",
+)
+_FORCE_CATEGORICAL_FIELDS = ("story", "beam_id", "case_id", "load_case")
+
+
+def _read_forces(adapter: Any, source: Path | str) -> ColumnarFrame:
+    return read_columnar_csv(
+        source,
+        column_map=lambda headers: adapter._build_column_map(
+            headers, adapter.FORCES_COLUMNS
+        ),
+        numeric_fields=_FORCE_NUMERIC_FIELDS,
+        categorical_fields=_FORCE_CATEGORICAL_FIELDS,
+    )
+
+
+def _etabs_forces(adapter: ETABSAdapter, source: Path | str) -> list[BeamForces]:
+    frame = _read_forces(adapter, source)
+    is_vba_envelope = adapter._is_envelope_forces(frame.column_map)
+    if frame.row_count == 0:
+        raise ValueError("ETABS forces CSV has headers but no data rows")
+
+    beam = frame.categorical["beam_id"]
+    story = frame.categorical.get("story")
+    checks: list[tuple[np.ndarray, Callable[[int], str]]] = [
+        (beam.empty, lambda _row: "beam_id must be non-empty")
+    ]
+    if is_vba_envelope:
+        for field in ("mu_max", "mu_min", "vu_max"):
+            checks += _strict_number_checks(frame.numeric.get(field))
+    else:
+        case = frame.categorical["case_id"]
+        checks.append((case.empty, lambda _row: "case_id must be non-empty"))
+        for field in ("station", "m3", "v2", "p"):
+            checks += _strict_number_checks(frame.numeric.get(field))
+    _raise_first_bad_row(checks, prefix="ETABS forces")
+
+    everything = np.arange(frame.row_count)
+    story_codes = story.codes if story else np.zeros(frame.row_count, np.int32)
+    story_names = story.categories if story else ("",)
+
+    def full_id(row: int) -> str:
+        label = beam.value(row)
+        level = story_names[int(story_codes[row])]
+        return f"{label}_{level}" if level else label
+
+    if is_vba_envelope:
+        groups = _Groups.of(everything, [beam.codes, story_codes])
+        zeros = np.zeros(frame.row_count)
+        mu_max = frame.numeric.get("mu_max")
+        mu_min = frame.numeric.get("mu_min")
+        vu_col = frame.numeric.get("vu_max")
+        mu_signed = mu_max.values if mu_max else zeros
+        if mu_min is not None:
+            mu_signed = np.where(
+                np.abs(mu_min.values) > np.abs(mu_signed), mu_min.values, mu_signed
+            )
+        vu_signed = vu_col.values if vu_col else zeros
+        last = groups.last
+        return [
+            BeamForces(
+                id=full_id(row),
+                load_case="Envelope",
+                mu_knm=abs(moment),
+                vu_kn=abs(shear),
+                pu_kn=0.0,
+                station_count=1,
+                moment_signed_knm=moment,
+                shear_signed_kn=shear,
+                envelope_basis=_ETABS_ENVELOPE_BASIS,
+            )
+            for row, moment, shear in zip(
+                last.tolist(),
+                _tolist(mu_signed, last),
+                _tolist(vu_signed, last),
+                strict=True,
+            )
+        ]
+
+    case = frame.categorical["case_id"]
+    groups = _Groups.of(everything, [beam.codes, story_codes, case.codes])
+    station = frame.numeric["station"].values
+    m3 = frame.numeric["m3"].values
+    v2 = frame.numeric["v2"].values
+    p_col = frame.numeric.get("p")
+    p_abs = np.abs(p_col.values) if p_col else np.zeros(frame.row_count)
+    moment_rows = groups.first_argmax(np.abs(m3))
+    shear_rows = groups.first_argmax(np.abs(v2))
+    return [
+        BeamForces(
+            id=full_id(first),
+            load_case=case.value(first),
+            mu_knm=abs(moment),
+            vu_kn=abs(shear),
+            pu_kn=axial,
+            station_count=count,
+            moment_signed_knm=moment,
+            moment_station=moment_station,
+            shear_signed_kn=shear,
+            shear_station=shear_station,
+            shear_at_moment_station_kn=shear_at_moment,
+            moment_at_shear_station_knm=moment_at_shear,
+            envelope_basis=_ETABS_RAW_BASIS,
+        )
+        for (
+            first,
+            count,
+            axial,
+            moment,
+            moment_station,
+            shear_at_moment,
+            shear,
+            shear_station,
+            moment_at_shear,
+        ) in zip(
+            groups.first.tolist(),
+            groups.counts.tolist(),
+            groups.max(p_abs).tolist(),
+            _tolist(m3, moment_rows),
+            _tolist(station, moment_rows),
+            _tolist(v2, moment_rows),
+            _tolist(v2, shear_rows),
+            _tolist(station, shear_rows),
+            _tolist(m3, shear_rows),
+            strict=True,
+        )
+    ]
+
+
+def _lenient_forces(
+    adapter: SAFEAdapter | STAADAdapter, source: Path | str
+) -> list[BeamForces]:
+    """SAFE and STAAD skip unusable rows instead of failing the file."""
+    frame = _read_forces(adapter, source)
+    if isinstance(adapter, STAADAdapter):
+        is_envelope = adapter._is_envelope_forces(frame.column_map, list(frame.headers))
+    else:
+        is_envelope = adapter._is_envelope_forces(frame.column_map)
+    if frame.row_count == 0:
+        return []
+
+    beam = frame.categorical["beam_id"]
+    story = frame.categorical.get("story")
+    case = frame.categorical.get("case_id")
+    n = frame.row_count
+    zeros = np.zeros(n)
+    usable = np.ones(n, dtype=bool)
+    is_staad = isinstance(adapter, STAADAdapter)
+    if is_staad:
+        # STAAD skips blank members, ignores story and falls back to a
+        # "Default" case; blank and explicit "Default" cases share one group.
+        usable &= ~beam.empty
+        story_codes = np.zeros(n, dtype=np.int32)
+        story_names: tuple[str, ...] = ("",)
+        case_names = (
+            tuple(name or "Default" for name in case.categories)
+            if case
+            else ("Default",)
+        )
+        relabel = np.asarray(
+            [case_names.index(name) for name in case_names], dtype=np.int32
+        )
+        case_codes = relabel[case.codes] if case else np.zeros(n, dtype=np.int32)
+    else:
+        story_codes = story.codes if story else np.zeros(n, dtype=np.int32)
+        story_names = story.categories if story else ("",)
+        case_codes = case.codes if case else np.zeros(n, dtype=np.int32)
+        case_names = case.categories if case else ("Envelope",)
+
+    def optional(field: str) -> np.ndarray:
+        # ``float(row.get(col, 0) or 0)``: an empty cell is zero, while a
+        # whitespace-only or malformed cell skips the row.
+        column = frame.numeric.get(field)
+        if column is None:
+            return zeros
+        usable[:] &= ~(column.padded | column.malformed | column.non_finite)
+        return np.asarray(np.abs(column.filled(0.0)), dtype=float)
+
+    def required(field: str) -> np.ndarray:
+        column = frame.numeric[field]
+        usable[:] &= ~column.invalid
+        return np.asarray(np.abs(column.values), dtype=float)
+
+    if is_envelope:
+        mu = optional("mu_max")
+        vu = optional("vu_max")
+        pu = zeros
+    else:
+        mu = required("m3")
+        vu = required("v2")
+        # SAFE parses a present axial column strictly; STAAD treats blank as 0.
+        if is_staad:
+            pu = optional("p")
+        elif "p" in frame.numeric:
+            pu = required("p")
+        else:
+            pu = zeros
+
+    rows = np.flatnonzero(usable)
+    if len(rows) == 0:
+        return []
+    if is_staad:
+        keys = [beam.codes, case_codes]
+    elif is_envelope:
+        keys = [beam.codes, story_codes]
+    else:
+        keys = [beam.codes, story_codes, case_codes]
+    groups = _Groups.of(rows, keys)
+
+    def member_id(row: int) -> str:
+        label = beam.value(row)
+        if is_staad:
+            return label
+        level = story_names[int(story_codes[row])]
+        return f"{label}_{level}" if level else label
+
+    def load_case(row: int) -> str:
+        if is_envelope and not is_staad:
+            return "Envelope"
+        return case_names[int(case_codes[row])]
+
+    if is_envelope:
+        last = groups.last
+        return [
+            BeamForces(
+                id=member_id(row),
+                load_case=load_case(row),
+                mu_knm=moment,
+                vu_kn=shear,
+                pu_kn=0.0,
+                station_count=1,
+            )
+            for row, moment, shear in zip(
+                last.tolist(), _tolist(mu, last), _tolist(vu, last), strict=True
+            )
+        ]
+    return [
+        BeamForces(
+            id=member_id(first),
+            load_case=load_case(first),
+            mu_knm=moment,
+            vu_kn=shear,
+            pu_kn=axial,
+            station_count=count,
+        )
+        for first, count, moment, shear, axial in zip(
+            groups.first.tolist(),
+            groups.counts.tolist(),
+            groups.max(mu).tolist(),
+            groups.max(vu).tolist(),
+            groups.max(pu).tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _generic_forces(adapter: GenericCSVAdapter, source: Path | str) -> list[BeamForces]:
+    """One record per row; blank forces are zero, bad numbers fail the file."""
+    frame = _read_forces(adapter, source)
+    adapter._check_forces_columns(frame.column_map, list(frame.headers))
+    if frame.row_count == 0:
+        return []
+
+    beam = frame.categorical["beam_id"]
+    story = frame.categorical.get("story")
+    load_case = frame.categorical.get("load_case")
+    usable = ~beam.empty
+    rows = np.flatnonzero(usable)
+    checks: list[tuple[np.ndarray, Callable[[int], str]]] = []
+    values: dict[str, np.ndarray] = {}
+    for field in ("mu_knm", "vu_kn", "pu_kn"):
+        column = frame.numeric.get(field)
+        if column is None:
+            values[field] = np.zeros(frame.row_count)
+            continue
+        values[field] = np.abs(column.filled(0.0))
+
+        def malformed(row: int, name: str = field, col: NumericColumn = column) -> str:
+            text = col.bad_text[row].strip()
+            return f"Invalid {name} value at CSV row {row + 2}: {text!r}"
+
+        def non_finite(row: int, name: str = field, col: NumericColumn = column) -> str:
+            text = col.bad_text[row].strip()
+            return (
+                f"Invalid {name} value at CSV row {row + 2}: " f"{text!r} is not finite"
+            )
+
+        checks += [
+            (column.malformed & usable, malformed),
+            (column.non_finite & usable, non_finite),
+        ]
+    first_rows = [int(np.argmax(mask)) for mask, _message in checks if mask.any()]
+    if first_rows:
+        row_index = min(first_rows)
+        for mask, message in checks:
+            if mask[row_index]:
+                raise ValueError(message(row_index))
+
+    def member_id(row: int) -> str:
+        label = beam.value(row)
+        level = story.value(row) if story else ""
+        return f"{label}_{level}" if level else label
+
+    return [
+        BeamForces(
+            id=member_id(row),
+            load_case=(load_case.value(row) if load_case else "") or "Design",
+            mu_knm=mu,
+            vu_kn=vu,
+            pu_kn=pu,
+            station_count=1,
+        )
+        for row, mu, vu, pu in zip(
+            rows.tolist(),
+            _tolist(values["mu_knm"], rows),
+            _tolist(values["vu_kn"], rows),
+            _tolist(values["pu_kn"], rows),
+            strict=True,
+        )
+    ]
+
+
+def load_forces_columnar(adapter: InputAdapter, source: Path | str) -> list[BeamForces]:
+    """Load forces through the columnar fast path of ``adapter``.
+
+    Produces the same records as ``adapter.load_forces(source)``: the same
+    envelope grouping, extremum selection, record order and error messages.
+    SAFE and STAAD rows with non-finite numbers are skipped like malformed
+    ones instead of reaching the canonical model.
+
+    Args:
+        adapter: ETABS, SAFE, STAAD or Generic adapter instance
+        source: Path to the forces CSV
+
+    Returns:
+        List of BeamForces models
+
+    Raises:
+        ValueError: If required columns are missing or a strict row is invalid
+        FileNotFoundError: If the file doesn't exist
+
+    Adapters without a columnar layout use their row path, ``load_forces``.
+    """
+    if isinstance(adapter, ETABSAdapter):
+        return _etabs_forces(adapter, source)
+    if isinstance(adapter, SAFEAdapter | STAADAdapter):
+        return _lenient_forces(adapter, source)
+    if isinstance(adapter, GenericCSVAdapter):
+        return _generic_forces(adapter, source)
+    return adapter.load_forces(source)
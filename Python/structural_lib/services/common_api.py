@@ -15,6 +15,7 @@ import inspect
 import json
 import math
 import platform as _platform
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from numbers import Real
 from pathlib import Path
@@ -125,8 +126,18 @@ def _validate_plausibility(
 
 
 def get_library_version() -> str:
-    """Return the version authoritative for the code imported at runtime."""
+    """Return the version authoritative for the code imported at runtime.
 
+    Every design result stamps this version, and resolving it parses
+    ``pyproject.toml`` and package metadata, so it is resolved once per
+    process, like ``evidence.get_library_content_identity``.
+    """
+
+    return _cached_library_version()
+
+
+@lru_cache(maxsize=1)
+def _cached_library_version() -> str:
     return get_runtime_version()
 
 
@@ -0,0 +1,511 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Compact, lazily materialized import row ledgers.
+
+``ImportNormalizationLedgerV1`` keeps one ``ImportRowLedgerV1`` per source row
+with one ``ImportFieldLedgerV1`` per field. For uploads with 100k rows that is
+millions of Python objects. :class:`CompactRowLedger` records the same
+evidence in parallel arrays instead:
+
+- per artifact, one column schema (header, canonical field, units, default
+  action) shared by all of its rows;
+- per row, the source row number, record identity, status, an index into a
+  table of interned issue-code tuples, and the physical CSV cells;
+- sparse maps for the rare exclusions and rejected numeric cells.
+
+Rows are materialized into the pydantic models only when inspected, so a
+paginated endpoint or a blocked-row report never builds the whole ledger.
+``CompactLosslessImport.to_result()`` materializes everything for callers of
+the ``LosslessImportResultV1`` API; the two forms are field-for-field equal.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from structural_lib.core.models import BeamBatchInput
+
+from .import_ledger import (
+    AdapterSelectionV1,
+    ImportArtifactV1,
+    ImportFieldAction,
+    ImportFieldLedgerV1,
+    ImportIssueCode,
+    ImportIssueV1,
+    ImportNormalizationLedgerV1,
+    ImportRowLedgerV1,
+    ImportStatus,
+    ImportTotalsV1,
+    LosslessImportResultV1,
+)
+
+ArtifactRole = Literal["geometry", "forces", "combined"]
+ValueKind = Literal["text", "number", "none"]
+
+_STATUSES = (ImportStatus.ACCEPTED, ImportStatus.BLOCKED)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+
+
+@dataclass(frozen=True)
+class LedgerColumn:
+    """Schema of one source column, shared by every row of an artifact.
+
+    Attributes:
+        raw_header: Header as written in the source artifact
+        canonical_field: Normalized field name, or None for metadata
+        units: Units of the canonical field
+        action: Disposition of cells that are not individually rejected
+        value_kind: ``"number"`` parses normalized cells as floats, ``"text"``
+            keeps the stripped text, ``"none"`` records no parsed value
+    """
+
+    raw_header: str
+    canonical_field: str | None
+    units: str | None
+    action: ImportFieldAction
+    value_kind: ValueKind
+
+
+@dataclass(frozen=True)
+class _Segment:
+    role: ArtifactRole
+    artifact_index: int | None
+    columns: tuple[LedgerColumn, ...]
+
+
+class CompactRowLedger:
+    """Physical-row ledger stored as parallel arrays.
+
+    Rows are appended artifact by artifact: call :meth:`begin_artifact` with
+    the column schema, then :meth:`append` once per physical row.
+    """
+
+    def __init__(self) -> None:
+        self._segments: list[_Segment] = []
+        self._segment_of = array("I")
+        self._row_numbers = array("q")
+        self._record_ids: list[str] = []
+        self._cells: list[Sequence[str]] = []
+        self._status = bytearray()
+        self._code_set_of = array("I")
+        self._code_sets: list[tuple[ImportIssueCode, ...]] = [()]
+        self._code_set_index: dict[tuple[ImportIssueCode, ...], int] = {(): 0}
+        self._exclusions: dict[int, str] = {}
+        self._rejected: dict[int, frozenset[int]] = {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def begin_artifact(
+        self,
+        *,
+        role: ArtifactRole,
+        columns: Sequence[LedgerColumn],
+        artifact_index: int | None = None,
+    ) -> None:
+        """Start a new artifact; following rows share ``columns``."""
+        self._segments.append(_Segment(role, artifact_index, tuple(columns)))
+
+    def append(
+        self,
+        *,
+        source_row_number: int,
+        source_record_id: str,
+        cells: Sequence[str],
+        status: ImportStatus,
+        issue_codes: Iterable[ImportIssueCode] = (),
+        exclusion_reason: str | None = None,
+        rejected_columns: Iterable[int] = (),
+    ) -> int:
+        """Append one physical row and return its ledger index.
+
+        ``cells`` is kept by reference; cells beyond the schema width are
+        ignored and missing trailing cells read as empty.
+        """
+        if not self._segments:
+            raise ValueError("begin_artifact() must be called before append()")
+        index = len(self._record_ids)
+        self._segment_of.append(len(self._segments) - 1)
+        self._row_numbers.append(source_row_number)
+        self._record_ids.append(source_record_id)
+        self._cells.append(cells)
+        self._status.append(_STATUS_CODE[status])
+        self._code_set_of.append(self._intern(issue_codes))
+        if exclusion_reason is not None:
+            self._exclusions[index] = exclusion_reason
+        rejected = frozenset(rejected_columns)
+        if rejected:
+            self._rejected[index] = rejected
+        return index
+
+    def add_issue_code(self, index: int, code: ImportIssueCode) -> None:
+        """Block row ``index`` and record ``code`` on it."""
+        self._status[index] = _STATUS_CODE[ImportStatus.BLOCKED]
+        codes = set(self._code_sets[self._code_set_of[index]]) | {code}
+        self._code_set_of[index] = self._intern(codes)
+
+    def extend(self, other: CompactRowLedger) -> None:
+        """Append every row of ``other`` (used to join artifact ledgers)."""
+        offset = len(self._segments)
+        base = len(self._record_ids)
+        self._segments.extend(other._segments)
+        self._segment_of.extend(segment + offset for segment in other._segment_of)
+        self._row_numbers.extend(other._row_numbers)
+        self._record_ids.extend(other._record_ids)
+        self._cells.extend(other._cells)
+        self._status.extend(other._status)
+        self._code_set_of.extend(
+            self._intern(other._code_sets[code_set]) for code_set in other._code_set_of
+        )
+        self._exclusions.update(
+            {base + index: reason for index, reason in other._exclusions.items()}
+        )
+        self._rejected.update(
+            {base + index: columns for index, columns in other._rejected.items()}
+        )
+
+    def _intern(self, codes: Iterable[ImportIssueCode]) -> int:
+        key = tuple(sorted(set(codes), key=lambda code: code.value))
+        index = self._code_set_index.get(key)
+        if index is None:
+            index = len(self._code_sets)
+            self._code_sets.append(key)
+            self._code_set_index[key] = index
+        return index
+
+    # ------------------------------------------------------------------
+    # Cheap per-row accessors
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._record_ids)
+
+    def role(self, index: int) -> ArtifactRole:
+        """Artifact role of row ``index``."""
+        return self._segments[self._segment_of[index]].role
+
+    def status(self, index: int) -> ImportStatus:
+        """Status of row ``index``."""
+        return _STATUSES[self._status[index]]
+
+    def source_record_id(self, index: int) -> str:
+        """Source record identity of row ``index``."""
+        return self._record_ids[index]
+
+    def source_row_number(self, index: int) -> int:
+        """Physical source row number (header is row 1) of row ``index``."""
+        return self._row_numbers[index]
+
+    def issue_codes(self, index: int) -> tuple[ImportIssueCode, ...]:
+        """Sorted issue codes of row ``index``."""
+        return self._code_sets[self._code_set_of[index]]
+
+    def exclusion_reason(self, index: int) -> str | None:
+        """Exclusion reason of row ``index``, if it is excluded."""
+        return self._exclusions.get(index)
+
+    @property
+    def accepted_count(self) -> int:
+        """Number of accepted rows."""
+        return self._status.count(_STATUS_CODE[ImportStatus.ACCEPTED])
+
+    @property
+    def excluded_count(self) -> int:
+        """Number of rows with an exclusion reason."""
+        return len(self._exclusions)
+
+    def included_count(self, roles: Iterable[ArtifactRole] | None = None) -> int:
+        """Rows without an exclusion reason, optionally limited to ``roles``."""
+        if roles is None:
+            return len(self) - len(self._exclusions)
+        wanted = {
+            position
+            for position, segment in enumerate(self._segments)
+            if segment.role in set(roles)
+        }
+        return sum(
+            1
+            for index, segment in enumerate(self._segment_of)
+            if segment in wanted and index not in self._exclusions
+        )
+
+    def indexes(self, status: ImportStatus | None = None) -> list[int]:
+        """Row indexes, optionally only those with ``status``."""
+        if status is None:
+            return list(range(len(self)))
+        code = _STATUS_CODE[status]
+        return [index for index, value in enumerate(self._status) if value == code]
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+
+    def row(self, index: int) -> ImportRowLedgerV1:
+        """Materialize row ``index`` as an ``ImportRowLedgerV1``."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"ledger row {index} out of range")
+        segment = self._segments[self._segment_of[index]]
+        cells = self._cells[index]
+        rejected = self._rejected.get(index, frozenset())
+        fields = []
+        for position, column in enumerate(segment.columns):
+            raw_value = cells[position] if position < len(cells) else ""
+            action = (
+                ImportFieldAction.REJECTED if position in rejected else column.action
+            )
+            fields.append(
+                ImportFieldLedgerV1(
+                    raw_header=column.raw_header,
+                    canonical_field=column.canonical_field,
+                    raw_value=raw_value,
+                    parsed_value=_parsed_value(column, raw_value, position in rejected),
+                    units=column.units,
+                    action=action,
+                )
+            )
+        return ImportRowLedgerV1(
+            artifact_role=segment.role,
+            artifact_index=segment.artifact_index,
+            source_row_number=self._row_numbers[index],
+            source_record_id=self._record_ids[index],
+            status=self.status(index),
+            fields=tuple(fields),
+            issue_codes=self.issue_codes(index),
+            exclusion_reason=self._exclusions.get(index),
+        )
+
+    def __iter__(self) -> Iterator[ImportRowLedgerV1]:
+        """Materialize rows one at a time, in ledger order."""
+        return (self.row(index) for index in range(len(self)))
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        *,
+        status: ImportStatus | None = None,
+    ) -> list[ImportRowLedgerV1]:
+        """Materialize one page of rows, optionally filtered by ``status``."""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must be non-negative")
+        if status is None:
+            selected: Sequence[int] = range(offset, min(offset + limit, len(self)))
+        else:
+            selected = self.indexes(status)[offset : offset + limit]
+        return [self.row(index) for index in selected]
+
+    def to_rows(self) -> tuple[ImportRowLedgerV1, ...]:
+        """Materialize every row."""
+        return tuple(self)
+
+    # ------------------------------------------------------------------
+    # Serialization (cache disk tier)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible form that :meth:`from_dict` restores."""
+        return {
+            "segments": [
+                {
+                    "role": segment.role,
+                    "artifact_index": segment.artifact_index,
+                    "columns": [
+                        [
+                            column.raw_header,
+                            column.canonical_field,
+                            column.units,
+                            column.action.value,
+                            column.value_kind,
+                        ]
+                        for column in segment.columns
+                    ],
+                }
+                for segment in self._segments
+            ],
+            "segment_of": self._segment_of.tolist(),
+            "row_numbers": self._row_numbers.tolist(),
+            "record_ids": self._record_ids,
+            "cells": [list(cells) for cells in self._cells],
+            "status": list(self._status),
+            "code_sets": [[code.value for code in codes] for codes in self._code_sets],
+            "code_set_of": self._code_set_of.tolist(),
+            "exclusions": [
+                [index, reason] for index, reason in self._exclusions.items()
+            ],
+            "rejected": [
+                [index, sorted(columns)] for index, columns in self._rejected.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CompactRowLedger:
+        """Rebuild a ledger from :meth:`to_dict` output.
+
+        Raises:
+            ValueError: If the payload is inconsistent
+            KeyError: If a required key is missing
+        """
+        ledger = cls()
+        ledger._segments = [
+            _Segment(
+                role=segment["role"],
+                artifact_index=segment["artifact_index"],
+                columns=tuple(
+                    LedgerColumn(
+                        raw_header=column[0],
+                        canonical_field=column[1],
+                        units=column[2],
+                        action=ImportFieldAction(column[3]),
+                        value_kind=column[4],
+                    )
+                    for column in segment["columns"]
+                ),
+            )
+            for segment in data["segments"]
+        ]
+        ledger._segment_of = array("I", data["segment_of"])
+        ledger._row_numbers = array("q", data["row_numbers"])
+        ledger._record_ids = list(data["record_ids"])
+        ledger._cells = list(data["cells"])
+        ledger._status = bytearray(data["status"])
+        ledger._code_sets = [
+            tuple(ImportIssueCode(code) for code in codes)
+            for codes in data["code_sets"]
+        ]
+        ledger._code_set_index = {
+            codes: index for index, codes in enumerate(ledger._code_sets)
+        }
+        ledger._code_set_of = array("I", data["code_set_of"])
+        ledger._exclusions = {
+            int(index): reason for index, reason in data["exclusions"]
+        }
+        ledger._rejected = {
+            int(index): frozenset(columns) for index, columns in data["rejected"]
+        }
+        lengths = {
+            len(ledger._segment_of),
+            len(ledger._row_numbers),
+            len(ledger._record_ids),
+            len(ledger._cells),
+            len(ledger._status),
+            len(ledger._code_set_of),
+        }
+        if len(lengths) != 1:
+            raise ValueError("compact ledger arrays have inconsistent lengths")
+        if any(segment >= len(ledger._segments) for segment in ledger._segment_of):
+            raise ValueError("compact ledger row references a missing artifact")
+        if any(code_set >= len(ledger._code_sets) for code_set in ledger._code_set_of):
+            raise ValueError("compact ledger row references a missing issue set")
+        return ledger
+
+
+def _parsed_value(
+    column: LedgerColumn, raw_value: str, rejected: bool
+) -> str | float | None:
+    if column.value_kind == "none":
+        return None
+    stripped = raw_value.strip()
+    if column.value_kind == "text":
+        return stripped or None
+    if rejected or not stripped:
+        return None
+    return float(stripped)
+
+
+@dataclass(frozen=True)
+class CompactLosslessImport:
+    """Lossless import outcome whose row ledger stays compact.
+
+    Everything except the rows is held as the usual pydantic models. Use
+    :meth:`to_result` for the fully materialized ``LosslessImportResultV1``.
+    """
+
+    status: ImportStatus
+    batch: BeamBatchInput | None
+    issues: tuple[ImportIssueV1, ...]
+    geometry_artifact: ImportArtifactV1
+    forces_artifact: ImportArtifactV1
+    adapter_selection: AdapterSelectionV1
+    totals: ImportTotalsV1
+    rows: CompactRowLedger
+    artifacts: tuple[ImportArtifactV1, ...] = ()
+
+    def ledger(self) -> ImportNormalizationLedgerV1:
+        """Materialize the complete normalization ledger."""
+        return ImportNormalizationLedgerV1(
+            geometry_artifact=self.geometry_artifact,
+            forces_artifact=self.forces_artifact,
+            adapter_selection=self.adapter_selection,
+            rows=self.rows.to_rows(),
+            totals=self.totals,
+            artifacts=self.artifacts,
+        )
+
+    def to_result(self) -> LosslessImportResultV1:
+        """Materialize the ``LosslessImportResultV1`` for this import."""
+        return LosslessImportResultV1(
+            status=self.status,
+            batch=self.batch,
+            ledger=self.ledger(),
+            issues=self.issues,
+        )
+
+    def ledger_summary(self) -> dict[str, Any]:
+        """JSON ledger payload without the ``rows`` array."""
+        summary = ImportNormalizationLedgerV1(
+            geometry_artifact=self.geometry_artifact,
+            forces_artifact=self.forces_artifact,
+            adapter_selection=self.adapter_selection,
+            rows=(),
+            totals=self.totals,
+            artifacts=self.artifacts,
+        ).model_dump(mode="json")
+        del summary["rows"]
+        return summary
+
+    def iter_ledger_json(
+        self, *, separators: tuple[str, str] = (",", ":")
+    ) -> Iterator[str]:
+        """Yield the ledger as canonical JSON text, one row at a time.
+
+        The concatenated chunks equal ``json.dumps(ledger().model_dump(
+        mode="json"), sort_keys=True, allow_nan=False, separators=...)``, so
+        hashes of the streamed text match hashes of the materialized ledger
+        while holding only one materialized row at a time.
+        """
+
+        def dumps(value: Any) -> str:
+            return json.dumps(
+                value, sort_keys=True, allow_nan=False, separators=separators
+            )
+
+        key_separator = separators[1]
+        summary = self.ledger_summary()
+        keys = sorted([*summary, "rows"])
+        yield "{"
+        for position, key in enumerate(keys):
+            if position:
+                yield separators[0]
+            yield dumps(key) + key_separator
+            if key != "rows":
+                yield dumps(summary[key])
+                continue
+            yield "["
+            for index, row in enumerate(self.rows):
+                if index:
+                    yield separators[0]
+                yield dumps(row.model_dump(mode="json"))
+            yield "]"
+        yield "}"
+
+
+__all__ = [
+    "CompactLosslessImport",
+    "CompactRowLedger",
+    "LedgerColumn",
+]
@@ -21,6 +21,10 @@ Usage:
 
 from __future__ import annotations
 
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -62,6 +66,7 @@ from structural_lib.codes.is456.beam.detailing import (
     BeamDetailingResult,
     StirrupArrangement,
     create_beam_detailing,
+    group_similar_beams,
 )
 
 from . import bbs
@@ -90,6 +95,7 @@ REBAR_OFFSET = 30  # Offset from beam edge for rebar line
 DEFAULT_SHEET_MARGIN = 200.0  # mm
 DEFAULT_TITLE_BLOCK_WIDTH = 900.0  # mm
 DEFAULT_TITLE_BLOCK_HEIGHT = 250.0  # mm
+DEFAULT_BEAMS_PER_SHEET = 100
 
 
 # =============================================================================
@@ -180,65 +186,6 @@ REBAR_UNIT_WEIGHT = {
 }
 
 
-def _get_beam_type_key(detailing: BeamDetailingResult) -> str:
-    """
-    Generate a type key for grouping similar beams.
-
-    Beams with same size, span (±100mm), and reinforcement are grouped.
-    """
-    # Round span to nearest 100mm for grouping tolerance
-    span_rounded = round(detailing.span / 100) * 100
-
-    # Get bottom bar summary (primary identifier)
-    if detailing.bottom_bars:
-        mid_idx = len(detailing.bottom_bars) // 2
-        bot = detailing.bottom_bars[mid_idx]
-        bot_str = f"{bot.count}T{int(bot.diameter)}"
-    else:
-        bot_str = "0T0"
-
-    # Get top bar summary
-    if detailing.top_bars:
-        mid_idx = len(detailing.top_bars) // 2
-        top = detailing.top_bars[mid_idx]
-        top_str = f"{top.count}T{int(top.diameter)}"
-    else:
-        top_str = "0T0"
-
-    # Get stirrup summary
-    if detailing.stirrups:
-        stir = detailing.stirrups[0]
-        stir_str = f"{int(stir.diameter)}@{int(stir.spacing)}"
-    else:
-        stir_str = "0@0"
-
-    return f"{int(detailing.b)}x{int(detailing.D)}_{span_rounded}_{bot_str}_{top_str}_{stir_str}"
-
-
-def group_similar_beams(
-    detailings: list[BeamDetailingResult],
-) -> dict[str, list[BeamDetailingResult]]:
-    """
-    Group beams by type (size + span + reinforcement).
-
-    Industry standard: Similar beams are shown once with references to all
-    beam IDs that use the same detail.
-
-    Args:
-        detailings: List of beam detailing results
-
-    Returns:
-        Dict mapping type_key to list of beams with that type
-    """
-    groups: dict[str, list[BeamDetailingResult]] = {}
-    for detailing in detailings:
-        type_key = _get_beam_type_key(detailing)
-        if type_key not in groups:
-            groups[type_key] = []
-        groups[type_key].append(detailing)
-    return groups
-
-
 def generate_beam_schedule_table(
     detailings: list[BeamDetailingResult],
 ) -> list[dict[str, Any]]:
@@ -1311,6 +1258,134 @@ def generate_beam_dxf(
 # =============================================================================
 
 
+def _detail_block_key(
+    detailing: BeamDetailingResult, include_dimensions: bool, include_section_cuts: bool
+) -> str:
+    """Key of everything :func:`_draw_beam_detail` draws for a beam."""
+    return repr(
+        (
+            detailing.span,
+            detailing.D,
+            detailing.b,
+            detailing.cover,
+            detailing.top_bars,
+            detailing.bottom_bars,
+            detailing.stirrups,
+            include_dimensions,
+            include_section_cuts,
+        )
+    )
+
+
+def _draw_beam_detail(
+    layout: Any,
+    detailing: BeamDetailingResult,
+    origin: tuple[float, float],
+    include_dimensions: bool,
+    include_section_cuts: bool,
+) -> None:
+    """Draw a beam's elevation, dimensions and section cuts.
+
+    Nothing here depends on the beam id, so ``layout`` may be a BLOCK shared
+    by every beam of the same type.
+    """
+    x_origin, y_origin = origin
+
+    draw_beam_elevation(
+        layout,
+        span=detailing.span,
+        D=detailing.D,
+        b=detailing.b,
+        cover=detailing.cover,
+        top_bars=detailing.top_bars,
+        bottom_bars=detailing.bottom_bars,
+        stirrups=detailing.stirrups,
+        origin=(x_origin, y_origin),
+    )
+
+    if include_dimensions:
+        draw_dimensions(
+            layout, detailing.span, detailing.D, origin=(x_origin, y_origin)
+        )
+
+    # Add section cuts
+    if include_section_cuts:
+        section_x_offset = x_origin + detailing.span + 500
+
+        # Get bar arrangements for support (first zone)
+        top_bar_support = (
+            detailing.top_bars[0]
+            if detailing.top_bars
+            else BarArrangement(
+                count=2, diameter=12, area_provided=226, spacing=100, layers=1
+            )
+        )
+        bottom_bar_support = (
+            detailing.bottom_bars[0]
+            if detailing.bottom_bars
+            else BarArrangement(
+                count=2, diameter=12, area_provided=226, spacing=100, layers=1
+            )
+        )
+
+        draw_section_cut(
+            layout,
+            b=detailing.b,
+            D=detailing.D,
+            cover=detailing.cover,
+            top_bars=top_bar_support,
+            bottom_bars=bottom_bar_support,
+            stirrup=(
+                detailing.stirrups[0]
+                if detailing.stirrups
+                else StirrupArrangement(
+                    diameter=8, legs=2, spacing=150, zone_length=1000
+                )
+            ),
+            origin=(section_x_offset, y_origin),
+            scale=1.0,
+            title="SECTION A-A",
+        )
+
+        # Section B-B at midspan
+        section_b_offset = section_x_offset + detailing.b + 200
+        mid_idx = len(detailing.top_bars) // 2 if detailing.top_bars else 0
+        top_bar_mid = (
+            detailing.top_bars[mid_idx]
+            if detailing.top_bars
+            else BarArrangement(
+                count=2, diameter=12, area_provided=226, spacing=100, layers=1
+            )
+        )
+        bottom_bar_mid = (
+            detailing.bottom_bars[mid_idx]
+            if detailing.bottom_bars
+            else BarArrangement(
+                count=2, diameter=12, area_provided=226, spacing=100, layers=1
+            )
+        )
+        stirrup_mid_idx = len(detailing.stirrups) // 2 if detailing.stirrups else 0
+
+        draw_section_cut(
+            layout,
+            b=detailing.b,
+            D=detailing.D,
+            cover=detailing.cover,
+            top_bars=top_bar_mid,
+            bottom_bars=bottom_bar_mid,
+            stirrup=(
+                detailing.stirrups[stirrup_mid_idx]
+                if detailing.stirrups
+                else StirrupArrangement(
+                    diameter=8, legs=2, spacing=200, zone_length=2000
+                )
+            ),
+            origin=(section_b_offset, y_origin),
+            scale=1.0,
+            title="SECTION B-B",
+        )
+
+
 def generate_multi_beam_dxf(
     detailings: list[BeamDetailingResult],
     output_path: str,
@@ -1327,6 +1402,7 @@ def generate_multi_beam_dxf(
     sheet_margin_mm: float = DEFAULT_SHEET_MARGIN,
     title_block_width_mm: float = DEFAULT_TITLE_BLOCK_WIDTH,
     title_block_height_mm: float = DEFAULT_TITLE_BLOCK_HEIGHT,
+    use_blocks: bool = False,
 ) -> str:
     """
     Generate a single DXF file containing multiple beam details in a grid layout.
@@ -1352,6 +1428,9 @@ def generate_multi_beam_dxf(
         sheet_margin_mm: Sheet margin for deliverable layout (mm)
         title_block_width_mm: Title block width (mm)
         title_block_height_mm: Title block height (mm)
+        use_blocks: Define each distinct detail (elevation, dimensions, section
+            cuts) once as a BLOCK and place it with INSERTs; annotations stay
+            per beam
 
     Returns:
         Path to generated DXF file
@@ -1437,6 +1516,7 @@ def generate_multi_beam_dxf(
         row_y_offsets[r] = row_y_offsets[r - 1] + row_heights[r - 1] + row_spacing
 
     # --- Draw each beam at its computed position ---
+    blocks: dict[str, str] = {}
     for idx, detailing in enumerate(draw_list):
         # Calculate row and column
         row = idx // columns
@@ -1448,26 +1528,31 @@ def generate_multi_beam_dxf(
         x_origin = base_x + col_x_offsets[col]
         y_origin = base_y + row_y_offsets[row]
 
-        # Draw beam elevation
-        draw_beam_elevation(
-            msp,
-            span=detailing.span,
-            D=detailing.D,
-            b=detailing.b,
-            cover=detailing.cover,
-            top_bars=detailing.top_bars,
-            bottom_bars=detailing.bottom_bars,
-            stirrups=detailing.stirrups,
-            origin=(x_origin, y_origin),
-        )
-
-        # Add dimensions
-        if include_dimensions:
-            draw_dimensions(
-                msp, detailing.span, detailing.D, origin=(x_origin, y_origin)
+        if use_blocks:
+            # Identical details are drawn once into a BLOCK and placed by INSERT
+            key = _detail_block_key(detailing, include_dimensions, include_section_cuts)
+            block_name = blocks.get(key)
+            if block_name is None:
+                block_name = f"BEAM_TYPE_{len(blocks) + 1}"
+                blocks[key] = block_name
+                _draw_beam_detail(
+                    doc.blocks.new(name=block_name),
+                    detailing,
+                    origin=(0.0, 0.0),
+                    include_dimensions=include_dimensions,
+                    include_section_cuts=include_section_cuts,
+                )
+            msp.add_blockref(block_name, (x_origin, y_origin))
+        else:
+            _draw_beam_detail(
+                msp,
+                detailing,
+                origin=(x_origin, y_origin),
+                include_dimensions=include_dimensions,
+                include_section_cuts=include_section_cuts,
             )
 
-        # Add annotations
+        # Annotations carry the beam id and bar marks, so stay per beam
         if include_annotations:
             draw_annotations(
                 msp,
@@ -1485,83 +1570,6 @@ def generate_multi_beam_dxf(
                 origin=(x_origin, y_origin),
             )
 
-        # Add section cuts
-        if include_section_cuts:
-            section_x_offset = x_origin + detailing.span + 500
-
-            # Get bar arrangements for support (first zone)
-            top_bar_support = (
-                detailing.top_bars[0]
-                if detailing.top_bars
-                else BarArrangement(
-                    count=2, diameter=12, area_provided=226, spacing=100, layers=1
-                )
-            )
-            bottom_bar_support = (
-                detailing.bottom_bars[0]
-                if detailing.bottom_bars
-                else BarArrangement(
-                    count=2, diameter=12, area_provided=226, spacing=100, layers=1
-                )
-            )
-
-            draw_section_cut(
-                msp,
-                b=detailing.b,
-                D=detailing.D,
-                cover=detailing.cover,
-                top_bars=top_bar_support,
-                bottom_bars=bottom_bar_support,
-                stirrup=(
-                    detailing.stirrups[0]
-                    if detailing.stirrups
-                    else StirrupArrangement(
-                        diameter=8, legs=2, spacing=150, zone_length=1000
-                    )
-                ),
-                origin=(section_x_offset, y_origin),
-                scale=1.0,
-                title="SECTION A-A",
-            )
-
-            # Section B-B at midspan
-            section_b_offset = section_x_offset + detailing.b + 200
-            mid_idx = len(detailing.top_bars) // 2 if detailing.top_bars else 0
-            top_bar_mid = (
-                detailing.top_bars[mid_idx]
-                if detailing.top_bars
-                else BarArrangement(
-                    count=2, diameter=12, area_provided=226, spacing=100, layers=1
-                )
-            )
-            bottom_bar_mid = (
-                detailing.bottom_bars[mid_idx]
-                if detailing.bottom_bars
-                else BarArrangement(
-                    count=2, diameter=12, area_provided=226, spacing=100, layers=1
-                )
-            )
-            stirrup_mid_idx = len(detailing.stirrups) // 2 if detailing.stirrups else 0
-
-            draw_section_cut(
-                msp,
-                b=detailing.b,
-                D=detailing.D,
-                cover=detailing.cover,
-                top_bars=top_bar_mid,
-                bottom_bars=bottom_bar_mid,
-                stirrup=(
-                    detailing.stirrups[stirrup_mid_idx]
-                    if detailing.stirrups
-                    else StirrupArrangement(
-                        diameter=8, legs=2, spacing=200, zone_length=2000
-                    )
-                ),
-                origin=(section_b_offset, y_origin),
-                scale=1.0,
-                title="SECTION B-B",
-            )
-
     # Add beam schedule table (industry standard)
     schedule_height = 0.0
     if include_beam_schedule and len(detailings) > 1:
@@ -1649,6 +1657,202 @@ def generate_multi_beam_dxf(
     return output_path
 
 
+# =============================================================================
+# Sheet Sets
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class DXFSheetSet:
+    """Files written by :func:`generate_multi_beam_dxf_sheets`.
+
+    Attributes:
+        sheets: Sheet drawings, in beam order
+        sheet_beams: Beam ids drawn on each sheet
+        index_path: Index drawing listing every sheet and its beams
+        bundle_path: Zip of the index and all sheets, when requested
+    """
+
+    sheets: tuple[Path, ...]
+    sheet_beams: tuple[tuple[str, ...], ...]
+    index_path: Path
+    bundle_path: Path | None = None
+
+
+def _generate_sheet(
+    detailings: list[BeamDetailingResult], output_path: str, options: dict
+) -> str:
+    """Worker entry point: one sheet of a set."""
+    return generate_multi_beam_dxf(detailings, output_path, **options)
+
+
+def _draw_sheet_index(
+    msp: Any, title: str, rows: list[tuple[str, str, tuple[str, ...]]]
+) -> None:
+    """Draw the sheet list: number, file and beam range per sheet."""
+    row_height = TEXT_HEIGHT * 2
+    y: float = row_height * (len(rows) + 2)
+    msp.add_text(
+        title, dxfattribs={"layer": "TEXT", "height": TEXT_HEIGHT * 1.5}
+    ).set_placement((0, y), align=_text_align("LEFT"))
+    columns = (("SHEET", 0.0), ("FILE", 800.0), ("BEAMS", 2400.0), ("COUNT", 6000.0))
+    y -= row_height * 1.5
+    for label, x in columns:
+        msp.add_text(
+            label, dxfattribs={"layer": "TEXT", "height": TEXT_HEIGHT}
+        ).set_placement((x, y), align=_text_align("LEFT"))
+    for number, file_name, beam_ids in rows:
+        y -= row_height
+        beam_range = (
+            beam_ids[0] if len(beam_ids) == 1 else f"{beam_ids[0]} to {beam_ids[-1]}"
+        )
+        for text, (_label, x) in zip(
+            (number, file_name, beam_range, str(len(beam_ids))), columns, strict=True
+        ):
+            msp.add_text(
+                text, dxfattribs={"layer": "TEXT", "height": TEXT_HEIGHT}
+            ).set_placement((x, y), align=_text_align("LEFT"))
+
+
+def generate_multi_beam_dxf_sheets(
+    detailings: list[BeamDetailingResult],
+    output_dir: str | Path,
+    *,
+    stem: str = "beams",
+    beams_per_sheet: int = DEFAULT_BEAMS_PER_SHEET,
+    max_workers: int | None = None,
+    bundle: bool = True,
+    columns: int = 2,
+    include_dimensions: bool = True,
+    include_annotations: bool = True,
+    include_section_cuts: bool = True,
+    include_title_block: bool = False,
+    include_beam_schedule: bool = False,
+    title_block: dict | None = None,
+    sheet_margin_mm: float = DEFAULT_SHEET_MARGIN,
+    title_block_width_mm: float = DEFAULT_TITLE_BLOCK_WIDTH,
+    title_block_height_mm: float = DEFAULT_TITLE_BLOCK_HEIGHT,
+    use_blocks: bool = True,
+) -> DXFSheetSet:
+    """
+    Split a large beam schedule into DXF sheets drawn in parallel.
+
+    One drawing of a whole project is slow to write and heavy for CAD to
+    open. Here beams are cut, in order, into sheets of ``beams_per_sheet``,
+    each laid out by :func:`generate_multi_beam_dxf` in its own worker
+    process. An index drawing lists every sheet with its beam range, and the
+    index and sheets are zipped into one bundle.
+
+    Files are named ``{stem}_01.dxf``, ``{stem}_02.dxf``, ...,
+    ``{stem}_index.dxf`` and ``{stem}.zip``.
+
+    Args:
+        detailings: Beams to draw, in schedule order
+        output_dir: Directory for the sheets, index and bundle (created)
+        stem: File name prefix
+        beams_per_sheet: Beams per sheet (must be >= 1)
+        max_workers: Worker processes; ``1`` draws in-process
+        bundle: Write the zip bundle
+        columns: Grid columns per sheet
+        include_dimensions: Add dimension lines
+        include_annotations: Add text annotations
+        include_section_cuts: Add cross-section views
+        include_title_block: Draw a border and title block on each sheet; the
+            title gains "SHEET i OF n"
+        include_beam_schedule: Add each sheet's beam schedule table
+        title_block: Optional dict to override title block fields
+        sheet_margin_mm: Sheet margin for deliverable layout (mm)
+        title_block_width_mm: Title block width (mm)
+        title_block_height_mm: Title block height (mm)
+        use_blocks: Share identical details as BLOCKs within each sheet
+
+    Returns:
+        DXFSheetSet with the written paths
+
+    Raises:
+        ValueError: If detailings is empty or beams_per_sheet < 1
+    """
+    check_ezdxf()
+
+    if not detailings:
+        raise ValueError("At least one beam detailing result is required")
+    if beams_per_sheet < 1:
+        raise ValueError("beams_per_sheet must be >= 1")
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    chunks = [
+        detailings[i : i + beams_per_sheet]
+        for i in range(0, len(detailings), beams_per_sheet)
+    ]
+    width = max(2, len(str(len(chunks))))
+    paths = [directory / f"{stem}_{n:0{width}d}.dxf" for n in range(1, len(chunks) + 1)]
+
+    base_title = (title_block or {}).get("title", "RC BEAM DETAIL SHEET")
+    options = [
+        {
+            "columns": columns,
+            "include_dimensions": include_dimensions,
+            "include_annotations": include_annotations,
+            "include_section_cuts": include_section_cuts,
+            "include_title_block": include_title_block,
+            "include_beam_schedule": include_beam_schedule,
+            "title_block": {
+                **(title_block or {}),
+                "title": f"{base_title} - SHEET {n} OF {len(chunks)}",
+            },
+            "sheet_margin_mm": sheet_margin_mm,
+            "title_block_width_mm": title_block_width_mm,
+            "title_block_height_mm": title_block_height_mm,
+            "use_blocks": use_blocks,
+        }
+        for n in range(1, len(chunks) + 1)
+    ]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    jobs = (chunks, [str(path) for path in paths], options)
+    if workers <= 1:
+        list(map(_generate_sheet, *jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_generate_sheet, *jobs))
+
+    sheet_beams = tuple(
+        tuple(d.beam_id or f"B{i + 1}" for i, d in enumerate(chunk, start=offset))
+        for offset, chunk in zip(
+            range(0, len(detailings), beams_per_sheet), chunks, strict=True
+        )
+    )
+    index_path = directory / f"{stem}_index.dxf"
+    doc = ezdxf.new("R2010")
+    if units is not None:
+        doc.units = units.MM
+    setup_layers(doc)
+    _draw_sheet_index(
+        doc.modelspace(),
+        f"{base_title} - INDEX ({len(detailings)} beams, {len(chunks)} sheets)",
+        [
+            (f"{n:0{width}d}", path.name, beams)
+            for n, (path, beams) in enumerate(zip(paths, sheet_beams, strict=True), 1)
+        ],
+    )
+    doc.saveas(str(index_path))
+
+    bundle_path = None
+    if bundle:
+        bundle_path = directory / f"{stem}.zip"
+        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in (index_path, *paths):
+                archive.write(path, arcname=path.name)
+
+    return DXFSheetSet(
+        sheets=tuple(paths),
+        sheet_beams=sheet_beams,
+        index_path=index_path,
+        bundle_path=bundle_path,
+    )
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -9,6 +9,8 @@ Functions decorated with @xw.func become User-Defined Functions (UDFs) in Excel.
 Usage in Excel:
     =IS456_MuLim(300, 450, 25, 500)  -> Returns limiting moment
     =IS456_AstRequired(300, 450, 120, 25, 500)  -> Returns required steel area
+    =IS456_AstRequired_Array(B2:B5001, D2:D5001, G2:G5001, 25, 500)
+        -> Spills one result per row in a single call
 
 Setup:
     1. Install xlwings: pip install xlwings
@@ -19,13 +21,13 @@ Setup:
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 try:
     import xlwings as xw
 except ImportError:
     # Provide no-op stubs so the module can be imported without xlwings
-    from collections.abc import Callable
-    from typing import Any
-
     class _Stub:
         @staticmethod
         def func(fn: Any = None, **kw: Any) -> Any:
@@ -212,6 +214,155 @@ def IS456_Ld(dia: float, fck: float, fy: float) -> float | str:
         return f"Error: {str(e)}"
 
 
+# ============================================================================
+# ARRAY UDFs (one call per range instead of one call per cell)
+# ============================================================================
+#
+# Every scalar UDF call crosses the Excel/Python boundary, and that crossing
+# costs far more than the calculation. The *_Array variants take whole
+# ranges, run the scalar UDF for each row inside one call, and return a
+# column that spills in dynamic-array Excel. A single cell or constant is
+# repeated for every row, and a row with an empty input gives an empty cell.
+# A failing row gets its own "Error: ..." text instead of failing the range.
+
+
+def _flatten_range(values: Any) -> list[Any]:
+    """Return the cells of a range (row-major), or a constant as one cell."""
+    if not isinstance(values, (list, tuple)):
+        return [values]
+    cells: list[Any] = []
+    for row in values:
+        if isinstance(row, (list, tuple)):
+            cells.extend(row)
+        else:
+            cells.append(row)
+    return cells
+
+
+def _map_rows(fn: Callable[..., Any], *ranges: Any) -> list[list[Any]]:
+    """Apply ``fn`` row by row across ``ranges``, as a one-column spill."""
+    columns = [_flatten_range(values) for values in ranges]
+    rows = max(len(column) for column in columns)
+    if any(len(column) not in (1, rows) for column in columns):
+        return [["Error: Input ranges must have the same number of cells"]]
+    columns = [column * rows if len(column) == 1 else column for column in columns]
+
+    # Schedules repeat sections and grades; evaluate each distinct row once
+    results: dict[tuple[Any, ...], Any] = {}
+    spill: list[list[Any]] = []
+    for args in zip(*columns, strict=True):
+        if None in args or "" in args:
+            spill.append([""])
+            continue
+        if args not in results:
+            try:
+                results[args] = fn(*args)
+            except Exception as e:
+                results[args] = f"Error: {str(e)}"
+        spill.append([results[args]])
+    return spill
+
+
+@xw.func
+@xw.arg("b", ndim=2, doc="Beam widths (mm)")
+@xw.arg("d", ndim=2, doc="Effective depths (mm)")
+@xw.arg("fck", ndim=2, doc="Concrete grades (N/mm²)")
+@xw.arg("fy", ndim=2, doc="Steel grades (N/mm²)")
+@xw.ret(doc="Limiting moment of resistance per row (kN·m)")
+def IS456_MuLim_Array(b: Any, d: Any, fck: Any, fy: Any) -> list[list[Any]]:
+    """
+    Row-wise IS456_MuLim over ranges.
+
+    Example in Excel:
+        =IS456_MuLim_Array(B2:B5001, D2:D5001, 25, 500)
+    """
+    return _map_rows(IS456_MuLim, b, d, fck, fy)
+
+
+@xw.func
+@xw.arg("b", ndim=2, doc="Beam widths (mm)")
+@xw.arg("d", ndim=2, doc="Effective depths (mm)")
+@xw.arg("mu", ndim=2, doc="Factored moments (kN·m)")
+@xw.arg("fck", ndim=2, doc="Concrete grades (N/mm²)")
+@xw.arg("fy", ndim=2, doc="Steel grades (N/mm²)")
+@xw.ret(doc="Required tension steel area per row (mm²) or status text")
+def IS456_AstRequired_Array(
+    b: Any, d: Any, mu: Any, fck: Any, fy: Any
+) -> list[list[Any]]:
+    """
+    Row-wise IS456_AstRequired over ranges.
+
+    Example in Excel:
+        =IS456_AstRequired_Array(B2:B5001, D2:D5001, G2:G5001, E2:E5001, 500)
+    """
+    return _map_rows(IS456_AstRequired, b, d, mu, fck, fy)
+
+
+@xw.func
+@xw.arg("vu", ndim=2, doc="Factored shear forces (kN)")
+@xw.arg("b", ndim=2, doc="Beam widths (mm)")
+@xw.arg("d", ndim=2, doc="Effective depths (mm)")
+@xw.arg("fck", ndim=2, doc="Concrete grades (N/mm²)")
+@xw.arg("fy", ndim=2, doc="Steel grades (N/mm²)")
+@xw.arg("dia_stirrup", ndim=2, doc="Stirrup diameters (mm)")
+@xw.arg("pt", ndim=2, doc="Tension steel percentages (%)")
+@xw.ret(doc="Required stirrup spacing per row (mm)")
+def IS456_ShearSpacing_Array(
+    vu: Any, b: Any, d: Any, fck: Any, fy: Any, dia_stirrup: Any, pt: Any
+) -> list[list[Any]]:
+    """
+    Row-wise IS456_ShearSpacing over ranges.
+
+    Example in Excel:
+        =IS456_ShearSpacing_Array(H2:H5001, B2:B5001, D2:D5001, 25, 500, 8, 0.5)
+    """
+    return _map_rows(IS456_ShearSpacing, vu, b, d, fck, fy, dia_stirrup, pt)
+
+
+@xw.func
+@xw.arg("num_bars", ndim=2, doc="Numbers of bars")
+@xw.arg("dia", ndim=2, doc="Bar diameters (mm)")
+@xw.ret(doc="Bar callout string per row")
+def IS456_BarCallout_Array(num_bars: Any, dia: Any) -> list[list[Any]]:
+    """
+    Row-wise IS456_BarCallout over ranges.
+
+    Example in Excel:
+        =IS456_BarCallout_Array(L2:L5001, 16)
+    """
+    return _map_rows(IS456_BarCallout, num_bars, dia)
+
+
+@xw.func
+@xw.arg("legs", ndim=2, doc="Numbers of stirrup legs")
+@xw.arg("dia", ndim=2, doc="Stirrup diameters (mm)")
+@xw.arg("spacing", ndim=2, doc="Spacings (mm)")
+@xw.ret(doc="Stirrup callout string per row")
+def IS456_StirrupCallout_Array(legs: Any, dia: Any, spacing: Any) -> list[list[Any]]:
+    """
+    Row-wise IS456_StirrupCallout over ranges.
+
+    Example in Excel:
+        =IS456_StirrupCallout_Array(2, 8, N2:N5001)
+    """
+    return _map_rows(IS456_StirrupCallout, legs, dia, spacing)
+
+
+@xw.func
+@xw.arg("dia", ndim=2, doc="Bar diameters (mm)")
+@xw.arg("fck", ndim=2, doc="Concrete grades (N/mm²)")
+@xw.arg("fy", ndim=2, doc="Steel grades (N/mm²)")
+@xw.ret(doc="Development length per row (mm)")
+def IS456_Ld_Array(dia: Any, fck: Any, fy: Any) -> list[list[Any]]:
+    """
+    Row-wise IS456_Ld over ranges.
+
+    Example in Excel:
+        =IS456_Ld_Array(16, E2:E5001, 500)
+    """
+    return _map_rows(IS456_Ld, dia, fck, fy)
+
+
 # ============================================================================
 # MACRO FUNCTIONS (called by Excel buttons, not formulas)
 # ============================================================================
@@ -6,9 +6,11 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import os
 import re
 from collections import Counter
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from importlib import resources
 from numbers import Real
 from typing import Any
@@ -152,6 +154,7 @@ _KNOWN_HELD_HEADERS = {
 }
 _WORKBOOK_ARTIFACT_NAME = "structural-lib-rectangular-beam-workbench-v1.xlsx"
 _WORKBOOK_RESOURCE_DIR = "data/excel/outputs/e1-excel-routine-workbench"
+_MIN_ROWS_PER_WORKER = 50
 
 
 def _workbook_artifact_identity() -> tuple[str, int]:
@@ -596,9 +599,92 @@ def _passport(
     )
 
 
+def _design_row(
+    normalized: Mapping[str, Any],
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Return the canonical result of one normalized row, or its error message."""
+    call = dict(normalized)
+    basis = call.pop("effective_depth_basis")
+    if basis is not None:
+        call["effective_depth_basis"] = EffectiveDepthBasisV1(**basis)
+    try:
+        canonical = to_transport_value(design_beam_is456(**call))
+    except (TypeError, ValueError) as exc:
+        return None, str(exc)
+    assert isinstance(canonical, dict)
+    return canonical, None
+
+
+def _design_rows(
+    rows: Sequence[Mapping[str, Any]], max_workers: int | None
+) -> list[tuple[dict[str, Any] | None, str | None]]:
+    # A row designs in a few milliseconds; small tables stay in-process
+    workers = min(
+        max_workers or os.cpu_count() or 1,
+        max(1, len(rows) // _MIN_ROWS_PER_WORKER),
+    )
+    if workers <= 1:
+        return list(map(_design_row, rows))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _design_row, rows, chunksize=max(1, len(rows) // (workers * 4))
+            )
+        )
+
+
+def _reusable_entries(
+    previous: ExcelWorkbookRunResultV1 | None,
+    *,
+    selection_hash: str,
+    mapping_hash: str,
+    library_content_identity: str,
+) -> dict[str, ExcelRowLedgerEntryV1]:
+    """Index the calculated rows of a prior run that this run may keep as-is.
+
+    A passport binds the raw row, selection, mapping and library identity, so
+    a prior entry is only valid while all four are unchanged. Calculation
+    errors are not reused because their issue paths name the row position.
+    """
+    if (
+        previous is None
+        or previous.workbook_selection_hash != selection_hash
+        or previous.mapping.mapping_hash != mapping_hash
+        or previous.library_content_identity != library_content_identity
+    ):
+        return {}
+    return {
+        item.raw_row_hash: item
+        for item in previous.row_ledger
+        if item.disposition is ExcelRowDispositionV1.ACCEPTED
+        and item.passport is not None
+    }
+
+
 def run_excel_workbook_v1(
     request: ExcelWorkbookRunRequestV1,
+    *,
+    previous: ExcelWorkbookRunResultV1 | None = None,
+    max_workers: int | None = None,
 ) -> ExcelWorkbookRunResultV1:
+    """Design every accepted row of a reviewed selected table.
+
+    Rows are normalized and checked in order, then each distinct normalized
+    input is designed once, across worker processes for large tables. The
+    ledger keeps source-row order, so the result and its bundle hash do not
+    depend on how the work was split.
+
+    Args:
+        request: Selected table plus the reviewed mapping hash.
+        previous: Result of an earlier run of the same workbook selection.
+            Rows whose raw values are unchanged keep their prior ledger
+            entries when the mapping and library identity also match, so a
+            re-run after a cell edit only designs the edited rows.
+        max_workers: Worker process cap (default: CPU count).
+
+    Raises:
+        ValueError: The mapping preview is blocked or not the reviewed one.
+    """
     preview_request = ExcelWorkbookPreviewRequestV1(
         selection=request.selection,
         headers=request.headers,
@@ -625,8 +711,17 @@ def run_excel_workbook_v1(
 
     selection_hash = _selection_hash(preview_request)
     library_content_identity = get_library_content_identity()
-    ledger: list[ExcelRowLedgerEntryV1] = []
+    reusable = _reusable_entries(
+        previous,
+        selection_hash=selection_hash,
+        mapping_hash=preview.mapping_hash,
+        library_content_identity=library_content_identity,
+    )
+    # Entries stay None until their row is designed below
+    ledger: list[ExcelRowLedgerEntryV1 | None] = []
     normalized_inputs: list[dict[str, Any]] = []
+    pending: list[tuple[int, str, str, str, dict[str, Any], str]] = []
+    pending_keys: dict[str, dict[str, Any]] = {}
     for offset, raw in enumerate(request.rows):
         source_row = request.selection.first_data_row_number + offset
         row_path = f"rows[{offset}]"
@@ -702,13 +797,32 @@ def run_excel_workbook_v1(
             continue
 
         normalized_inputs.append(normalized)
-        call = dict(normalized)
-        basis = call.pop("effective_depth_basis")
-        if basis is not None:
-            call["effective_depth_basis"] = EffectiveDepthBasisV1(**basis)
+        prior = reusable.get(raw_row_hash)
+        if prior is not None:
+            ledger.append(prior.model_copy(update={"source_row_number": source_row}))
+            continue
+
+        # Identical normalized rows are designed once
+        key = _canonical_json_hash(normalized)
+        pending_keys.setdefault(key, normalized)
+        pending.append((len(ledger), row_id, beam_id, raw_row_hash, normalized, key))
+        ledger.append(None)
+
+    designs = dict(
+        zip(
+            pending_keys,
+            _design_rows(list(pending_keys.values()), max_workers),
+            strict=True,
+        )
+    )
+    for index, row_id, beam_id, raw_row_hash, normalized, key in pending:
+        raw = request.rows[index]
+        source_row = request.selection.first_data_row_number + index
+        row_path = f"rows[{index}]"
+        canonical, error = designs[key]
         try:
-            canonical = to_transport_value(design_beam_is456(**call))
-            assert isinstance(canonical, dict)
+            if canonical is None:
+                raise ValueError(error)
             passport = _passport(
                 row_id=row_id,
                 beam_id=beam_id,
@@ -719,51 +833,48 @@ def run_excel_workbook_v1(
                 mapping_hash=preview.mapping_hash,
                 library_content_identity=library_content_identity,
             )
-            ledger.append(
-                ExcelRowLedgerEntryV1(
-                    source_row_number=source_row,
-                    raw_values=raw,
-                    raw_row_hash=raw_row_hash,
-                    row_id=row_id,
-                    beam_id=beam_id,
-                    disposition=ExcelRowDispositionV1.ACCEPTED,
-                    normalized_input=normalized,
-                    result_envelope=canonical["result_envelope"],
-                    result=canonical,
-                    passport=passport,
-                )
+            ledger[index] = ExcelRowLedgerEntryV1(
+                source_row_number=source_row,
+                raw_values=raw,
+                raw_row_hash=raw_row_hash,
+                row_id=row_id,
+                beam_id=beam_id,
+                disposition=ExcelRowDispositionV1.ACCEPTED,
+                normalized_input=normalized,
+                result_envelope=canonical["result_envelope"],
+                result=canonical,
+                passport=passport,
             )
         except (TypeError, ValueError) as exc:
-            ledger.append(
-                ExcelRowLedgerEntryV1(
-                    source_row_number=source_row,
-                    raw_values=raw,
-                    raw_row_hash=raw_row_hash,
-                    row_id=row_id,
-                    beam_id=beam_id,
-                    disposition=ExcelRowDispositionV1.ACCEPTED,
-                    normalized_input=normalized,
-                    result_envelope=_calculation_error_envelope(exc, row_path),
-                    issues=(
-                        _issue(
-                            "E_EXCEL_CANONICAL_CALCULATION",
-                            row_path,
-                            str(exc),
-                        ),
+            ledger[index] = ExcelRowLedgerEntryV1(
+                source_row_number=source_row,
+                raw_values=raw,
+                raw_row_hash=raw_row_hash,
+                row_id=row_id,
+                beam_id=beam_id,
+                disposition=ExcelRowDispositionV1.ACCEPTED,
+                normalized_input=normalized,
+                result_envelope=_calculation_error_envelope(exc, row_path),
+                issues=(
+                    _issue(
+                        "E_EXCEL_CANONICAL_CALCULATION",
+                        row_path,
+                        str(exc),
                     ),
-                )
+                ),
             )
+    entries = [item for item in ledger if item is not None]
 
     counts = ExcelRowCountV1(
-        source_rows=len(ledger),
+        source_rows=len(entries),
         accepted_rows=sum(
-            item.disposition is ExcelRowDispositionV1.ACCEPTED for item in ledger
+            item.disposition is ExcelRowDispositionV1.ACCEPTED for item in entries
         ),
         blocked_rows=sum(
-            item.disposition is ExcelRowDispositionV1.BLOCKED for item in ledger
+            item.disposition is ExcelRowDispositionV1.BLOCKED for item in entries
         ),
         excluded_rows=sum(
-            item.disposition is ExcelRowDispositionV1.EXCLUDED for item in ledger
+            item.disposition is ExcelRowDispositionV1.EXCLUDED for item in entries
         ),
     )
     contract = _contract()
@@ -777,7 +888,7 @@ def run_excel_workbook_v1(
         "source_table_hash": source_table_hash,
         "mapping": preview.model_dump(mode="json"),
         "counts": counts.model_dump(mode="json"),
-        "row_ledger": [item.model_dump(mode="json") for item in ledger],
+        "row_ledger": [item.model_dump(mode="json") for item in entries],
         "normalized_input_hash": normalized_input_hash,
         "library_version": library_version,
         "library_content_identity": library_content_identity,
@@ -792,7 +903,7 @@ def run_excel_workbook_v1(
         source_table_hash=source_table_hash,
         mapping=preview,
         counts=counts,
-        row_ledger=tuple(ledger),
+        row_ledger=tuple(entries),
         normalized_input_hash=normalized_input_hash,
         library_version=library_version,
         library_content_identity=library_content_identity,
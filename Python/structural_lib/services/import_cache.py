@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Bounded cache for the defaults-independent stage of lossless imports.
+
+Users typically re-upload the same export while adjusting project defaults.
+Adapter selection, the physical-row ledger and force parsing depend only on
+the artifact bytes, the requested format and the library build, so that stage
+is cached here and only the defaults-dependent geometry stage runs again.
+
+Entries live in an in-memory LRU and, optionally, as JSON files in a private
+directory so they survive process restarts. Keys include the library's
+runtime identity, so an upgrade never reuses evidence from another build.
+
+Example:
+    >>> cache = ImportResultCache(max_entries=16)
+    >>> result = parse_dual_csv_lossless(geometry, forces, cache=cache)
+    >>> cache.stats().hits
+    0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from structural_lib.core.models import BeamForces
+from structural_lib.core.version import get_runtime_version_identity
+
+from .compact_ledger import CompactRowLedger
+from .import_ledger import (
+    AdapterSelectionV1,
+    ImportArtifactV1,
+    ImportIssueV1,
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_SCHEMA = "import-stage-cache-v2"
+
+
+@dataclass(frozen=True)
+class ParsedImportV1:
+    """Defaults-independent evidence for one lossless import.
+
+    Attributes:
+        adapter_key: Selected adapter, or None when selection blocked
+        selection: Adapter selection evidence
+        issues: Selection and ledger issues, in ledger order
+        artifacts: Artifact identities (one for combined, two for dual)
+        rows: Compact physical-row ledger for every artifact
+        forces: Canonical forces, loaded only when the ledger is clean
+        forces_error: Adapter error raised while loading forces, if any
+    """
+
+    adapter_key: str | None
+    selection: AdapterSelectionV1
+    issues: tuple[ImportIssueV1, ...]
+    artifacts: tuple[ImportArtifactV1, ...]
+    rows: CompactRowLedger
+    forces: tuple[BeamForces, ...] = ()
+    forces_error: str | None = None
+
+    def to_json(self) -> str:
+        """Serialize for the disk tier; :meth:`from_json` restores it."""
+        return json.dumps(
+            {
+                "adapter_key": self.adapter_key,
+                "selection": self.selection.model_dump(mode="json"),
+                "issues": [issue.model_dump(mode="json") for issue in self.issues],
+                "artifacts": [
+                    artifact.model_dump(mode="json") for artifact in self.artifacts
+                ],
+                "rows": self.rows.to_dict(),
+                "forces": [force.model_dump(mode="json") for force in self.forces],
+                "forces_error": self.forces_error,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> ParsedImportV1:
+        """Restore :meth:`to_json` output.
+
+        Raises:
+            ValueError: If the text is not a valid entry (including
+                ``pydantic.ValidationError``)
+            KeyError: If a required key is missing
+            TypeError: If a value has the wrong shape
+        """
+        data = json.loads(text)
+        return cls(
+            adapter_key=data["adapter_key"],
+            selection=AdapterSelectionV1.model_validate(data["selection"]),
+            issues=tuple(ImportIssueV1.model_validate(item) for item in data["issues"]),
+            artifacts=tuple(
+                ImportArtifactV1.model_validate(item) for item in data["artifacts"]
+            ),
+            rows=CompactRowLedger.from_dict(data["rows"]),
+            forces=tuple(BeamForces.model_validate(item) for item in data["forces"]),
+            forces_error=data["forces_error"],
+        )
+
+
+@dataclass(frozen=True)
+class ImportCacheStats:
+    """Counters for an :class:`ImportResultCache`."""
+
+    hits: int
+    misses: int
+    memory_hits: int
+    disk_hits: int
+    stores: int
+    evictions: int
+    entries: int
+    max_entries: int
+    disk_enabled: bool
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible view including ``hit_ratio``."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+@cache
+def _library_identity() -> str:
+    identity = get_runtime_version_identity()
+    return f"{identity.package_version}@{identity.package_origin}"
+
+
+def import_cache_key(
+    *,
+    kind: str,
+    artifact_hashes: Sequence[str],
+    artifact_suffixes: Sequence[str],
+    format_hint: str | None,
+    columnar: bool,
+) -> str:
+    """Build the cache key for one import stage.
+
+    Args:
+        kind: ``"single"`` or ``"dual"``
+        artifact_hashes: SHA-256 of each artifact, in role order
+        artifact_suffixes: File suffix of each artifact (adapters check it)
+        format_hint: Requested adapter or ``"auto"``
+        columnar: Whether forces use the columnar fast path
+
+    Returns:
+        Hex SHA-256 of the canonical key payload
+    """
+
+    payload = {
+        "schema": _KEY_SCHEMA,
+        "kind": kind,
+        "artifacts": list(artifact_hashes),
+        "suffixes": [suffix.lower() for suffix in artifact_suffixes],
+        "format_hint": (format_hint or "auto").strip().lower(),
+        "columnar": columnar,
+        "library": _library_identity(),
+    }
+    return sha256(
+        json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+class ImportResultCache:
+    """Thread-safe LRU of :class:`ParsedImportV1` with optional disk tier.
+
+    Args:
+        max_entries: Entries kept in memory and on disk
+        directory: Private directory for JSON entries; None keeps memory only
+
+    Raises:
+        ValueError: If ``max_entries`` is not positive
+    """
+
+    def __init__(
+        self, max_entries: int = 32, directory: Path | str | None = None
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, ParsedImportV1] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> ParsedImportV1 | None:
+        """Return the cached stage for ``key``, promoting disk hits to memory."""
+        with self._lock:
+            parsed = self._entries.get(key)
+            if parsed is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._memory_hits += 1
+                return parsed
+
+        parsed = self._read_disk(key)
+        with self._lock:
+            if parsed is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._remember(key, parsed)
+        return parsed
+
+    def put(self, key: str, parsed: ParsedImportV1) -> None:
+        """Store ``parsed`` under ``key``."""
+        with self._lock:
+            self._stores += 1
+            self._remember(key, parsed)
+        self._write_disk(key, parsed)
+
+    def clear(self) -> None:
+        """Drop every entry (memory and disk) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._memory_hits = self._disk_hits = 0
+            self._stores = self._evictions = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> ImportCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return ImportCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                stores=self._stores,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                disk_enabled=self.directory is not None,
+            )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, parsed: ParsedImportV1) -> None:
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _read_disk(self, key: str) -> ParsedImportV1 | None:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            return ParsedImportV1.from_json(text)
+        except (ValueError, KeyError, TypeError):
+            # A corrupt or foreign entry is a miss, never trusted evidence.
+            logger.warning("Discarding invalid import cache entry %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, key: str, parsed: ParsedImportV1) -> None:
+        if self.directory is None:
+            return
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as handle:
+                handle.write(parsed.to_json())
+            os.replace(handle.name, self.directory / f"{key}.json")
+            entries = sorted(
+                self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime
+            )
+            for stale in entries[: max(0, len(entries) - self.max_entries)]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Could not persist import cache entry", exc_info=True)
+
+
+__all__ = [
+    "ImportCacheStats",
+    "ImportResultCache",
+    "ParsedImportV1",
+    "import_cache_key",
+]
@@ -64,6 +64,7 @@ class ImportIssueV1(BaseModel):
     message: str
     artifact_role: Literal["geometry", "forces", "combined"] | None = None
     source_row_number: int | None = Field(default=None, ge=2)
+    artifact_index: int | None = Field(default=None, ge=0)
 
 
 class ImportArtifactV1(BaseModel):
@@ -114,6 +115,7 @@ class ImportRowLedgerV1(BaseModel):
     fields: tuple[ImportFieldLedgerV1, ...]
     issue_codes: tuple[ImportIssueCode, ...] = ()
     exclusion_reason: str | None = None
+    artifact_index: int | None = Field(default=None, ge=0)
 
 
 class ImportTotalsV1(BaseModel):
@@ -139,7 +141,12 @@ class ImportTotalsV1(BaseModel):
 
 
 class ImportNormalizationLedgerV1(BaseModel):
-    """Replayable field, row, adapter, and matching evidence."""
+    """Replayable field, row, adapter, and matching evidence.
+
+    Multi-artifact project imports list every artifact in ``artifacts`` and
+    tag rows and issues with their ``artifact_index``. ``geometry_artifact``
+    and ``forces_artifact`` then name the first artifact of each role.
+    """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
 
@@ -149,6 +156,16 @@ class ImportNormalizationLedgerV1(BaseModel):
     adapter_selection: AdapterSelectionV1
     rows: tuple[ImportRowLedgerV1, ...]
     totals: ImportTotalsV1
+    artifacts: tuple[ImportArtifactV1, ...] = ()
+
+    @model_validator(mode="after")
+    def _rows_reference_listed_artifacts(self) -> ImportNormalizationLedgerV1:
+        for row in self.rows:
+            if row.artifact_index is not None and row.artifact_index >= len(
+                self.artifacts
+            ):
+                raise ValueError("row artifact_index must reference a listed artifact")
+        return self
 
 
 class LosslessImportResultV1(BaseModel):
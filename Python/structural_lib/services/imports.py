@@ -6,15 +6,18 @@ from __future__ import annotations
 
 import csv
 import math
+import os
 import re
 from collections import Counter, defaultdict
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from hashlib import sha256
 from pathlib import Path
 from typing import Any, Literal
 
 from structural_lib.core.data_types import ValidationReport
+from structural_lib.core.instrumentation import stage
 from structural_lib.core.models import (
     BeamBatchInput,
     BeamForces,
@@ -29,15 +32,14 @@ from .adapters import (
     SAFEAdapter,
     STAADAdapter,
 )
+from .compact_ledger import CompactLosslessImport, CompactRowLedger, LedgerColumn
+from .import_cache import ImportResultCache, ParsedImportV1, import_cache_key
 from .import_ledger import (
     AdapterSelectionV1,
     ImportArtifactV1,
     ImportFieldAction,
-    ImportFieldLedgerV1,
     ImportIssueCode,
     ImportIssueV1,
-    ImportNormalizationLedgerV1,
-    ImportRowLedgerV1,
     ImportStatus,
     ImportTotalsV1,
     LosslessImportResultV1,
@@ -207,12 +209,22 @@ def _select_adapter_with_evidence(
     geometry_csv: Path | str,
     forces_csv: Path | str,
     format_hint: str | None,
+) -> tuple[InputAdapter | None, AdapterSelectionV1, tuple[ImportIssueV1, ...]]:
+    return _select_adapter_for_artifacts(
+        (geometry_csv, forces_csv), format_hint=format_hint
+    )
+
+
+def _select_adapter_for_artifacts(
+    artifacts: Sequence[Path | str],
+    *,
+    format_hint: str | None,
 ) -> tuple[InputAdapter | None, AdapterSelectionV1, tuple[ImportIssueV1, ...]]:
     requested = (format_hint or "auto").strip().lower()
     candidates = tuple(
         _adapter_key(adapter)
         for adapter in _build_adapters()
-        if adapter.can_handle(geometry_csv) and adapter.can_handle(forces_csv)
+        if all(adapter.can_handle(artifact) for artifact in artifacts)
     )
 
     if requested != "auto":
@@ -426,10 +438,14 @@ def _required_fields(
 
 def _read_rows(path: Path) -> tuple[bytes, list[str], list[list[str]]]:
     raw = path.read_bytes()
+    return (raw, *_split_rows(raw))
+
+
+def _split_rows(raw: bytes) -> tuple[list[str], list[list[str]]]:
     parsed = list(csv.reader(raw.decode("utf-8-sig").splitlines()))
     if not parsed:
-        return raw, [], []
-    return raw, [value.strip() for value in parsed[0]], parsed[1:]
+        return [], []
+    return [value.strip() for value in parsed[0]], parsed[1:]
 
 
 def _source_record_id(
@@ -457,16 +473,39 @@ def _artifact_ledger(
     role: Literal["geometry", "forces", "combined"],
     adapter: InputAdapter | None,
     artifact_name: str | None = None,
-) -> tuple[ImportArtifactV1, list[ImportRowLedgerV1], list[ImportIssueV1]]:
+    artifact_index: int | None = None,
+) -> tuple[ImportArtifactV1, CompactRowLedger, list[ImportIssueV1]]:
     path = Path(path_value)
     raw, headers, physical_rows = _read_rows(path)
-    artifact = ImportArtifactV1(
+    return _ledger_from_rows(
+        raw,
+        headers,
+        physical_rows,
         name=artifact_name or path.name,
+        role=role,
+        adapter=adapter,
+        artifact_index=artifact_index,
+    )
+
+
+def _ledger_from_rows(
+    raw: bytes,
+    headers: list[str],
+    physical_rows: list[list[str]],
+    *,
+    name: str,
+    role: Literal["geometry", "forces", "combined"],
+    adapter: InputAdapter | None,
+    artifact_index: int | None,
+) -> tuple[ImportArtifactV1, CompactRowLedger, list[ImportIssueV1]]:
+    artifact = ImportArtifactV1(
+        name=name,
         sha256=sha256(raw).hexdigest(),
         headers=tuple(headers),
         source_rows=len(physical_rows),
     )
     issues: list[ImportIssueV1] = []
+    rows = CompactRowLedger()
     if not headers:
         issues.append(
             ImportIssueV1(
@@ -474,33 +513,26 @@ def _artifact_ledger(
                 path=f"{role}.headers",
                 message=f"{role.title()} artifact has no header row",
                 artifact_role=role,
+                artifact_index=artifact_index,
             )
         )
     if adapter is None:
-        return (
-            artifact,
-            [
-                ImportRowLedgerV1(
-                    artifact_role=role,
-                    source_row_number=row_number,
-                    source_record_id=f"{role}:row:{row_number}",
-                    status=ImportStatus.BLOCKED,
-                    fields=tuple(
-                        ImportFieldLedgerV1(
-                            raw_header=header,
-                            canonical_field=None,
-                            raw_value=(row[index] if index < len(row) else ""),
-                            parsed_value=None,
-                            units=None,
-                            action=ImportFieldAction.REJECTED,
-                        )
-                        for index, header in enumerate(headers)
-                    ),
-                )
-                for row_number, row in enumerate(physical_rows, start=2)
+        rows.begin_artifact(
+            role=role,
+            artifact_index=artifact_index,
+            columns=[
+                LedgerColumn(header, None, None, ImportFieldAction.REJECTED, "none")
+                for header in headers
             ],
-            issues,
         )
+        for row_number, row in enumerate(physical_rows, start=2):
+            rows.append(
+                source_row_number=row_number,
+                source_record_id=f"{role}:row:{row_number}",
+                cells=row,
+                status=ImportStatus.BLOCKED,
+            )
+        return artifact, rows, issues
 
     canonical, header_problems = _canonical_headers(
         headers, _column_spec(adapter, role)
@@ -524,6 +556,7 @@ def _artifact_ledger(
                 path=f"{role}.headers[{index}]",
                 message=message,
                 artifact_role=role,
+                artifact_index=artifact_index,
             )
         )
 
@@ -537,31 +570,60 @@ def _artifact_ledger(
                 path=f"{role}.headers.{field}",
                 message=f"Missing required {role} field {field!r}",
                 artifact_role=role,
+                artifact_index=artifact_index,
             )
         )
 
-    rows: list[ImportRowLedgerV1] = []
+    # The per-column disposition is fixed by the header; only numeric cells
+    # can be rejected row by row, which the compact ledger records sparsely.
+    columns: list[LedgerColumn] = []
+    calculation_columns: set[int] = set()
+    for index, header in enumerate(headers):
+        canonical_field = canonical[index]
+        if canonical_field is None:
+            explicitly_metadata = header.strip().casefold() in (
+                _EXPLICIT_METADATA_HEADERS
+            )
+            calculation_like = (
+                bool(_CALCULATION_HEADER.search(header)) and not explicitly_metadata
+            )
+            if calculation_like:
+                calculation_columns.add(index)
+            columns.append(
+                LedgerColumn(
+                    header,
+                    None,
+                    None,
+                    (
+                        ImportFieldAction.REJECTED
+                        if calculation_like
+                        else ImportFieldAction.METADATA_ONLY
+                    ),
+                    "text",
+                )
+            )
+        else:
+            columns.append(
+                LedgerColumn(
+                    header,
+                    canonical_field,
+                    _UNITS.get(canonical_field),
+                    ImportFieldAction.NORMALIZED,
+                    "number" if canonical_field in _NUMERIC_FIELDS else "text",
+                )
+            )
+    rows.begin_artifact(role=role, columns=columns, artifact_index=artifact_index)
+
     for source_row_number, physical_row in enumerate(physical_rows, start=2):
         values: dict[str, str] = {}
         row_codes = set(header_block_codes)
-        fields: list[ImportFieldLedgerV1] = []
+        rejected: list[int] = []
         for index, header in enumerate(headers):
             raw_value = physical_row[index] if index < len(physical_row) else ""
             stripped = raw_value.strip()
             canonical_field = canonical[index]
             if canonical_field is None:
-                explicitly_metadata = header.strip().casefold() in (
-                    _EXPLICIT_METADATA_HEADERS
-                )
-                calculation_like = (
-                    bool(_CALCULATION_HEADER.search(header)) and not explicitly_metadata
-                )
-                action = (
-                    ImportFieldAction.REJECTED
-                    if calculation_like
-                    else ImportFieldAction.METADATA_ONLY
-                )
-                if calculation_like:
+                if index in calculation_columns:
                     row_codes.add(ImportIssueCode.UNKNOWN_CALCULATION_HEADER)
                     issues.append(
                         ImportIssueV1(
@@ -569,72 +631,59 @@ def _artifact_ledger(
                             path=f"{role}.rows[{source_row_number}].{header}",
                             message=f"Unknown calculation-looking header {header!r}",
                             artifact_role=role,
+                            artifact_index=artifact_index,
                             source_row_number=source_row_number,
                         )
                     )
-                parsed: str | float | None = stripped or None
-            else:
-                values[canonical_field] = stripped
-                action = ImportFieldAction.NORMALIZED
-                parsed = stripped or None
-                if not stripped and canonical_field in required:
-                    row_codes.add(ImportIssueCode.MISSING_VALUE)
+                continue
+            values[canonical_field] = stripped
+            if not stripped and canonical_field in required:
+                row_codes.add(ImportIssueCode.MISSING_VALUE)
+                issues.append(
+                    ImportIssueV1(
+                        code=ImportIssueCode.MISSING_VALUE,
+                        path=f"{role}.rows[{source_row_number}].{canonical_field}",
+                        message=f"Required field {canonical_field!r} is empty",
+                        artifact_role=role,
+                        artifact_index=artifact_index,
+                        source_row_number=source_row_number,
+                    )
+                )
+            elif stripped and canonical_field in _NUMERIC_FIELDS:
+                try:
+                    number = float(stripped)
+                except ValueError:
+                    row_codes.add(ImportIssueCode.MALFORMED_NUMBER)
+                    rejected.append(index)
                     issues.append(
                         ImportIssueV1(
-                            code=ImportIssueCode.MISSING_VALUE,
+                            code=ImportIssueCode.MALFORMED_NUMBER,
                             path=f"{role}.rows[{source_row_number}].{canonical_field}",
-                            message=f"Required field {canonical_field!r} is empty",
+                            message=(
+                                f"Field {canonical_field!r} is not a valid number"
+                            ),
                             artifact_role=role,
+                            artifact_index=artifact_index,
                             source_row_number=source_row_number,
                         )
                     )
-                elif stripped and canonical_field in _NUMERIC_FIELDS:
-                    try:
-                        number = float(stripped)
-                    except ValueError:
-                        row_codes.add(ImportIssueCode.MALFORMED_NUMBER)
-                        action = ImportFieldAction.REJECTED
-                        parsed = None
+                else:
+                    if not math.isfinite(number):
+                        row_codes.add(ImportIssueCode.NON_FINITE_NUMBER)
+                        rejected.append(index)
                         issues.append(
                             ImportIssueV1(
-                                code=ImportIssueCode.MALFORMED_NUMBER,
-                                path=f"{role}.rows[{source_row_number}].{canonical_field}",
-                                message=(
-                                    f"Field {canonical_field!r} is not a valid number"
+                                code=ImportIssueCode.NON_FINITE_NUMBER,
+                                path=(
+                                    f"{role}.rows[{source_row_number}]."
+                                    f"{canonical_field}"
                                 ),
+                                message=f"Field {canonical_field!r} must be finite",
                                 artifact_role=role,
+                                artifact_index=artifact_index,
                                 source_row_number=source_row_number,
                             )
                         )
-                    else:
-                        if not math.isfinite(number):
-                            row_codes.add(ImportIssueCode.NON_FINITE_NUMBER)
-                            action = ImportFieldAction.REJECTED
-                            parsed = None
-                            issues.append(
-                                ImportIssueV1(
-                                    code=ImportIssueCode.NON_FINITE_NUMBER,
-                                    path=(
-                                        f"{role}.rows[{source_row_number}]."
-                                        f"{canonical_field}"
-                                    ),
-                                    message=f"Field {canonical_field!r} must be finite",
-                                    artifact_role=role,
-                                    source_row_number=source_row_number,
-                                )
-                            )
-                        else:
-                            parsed = number
-            fields.append(
-                ImportFieldLedgerV1(
-                    raw_header=header,
-                    canonical_field=canonical_field,
-                    raw_value=raw_value,
-                    parsed_value=parsed,
-                    units=_UNITS.get(canonical_field) if canonical_field else None,
-                    action=action,
-                )
-            )
 
         if len(physical_row) > len(headers):
             row_codes.add(ImportIssueCode.CONFLICTING_HEADER)
@@ -644,6 +693,7 @@ def _artifact_ledger(
                     path=f"{role}.rows[{source_row_number}]",
                     message="Source row contains more values than the header row",
                     artifact_role=role,
+                    artifact_index=artifact_index,
                     source_row_number=source_row_number,
                 )
             )
@@ -653,23 +703,21 @@ def _artifact_ledger(
             if frame_type and frame_type != "beam":
                 exclusion_reason = f"non-beam frame_type={values['frame_type']}"
         rows.append(
-            ImportRowLedgerV1(
-                artifact_role=role,
-                source_row_number=source_row_number,
-                source_record_id=_source_record_id(
-                    role, source_row_number, values, adapter
-                ),
-                status=ImportStatus.BLOCKED if row_codes else ImportStatus.ACCEPTED,
-                fields=tuple(fields),
-                issue_codes=tuple(sorted(row_codes, key=lambda code: code.value)),
-                exclusion_reason=exclusion_reason,
-            )
+            source_row_number=source_row_number,
+            source_record_id=_source_record_id(
+                role, source_row_number, values, adapter
+            ),
+            cells=physical_row,
+            status=ImportStatus.BLOCKED if row_codes else ImportStatus.ACCEPTED,
+            issue_codes=row_codes,
+            exclusion_reason=exclusion_reason,
+            rejected_columns=rejected,
         )
 
     identities: dict[str, list[int]] = defaultdict(list)
-    for index, row in enumerate(rows):
-        if row.exclusion_reason is None:
-            identities[row.source_record_id].append(index)
+    for index in range(len(rows)):
+        if rows.exclusion_reason(index) is None:
+            identities[rows.source_record_id(index)].append(index)
     duplicate_indexes = {
         index
         for indexes in identities.values()
@@ -677,47 +725,148 @@ def _artifact_ledger(
         for index in indexes
     }
     for index in sorted(duplicate_indexes):
-        row = rows[index]
-        code_set = set(row.issue_codes) | {ImportIssueCode.DUPLICATE_RECORD_ID}
-        rows[index] = row.model_copy(
-            update={
-                "status": ImportStatus.BLOCKED,
-                "issue_codes": tuple(sorted(code_set, key=lambda code: code.value)),
-            }
-        )
+        rows.add_issue_code(index, ImportIssueCode.DUPLICATE_RECORD_ID)
+        record_id = rows.source_record_id(index)
         issues.append(
             ImportIssueV1(
                 code=ImportIssueCode.DUPLICATE_RECORD_ID,
-                path=f"{role}.rows[{row.source_row_number}].source_record_id",
-                message=f"Duplicate source record identity {row.source_record_id!r}",
+                path=f"{role}.rows[{rows.source_row_number(index)}].source_record_id",
+                message=f"Duplicate source record identity {record_id!r}",
                 artifact_role=role,
-                source_row_number=row.source_row_number,
+                artifact_index=artifact_index,
+                source_row_number=rows.source_row_number(index),
             )
         )
     return artifact, rows, issues
 
 
-def parse_single_csv_lossless(
-    combined_csv: Path | str,
+def _parse_import_stage(
+    raws: Sequence[bytes],
+    paths: Sequence[Path | str],
     *,
-    format_hint: str | None = None,
-    defaults: DesignDefaults | None = None,
-    artifact_name: str | None = None,
-) -> LosslessImportResultV1:
-    """Parse one combined geometry/actions artifact with physical-row accounting."""
+    roles: Sequence[Literal["geometry", "forces", "combined"]],
+    names: Sequence[str],
+    format_hint: str | None,
+    columnar: bool,
+) -> ParsedImportV1:
+    """Run the defaults-independent import stage (selection, ledger, forces)."""
+
+    with stage("import.parse"):
+        selection_paths = (paths[0], paths[-1])
+        adapter, selection, selection_issues = _select_adapter_with_evidence(
+            geometry_csv=selection_paths[0],
+            forces_csv=selection_paths[1],
+            format_hint=format_hint,
+        )
+        artifacts: list[ImportArtifactV1] = []
+        rows = CompactRowLedger()
+        issues = list(selection_issues)
+        for raw, role, name in zip(raws, roles, names, strict=True):
+            artifact, artifact_rows, artifact_issues = _ledger_from_rows(
+                raw,
+                *_split_rows(raw),
+                name=name,
+                role=role,
+                adapter=adapter,
+                artifact_index=None,
+            )
+            artifacts.append(artifact)
+            rows.extend(artifact_rows)
+            issues.extend(artifact_issues)
+
+        forces: list[BeamForces] = []
+        forces_error: str | None = None
+        if adapter is not None and not issues and rows.accepted_count == len(rows):
+            try:
+                forces = (
+                    adapter.load_forces_columnar(paths[-1])
+                    if columnar
+                    else adapter.load_forces(paths[-1])
+                )
+            except (OSError, TypeError, ValueError, KeyError) as exc:
+                forces_error = str(exc)
+        return ParsedImportV1(
+            adapter_key=_adapter_key(adapter) if adapter is not None else None,
+            selection=selection,
+            issues=tuple(issues),
+            artifacts=tuple(artifacts),
+            rows=rows,
+            forces=tuple(forces),
+            forces_error=forces_error,
+        )
+
+
+def _import_stage(
+    paths: Sequence[Path | str],
+    *,
+    kind: Literal["single", "dual"],
+    names: Sequence[str],
+    format_hint: str | None,
+    columnar: bool,
+    cache: ImportResultCache | None,
+) -> ParsedImportV1:
+    """Return the parsed stage for ``paths``, from ``cache`` when possible."""
+
+    raws = [Path(path).read_bytes() for path in paths]
+    roles: tuple[Literal["geometry", "forces", "combined"], ...] = (
+        ("combined",) if kind == "single" else ("geometry", "forces")
+    )
+    if cache is None:
+        return _parse_import_stage(
+            raws,
+            paths,
+            roles=roles,
+            names=names,
+            format_hint=format_hint,
+            columnar=columnar,
+        )
 
-    adapter, selection, selection_issues = _select_adapter_with_evidence(
-        geometry_csv=combined_csv,
-        forces_csv=combined_csv,
+    key = import_cache_key(
+        kind=kind,
+        artifact_hashes=[sha256(raw).hexdigest() for raw in raws],
+        artifact_suffixes=[Path(path).suffix for path in paths],
         format_hint=format_hint,
+        columnar=columnar,
     )
-    artifact, rows, ledger_issues = _artifact_ledger(
-        combined_csv,
-        role="combined",
-        adapter=adapter,
-        artifact_name=artifact_name,
+    parsed = cache.get(key)
+    if parsed is None:
+        parsed = _parse_import_stage(
+            raws,
+            paths,
+            roles=roles,
+            names=names,
+            format_hint=format_hint,
+            columnar=columnar,
+        )
+        cache.put(key, parsed)
+        return parsed
+    if [artifact.name for artifact in parsed.artifacts] == list(names):
+        return parsed
+    return replace(
+        parsed,
+        artifacts=tuple(
+            artifact.model_copy(update={"name": name})
+            for artifact, name in zip(parsed.artifacts, names, strict=True)
+        ),
+    )
+
+
+def _finish_import(
+    parsed: ParsedImportV1,
+    geometry_csv: Path | str,
+    *,
+    combined: bool,
+    defaults: DesignDefaults | None,
+) -> CompactLosslessImport:
+    """Apply the defaults-dependent stage: geometry, matching and totals."""
+
+    adapter = (
+        _ADAPTER_FACTORIES[parsed.adapter_key]()
+        if parsed.adapter_key is not None
+        else None
     )
-    issues = list(selection_issues) + ledger_issues
+    rows = parsed.rows
+    issues = list(parsed.issues)
     batch: BeamBatchInput | None = None
     beams: list[BeamGeometry] = []
     forces: list[BeamForces] = []
@@ -740,15 +889,15 @@ def parse_single_csv_lossless(
             )
         )
 
-    if (
-        adapter is not None
-        and not issues
-        and all(row.status is ImportStatus.ACCEPTED for row in rows)
-    ):
+    if adapter is not None and not issues and rows.accepted_count == len(rows):
         try:
+            # Generic rows are required to carry these values. The object is
+            # therefore a non-consumed adapter argument, not a project default.
             selected_defaults = defaults or DesignDefaults()  # type: ignore[call-arg]
-            beams = adapter.load_geometry(combined_csv, selected_defaults)
-            forces = adapter.load_forces(combined_csv)
+            beams = adapter.load_geometry(geometry_csv, selected_defaults)
+            if parsed.forces_error is not None:
+                raise ValueError(parsed.forces_error)
+            forces = list(parsed.forces)
         except (OSError, TypeError, ValueError, KeyError) as exc:
             issues.append(
                 ImportIssueV1(
@@ -758,19 +907,35 @@ def parse_single_csv_lossless(
                 )
             )
         else:
-            expected_records = sum(row.exclusion_reason is None for row in rows)
-            if len(beams) != expected_records or len(forces) != expected_records:
-                issues.append(
-                    ImportIssueV1(
-                        code=ImportIssueCode.ADAPTER_ROW_LOSS,
-                        path="combined",
-                        message=(
-                            f"Adapter returned {len(beams)} geometry and {len(forces)} "
-                            f"force records from {expected_records} accepted source rows"
-                        ),
-                        artifact_role="combined",
+            if combined:
+                expected_records = rows.included_count()
+                if len(beams) != expected_records or len(forces) != expected_records:
+                    issues.append(
+                        ImportIssueV1(
+                            code=ImportIssueCode.ADAPTER_ROW_LOSS,
+                            path="combined",
+                            message=(
+                                f"Adapter returned {len(beams)} geometry and "
+                                f"{len(forces)} force records from "
+                                f"{expected_records} accepted source rows"
+                            ),
+                            artifact_role="combined",
+                        )
+                    )
+            else:
+                expected_geometry = rows.included_count(("geometry",))
+                if len(beams) != expected_geometry:
+                    issues.append(
+                        ImportIssueV1(
+                            code=ImportIssueCode.ADAPTER_ROW_LOSS,
+                            path="geometry",
+                            message=(
+                                f"Adapter returned {len(beams)} geometry records from "
+                                f"{expected_geometry} accepted source rows"
+                            ),
+                            artifact_role="geometry",
+                        )
                     )
-                )
             duplicates = {
                 value
                 for value, count in Counter(beam.id for beam in beams).items()
@@ -792,9 +957,7 @@ def parse_single_csv_lossless(
                 )
             if beams and forces:
                 candidate = BeamBatchInput(
-                    beams=beams,
-                    forces=forces,
-                    defaults=selected_defaults,
+                    beams=beams, forces=forces, defaults=selected_defaults
                 )
                 unmatched_beams = candidate.get_unmatched_beams()
                 unmatched_forces = candidate.get_unmatched_forces()
@@ -829,12 +992,11 @@ def parse_single_csv_lossless(
                     )
                 )
 
-    accepted_rows = sum(row.status is ImportStatus.ACCEPTED for row in rows)
     totals = ImportTotalsV1(
         source_rows=len(rows),
-        accepted_rows=accepted_rows,
-        blocked_rows=len(rows) - accepted_rows,
-        excluded_rows=sum(row.exclusion_reason is not None for row in rows),
+        accepted_rows=rows.accepted_count,
+        blocked_rows=len(rows) - rows.accepted_count,
+        excluded_rows=rows.excluded_count,
         geometry_records=len(beams),
         force_records=len(forces),
         matched_records=len(
@@ -843,26 +1005,104 @@ def parse_single_csv_lossless(
         unmatched_geometry=len(unmatched_beams),
         unmatched_forces=len(unmatched_forces),
     )
-    ledger = ImportNormalizationLedgerV1(
-        geometry_artifact=artifact,
-        forces_artifact=artifact,
-        adapter_selection=selection,
-        rows=tuple(rows),
-        totals=totals,
-    )
     status = (
         ImportStatus.ACCEPTED
         if batch is not None and not issues
         else ImportStatus.BLOCKED
     )
-    return LosslessImportResultV1(
+    return CompactLosslessImport(
         status=status,
         batch=batch,
-        ledger=ledger,
         issues=tuple(issues),
+        geometry_artifact=parsed.artifacts[0],
+        forces_artifact=parsed.artifacts[-1],
+        adapter_selection=parsed.selection,
+        totals=totals,
+        rows=rows,
     )
 
 
+def parse_single_csv_compact(
+    combined_csv: Path | str,
+    *,
+    format_hint: str | None = None,
+    defaults: DesignDefaults | None = None,
+    artifact_name: str | None = None,
+    columnar: bool = False,
+    cache: ImportResultCache | None = None,
+) -> CompactLosslessImport:
+    """Like :func:`parse_single_csv_lossless`, keeping the row ledger compact.
+
+    Rows are materialized only when inspected, e.g. one page at a time with
+    ``result.rows.page(...)``; ``result.to_result()`` returns the full
+    ``LosslessImportResultV1``.
+    """
+
+    parsed = _import_stage(
+        (combined_csv,),
+        kind="single",
+        names=(artifact_name or Path(combined_csv).name,),
+        format_hint=format_hint,
+        columnar=columnar,
+        cache=cache,
+    )
+    return _finish_import(parsed, combined_csv, combined=True, defaults=defaults)
+
+
+def parse_single_csv_lossless(
+    combined_csv: Path | str,
+    *,
+    format_hint: str | None = None,
+    defaults: DesignDefaults | None = None,
+    artifact_name: str | None = None,
+    columnar: bool = False,
+    cache: ImportResultCache | None = None,
+) -> LosslessImportResultV1:
+    """Parse one combined geometry/actions artifact with physical-row accounting.
+
+    ``columnar=True`` loads forces through the adapter's NumPy fast path
+    (optional ``columnar`` extra); the ledger and result are unchanged.
+    With a ``cache``, a re-upload of identical bytes reuses the parsed ledger
+    and forces and re-applies only ``defaults``.
+    """
+
+    return parse_single_csv_compact(
+        combined_csv,
+        format_hint=format_hint,
+        defaults=defaults,
+        artifact_name=artifact_name,
+        columnar=columnar,
+        cache=cache,
+    ).to_result()
+
+
+def parse_dual_csv_compact(
+    geometry_csv: Path | str,
+    forces_csv: Path | str,
+    *,
+    format_hint: str | None = None,
+    defaults: DesignDefaults | None = None,
+    geometry_artifact_name: str | None = None,
+    forces_artifact_name: str | None = None,
+    columnar: bool = False,
+    cache: ImportResultCache | None = None,
+) -> CompactLosslessImport:
+    """Like :func:`parse_dual_csv_lossless`, keeping the row ledger compact."""
+
+    parsed = _import_stage(
+        (geometry_csv, forces_csv),
+        kind="dual",
+        names=(
+            geometry_artifact_name or Path(geometry_csv).name,
+            forces_artifact_name or Path(forces_csv).name,
+        ),
+        format_hint=format_hint,
+        columnar=columnar,
+        cache=cache,
+    )
+    return _finish_import(parsed, geometry_csv, combined=False, defaults=defaults)
+
+
 def parse_dual_csv_lossless(
     geometry_csv: Path | str,
     forces_csv: Path | str,
@@ -871,34 +1111,273 @@ def parse_dual_csv_lossless(
     defaults: DesignDefaults | None = None,
     geometry_artifact_name: str | None = None,
     forces_artifact_name: str | None = None,
+    columnar: bool = False,
+    cache: ImportResultCache | None = None,
 ) -> LosslessImportResultV1:
-    """Parse two CSV artifacts only when every design-bearing record is safe."""
+    """Parse two CSV artifacts only when every design-bearing record is safe.
 
-    adapter, selection, selection_issues = _select_adapter_with_evidence(
-        geometry_csv=geometry_csv,
-        forces_csv=forces_csv,
-        format_hint=format_hint,
-    )
-    geometry_artifact, geometry_rows, geometry_issues = _artifact_ledger(
+    ``columnar=True`` loads forces through the adapter's NumPy fast path
+    (optional ``columnar`` extra); the ledger and result are unchanged.
+    With a ``cache``, a re-upload of identical bytes reuses the parsed ledger
+    and forces and re-applies only ``defaults``.
+    """
+
+    return parse_dual_csv_compact(
         geometry_csv,
-        role="geometry",
-        adapter=adapter,
-        artifact_name=geometry_artifact_name,
-    )
-    forces_artifact, force_rows, force_issues = _artifact_ledger(
         forces_csv,
-        role="forces",
+        format_hint=format_hint,
+        defaults=defaults,
+        geometry_artifact_name=geometry_artifact_name,
+        forces_artifact_name=forces_artifact_name,
+        columnar=columnar,
+        cache=cache,
+    ).to_result()
+
+
+# =============================================================================
+# Multi-artifact project import
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _ProjectPartial:
+    """Ledger and canonical records parsed from one project artifact."""
+
+    role: Literal["geometry", "forces", "combined"] | None
+    artifact: ImportArtifactV1
+    rows: CompactRowLedger
+    issues: list[ImportIssueV1]
+    beams: list[BeamGeometry]
+    forces: list[BeamForces]
+
+
+def _classify_artifact(
+    headers: Sequence[str], adapter: InputAdapter
+) -> Literal["geometry", "forces", "combined"] | None:
+    """Infer an artifact's role from the headers that satisfy each column spec."""
+
+    roles: list[Literal["geometry", "forces"]] = []
+    for role in ("geometry", "forces"):
+        canonical, _ = _canonical_headers(headers, _column_spec(adapter, role))
+        available = {field for field in canonical if field is not None}
+        if available and _required_fields(adapter, role, available) <= available:
+            roles.append(role)
+    if len(roles) == 2:
+        return "combined"
+    return roles[0] if roles else None
+
+
+def _parse_project_artifact(
+    path_value: Path | str,
+    artifact_index: int,
+    artifact_name: str,
+    adapter_key: str,
+    defaults: DesignDefaults | None,
+    load: bool,
+    columnar: bool,
+) -> _ProjectPartial:
+    """Parse one project artifact; runs in a worker process."""
+
+    adapter = _ADAPTER_FACTORIES[adapter_key]()
+    raw, headers, physical_rows = _read_rows(Path(path_value))
+    role = _classify_artifact(headers, adapter)
+    if role is None:
+        artifact, rows, issues = _ledger_from_rows(
+            raw,
+            headers,
+            physical_rows,
+            name=artifact_name,
+            role="combined",
+            adapter=None,
+            artifact_index=artifact_index,
+        )
+        issues.append(
+            ImportIssueV1(
+                code=ImportIssueCode.UNKNOWN_FORMAT,
+                path=f"artifacts[{artifact_index}]",
+                message=(
+                    f"Artifact {artifact_name!r} is neither {adapter_key} geometry "
+                    "nor forces"
+                ),
+                artifact_index=artifact_index,
+            )
+        )
+        return _ProjectPartial(None, artifact, rows, issues, [], [])
+
+    artifact, rows, issues = _ledger_from_rows(
+        raw,
+        headers,
+        physical_rows,
+        name=artifact_name,
+        role=role,
         adapter=adapter,
-        artifact_name=forces_artifact_name,
+        artifact_index=artifact_index,
     )
-    rows = geometry_rows + force_rows
-    issues = list(selection_issues) + geometry_issues + force_issues
-    batch: BeamBatchInput | None = None
     beams: list[BeamGeometry] = []
     forces: list[BeamForces] = []
-    unmatched_beams: list[str] = []
-    unmatched_forces: list[str] = []
+    if not load or issues or rows.accepted_count != len(rows):
+        return _ProjectPartial(role, artifact, rows, issues, beams, forces)
+
+    try:
+        if role in {"geometry", "combined"}:
+            beams = adapter.load_geometry(
+                path_value, defaults or DesignDefaults()  # type: ignore[call-arg]
+            )
+        if role in {"forces", "combined"}:
+            forces = (
+                adapter.load_forces_columnar(path_value)
+                if columnar
+                else adapter.load_forces(path_value)
+            )
+    except (OSError, TypeError, ValueError, KeyError) as exc:
+        issues.append(
+            ImportIssueV1(
+                code=ImportIssueCode.ADAPTER_PARSE_ERROR,
+                path=f"artifacts[{artifact_index}].adapter",
+                message=f"Adapter parse failed for {artifact_name!r}: {exc}",
+                artifact_index=artifact_index,
+            )
+        )
+        return _ProjectPartial(role, artifact, rows, issues, [], [])
+
+    # Force rows are stations that the adapter reduces to envelopes, so only
+    # geometry-bearing artifacts have a one-record-per-row conservation check.
+    expected = rows.included_count()
+    row_loss = role != "forces" and len(beams) != expected
+    if role == "combined":
+        row_loss = row_loss or len(forces) != expected
+    if row_loss:
+        issues.append(
+            ImportIssueV1(
+                code=ImportIssueCode.ADAPTER_ROW_LOSS,
+                path=f"artifacts[{artifact_index}]",
+                message=(
+                    f"Adapter returned {len(beams)} geometry and {len(forces)} "
+                    f"force records from {expected} accepted source rows"
+                ),
+                artifact_role=role,
+                artifact_index=artifact_index,
+            )
+        )
+    return _ProjectPartial(role, artifact, rows, issues, beams, forces)
+
+
+def _cross_artifact_duplicates(
+    partials: Sequence[_ProjectPartial],
+) -> list[ImportIssueV1]:
+    """Block records whose identity repeats across artifacts of one role.
 
+    Duplicates inside a single artifact are already blocked by its ledger.
+    """
+
+    identities: dict[tuple[str, str], list[tuple[int, int]]] = defaultdict(list)
+    for artifact_index, partial in enumerate(partials):
+        if partial.role is None:
+            continue
+        group = "forces" if partial.role == "forces" else "geometry"
+        rows = partial.rows
+        for row_index in range(len(rows)):
+            if rows.exclusion_reason(row_index) is None:
+                identities[(group, rows.source_record_id(row_index))].append(
+                    (artifact_index, row_index)
+                )
+
+    issues: list[ImportIssueV1] = []
+    for (_, record_id), locations in identities.items():
+        if len({artifact_index for artifact_index, _ in locations}) < 2:
+            continue
+        for artifact_index, row_index in locations:
+            rows = partials[artifact_index].rows
+            rows.add_issue_code(row_index, ImportIssueCode.DUPLICATE_RECORD_ID)
+            role = rows.role(row_index)
+            source_row_number = rows.source_row_number(row_index)
+            issues.append(
+                ImportIssueV1(
+                    code=ImportIssueCode.DUPLICATE_RECORD_ID,
+                    path=f"{role}.rows[{source_row_number}].source_record_id",
+                    message=(
+                        f"Source record identity {record_id!r} repeats across "
+                        "artifacts"
+                    ),
+                    artifact_role=role,
+                    source_row_number=source_row_number,
+                    artifact_index=artifact_index,
+                )
+            )
+    issues.sort(key=lambda issue: (issue.artifact_index, issue.source_row_number))
+    return issues
+
+
+def _hash_join(
+    beams: Sequence[BeamGeometry], forces: Sequence[BeamForces]
+) -> tuple[int, list[str], list[str]]:
+    """Join geometry and forces on the canonical ``{label}_{story}`` member ID.
+
+    Returns:
+        Matched member count, then unmatched geometry and force IDs in source
+        order
+    """
+
+    beam_ids = {beam.id for beam in beams}
+    force_ids = {force.id for force in forces}
+    return (
+        len(beam_ids & force_ids),
+        [beam.id for beam in beams if beam.id not in force_ids],
+        [force.id for force in forces if force.id not in beam_ids],
+    )
+
+
+def parse_project_exports(
+    paths: Sequence[Path | str],
+    *,
+    format_hint: str | None = None,
+    defaults: DesignDefaults | None = None,
+    artifact_names: Sequence[str] | None = None,
+    max_workers: int | None = None,
+    columnar: bool = False,
+) -> LosslessImportResultV1:
+    """Parse a model exported as several CSV artifacts into one strict result.
+
+    Large models are often exported per storey or per table. Each artifact is
+    classified as geometry, forces, or combined from its headers and parsed
+    into a partial ledger in a process pool. The partials are merged in input
+    order, so rows, issues, and records are deterministic regardless of worker
+    scheduling, and geometry is hash-joined to forces on the canonical
+    ``{label}_{story}`` member ID.
+
+    The ledger lists every artifact with its own SHA-256 under ``artifacts``;
+    rows and issues carry the ``artifact_index`` they came from.
+
+    Args:
+        paths: CSV artifacts in a stable caller-chosen order
+        format_hint: Adapter key or ``"auto"``; all artifacts share one adapter
+        defaults: Explicit project defaults (required for non-generic adapters)
+        artifact_names: Display names recorded in the ledger, one per path
+        max_workers: Worker processes; ``1`` parses in-process
+        columnar: Load forces through the NumPy columnar fast path
+
+    Returns:
+        LosslessImportResultV1 with a batch only when every record is safe
+
+    Raises:
+        ValueError: If no paths are given or ``artifact_names`` has the wrong
+            length
+    """
+
+    if not paths:
+        raise ValueError("parse_project_exports requires at least one artifact")
+    names = (
+        list(artifact_names)
+        if artifact_names is not None
+        else [Path(path).name for path in paths]
+    )
+    if len(names) != len(paths):
+        raise ValueError("artifact_names must provide one name per path")
+
+    adapter, selection, selection_issues = _select_adapter_for_artifacts(
+        paths, format_hint=format_hint
+    )
+    issues = list(selection_issues)
     if (
         adapter is not None
         and not isinstance(adapter, GenericCSVAdapter)
@@ -915,123 +1394,133 @@ def parse_dual_csv_lossless(
             )
         )
 
-    if (
-        adapter is not None
-        and not issues
-        and all(row.status is ImportStatus.ACCEPTED for row in rows)
-    ):
-        try:
-            # Generic rows are required to carry these values. The object is
-            # therefore a non-consumed adapter argument, not a project default.
-            selected_defaults = defaults or DesignDefaults()  # type: ignore[call-arg]
-            beams = adapter.load_geometry(geometry_csv, selected_defaults)
-            forces = adapter.load_forces(forces_csv)
-        except (OSError, TypeError, ValueError, KeyError) as exc:
+    if adapter is None:
+        partials = []
+        for index, (path, name) in enumerate(zip(paths, names, strict=True)):
+            artifact, rows, artifact_issues = _artifact_ledger(
+                path,
+                role="combined",
+                adapter=None,
+                artifact_name=name,
+                artifact_index=index,
+            )
+            partials.append(
+                _ProjectPartial(None, artifact, rows, artifact_issues, [], [])
+            )
+    else:
+        jobs = (
+            paths,
+            range(len(paths)),
+            names,
+            [_adapter_key(adapter)] * len(paths),
+            [defaults] * len(paths),
+            [not issues] * len(paths),
+            [columnar] * len(paths),
+        )
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            partials = list(map(_parse_project_artifact, *jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(_parse_project_artifact, *jobs))
+
+    for partial in partials:
+        issues.extend(partial.issues)
+    issues.extend(_cross_artifact_duplicates(partials))
+    rows = CompactRowLedger()
+    for partial in partials:
+        rows.extend(partial.rows)
+
+    batch: BeamBatchInput | None = None
+    beams: list[BeamGeometry] = []
+    forces: list[BeamForces] = []
+    matched = 0
+    unmatched_beams: list[str] = []
+    unmatched_forces: list[str] = []
+    if adapter is not None and not issues:
+        beams = [beam for partial in partials for beam in partial.beams]
+        forces = [force for partial in partials for force in partial.forces]
+        duplicates = {
+            value
+            for value, count in Counter(beam.id for beam in beams).items()
+            if count > 1
+        } | {
+            value
+            for value, count in Counter(force.id for force in forces).items()
+            if count > 1
+        }
+        for duplicate in sorted(duplicates):
             issues.append(
                 ImportIssueV1(
-                    code=ImportIssueCode.ADAPTER_PARSE_ERROR,
-                    path="adapter",
-                    message=f"Adapter parse failed: {exc}",
+                    code=ImportIssueCode.DUPLICATE_RECORD_ID,
+                    path="adapter.output",
+                    message=f"Adapter output contains duplicate member ID {duplicate!r}",
                 )
             )
-        else:
-            expected_geometry = sum(
-                row.exclusion_reason is None for row in geometry_rows
-            )
-            if len(beams) != expected_geometry:
+        if beams and forces:
+            matched, unmatched_beams, unmatched_forces = _hash_join(beams, forces)
+            for member_id in unmatched_beams:
                 issues.append(
                     ImportIssueV1(
-                        code=ImportIssueCode.ADAPTER_ROW_LOSS,
-                        path="geometry",
-                        message=(
-                            f"Adapter returned {len(beams)} geometry records from "
-                            f"{expected_geometry} accepted source rows"
-                        ),
-                        artifact_role="geometry",
+                        code=ImportIssueCode.UNMATCHED_GEOMETRY,
+                        path=f"matching.geometry.{member_id}",
+                        message=f"Geometry member {member_id!r} has no matching forces",
                     )
                 )
-            duplicates = {
-                value
-                for value, count in Counter(beam.id for beam in beams).items()
-                if count > 1
-            } | {
-                value
-                for value, count in Counter(force.id for force in forces).items()
-                if count > 1
-            }
-            for duplicate in sorted(duplicates):
+            for member_id in unmatched_forces:
                 issues.append(
                     ImportIssueV1(
-                        code=ImportIssueCode.DUPLICATE_RECORD_ID,
-                        path="adapter.output",
-                        message=f"Adapter output contains duplicate member ID {duplicate!r}",
+                        code=ImportIssueCode.UNMATCHED_FORCE,
+                        path=f"matching.forces.{member_id}",
+                        message=f"Force member {member_id!r} has no matching geometry",
                     )
                 )
-            if beams and forces:
-                candidate = BeamBatchInput(
-                    beams=beams, forces=forces, defaults=selected_defaults
+            if not issues:
+                batch = BeamBatchInput(
+                    beams=beams,
+                    forces=forces,
+                    defaults=defaults or DesignDefaults(),  # type: ignore[call-arg]
                 )
-                unmatched_beams = candidate.get_unmatched_beams()
-                unmatched_forces = candidate.get_unmatched_forces()
-                for member_id in unmatched_beams:
-                    issues.append(
-                        ImportIssueV1(
-                            code=ImportIssueCode.UNMATCHED_GEOMETRY,
-                            path=f"matching.geometry.{member_id}",
-                            message=f"Geometry member {member_id!r} has no matching forces",
-                        )
-                    )
-                for member_id in unmatched_forces:
-                    issues.append(
-                        ImportIssueV1(
-                            code=ImportIssueCode.UNMATCHED_FORCE,
-                            path=f"matching.forces.{member_id}",
-                            message=f"Force member {member_id!r} has no matching geometry",
-                        )
-                    )
-                if not issues:
-                    batch = candidate
-            else:
-                issues.append(
-                    ImportIssueV1(
-                        code=ImportIssueCode.ADAPTER_ROW_LOSS,
-                        path="adapter.output",
-                        message="Adapter returned no usable geometry or force records",
-                    )
+        else:
+            issues.append(
+                ImportIssueV1(
+                    code=ImportIssueCode.ADAPTER_ROW_LOSS,
+                    path="adapter.output",
+                    message="Adapter returned no usable geometry or force records",
                 )
+            )
 
-    accepted_rows = sum(row.status is ImportStatus.ACCEPTED for row in rows)
+    artifacts = tuple(partial.artifact for partial in partials)
+    geometry_artifact = next(
+        (p.artifact for p in partials if p.role in {"geometry", "combined"}),
+        artifacts[0],
+    )
+    forces_artifact = next(
+        (p.artifact for p in partials if p.role in {"forces", "combined"}),
+        artifacts[0],
+    )
     totals = ImportTotalsV1(
         source_rows=len(rows),
-        accepted_rows=accepted_rows,
-        blocked_rows=len(rows) - accepted_rows,
-        excluded_rows=sum(row.exclusion_reason is not None for row in rows),
+        accepted_rows=rows.accepted_count,
+        blocked_rows=len(rows) - rows.accepted_count,
+        excluded_rows=rows.excluded_count,
         geometry_records=len(beams),
         force_records=len(forces),
-        matched_records=len(
-            {beam.id for beam in beams} & {force.id for force in forces}
-        ),
+        matched_records=matched,
         unmatched_geometry=len(unmatched_beams),
         unmatched_forces=len(unmatched_forces),
     )
-    ledger = ImportNormalizationLedgerV1(
+    return CompactLosslessImport(
+        status=ImportStatus.ACCEPTED if batch is not None else ImportStatus.BLOCKED,
+        batch=batch,
+        issues=tuple(issues),
         geometry_artifact=geometry_artifact,
         forces_artifact=forces_artifact,
         adapter_selection=selection,
-        rows=tuple(rows),
         totals=totals,
-    )
-    status = (
-        ImportStatus.ACCEPTED
-        if batch is not None and not issues
-        else ImportStatus.BLOCKED
-    )
-    return LosslessImportResultV1(
-        status=status,
-        batch=batch,
-        ledger=ledger,
-        issues=tuple(issues),
-    )
+        rows=rows,
+        artifacts=artifacts,
+    ).to_result()
 
 
 def parse_dual_csv(
@@ -1097,7 +1586,10 @@ __all__ = [
     "LosslessImportBlockedError",
     "merge_geometry_forces",
     "parse_dual_csv",
+    "parse_dual_csv_compact",
     "parse_dual_csv_lossless",
+    "parse_project_exports",
+    "parse_single_csv_compact",
     "parse_single_csv_lossless",
     "validate_import",
 ]
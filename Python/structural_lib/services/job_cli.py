@@ -6,6 +6,7 @@ Tiny CLI wrapper for the job runner and cost optimization.
 
 Usage:
   python -m structural_lib.job_cli run --job path/to/job.json --out ./output/job_001
+  python -m structural_lib.job_cli run-dir --jobs ./jobs --out ./output --workers 4
   python -m structural_lib.job_cli optimize --span 5000 --mu 120 --vu 80
 """
 
@@ -27,6 +28,18 @@ def _build_parser() -> argparse.ArgumentParser:
     run.add_argument("--job", required=True, help="Path to job.json")
     run.add_argument("--out", required=True, help="Output directory")
 
+    run_dir = sub.add_parser(
+        "run-dir", help="Run every job.json of a folder, skipping unchanged jobs"
+    )
+    run_dir.add_argument("--jobs", required=True, help="Folder of job files")
+    run_dir.add_argument("--out", required=True, help="Output root directory")
+    run_dir.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    run_dir.add_argument(
+        "--force", action="store_true", help="Run unchanged jobs again"
+    )
+
     optimize = sub.add_parser("optimize", help="Find cost-optimal beam design")
     optimize.add_argument("--span", type=float, required=True, help="Beam span (mm)")
     optimize.add_argument(
@@ -74,6 +87,19 @@ def main(argv: list[str] | None = None) -> int:
         job_runner.run_job(job_path=args.job, out_dir=args.out)
         return 0
 
+    if args.cmd == "run-dir":
+        summary = job_runner.run_job_dir(
+            jobs_dir=args.jobs,
+            out_dir=args.out,
+            max_workers=args.workers,
+            force=args.force,
+        )
+        print(
+            f"{summary['ran']} ran, {summary['skipped']} skipped, "
+            f"{summary['failed']} failed; manifest: {summary['manifest']}"
+        )
+        return 1 if summary["failed"] else 0
+
     if args.cmd == "optimize":
         result = api.optimize_beam_cost(
             units=args.units,
@@ -18,15 +18,23 @@ v1 scope:
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
+import os
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 from structural_lib.codes.is456 import compliance
 from structural_lib.core.data_types import JobSpec
 
-from . import api, beam_pipeline
+from . import beam_pipeline
+
+# Folder runs: manifest of job input hashes and outcomes, flushed as jobs finish
+JOB_MANIFEST = "job-manifest.json"
+_JOB_MANIFEST_SCHEMA = "job-run-dir.v1"
+_MANIFEST_FLUSH_EVERY = 100
 
 
 def load_job_json(path: str | Path) -> JobSpec:
@@ -223,6 +231,9 @@ def run_job_is456(
     _write_json(parsed_dir / "beam.json", beam)
     _write_json(parsed_dir / "cases.json", cases)
 
+    # Imported here: the api facade imports this module.
+    from . import api
+
     report = api.check_beam_is456(
         units=units,
         cases=cases,  # type: ignore[arg-type]  # LoadCase is compatible with Dict[str, Any]
@@ -314,3 +325,143 @@ def run_job(
             "Missing required field 'code' in job file. Currently supported: 'IS456'."
         )
     raise ValueError(f"Unsupported code: '{code}'. Currently supported: 'IS456'.")
+
+
+def _run_job_file(job_path: str, out_dir: str) -> dict[str, Any]:
+    """Worker entry point: run one job file and report how it went."""
+    try:
+        summary = run_job(job_path=job_path, out_dir=out_dir)
+    except Exception as e:  # A bad job is recorded; the queue goes on
+        return {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+    return {
+        "status": "ok",
+        "job_id": summary["job_id"],
+        "is_ok": summary["is_ok"],
+        "governing_case_id": summary["governing_case_id"],
+        "governing_utilization": summary["governing_utilization"],
+    }
+
+
+def _load_job_manifest(path: Path, library: str) -> dict[str, Any]:
+    """Jobs of a previous run by the same library, or nothing."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("schema") != _JOB_MANIFEST_SCHEMA
+        or manifest.get("library") != library
+        or not isinstance(manifest.get("jobs"), dict)
+    ):
+        return {}
+    jobs: dict[str, Any] = manifest["jobs"]
+    return jobs
+
+
+def run_job_dir(
+    *,
+    jobs_dir: str | Path,
+    out_dir: str | Path,
+    max_workers: int | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Run every ``*.json`` job file of a folder, in parallel and resumably.
+
+    Each job writes its output tree to ``out_dir/<job file stem>/``.
+    ``out_dir/job-manifest.json`` records each job's input hash and outcome
+    and is rewritten as jobs finish, so an interrupted run resumes where it
+    stopped. A job is skipped when its file hash and the library content
+    identity match a successful previous run and its design results are
+    still on disk. Failed jobs are recorded and run again next time; they
+    never stop the other jobs. A worker process that dies fails the jobs it
+    takes down with it.
+
+    Args:
+        jobs_dir: Folder of job files
+        out_dir: Output root
+        max_workers: Worker processes; ``1`` runs in-process
+        force: Run every job even when unchanged
+
+    Returns:
+        Counts of ``ran``, ``skipped`` and ``failed`` jobs, the manifest
+        path and the manifest's ``jobs`` entries
+    """
+    # Imported here: evidence imports the design stack.
+    from .evidence import get_library_content_identity
+
+    jobs_root = Path(jobs_dir)
+    if not jobs_root.is_dir():
+        raise FileNotFoundError(f"Jobs folder not found: {jobs_root}")
+    out_root = Path(out_dir)
+    _ensure_dir(out_root)
+
+    library = get_library_content_identity()
+    manifest_path = out_root / JOB_MANIFEST
+    previous = {} if force else _load_job_manifest(manifest_path, library)
+    jobs: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, Path, Path]] = []
+    for job_path in sorted(jobs_root.glob("*.json")):
+        job_out = out_root / job_path.stem
+        input_hash = hashlib.sha256(job_path.read_bytes()).hexdigest()
+        entry = previous.get(job_path.name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("input") == input_hash
+            and entry.get("status") == "ok"
+            and (job_out / "design" / "design_results.json").is_file()
+        ):
+            jobs[job_path.name] = entry
+        else:
+            pending.append((job_path.name, job_path, job_out))
+            jobs[job_path.name] = {"input": input_hash, "status": "pending"}
+
+    def flush() -> None:
+        _write_json(
+            manifest_path,
+            {"schema": _JOB_MANIFEST_SCHEMA, "library": library, "jobs": jobs},
+        )
+
+    def record(name: str, outcome: dict[str, Any]) -> None:
+        jobs[name] = {"input": jobs[name]["input"], **outcome}
+
+    done = 0
+    try:
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            for name, job_path, job_out in pending:
+                record(name, _run_job_file(str(job_path), str(job_out)))
+                done += 1
+                if done % _MANIFEST_FLUSH_EVERY == 0:
+                    flush()
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_run_job_file, str(job_path), str(job_out)): name
+                    for name, job_path, job_out in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        outcome = future.result()
+                    except Exception as e:  # Worker died: BrokenProcessPool
+                        outcome = {
+                            "status": "failed",
+                            "error": f"{type(e).__name__}: {e}",
+                        }
+                    record(futures[future], outcome)
+                    done += 1
+                    if done % _MANIFEST_FLUSH_EVERY == 0:
+                        flush()
+    finally:
+        flush()
+
+    failed = sum(1 for entry in jobs.values() if entry["status"] == "failed")
+    return {
+        "out_dir": str(out_root),
+        "manifest": str(manifest_path),
+        "total": len(jobs),
+        "ran": len(pending),
+        "skipped": len(jobs) - len(pending),
+        "failed": failed,
+        "jobs": jobs,
+    }
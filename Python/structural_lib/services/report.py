@@ -30,11 +30,16 @@ Usage:
 from __future__ import annotations
 
 import csv
+import hashlib
 import html
 import io
 import json
+import os
 import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +51,12 @@ from . import report_svg
 # Utilization thresholds for scorecard warnings
 UTILIZATION_WARNING_THRESHOLD = 0.9
 
+# Batch report packages: shared stylesheet and incremental-render manifest
+REPORT_STYLESHEET = "assets/report.css"
+REPORT_MANIFEST = "report-manifest.json"
+_MANIFEST_SCHEMA = "design-report-package.v1"
+_MIN_PAGES_PER_WORKER = 50
+
 _REPORT_CSS = """
 /* Professional Structural Engineering Report Styles */
 * { box-sizing: border-box; }
@@ -1177,21 +1188,43 @@ def _render_units_table(items: list[UnitsAlert]) -> str:
     </table>"""
 
 
-def _wrap_html(title: str, body_html: str) -> str:
+_HTML_TAIL = """
+</body>
+</html>
+"""
+
+
+def _html_head(
+    title: str, *, stylesheet: str | None = None, inline_css: bool = True
+) -> str:
+    """Document start through ``<body>``; CSS inline, linked or left out."""
+    style = ""
+    if stylesheet:
+        style = f'<link rel="stylesheet" href="{html.escape(stylesheet)}">'
+    elif inline_css:
+        style = f"<style>{_REPORT_CSS}</style>"
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>{html.escape(title)}</title>
-    <style>{_REPORT_CSS}</style>
+    {style}
 </head>
 <body>
-{body_html}
-</body>
-</html>
 """
 
 
+def _wrap_html(
+    title: str,
+    body_html: str,
+    *,
+    stylesheet: str | None = None,
+    inline_css: bool = True,
+) -> str:
+    head = _html_head(title, stylesheet=stylesheet, inline_css=inline_css)
+    return head + body_html + _HTML_TAIL
+
+
 def _render_report_sections(data: ReportData) -> str:
     status = "✓ PASS" if data.is_ok else "✗ FAIL"
     status_class = "status-pass" if data.is_ok else "status-fail"
@@ -1254,12 +1287,97 @@ def _render_beam_section(
 </section>"""
 
 
-def export_html(data: ReportData) -> str:
-    """Export report data as HTML string (Phase 1 visuals)."""
-    body = f"""<h1>Beam Design Report</h1>
+def _report_body(data: ReportData) -> str:
+    return f"""<h1>Beam Design Report</h1>
 {_render_report_sections(data)}
 <p><em>Generated by structural_lib report.</em></p>"""
-    return _wrap_html(f"Beam Design Report - {data.job_id}", body)
+
+
+def export_html(data: ReportData, *, stylesheet: str | None = None) -> str:
+    """Export report data as HTML string (Phase 1 visuals).
+
+    Args:
+        data: Report data for one beam
+        stylesheet: Link this CSS URL instead of inlining the styles
+    """
+    return _wrap_html(
+        f"Beam Design Report - {data.job_id}",
+        _report_body(data),
+        stylesheet=stylesheet,
+    )
+
+
+# =============================================================================
+# PDF Export
+# =============================================================================
+
+# Reports laid out per WeasyPrint pass; bounds the DOM held at once
+DEFAULT_PDF_CHUNK_REPORTS = 25
+
+# Each report of a combined document starts on a new page
+_PDF_CSS = """
+.pdf-report { break-before: page; }
+.pdf-report:first-child { break-before: auto; }
+"""
+
+
+class _PdfRenderer:
+    """WeasyPrint with the report stylesheets and fonts parsed once."""
+
+    def __init__(self) -> None:
+        try:
+            import weasyprint
+            from weasyprint.text.fonts import FontConfiguration
+        except ImportError as e:
+            raise ImportError(
+                "weasyprint is required for PDF export. "
+                "Install with: pip install weasyprint>=60.0"
+            ) from e
+
+        self._weasyprint = weasyprint
+        self._font_config = FontConfiguration()
+        self._stylesheets = [
+            weasyprint.CSS(string=css, font_config=self._font_config)
+            for css in (_REPORT_CSS, _PDF_CSS)
+        ]
+
+    def render(self, html_content: str) -> Any:
+        """Lay out one HTML document; returns a WeasyPrint ``Document``."""
+        return self._weasyprint.HTML(string=html_content).render(
+            stylesheets=self._stylesheets, font_config=self._font_config
+        )
+
+    def write_pdf(self, html_content: str) -> bytes:
+        pdf_doc: bytes = self.render(html_content).write_pdf()
+        return pdf_doc
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_renderer() -> _PdfRenderer:
+    """Per-process renderer, so worker processes warm up once."""
+    return _PdfRenderer()
+
+
+def _pdf_html(reports: Sequence[ReportData], title: str) -> str:
+    body = "\n".join(
+        f'<div class="pdf-report">{_report_body(data)}</div>' for data in reports
+    )
+    return _wrap_html(title, body, inline_css=False)
+
+
+def _chunks(reports: Sequence[ReportData], size: int) -> list[list[ReportData]]:
+    if size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {size}")
+    return [list(reports[i : i + size]) for i in range(0, len(reports), size)]
+
+
+def _render_pdf_chunk(reports: list[ReportData]) -> list[bytes]:
+    """Worker entry point: one PDF per report."""
+    renderer = _get_pdf_renderer()
+    return [
+        renderer.write_pdf(_pdf_html([data], f"Beam Design Report - {data.job_id}"))
+        for data in reports
+    ]
 
 
 def export_pdf(data: ReportData) -> bytes:
@@ -1268,16 +1386,86 @@ def export_pdf(data: ReportData) -> bytes:
     Converts the HTML report to PDF for formal submission workflows.
     Requires weasyprint>=60.0 (optional dependency).
     """
-    try:
-        import weasyprint  # noqa: F811
-    except ImportError as e:
-        raise ImportError(
-            "weasyprint is required for PDF export. "
-            "Install with: pip install weasyprint>=60.0"
-        ) from e
-
-    html_content = export_html(data)
-    pdf_doc: bytes = weasyprint.HTML(string=html_content).write_pdf()
+    return _render_pdf_chunk([data])[0]
+
+
+def export_pdf_batch(
+    reports: Sequence[ReportData],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_PDF_CHUNK_REPORTS,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[bytes]:
+    """Export one PDF per report, rendering chunks of reports in parallel.
+
+    Each worker process parses the stylesheets and fonts once and reuses
+    them for every report it renders.
+
+    Args:
+        reports: Report data, one document each
+        max_workers: Worker processes; ``1`` renders in-process
+        chunk_size: Reports handed to a worker at a time
+        progress: Called as ``progress(completed, total)`` after each chunk
+
+    Returns:
+        PDF bytes in the order of ``reports``
+    """
+    chunks = _chunks(reports, chunk_size)
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    pdfs: list[bytes] = []
+
+    def collect(results: Iterable[list[bytes]]) -> None:
+        for rendered in results:
+            pdfs.extend(rendered)
+            if progress is not None:
+                progress(len(pdfs), len(reports))
+
+    if workers <= 1:
+        collect(map(_render_pdf_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            collect(executor.map(_render_pdf_chunk, chunks))
+    return pdfs
+
+
+def export_pdf_combined(
+    reports: Sequence[ReportData],
+    *,
+    title: str = "Beam Design Report",
+    chunk_size: int = DEFAULT_PDF_CHUNK_REPORTS,
+    progress: Callable[[int, int], None] | None = None,
+) -> bytes:
+    """Export all reports as one PDF, each report starting on a new page.
+
+    Reports are parsed and laid out ``chunk_size`` at a time and only the
+    pages are kept, so peak memory holds one chunk's HTML source and parse
+    rather than the whole submission's. Laid-out pages cannot leave the
+    process, so this renders in-process; use :func:`export_pdf_batch` for
+    parallel rendering.
+
+    Args:
+        reports: Report data in document order
+        title: PDF document title
+        chunk_size: Reports laid out per pass
+        progress: Called as ``progress(completed, total)`` after each chunk
+
+    Returns:
+        PDF bytes
+    """
+    if not reports:
+        raise ValueError("No reports to export")
+    renderer = _get_pdf_renderer()
+    first: Any = None
+    pages: list[Any] = []
+    completed = 0
+    for chunk in _chunks(reports, chunk_size):
+        document = renderer.render(_pdf_html(chunk, title))
+        first = first or document
+        pages.extend(document.pages)
+        completed += len(chunk)
+        if progress is not None:
+            progress(completed, len(reports))
+    pdf_doc: bytes = first.copy(pages).write_pdf()
     return pdf_doc
 
 
@@ -1470,38 +1658,18 @@ def _render_batch_index_table(
     </table>"""
 
 
-def render_design_report_single(
-    design_results: dict[str, Any],
-    *,
-    batch_threshold: int = 80,
+def _batch_index_body(
+    design_results: dict[str, Any], indexed: list[dict[str, Any]], index_table: str
 ) -> str:
-    """Render a single HTML report for multi-beam results."""
-    beams = design_results.get("beams", [])
+    """Heading, summary and beam index shared by both batch layouts."""
     code = str(design_results.get("code", "") or "")
     units = str(design_results.get("units", "") or "")
-
-    indexed = _build_beam_index(beams)
-    index_table = _render_batch_index_table(
-        indexed, link_prefix="#beam-", link_suffix=""
-    )
-
-    sections = []
-    for item in indexed:
-        data = _beam_report_data_from_design(item["beam"], code=code, units=units)
-        sections.append(
-            _render_beam_section(
-                data,
-                heading=item["label"],
-                section_id=f"beam-{item['slug']}",
-            )
-        )
-
     summary = design_results.get("summary", {})
-    total = summary.get("total_beams", len(beams))
+    total = summary.get("total_beams", len(indexed))
     passed = summary.get("passed", "")
     failed = summary.get("failed", "")
 
-    body = f"""<h1>Beam Design Report (Batch)</h1>
+    return f"""<h1>Beam Design Report (Batch)</h1>
 <div class="summary">
     <p><strong>Code:</strong> {html.escape(code)}</p>
     <p><strong>Units:</strong> {html.escape(units)}</p>
@@ -1510,10 +1678,106 @@ def render_design_report_single(
 <div class="section">
     <h2>Beam Index</h2>
     {index_table}
-</div>
-{"".join(sections)}"""
+</div>"""
 
-    return _wrap_html("Beam Design Report (Batch)", body)
+
+def iter_design_report_single(design_results: dict[str, Any]) -> Iterator[str]:
+    """Yield the single-file batch report in chunks, one beam at a time.
+
+    Joining the chunks gives :func:`render_design_report_single`; writing
+    them as they come keeps memory flat for large batches.
+    """
+    beams = design_results.get("beams", [])
+    code = str(design_results.get("code", "") or "")
+    units = str(design_results.get("units", "") or "")
+
+    indexed = _build_beam_index(beams)
+    index_table = _render_batch_index_table(
+        indexed, link_prefix="#beam-", link_suffix=""
+    )
+
+    yield _html_head("Beam Design Report (Batch)")
+    yield _batch_index_body(design_results, indexed, index_table) + "\n"
+    for item in indexed:
+        data = _beam_report_data_from_design(item["beam"], code=code, units=units)
+        yield _render_beam_section(
+            data,
+            heading=item["label"],
+            section_id=f"beam-{item['slug']}",
+        )
+    yield _HTML_TAIL
+
+
+def render_design_report_single(
+    design_results: dict[str, Any],
+    *,
+    batch_threshold: int = 80,
+) -> str:
+    """Render a single HTML report for multi-beam results."""
+    return "".join(iter_design_report_single(design_results))
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _sha256_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _write_if_changed(path: Path, text: str) -> str:
+    """Write ``text`` unless the file already holds it; return its SHA-256."""
+    digest = _sha256_text(text)
+    if _sha256_file(path) != digest:
+        path.write_text(text, encoding="utf-8")
+    return digest
+
+
+def _page_input_hash(
+    beam: dict[str, Any], *, slug: str, code: str, units: str, renderer: str
+) -> str:
+    """Hash of everything a beam page is rendered from."""
+    payload = json.dumps(
+        {
+            "beam": beam,
+            "code": code,
+            "renderer": renderer,
+            "slug": slug,
+            "units": units,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return _sha256_text(payload)
+
+
+def _load_report_manifest(path: Path, renderer: str) -> dict[str, Any]:
+    """Pages of a previous run by the same library, or nothing."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("schema") != _MANIFEST_SCHEMA
+        or manifest.get("renderer") != renderer
+        or not isinstance(manifest.get("pages"), dict)
+    ):
+        return {}
+    pages: dict[str, Any] = manifest["pages"]
+    return pages
+
+
+def _write_beam_page(path: str, beam: dict[str, Any], code: str, units: str) -> str:
+    """Worker entry point: render and write one beam page, return its SHA-256."""
+    data = _beam_report_data_from_design(beam, code=code, units=units)
+    text = export_html(data, stylesheet=f"../{REPORT_STYLESHEET}")
+    Path(path).write_text(text, encoding="utf-8")
+    return _sha256_text(text)
 
 
 def write_design_report_package(
@@ -1521,26 +1785,51 @@ def write_design_report_package(
     *,
     output_path: Path,
     batch_threshold: int = 80,
+    max_workers: int | None = None,
 ) -> list[Path]:
-    """Write HTML report package for multi-beam results."""
+    """Write HTML report package for multi-beam results.
+
+    Below ``batch_threshold`` beams the report is one self-contained HTML
+    file, streamed to disk section by section. From ``batch_threshold`` up it
+    is a folder: ``index.html``, one page per beam under ``beams/``, and the
+    stylesheet once under ``assets/``, linked from every page.
+
+    Folder packages are incremental. ``report-manifest.json`` records a hash
+    of each page's inputs (beam data, code, units and the library content
+    identity) and of the page written. On the next run a page is rendered
+    again only when its inputs changed or its file no longer matches; pages
+    of beams that left the batch are removed. Pages to render are fanned out
+    over worker processes.
+
+    Args:
+        design_results: Multi-beam design results
+        output_path: ``.html`` file or folder; a batch written to an
+            ``.html`` path goes to the folder named after its stem
+        batch_threshold: Beam count from which a folder package is written
+        max_workers: Worker processes for beam pages; ``1`` renders
+            in-process
+
+    Returns:
+        Paths of the package pages, index first, whether rewritten or not
+    """
     beams = design_results.get("beams", [])
     indexed = _build_beam_index(beams)
     code = str(design_results.get("code", "") or "")
     units = str(design_results.get("units", "") or "")
 
     if len(beams) < batch_threshold:
-        html_output = render_design_report_single(
-            design_results, batch_threshold=batch_threshold
-        )
         if output_path.suffix.lower() in {".html", ".htm"}:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(html_output, encoding="utf-8")
-            return [output_path]
+            target = output_path
+        else:
+            output_path.mkdir(parents=True, exist_ok=True)
+            target = output_path / "index.html"
+        with target.open("w", encoding="utf-8") as handle:
+            for chunk in iter_design_report_single(design_results):
+                handle.write(chunk)
+        return [target]
 
-        output_path.mkdir(parents=True, exist_ok=True)
-        index_path = output_path / "index.html"
-        index_path.write_text(html_output, encoding="utf-8")
-        return [index_path]
+    from .evidence import get_library_content_identity
 
     # Folder output with index + per-beam pages
     out_dir = output_path
@@ -1550,39 +1839,144 @@ def write_design_report_package(
     out_dir.mkdir(parents=True, exist_ok=True)
     beams_dir = out_dir / "beams"
     beams_dir.mkdir(parents=True, exist_ok=True)
+    stylesheet_path = out_dir / REPORT_STYLESHEET
+    stylesheet_path.parent.mkdir(parents=True, exist_ok=True)
+
+    renderer = get_library_content_identity()
+    manifest_path = out_dir / REPORT_MANIFEST
+    previous = _load_report_manifest(manifest_path, renderer)
+    pages: dict[str, dict[str, str]] = {
+        REPORT_STYLESHEET: {"sha256": _write_if_changed(stylesheet_path, _REPORT_CSS)}
+    }
 
     index_table = _render_batch_index_table(
         indexed, link_prefix="beams/", link_suffix=".html"
     )
-    summary = design_results.get("summary", {})
-    total = summary.get("total_beams", len(beams))
-    passed = summary.get("passed", "")
-    failed = summary.get("failed", "")
-
-    index_body = f"""<h1>Beam Design Report (Batch)</h1>
-<div class="summary">
-    <p><strong>Code:</strong> {html.escape(code)}</p>
-    <p><strong>Units:</strong> {html.escape(units)}</p>
-    <p><strong>Total beams:</strong> {total} | <strong>Passed:</strong> {passed} | <strong>Failed:</strong> {failed}</p>
-</div>
-<div class="section">
-    <h2>Beam Index</h2>
-    {index_table}
-</div>"""
-
     index_path = out_dir / "index.html"
-    index_path.write_text(
-        _wrap_html("Beam Design Report (Batch)", index_body), encoding="utf-8"
-    )
+    pages["index.html"] = {
+        "sha256": _write_if_changed(
+            index_path,
+            _wrap_html(
+                "Beam Design Report (Batch)",
+                _batch_index_body(design_results, indexed, index_table),
+                stylesheet=REPORT_STYLESHEET,
+            ),
+        )
+    }
 
     written = [index_path]
+    pending: list[tuple[str, str, dict[str, Any]]] = []
     for item in indexed:
-        data = _beam_report_data_from_design(item["beam"], code=code, units=units)
-        html_output = export_html(data)
         beam_path = beams_dir / f"{item['slug']}.html"
-        beam_path.write_text(html_output, encoding="utf-8")
+        name = beam_path.relative_to(out_dir).as_posix()
+        input_hash = _page_input_hash(
+            item["beam"], slug=item["slug"], code=code, units=units, renderer=renderer
+        )
+        entry = previous.get(name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("input") == input_hash
+            and entry.get("sha256") == _sha256_file(beam_path)
+        ):
+            pages[name] = entry
+        else:
+            pages[name] = {"input": input_hash}
+            pending.append((name, str(beam_path), item["beam"]))
         written.append(beam_path)
 
+    if pending:
+        jobs = (
+            [path for _, path, _ in pending],
+            [beam for _, _, beam in pending],
+            [code] * len(pending),
+            [units] * len(pending),
+        )
+        # A page renders in about a millisecond; small batches stay in-process
+        workers = min(
+            max_workers or os.cpu_count() or 1,
+            max(1, len(pending) // _MIN_PAGES_PER_WORKER),
+        )
+        if workers <= 1:
+            digests = list(map(_write_beam_page, *jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                digests = list(
+                    executor.map(
+                        _write_beam_page,
+                        *jobs,
+                        chunksize=max(1, len(pending) // (workers * 4)),
+                    )
+                )
+        for (name, _, _), digest in zip(pending, digests, strict=True):
+            pages[name]["sha256"] = digest
+
+    # Beams that left the batch
+    for name in previous.keys() - pages.keys():
+        stale = (out_dir / name).resolve()
+        if stale.parent == beams_dir.resolve():
+            stale.unlink(missing_ok=True)
+
+    manifest_path.write_text(
+        json.dumps(
+            {"schema": _MANIFEST_SCHEMA, "renderer": renderer, "pages": pages},
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    return written
+
+
+def write_design_report_pdfs(
+    design_results: dict[str, Any],
+    *,
+    output_path: Path,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_PDF_CHUNK_REPORTS,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[Path]:
+    """Write PDF reports for multi-beam results.
+
+    A ``.pdf`` output path receives one combined document, each beam on a
+    new page. Any other path is a folder receiving one ``<slug>.pdf`` per
+    beam, rendered in parallel.
+
+    Args:
+        design_results: Multi-beam design results
+        output_path: ``.pdf`` file or folder
+        max_workers: Worker processes for per-beam documents
+        chunk_size: Reports rendered per pass or per worker task
+        progress: Called as ``progress(completed, total)``
+
+    Returns:
+        Paths of the PDFs written
+    """
+    indexed = _build_beam_index(design_results.get("beams", []))
+    if not indexed:
+        raise ValueError("Design results contain no beams")
+    code = str(design_results.get("code", "") or "")
+    units = str(design_results.get("units", "") or "")
+    reports = [
+        _beam_report_data_from_design(item["beam"], code=code, units=units)
+        for item in indexed
+    ]
+
+    if output_path.suffix.lower() == ".pdf":
+        pdf = export_pdf_combined(reports, chunk_size=chunk_size, progress=progress)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(pdf)
+        return [output_path]
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    pdfs = export_pdf_batch(
+        reports, max_workers=max_workers, chunk_size=chunk_size, progress=progress
+    )
+    written = []
+    for item, pdf in zip(indexed, pdfs, strict=True):
+        path = output_path / f"{item['slug']}.pdf"
+        path.write_bytes(pdf)
+        written.append(path)
     return written
 
 
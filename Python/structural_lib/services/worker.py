@@ -0,0 +1,299 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""worker
+
+Resident worker for Excel and CLI callers.
+
+Each ``python -m structural_lib ...`` call pays the library import cost
+again. A worker loads the library once and answers calls over a local
+socket, so callers pay one round trip:
+
+    python -m structural_lib serve --socket /tmp/structural_lib.sock
+    python -m structural_lib --worker /tmp/structural_lib.sock design in.csv -o out.json
+
+The address is a Unix socket path, or a Windows named pipe
+(``\\\\.\\pipe\\structural_lib``).
+
+Excel does not forward to the worker: xlwings keeps its own UDF server
+resident. The ``udf`` method serves other local callers of the same
+``IS456_*`` functions.
+
+Protocol:
+    Each message is a 4-byte big-endian length followed by a UTF-8 JSON
+    object (``multiprocessing.connection`` framing, no auth key). A request
+    is ``{"method": str, "params": list}``; the reply is
+    ``{"ok": true, "result": ...}`` or
+    ``{"ok": false, "error": str, "type": str}``.
+
+Methods:
+    ping      -> {"pid", "version"}
+    udf       params [name, *args] -> value of an ``IS456_*`` Excel UDF
+    cli       params [argv, cwd] -> {"exit_code", "stdout", "stderr"}
+    shutdown  -> stops the worker after replying
+
+This module imports only the standard library at module level, so a thin
+client does not load the design stack.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import stat
+import sys
+import threading
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any
+
+# Modules loaded before the first call when the worker starts with preload
+_PRELOAD_MODULES = (
+    "structural_lib.services.excel_bridge",
+    "structural_lib.services.api",
+    "structural_lib.services.job_runner",
+    "structural_lib.__main__",
+)
+
+# The CLI writes to process-wide stdout/stderr and resolves paths against the
+# process cwd, so CLI calls run one at a time; UDF calls do not take the lock.
+_CLI_LOCK = threading.Lock()
+
+# Windows named pipe addresses; every other address is a Unix socket path
+_PIPE_PREFIX = "\\\\.\\pipe\\"
+
+
+class WorkerError(RuntimeError):
+    """A worker call failed, or no worker answered at the address."""
+
+
+# =============================================================================
+# Method handlers
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def _udfs() -> dict[str, Callable[..., Any]]:
+    from structural_lib.services import excel_bridge
+
+    return {
+        name: getattr(excel_bridge, name)
+        for name in dir(excel_bridge)
+        if name.startswith("IS456_")
+    }
+
+
+def _ping() -> dict[str, Any]:
+    import structural_lib
+
+    return {"pid": os.getpid(), "version": structural_lib.__version__}
+
+
+def _udf(name: str, *args: Any) -> Any:
+    try:
+        fn = _udfs()[name]
+    except KeyError:
+        raise ValueError(f"Unknown UDF: {name}") from None
+    return fn(*args)
+
+
+def _cli(argv: Sequence[str], cwd: str | None = None) -> dict[str, Any]:
+    from structural_lib.__main__ import _command_of, main
+
+    if _command_of(argv) == "serve":
+        raise ValueError("serve cannot run inside a worker")
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with _CLI_LOCK:
+        previous = os.getcwd()
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    exit_code = main(list(argv))
+                except SystemExit as exc:  # argparse errors and --help
+                    code = exc.code
+                    exit_code = code if isinstance(code, int) else int(bool(code))
+        finally:
+            os.chdir(previous)
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+_METHODS: dict[str, Callable[..., Any]] = {
+    "ping": _ping,
+    "udf": _udf,
+    "cli": _cli,
+}
+
+
+def _dispatch(request: dict[str, Any]) -> dict[str, Any]:
+    method = request.get("method")
+    params = request.get("params") or []
+    try:
+        if method not in _METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        return {"ok": True, "result": _METHODS[method](*params)}
+    except Exception as exc:
+        return {"ok": False, "error": str(exc), "type": type(exc).__name__}
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+def _prepare_address(address: str) -> None:
+    """Remove a stale Unix socket left by a worker that did not exit cleanly."""
+    if address.startswith(_PIPE_PREFIX) or not os.path.lexists(address):
+        return
+    if not stat.S_ISSOCK(os.lstat(address).st_mode):
+        raise WorkerError(f"{address} exists and is not a socket")
+    try:
+        Client(address).close()
+    except OSError:
+        os.unlink(address)
+    else:
+        raise WorkerError(f"A worker is already listening on {address}")
+
+
+def _handle(conn: Connection, stop: threading.Event, address: str) -> None:
+    with conn:
+        while True:
+            try:
+                payload = conn.recv_bytes()
+            except (EOFError, OSError):
+                return
+            try:
+                request = json.loads(payload)
+            except ValueError as exc:
+                reply = {"ok": False, "error": str(exc), "type": "ValueError"}
+            else:
+                if request.get("method") == "shutdown":
+                    stop.set()
+                    reply = {"ok": True, "result": None}
+                else:
+                    reply = _dispatch(request)
+            conn.send_bytes(json.dumps(reply, default=str).encode("utf-8"))
+            if stop.is_set():
+                # Wake the accept loop so serve() can return
+                with contextlib.suppress(OSError):
+                    Client(address).close()
+                return
+
+
+def serve(
+    address: str,
+    *,
+    preload: bool = True,
+    ready: Callable[[], None] | None = None,
+) -> None:
+    """Answer worker calls on ``address`` until a shutdown request arrives.
+
+    Every client connection gets its own thread and may send any number of
+    requests.
+
+    Args:
+        address: Unix socket path or Windows named pipe name.
+        preload: Import the Excel UDFs and CLI stacks before listening.
+        ready: Called once the worker is listening.
+
+    Raises:
+        WorkerError: Another worker already listens on ``address``.
+    """
+    if preload:
+        import importlib
+
+        for name in _PRELOAD_MODULES:
+            importlib.import_module(name)
+        _udfs()
+
+    _prepare_address(address)
+    stop = threading.Event()
+    with Listener(address) as listener:
+        if ready is not None:
+            ready()
+        while not stop.is_set():
+            try:
+                conn = listener.accept()
+            except OSError:
+                break
+            if stop.is_set():
+                conn.close()
+                break
+            threading.Thread(
+                target=_handle, args=(conn, stop, address), daemon=True
+            ).start()
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+class WorkerClient:
+    """Connection to a running worker; reuse it for many calls.
+
+    Example:
+        >>> with WorkerClient("/tmp/structural_lib.sock") as worker:
+        ...     worker.udf("IS456_MuLim", 300, 450, 25, 500)
+    """
+
+    def __init__(self, address: str) -> None:
+        try:
+            self._conn = Client(address)
+        except OSError as exc:
+            raise WorkerError(f"No worker is listening on {address}: {exc}") from exc
+
+    def call(self, method: str, *params: Any) -> Any:
+        """Send one request and return its result.
+
+        Raises:
+            WorkerError: The worker reported an error for the call.
+        """
+        request = {"method": method, "params": list(params)}
+        self._conn.send_bytes(json.dumps(request).encode("utf-8"))
+        reply: dict[str, Any] = json.loads(self._conn.recv_bytes())
+        if not reply["ok"]:
+            raise WorkerError(f"{reply['type']}: {reply['error']}")
+        return reply["result"]
+
+    def ping(self) -> dict[str, Any]:
+        result: dict[str, Any] = self.call("ping")
+        return result
+
+    def udf(self, name: str, *args: Any) -> Any:
+        """Evaluate an ``IS456_*`` Excel UDF in the worker."""
+        return self.call("udf", name, *args)
+
+    def cli(self, argv: Sequence[str], cwd: str | Path | None = None) -> dict[str, Any]:
+        """Run ``python -m structural_lib <argv>`` in the worker."""
+        result: dict[str, Any] = self.call("cli", list(argv), str(cwd or Path.cwd()))
+        return result
+
+    def shutdown(self) -> None:
+        self.call("shutdown")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> WorkerClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def forward_cli(address: str, argv: Sequence[str]) -> int:
+    """Run a CLI command in the worker and replay its output locally."""
+    with WorkerClient(address) as worker:
+        result = worker.cli(argv)
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return int(result["exit_code"])
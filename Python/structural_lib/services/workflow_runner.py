@@ -13,7 +13,7 @@ from collections import OrderedDict
 from collections.abc import Callable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any, Protocol, cast
 
 from structural_lib.core.result_contract import (
     CalculationStatus,
@@ -52,6 +52,7 @@ __all__ = [
     "WorkflowDefinitionError",
     "WorkflowIdempotencyError",
     "WorkflowInputError",
+    "WorkflowReplayStore",
     "WorkflowRunner",
     "get_beam_workflow_template_document",
     "serialize_beam_workflow_template",
@@ -102,6 +103,59 @@ class _CachedRun:
     result: dict[str, Any]
 
 
+class WorkflowReplayStore(Protocol):
+    """Where a runner keeps completed runs for idempotent replay.
+
+    Runners that share one store replay each other's runs; the first result
+    stored for a run ID wins.
+    """
+
+    def get(self, run_id: str) -> tuple[str, dict[str, Any]] | None:
+        """Return ``(fingerprint, result)`` for a stored run, or None."""
+        ...
+
+    def put(
+        self, run_id: str, fingerprint: str, result: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Store a run unless one exists; return the existing entry if so."""
+        ...
+
+
+class _MemoryReplayStore:
+    """Least-recently-stored replay cache bounded by ``MAX_CACHED_RUNS``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._runs: OrderedDict[str, _CachedRun] = OrderedDict()
+
+    def get(self, run_id: str) -> tuple[str, dict[str, Any]] | None:
+        with self._lock:
+            cached = self._runs.get(run_id)
+        return None if cached is None else (cached.fingerprint, cached.result)
+
+    def put(
+        self, run_id: str, fingerprint: str, result: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]] | None:
+        with self._lock:
+            cached = self._runs.get(run_id)
+            if cached is not None:
+                return cached.fingerprint, cached.result
+            self._runs[run_id] = _CachedRun(fingerprint, deepcopy(result))
+            while len(self._runs) > MAX_CACHED_RUNS:
+                self._runs.popitem(last=False)
+        return None
+
+
+def _replay(cached: tuple[str, dict[str, Any]], fingerprint: str) -> dict[str, Any]:
+    if cached[0] != fingerprint:
+        raise WorkflowIdempotencyError(
+            "run_id was already used for a different workflow request"
+        )
+    replay = deepcopy(cached[1])
+    replay["idempotent_replay"] = True
+    return replay
+
+
 def _json_bytes(value: Any) -> bytes:
     try:
         encoded = json.dumps(
@@ -262,13 +316,19 @@ def _fingerprint(
 
 
 class WorkflowRunner:
-    """One-process bounded runner with deterministic idempotency and cancellation."""
+    """Bounded runner with deterministic idempotency and cancellation.
+
+    The concurrency quota and cancellation are per process. Idempotent replay
+    spans every runner given the same ``replay_store``; the default store is
+    private to this runner.
+    """
 
     def __init__(
         self,
         *,
         max_concurrency: int = 1,
         clock: Callable[[], float] = time.monotonic,
+        replay_store: WorkflowReplayStore | None = None,
     ) -> None:
         if max_concurrency != 1:
             raise ValueError("The approved workflow runner concurrency is exactly 1")
@@ -276,7 +336,9 @@ class WorkflowRunner:
         self._lock = threading.Lock()
         self._active = 0
         self._active_run_ids: set[str] = set()
-        self._cache: OrderedDict[str, _CachedRun] = OrderedDict()
+        self._replays: WorkflowReplayStore = (
+            _MemoryReplayStore() if replay_store is None else replay_store
+        )
         self._cancelled: set[str] = set()
 
     def cancel(self, run_id: str) -> bool:
@@ -336,16 +398,9 @@ class WorkflowRunner:
             review_acknowledged,
             timeout_ms,
         )
-        with self._lock:
-            cached = self._cache.get(run_id)
+        cached = self._replays.get(run_id)
         if cached is not None:
-            if cached.fingerprint != fingerprint:
-                raise WorkflowIdempotencyError(
-                    "run_id was already used for a different workflow request"
-                )
-            replay = deepcopy(cached.result)
-            replay["idempotent_replay"] = True
-            return replay
+            return _replay(cached, fingerprint)
 
         self._enter(run_id)
         try:
@@ -366,11 +421,10 @@ class WorkflowRunner:
             result["idempotent_replay"] = False
             if len(_json_bytes(result)) > MAX_OUTPUT_BYTES:
                 raise WorkflowInputError("Workflow output exceeds byte quota")
-            with self._lock:
-                self._cache[run_id] = _CachedRun(fingerprint, deepcopy(result))
-                self._cache.move_to_end(run_id)
-                while len(self._cache) > MAX_CACHED_RUNS:
-                    self._cache.popitem(last=False)
+            # Another process sharing the store may have finished first.
+            cached = self._replays.put(run_id, fingerprint, result)
+            if cached is not None:
+                return _replay(cached, fingerprint)
             return result
         finally:
             self._leave(run_id)
@@ -425,6 +425,9 @@ def building_to_3d_geometry(
     from structural_lib.core.models import BeamGeometry as BeamGeometryModel
 
     beam_list: list[BuildingBeam3D] = []
+    # Bounds grow as members are read, so large models are walked once
+    lower = [math.inf, math.inf, math.inf]
+    upper = [-math.inf, -math.inf, -math.inf]
 
     for beam in beams:
         if not isinstance(beam, BeamGeometryModel):
@@ -453,16 +456,21 @@ def building_to_3d_geometry(
                 end=end,
             )
         )
+        for i, (a, b) in enumerate(
+            ((start.x, end.x), (start.y, end.y), (start.z, end.z))
+        ):
+            if a > b:
+                a, b = b, a
+            if a < lower[i]:
+                lower[i] = a
+            if b > upper[i]:
+                upper[i] = b
 
     if not beam_list:
         raise ValueError("No beams provided for building geometry")
 
-    min_x = min(min(b.start.x, b.end.x) for b in beam_list)
-    max_x = max(max(b.start.x, b.end.x) for b in beam_list)
-    min_y = min(min(b.start.y, b.end.y) for b in beam_list)
-    max_y = max(max(b.start.y, b.end.y) for b in beam_list)
-    min_z = min(min(b.start.z, b.end.z) for b in beam_list)
-    max_z = max(max(b.start.z, b.end.z) for b in beam_list)
+    min_x, min_y, min_z = lower
+    max_x, max_y, max_z = upper
 
     center = Point3D(
         (min_x + max_x) / 2,
@@ -0,0 +1,282 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Packed binary building geometry for WebGL viewers.
+
+:func:`~structural_lib.visualization.geometry_3d.building_to_3d_geometry`
+creates a ``Point3D`` per member end, and its JSON form repeats every
+coordinate and key per member. For a 20,000-member building that is
+megabytes of JSON to build, send and parse. This module packs the same line
+geometry into typed buffers that three.js can hand to ``BufferGeometry``
+without per-member work:
+
+- ``positions``: Float32 ``(x, y, z)`` per distinct member end, relative to
+  ``origin`` so Float32 keeps sub-millimetre precision in large models
+- ``indices``: Uint32 vertex pair per member, for ``LineSegments``
+- ``frameTypes``: Uint8 code per member into ``FRAME_TYPES``
+- ``storyIndices``: Uint32 per member into the header's story table
+
+Member ids and story names travel once, in the JSON header.
+
+Layout (little-endian)::
+
+    magic "SLPG" | uint32 version | uint32 header bytes | JSON header | body
+
+The header is space-padded to a multiple of 4 bytes. Each buffer's
+``offset`` is relative to the start of the body and a multiple of 4, so
+``new Float32Array(payload, 12 + headerBytes + offset, count)`` views it
+without copying.
+
+NumPy is an optional dependency: ``pip install structural-lib-is456[geometry]``.
+
+Example:
+    >>> packed = pack_building_geometry(beams)
+    >>> payload = packed.to_bytes()
+    >>> unpack_building_geometry(payload).member_ids == packed.member_ids
+    True
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ModuleNotFoundError as exc:  # pragma: no cover - exercised without numpy
+    raise ModuleNotFoundError(
+        "Packed geometry requires the optional 'geometry' extra. "
+        "Install structural-lib-is456[geometry]."
+    ) from exc
+
+if TYPE_CHECKING:
+    from structural_lib.core.models import BeamGeometry
+
+__all__ = [
+    "FRAME_TYPES",
+    "PACKED_GEOMETRY_MAGIC",
+    "PACKED_GEOMETRY_MEDIA_TYPE",
+    "PACKED_GEOMETRY_VERSION",
+    "PackedBuildingGeometry",
+    "pack_building_geometry",
+    "unpack_building_geometry",
+]
+
+PACKED_GEOMETRY_MAGIC = b"SLPG"
+PACKED_GEOMETRY_VERSION = 1
+PACKED_GEOMETRY_MEDIA_TYPE = "application/octet-stream"
+FRAME_TYPES = ("beam", "column", "brace")
+
+_PREAMBLE = struct.Struct("<4sII")
+# Buffer name -> (dtype, components per member or vertex)
+_BUFFERS: dict[str, tuple[np.dtype[Any], int]] = {
+    "positions": (np.dtype("<f4"), 3),
+    "indices": (np.dtype("<u4"), 2),
+    "frameTypes": (np.dtype("u1"), 1),
+    "storyIndices": (np.dtype("<u4"), 1),
+}
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+@dataclass
+class PackedBuildingGeometry:
+    """Building line geometry as typed arrays.
+
+    Attributes:
+        origin: Point (mm) that ``positions`` are relative to; the bounding
+            box centre
+        positions: ``(vertices, 3)`` float32 member ends, in mm from origin
+        indices: ``(members, 2)`` uint32 start/end rows of ``positions``
+        frame_types: ``(members,)`` uint8 codes into ``FRAME_TYPES``
+        story_indices: ``(members,)`` uint32 rows of ``stories``
+        member_ids: Member id per member, in input order
+        stories: Distinct story names, in first-seen order
+        bounding_box: Exact bounds in mm, rounded like the JSON response
+        metadata: Free-form receipt copied into the header
+    """
+
+    origin: tuple[float, float, float]
+    positions: np.ndarray
+    indices: np.ndarray
+    frame_types: np.ndarray
+    story_indices: np.ndarray
+    member_ids: tuple[str, ...]
+    stories: tuple[str, ...]
+    bounding_box: dict[str, float]
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def member_count(self) -> int:
+        return len(self.member_ids)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+    def _arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "positions": self.positions,
+            "indices": self.indices,
+            "frameTypes": self.frame_types,
+            "storyIndices": self.story_indices,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the packed layout described in the module docstring."""
+        arrays = {
+            name: np.ascontiguousarray(array, dtype=_BUFFERS[name][0]).reshape(-1)
+            for name, array in self._arrays().items()
+        }
+        buffers: dict[str, dict[str, Any]] = {}
+        offset = 0
+        for name, array in arrays.items():
+            buffers[name] = {
+                "offset": offset,
+                "count": int(array.size),
+                "componentType": array.dtype.name,
+                "itemSize": _BUFFERS[name][1],
+            }
+            offset = _align(offset + array.nbytes)
+        header = {
+            "version": PACKED_GEOMETRY_VERSION,
+            "byteOrder": "little",
+            "units": "mm",
+            "memberCount": self.member_count,
+            "vertexCount": self.vertex_count,
+            "origin": list(self.origin),
+            "boundingBox": self.bounding_box,
+            "frameTypes": list(FRAME_TYPES),
+            "memberIds": list(self.member_ids),
+            "stories": list(self.stories),
+            "metadata": self.metadata,
+            "buffers": buffers,
+        }
+        encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        # Pad with spaces so the body starts on a 4-byte boundary
+        encoded = encoded.ljust(_align(len(encoded)), b" ")
+
+        parts = [
+            _PREAMBLE.pack(
+                PACKED_GEOMETRY_MAGIC, PACKED_GEOMETRY_VERSION, len(encoded)
+            ),
+            encoded,
+        ]
+        for array in arrays.values():
+            data = array.tobytes()
+            parts.append(data.ljust(_align(len(data)), b"\0"))
+        return b"".join(parts)
+
+
+def pack_building_geometry(
+    beams: Iterable[BeamGeometry],
+    *,
+    unit_scale: float = 1000.0,
+    include_frame_types: tuple[str, ...] | None = None,
+) -> PackedBuildingGeometry:
+    """Pack line geometry for a multi-beam building view.
+
+    Accepts the same members and filters as
+    :func:`~structural_lib.visualization.geometry_3d.building_to_3d_geometry`
+    and produces the same bounds. Member ends at identical coordinates share
+    one vertex.
+
+    Args:
+        beams: Iterable of BeamGeometry (coordinates typically in meters).
+        unit_scale: Scale factor applied to coordinates (default converts m -> mm).
+        include_frame_types: Optional filter for frame types ("beam", "column", "brace").
+
+    Returns:
+        PackedBuildingGeometry ready for :meth:`~PackedBuildingGeometry.to_bytes`.
+
+    Raises:
+        ValueError: If no members remain after filtering.
+    """
+    from structural_lib.core.models import BeamGeometry as BeamGeometryModel
+
+    frame_codes = {name: code for code, name in enumerate(FRAME_TYPES)}
+    story_codes: dict[str, int] = {}
+    member_ids: list[str] = []
+    member_frames: list[int] = []
+    member_stories: list[int] = []
+    coordinates: list[float] = []
+
+    # The only per-member Python work: collecting scalars from the models.
+    for beam in beams:
+        if not isinstance(beam, BeamGeometryModel):
+            continue
+        frame_type = str(beam.frame_type.value)
+        if include_frame_types and frame_type not in include_frame_types:
+            continue
+        member_ids.append(beam.id)
+        member_frames.append(frame_codes[frame_type])
+        member_stories.append(story_codes.setdefault(beam.story, len(story_codes)))
+        p1, p2 = beam.point1, beam.point2
+        coordinates.extend((p1.x, p1.y, p1.z, p2.x, p2.y, p2.z))
+
+    if not member_ids:
+        raise ValueError("No beams provided for building geometry")
+
+    ends = np.asarray(coordinates, dtype=np.float64).reshape(-1, 3) * unit_scale
+    lower = ends.min(axis=0)
+    upper = ends.max(axis=0)
+    center = (lower + upper) / 2
+    vertices, inverse = np.unique(ends, axis=0, return_inverse=True)
+
+    bounding_box = {
+        f"{bound}_{axis}": round(float(values[i]), 3)
+        for i, axis in enumerate("xyz")
+        for bound, values in (("min", lower), ("max", upper))
+    }
+    return PackedBuildingGeometry(
+        origin=(float(center[0]), float(center[1]), float(center[2])),
+        positions=(vertices - center).astype(np.float32),
+        indices=inverse.reshape(-1, 2).astype(np.uint32),
+        frame_types=np.asarray(member_frames, dtype=np.uint8),
+        story_indices=np.asarray(member_stories, dtype=np.uint32),
+        member_ids=tuple(member_ids),
+        stories=tuple(story_codes),
+        bounding_box=bounding_box,
+        metadata={"unitScale": unit_scale, "beamCount": len(member_ids)},
+    )
+
+
+def unpack_building_geometry(data: bytes) -> PackedBuildingGeometry:
+    """Read a payload written by :meth:`PackedBuildingGeometry.to_bytes`.
+
+    Raises:
+        ValueError: If the payload is not packed geometry of a known version.
+    """
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("Packed geometry payload is truncated")
+    magic, version, header_size = _PREAMBLE.unpack_from(data)
+    if magic != PACKED_GEOMETRY_MAGIC:
+        raise ValueError("Not a packed geometry payload")
+    if version != PACKED_GEOMETRY_VERSION:
+        raise ValueError(f"Unsupported packed geometry version {version}")
+    body = _PREAMBLE.size + header_size
+    header = json.loads(data[_PREAMBLE.size : body])
+
+    arrays: dict[str, np.ndarray] = {}
+    for name, (dtype, item_size) in _BUFFERS.items():
+        view = header["buffers"][name]
+        array = np.frombuffer(
+            data, dtype=dtype, count=view["count"], offset=body + view["offset"]
+        )
+        arrays[name] = array.reshape(-1, item_size) if item_size > 1 else array
+
+    return PackedBuildingGeometry(
+        origin=tuple(header["origin"]),
+        positions=arrays["positions"],
+        indices=arrays["indices"],
+        frame_types=arrays["frameTypes"],
+        story_indices=arrays["storyIndices"],
+        member_ids=tuple(header["memberIds"]),
+        stories=tuple(header["stories"]),
+        bounding_box=header["boundingBox"],
+        metadata=header["metadata"],
+    )
@@ -0,0 +1,412 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Instanced rebar geometry for building-scale 3D views.
+
+:func:`~structural_lib.visualization.geometry_3d.beam_to_3d_geometry` emits
+every bar and every stirrup of one beam. Across a floor of 2,000 beams that
+is hundreds of thousands of objects, although most beams repeat a handful of
+details. This module draws each detail once and places it many times:
+
+- Beams are grouped into types with
+  :func:`~structural_lib.codes.is456.beam.detailing.group_similar_beams`,
+  the grouping used by the DXF beam schedule. Each type gets one
+  :class:`RebarPrototype` built from its first beam, in the beam-local
+  coordinates of ``geometry_3d`` (X along span from 0, Y across width from
+  the centre line, Z up from the soffit).
+- Each beam becomes an instance: a type index and a 4x4 column-major
+  transform, ready for ``THREE.InstancedMesh.instanceMatrix``. The
+  transform scales X by the beam's span over the prototype span, since a
+  type admits spans within ±50 mm.
+- Per-instance level of detail: beyond ``stirrup_distance_mm`` from the
+  view point stirrups are skipped, and beyond ``layer_distance_mm`` each
+  bar layer is drawn as one merged strip.
+
+Placement:
+    Member lines (BeamGeometry ``point1`` → ``point2``) are taken as the top
+    centre of the beam, the ETABS default insertion point. The detail is
+    centred along the line, so a clear-span detail sits between supports
+    on a centre-to-centre line.
+
+Display only: instances show their type's representative detail, as a
+beam schedule does.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .geometry_3d import beam_to_3d_geometry
+
+if TYPE_CHECKING:
+    from structural_lib.codes.is456.beam.detailing import BeamDetailingResult
+    from structural_lib.core.models import BeamGeometry
+
+__all__ = [
+    "LOD_BARS",
+    "LOD_FULL",
+    "LOD_LAYERS",
+    "InstancedRebarGeometry",
+    "PrototypeBar",
+    "PrototypeBarLayer",
+    "RebarPrototype",
+    "building_rebar_instances",
+]
+
+# Level-of-detail codes, per instance
+LOD_FULL = 0  # Bars and stirrups
+LOD_BARS = 1  # Bars only
+LOD_LAYERS = 2  # One merged strip per bar layer
+
+
+@dataclass(frozen=True, slots=True)
+class PrototypeBar:
+    """Straight bar running the prototype span at a fixed (y, z)."""
+
+    y: float
+    z: float
+    diameter: float
+    bar_type: str
+    zone: str
+
+    def to_dict(self) -> dict:
+        return {
+            "y": round(self.y, 1),
+            "z": round(self.z, 1),
+            "diameter": round(self.diameter, 1),
+            "barType": self.bar_type,
+            "zone": self.zone,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PrototypeBarLayer:
+    """Bars of one layer merged into a strip from ``y_min`` to ``y_max``."""
+
+    bar_type: str
+    z: float
+    diameter: float
+    count: int
+    y_min: float
+    y_max: float
+
+    def to_dict(self) -> dict:
+        return {
+            "barType": self.bar_type,
+            "z": round(self.z, 1),
+            "diameter": round(self.diameter, 1),
+            "count": self.count,
+            "yMin": round(self.y_min, 1),
+            "yMax": round(self.y_max, 1),
+        }
+
+
+@dataclass(frozen=True)
+class RebarPrototype:
+    """Reinforcement of one beam type, drawn once per instance."""
+
+    type_key: str
+    b: float
+    D: float
+    span: float
+    bars: tuple[PrototypeBar, ...]
+    layers: tuple[PrototypeBarLayer, ...]
+    stirrup_shape: tuple[tuple[float, float], ...]
+    stirrup_positions: tuple[float, ...]
+    stirrup_diameter: float
+    stirrup_legs: int
+    hook_type: str
+    instance_count: int
+
+    def to_dict(self) -> dict:
+        return {
+            "typeKey": self.type_key,
+            "dimensions": {"b": self.b, "D": self.D, "span": self.span},
+            "bars": [bar.to_dict() for bar in self.bars],
+            "layers": [layer.to_dict() for layer in self.layers],
+            "stirrup": {
+                "shape": [
+                    {"y": round(y, 1), "z": round(z, 1)} for y, z in self.stirrup_shape
+                ],
+                "positionsX": [round(x, 1) for x in self.stirrup_positions],
+                "diameter": round(self.stirrup_diameter, 1),
+                "legs": self.stirrup_legs,
+                "hookType": self.hook_type,
+            },
+            "instanceCount": self.instance_count,
+        }
+
+
+@dataclass
+class InstancedRebarGeometry:
+    """Prototypes plus flat per-instance arrays.
+
+    Attributes:
+        prototypes: One per beam type
+        beam_ids: Beam id per instance
+        stories: Story per instance
+        type_indices: Row of ``prototypes`` per instance
+        lod: ``LOD_*`` code per instance
+        matrices: 16 floats per instance, column-major, prototype → world (mm)
+    """
+
+    prototypes: list[RebarPrototype]
+    beam_ids: list[str]
+    stories: list[str]
+    type_indices: list[int]
+    lod: list[int]
+    matrices: list[float]
+    metadata: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "prototypes": [prototype.to_dict() for prototype in self.prototypes],
+            "instances": {
+                "beamIds": self.beam_ids,
+                "stories": self.stories,
+                "typeIndices": self.type_indices,
+                "lod": self.lod,
+                "matrices": [round(value, 4) for value in self.matrices],
+            },
+            "metadata": self.metadata,
+            "version": "1.0.0",
+        }
+
+
+# =============================================================================
+# Prototypes
+# =============================================================================
+
+
+def _build_prototype(
+    type_key: str,
+    representative: BeamDetailingResult,
+    instance_count: int,
+    is_seismic: bool,
+) -> RebarPrototype:
+    geometry = beam_to_3d_geometry(representative, is_seismic=is_seismic)
+
+    bars = tuple(
+        PrototypeBar(
+            y=rebar.segments[0].start.y,
+            z=rebar.segments[0].start.z,
+            diameter=rebar.diameter,
+            bar_type=rebar.bar_type,
+            zone=rebar.zone,
+        )
+        for rebar in geometry.rebars
+    )
+
+    by_layer: dict[tuple[str, float, float], list[float]] = {}
+    for bar in bars:
+        key = (bar.bar_type, round(bar.z, 1), bar.diameter)
+        by_layer.setdefault(key, []).append(bar.y)
+    layers = tuple(
+        PrototypeBarLayer(
+            bar_type=bar_type,
+            z=z,
+            diameter=diameter,
+            count=len(ys),
+            y_min=min(ys),
+            y_max=max(ys),
+        )
+        for (bar_type, z, diameter), ys in by_layer.items()
+    )
+
+    stirrups = geometry.stirrups
+    first = stirrups[0] if stirrups else None
+    return RebarPrototype(
+        type_key=type_key,
+        b=representative.b,
+        D=representative.D,
+        span=representative.span,
+        bars=bars,
+        layers=layers,
+        stirrup_shape=tuple((p.y, p.z) for p in first.path) if first else (),
+        stirrup_positions=tuple(stirrup.position_x for stirrup in stirrups),
+        stirrup_diameter=first.diameter if first else 0.0,
+        stirrup_legs=first.legs if first else 0,
+        hook_type=first.hook_type if first else "",
+        instance_count=instance_count,
+    )
+
+
+# =============================================================================
+# Instances
+# =============================================================================
+
+
+def _sub(a: Sequence[float], b: Sequence[float]) -> tuple[float, float, float]:
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _cross(a: Sequence[float], b: Sequence[float]) -> tuple[float, float, float]:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _unit(v: Sequence[float]) -> tuple[float, float, float]:
+    length = math.sqrt(v[0] ** 2 + v[1] ** 2 + v[2] ** 2)
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _segment_distance(
+    point: Sequence[float], start: Sequence[float], end: Sequence[float]
+) -> float:
+    """Distance from ``point`` to the segment ``start``-``end``."""
+    d = _sub(end, start)
+    w = _sub(point, start)
+    length_sq = d[0] ** 2 + d[1] ** 2 + d[2] ** 2
+    t = (w[0] * d[0] + w[1] * d[1] + w[2] * d[2]) / length_sq
+    t = min(1.0, max(0.0, t))
+    return math.dist(
+        point, (start[0] + t * d[0], start[1] + t * d[1], start[2] + t * d[2])
+    )
+
+
+def _placement_matrix(
+    start: Sequence[float],
+    end: Sequence[float],
+    span: float,
+    prototype: RebarPrototype,
+) -> list[float]:
+    """Column-major 4x4 taking prototype coordinates to world (mm)."""
+    direction = _sub(end, start)
+    length = math.sqrt(sum(c * c for c in direction))
+    ex = _unit(direction)
+    ey = _cross((0.0, 0.0, 1.0), ex)
+    if math.hypot(*ey) < 1e-9:
+        # Vertical member: keep local Y on world Y
+        ey = (0.0, 1.0, 0.0)
+    ey = _unit(ey)
+    ez = _cross(ex, ey)
+
+    scale_x = span / prototype.span
+    along = (length - span) / 2  # centre the detail on the line
+    origin = tuple(
+        start[i] + ex[i] * along - ez[i] * prototype.D  # line is top centre
+        for i in range(3)
+    )
+    return [
+        *(c * scale_x for c in ex),
+        0.0,
+        *ey,
+        0.0,
+        *ez,
+        0.0,
+        *origin,
+        1.0,
+    ]
+
+
+def building_rebar_instances(
+    detailings: Sequence[BeamDetailingResult],
+    placements: Iterable[BeamGeometry],
+    *,
+    unit_scale: float = 1000.0,
+    is_seismic: bool = False,
+    view_point_mm: tuple[float, float, float] | None = None,
+    stirrup_distance_mm: float | None = None,
+    layer_distance_mm: float | None = None,
+) -> InstancedRebarGeometry:
+    """Build instanced rebar geometry for many beams.
+
+    Args:
+        detailings: Beam detailing results, one per beam to draw.
+        placements: BeamGeometry members; matched to detailings by id.
+            Members without a detailing (columns, braces) are ignored.
+        unit_scale: Scale factor applied to coordinates (default converts m -> mm).
+        is_seismic: True to draw 135° stirrup hooks.
+        view_point_mm: World point (mm) that level-of-detail distances are
+            measured from, to the nearest point of each member line.
+        stirrup_distance_mm: Skip stirrups on members farther than this.
+        layer_distance_mm: Merge bars per layer on members farther than this.
+
+    Returns:
+        InstancedRebarGeometry in the order of ``detailings``.
+
+    Raises:
+        ValueError: If beam ids repeat, a beam has no placement or a
+            zero-length one, or a distance is given without a view point.
+    """
+    from structural_lib.codes.is456.beam.detailing import group_similar_beams
+
+    if view_point_mm is None and (
+        stirrup_distance_mm is not None or layer_distance_mm is not None
+    ):
+        raise ValueError("view_point_mm is required for distance-based detail")
+
+    ids = [detailing.beam_id for detailing in detailings]
+    if len(ids) != len(set(ids)):
+        raise ValueError("beam ids must be unique")
+    wanted = set(ids)
+    lines = {
+        member.id: (
+            (
+                member.point1.x * unit_scale,
+                member.point1.y * unit_scale,
+                member.point1.z * unit_scale,
+            ),
+            (
+                member.point2.x * unit_scale,
+                member.point2.y * unit_scale,
+                member.point2.z * unit_scale,
+            ),
+        )
+        for member in placements
+        if member.id in wanted
+    }
+    missing = [beam_id for beam_id in ids if beam_id not in lines]
+    if missing:
+        raise ValueError(f"No placement for beams: {', '.join(missing[:5])}")
+
+    prototypes: list[RebarPrototype] = []
+    type_of: dict[str, int] = {}
+    for type_key, members in group_similar_beams(list(detailings)).items():
+        for member in members:
+            type_of[member.beam_id] = len(prototypes)
+        prototypes.append(
+            _build_prototype(type_key, members[0], len(members), is_seismic)
+        )
+
+    type_indices: list[int] = []
+    lod: list[int] = []
+    matrices: list[float] = []
+    for detailing in detailings:
+        start, end = lines[detailing.beam_id]
+        if start == end:
+            raise ValueError(f"Beam {detailing.beam_id} has a zero-length placement")
+        index = type_of[detailing.beam_id]
+        type_indices.append(index)
+        matrices.extend(
+            _placement_matrix(start, end, detailing.span, prototypes[index])
+        )
+
+        level = LOD_FULL
+        if view_point_mm is not None:
+            distance = _segment_distance(view_point_mm, start, end)
+            if layer_distance_mm is not None and distance > layer_distance_mm:
+                level = LOD_LAYERS
+            elif stirrup_distance_mm is not None and distance > stirrup_distance_mm:
+                level = LOD_BARS
+        lod.append(level)
+
+    return InstancedRebarGeometry(
+        prototypes=prototypes,
+        beam_ids=ids,
+        stories=[detailing.story for detailing in detailings],
+        type_indices=type_indices,
+        lod=lod,
+        matrices=matrices,
+        metadata={
+            "unitScale": unit_scale,
+            "beamCount": len(ids),
+            "typeCount": len(prototypes),
+            "placement": "top_centre",
+        },
+    )
@@ -0,0 +1,442 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Uniform-grid spatial index over building member lines.
+
+:func:`~structural_lib.visualization.geometry_3d.building_to_3d_geometry`
+returns every member of a building. A viewer that only shows one bay, or
+only what the camera sees, and a clash check that compares members pairwise,
+both need to find members by position without scanning the whole model.
+
+:class:`MemberSpatialIndex` records each member in the cells of a uniform
+grid of cubes that its line passes through, sized from the mean member
+length so a typical member touches a few cells. A long diagonal member
+costs cells in proportion to its length, not to its bounding box volume.
+It answers:
+
+- :meth:`~MemberSpatialIndex.query_box`: members crossing a box
+- :meth:`~MemberSpatialIndex.nearest`: the k members nearest a point
+- :meth:`~MemberSpatialIndex.query_frustum`: members not wholly outside any
+  of a set of planes (a camera frustum)
+- :meth:`~MemberSpatialIndex.adjacent_pairs`: member pairs whose lines come
+  within a tolerance, comparing only members that share cells
+
+All coordinates are in mm. Queries return member positions in the order the
+members were indexed.
+
+Example:
+    >>> geometry = building_to_3d_geometry(beams)
+    >>> index = MemberSpatialIndex.from_building(geometry)
+    >>> [index.members[i].member_id for i, _ in index.nearest((0, 0, 0), k=2)]
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .geometry_3d import Building3DGeometry
+
+__all__ = [
+    "IndexedMember",
+    "MemberSpatialIndex",
+]
+
+Vector = tuple[float, float, float]
+_Cell = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedMember:
+    """One member line in world coordinates (mm)."""
+
+    member_id: str
+    story: str
+    frame_type: str
+    start: Vector
+    end: Vector
+
+    @property
+    def lower(self) -> Vector:
+        return (
+            min(self.start[0], self.end[0]),
+            min(self.start[1], self.end[1]),
+            min(self.start[2], self.end[2]),
+        )
+
+    @property
+    def upper(self) -> Vector:
+        return (
+            max(self.start[0], self.end[0]),
+            max(self.start[1], self.end[1]),
+            max(self.start[2], self.end[2]),
+        )
+
+
+# =============================================================================
+# Geometry helpers
+# =============================================================================
+
+
+def _point_segment_distance(
+    point: Sequence[float], start: Vector, end: Vector
+) -> float:
+    d = (end[0] - start[0], end[1] - start[1], end[2] - start[2])
+    length_sq = d[0] ** 2 + d[1] ** 2 + d[2] ** 2
+    if length_sq == 0:
+        return math.dist(point, start)
+    t = sum((point[i] - start[i]) * d[i] for i in range(3)) / length_sq
+    t = min(1.0, max(0.0, t))
+    return math.dist(point, tuple(start[i] + t * d[i] for i in range(3)))
+
+
+def _segment_segment_distance(a0: Vector, a1: Vector, b0: Vector, b1: Vector) -> float:
+    """Shortest distance between segments a0-a1 and b0-b1."""
+    d1 = tuple(a1[i] - a0[i] for i in range(3))
+    d2 = tuple(b1[i] - b0[i] for i in range(3))
+    r = tuple(a0[i] - b0[i] for i in range(3))
+    a = sum(c * c for c in d1)
+    e = sum(c * c for c in d2)
+    f = sum(d2[i] * r[i] for i in range(3))
+    if a == 0 and e == 0:
+        return math.dist(a0, b0)
+    if a == 0:
+        s, t = 0.0, min(1.0, max(0.0, f / e))
+    else:
+        c = sum(d1[i] * r[i] for i in range(3))
+        if e == 0:
+            s, t = min(1.0, max(0.0, -c / a)), 0.0
+        else:
+            b = sum(d1[i] * d2[i] for i in range(3))
+            denom = a * e - b * b
+            s = min(1.0, max(0.0, (b * f - c * e) / denom)) if denom else 0.0
+            t = (b * s + f) / e
+            if t < 0:
+                s, t = min(1.0, max(0.0, -c / a)), 0.0
+            elif t > 1:
+                s, t = min(1.0, max(0.0, (b - c) / a)), 1.0
+    return math.dist(
+        tuple(a0[i] + d1[i] * s for i in range(3)),
+        tuple(b0[i] + d2[i] * t for i in range(3)),
+    )
+
+
+def _segment_crosses_box(
+    start: Vector, end: Vector, lower: Sequence[float], upper: Sequence[float]
+) -> bool:
+    """Slab test: does the segment touch the closed box?"""
+    t0, t1 = 0.0, 1.0
+    for i in range(3):
+        delta = end[i] - start[i]
+        if delta == 0:
+            if not lower[i] <= start[i] <= upper[i]:
+                return False
+            continue
+        near = (lower[i] - start[i]) / delta
+        far = (upper[i] - start[i]) / delta
+        if near > far:
+            near, far = far, near
+        t0, t1 = max(t0, near), min(t1, far)
+        if t0 > t1:
+            return False
+    return True
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+class MemberSpatialIndex:
+    """Uniform grid over member lines.
+
+    Args:
+        members: Member lines to index
+        cell_size: Grid cell edge in mm; defaults to the mean member length
+
+    Raises:
+        ValueError: If there are no members or ``cell_size`` is not positive
+    """
+
+    def __init__(
+        self, members: Iterable[IndexedMember], *, cell_size: float | None = None
+    ) -> None:
+        self.members: tuple[IndexedMember, ...] = tuple(members)
+        if not self.members:
+            raise ValueError("No members to index")
+        if cell_size is None:
+            total = sum(math.dist(m.start, m.end) for m in self.members)
+            # Any positive size works when every member has zero length
+            cell_size = total / len(self.members) or 1.0
+        if not cell_size > 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+
+        self._bounds = [(m.lower, m.upper) for m in self.members]
+        self._cells: dict[_Cell, list[int]] = {}
+        lower = list(self._bounds[0][0])
+        upper = list(self._bounds[0][1])
+        for position, (low, high) in enumerate(self._bounds):
+            for i in range(3):
+                lower[i] = min(lower[i], low[i])
+                upper[i] = max(upper[i], high[i])
+            member = self.members[position]
+            for cell in self._segment_cells(member.start, member.end):
+                self._cells.setdefault(cell, []).append(position)
+        self.lower: Vector = (lower[0], lower[1], lower[2])
+        self.upper: Vector = (upper[0], upper[1], upper[2])
+        self._grid = (self._cell_of(self.lower), self._cell_of(self.upper))
+
+    @classmethod
+    def from_building(
+        cls, geometry: Building3DGeometry, *, cell_size: float | None = None
+    ) -> MemberSpatialIndex:
+        """Index the members of a :class:`Building3DGeometry`."""
+        return cls(
+            (
+                IndexedMember(
+                    member_id=beam.beam_id,
+                    story=beam.story,
+                    frame_type=beam.frame_type,
+                    start=beam.start.to_tuple(),
+                    end=beam.end.to_tuple(),
+                )
+                for beam in geometry.beams
+            ),
+            cell_size=cell_size,
+        )
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    @property
+    def cell_count(self) -> int:
+        """Number of occupied grid cells."""
+        return len(self._cells)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query_box(self, lower: Sequence[float], upper: Sequence[float]) -> list[int]:
+        """Members whose line touches the closed box ``lower``-``upper``."""
+        return [
+            position
+            for position in self._candidates(lower, upper)
+            if _segment_crosses_box(
+                self.members[position].start, self.members[position].end, lower, upper
+            )
+        ]
+
+    def nearest(
+        self,
+        point: Sequence[float],
+        k: int = 1,
+        *,
+        max_distance: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """The ``k`` members nearest ``point``, as ``(position, distance)``.
+
+        Searches outward one shell of cells at a time and stops once no
+        unvisited cell can hold a closer member.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        centre = self._cell_of(point)
+        low_cell, high_cell = self._grid
+        # Shells outside this range hold no indexed cells
+        first_shell = max(
+            max(lo - c, c - hi, 0)
+            for c, lo, hi in zip(centre, low_cell, high_cell, strict=True)
+        )
+        last_shell = max(
+            max(abs(c - lo), abs(c - hi))
+            for c, lo, hi in zip(centre, low_cell, high_cell, strict=True)
+        )
+        best: list[tuple[float, int]] = []  # max-heap of (-distance, -position)
+        seen: set[int] = set()
+        for shell in range(first_shell, last_shell + 1):
+            for cell in self._shell(centre, shell):
+                for position in self._cells.get(cell, ()):
+                    if position in seen:
+                        continue
+                    seen.add(position)
+                    member = self.members[position]
+                    distance = _point_segment_distance(point, member.start, member.end)
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, -position))
+                    elif -best[0][0] > distance:
+                        heapq.heapreplace(best, (-distance, -position))
+            # Anything in a later shell is at least this far from the point
+            reach = shell * self.cell_size
+            if len(best) == k and -best[0][0] <= reach:
+                break
+            if max_distance is not None and reach > max_distance:
+                break
+        ranked = sorted((-distance, -position) for distance, position in best)
+        return [(position, distance) for distance, position in ranked]
+
+    def query_frustum(self, planes: Sequence[Sequence[float]]) -> list[int]:
+        """Members not wholly outside any plane.
+
+        Each plane is ``(nx, ny, nz, constant)`` with the inside where
+        ``nx*x + ny*y + nz*z + constant >= 0``, as in three.js ``Plane``.
+        Members are culled when every cell their line passes through is
+        wholly outside a plane, or when both their ends are outside one
+        plane, so a few members near frustum corners may be kept.
+        """
+        selected: set[int] = set()
+        for cell, positions in self._cells.items():
+            low = tuple(c * self.cell_size for c in cell)
+            high = tuple((c + 1) * self.cell_size for c in cell)
+            if any(_box_outside_plane(low, high, plane) for plane in planes):
+                continue
+            for position in positions:
+                if position in selected:
+                    continue
+                member = self.members[position]
+                if not any(
+                    _outside(member.start, plane) and _outside(member.end, plane)
+                    for plane in planes
+                ):
+                    selected.add(position)
+        return sorted(selected)
+
+    def adjacent_pairs(self, tolerance: float = 0.0) -> list[tuple[int, int]]:
+        """Member pairs whose lines come within ``tolerance`` (mm).
+
+        Members joined at a node are adjacent at zero tolerance; a positive
+        tolerance also finds near misses and clashes between crossing
+        members.
+        """
+        if tolerance < 0:
+            raise ValueError("tolerance must not be negative")
+        pairs: list[tuple[int, int]] = []
+        for position, (low, high) in enumerate(self._bounds):
+            member = self.members[position]
+            grown_low = tuple(c - tolerance for c in low)
+            grown_high = tuple(c + tolerance for c in high)
+            for other in self._candidates(grown_low, grown_high):
+                if other <= position:
+                    continue
+                candidate = self.members[other]
+                distance = _segment_segment_distance(
+                    member.start, member.end, candidate.start, candidate.end
+                )
+                if distance <= tolerance:
+                    pairs.append((position, other))
+        return pairs
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cell_of(self, point: Sequence[float]) -> _Cell:
+        size = self.cell_size
+        return (
+            math.floor(point[0] / size),
+            math.floor(point[1] / size),
+            math.floor(point[2] / size),
+        )
+
+    def _cell_range(
+        self, lower: Sequence[float], upper: Sequence[float]
+    ) -> Iterator[_Cell]:
+        (i0, j0, k0), (i1, j1, k1) = self._cell_of(lower), self._cell_of(upper)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    yield (i, j, k)
+
+    def _segment_cells(self, start: Vector, end: Vector) -> set[_Cell]:
+        """Cells holding some point of the segment ``start``-``end``.
+
+        Takes the cell at both ends, at every grid plane the segment
+        crosses and midway between successive crossings, so cells the line
+        only grazes at an edge or corner are included.
+        """
+        size = self.cell_size
+        first, last = self._cell_of(start), self._cell_of(end)
+        stops = {0.0, 1.0}
+        for i in range(3):
+            # Differing cells imply a nonzero extent along this axis
+            for plane in range(min(first[i], last[i]) + 1, max(first[i], last[i]) + 1):
+                t = (plane * size - start[i]) / (end[i] - start[i])
+                stops.add(min(1.0, max(0.0, t)))
+        ordered = sorted(stops)
+        samples = ordered + [
+            (a + b) / 2 for a, b in zip(ordered, ordered[1:], strict=False)
+        ]
+        return {
+            self._cell_of([start[i] + t * (end[i] - start[i]) for i in range(3)])
+            for t in samples
+        }
+
+    def _candidates(self, lower: Sequence[float], upper: Sequence[float]) -> list[int]:
+        """Members in the box's cells whose bounding box overlaps it, in order."""
+        lower = [max(lower[i], self.lower[i]) for i in range(3)]
+        upper = [min(upper[i], self.upper[i]) for i in range(3)]
+        if any(lower[i] > upper[i] for i in range(3)):
+            return []
+        (i0, j0, k0), (i1, j1, k1) = self._cell_of(lower), self._cell_of(upper)
+        cells = (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1)
+        if cells > len(self._cells):
+            # Box covers most of the grid: walk the occupied cells instead
+            pools = (
+                positions
+                for (i, j, k), positions in self._cells.items()
+                if i0 <= i <= i1 and j0 <= j <= j1 and k0 <= k <= k1
+            )
+        else:
+            pools = (
+                self._cells.get(cell, []) for cell in self._cell_range(lower, upper)
+            )
+        found: set[int] = set()
+        for positions in pools:
+            for position in positions:
+                low, high = self._bounds[position]
+                if all(low[i] <= upper[i] and high[i] >= lower[i] for i in range(3)):
+                    found.add(position)
+        return sorted(found)
+
+    def _shell(self, centre: _Cell, radius: int) -> Iterator[_Cell]:
+        """Grid cells at Chebyshev distance exactly ``radius`` from ``centre``."""
+        ci, cj, ck = centre
+        (i0, j0, k0), (i1, j1, k1) = self._grid
+        if radius == 0:
+            yield centre
+            return
+        ks = range(max(ck - radius, k0), min(ck + radius, k1) + 1)
+        caps = [k for k in (ck - radius, ck + radius) if k0 <= k <= k1]
+        for i in range(max(ci - radius, i0), min(ci + radius, i1) + 1):
+            for j in range(max(cj - radius, j0), min(cj + radius, j1) + 1):
+                if abs(i - ci) == radius or abs(j - cj) == radius:
+                    for k in ks:
+                        yield (i, j, k)
+                else:
+                    for k in caps:
+                        yield (i, j, k)
+
+
+def _outside(point: Vector, plane: Sequence[float]) -> bool:
+    return (
+        plane[0] * point[0] + plane[1] * point[1] + plane[2] * point[2] + plane[3] < 0
+    )
+
+
+def _box_outside_plane(
+    lower: Sequence[float], upper: Sequence[float], plane: Sequence[float]
+) -> bool:
+    """True when the whole box is on the outside of ``plane``."""
+    # The corner furthest along the plane normal
+    corner = (
+        upper[0] if plane[0] >= 0 else lower[0],
+        upper[1] if plane[1] >= 0 else lower[1],
+        upper[2] if plane[2] >= 0 else lower[2],
+    )
+    return _outside(corner, plane)
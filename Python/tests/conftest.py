@@ -66,6 +66,13 @@ from pathlib import Path  # noqa: E402
 
 import pytest  # noqa: E402
 
+from structural_lib.core.models import (  # noqa: E402
+    BeamGeometry,
+    FrameType,
+    Point3D,
+    SectionProperties,
+)
+
 # =============================================================================
 # GOLDEN VECTORS FIXTURE
 # =============================================================================
@@ -128,3 +135,38 @@ def standard_beam_300x600(m30_fe500: dict) -> dict:
         "cover_mm": 25.0,
         **m30_fe500,
     }
+
+
+# =============================================================================
+# BUILDING GEOMETRY FIXTURES
+# =============================================================================
+
+
+@pytest.fixture()
+def make_member():
+    """Factory for 300x500 M25/Fe500 building members.
+
+    Call as ``make_member(member_id, start, end, story=..., frame_type=...)``
+    with ``start``/``end`` as ``(x, y, z)`` in metres; a beam on L1 by default.
+    """
+    section = SectionProperties(width_mm=300, depth_mm=500, fck_mpa=25, fy_mpa=500)
+
+    def make(
+        member_id: str,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+        *,
+        story: str = "L1",
+        frame_type: FrameType = FrameType.BEAM,
+    ) -> BeamGeometry:
+        return BeamGeometry(
+            id=member_id,
+            label=member_id,
+            story=story,
+            frame_type=frame_type,
+            point1=Point3D(x=start[0], y=start[1], z=start[2]),
+            point2=Point3D(x=end[0], y=end[1], z=end[2]),
+            section=section,
+        )
+
+    return make
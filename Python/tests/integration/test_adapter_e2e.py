@@ -19,6 +19,7 @@ Path Rules:
 
 from __future__ import annotations
 
+from hashlib import sha256
 from pathlib import Path
 
 import pytest
@@ -26,7 +27,13 @@ import pytest
 from structural_lib.core.models import DesignDefaults, FrameType
 from structural_lib.services.adapters import ETABSAdapter, GenericCSVAdapter
 from structural_lib.services.api import design_beam_is456
-from structural_lib.services.imports import parse_dual_csv
+from structural_lib.services.import_ledger import ImportIssueCode, ImportStatus
+from structural_lib.services.imports import (
+    build_import_design_defaults,
+    parse_dual_csv,
+    parse_dual_csv_lossless,
+    parse_project_exports,
+)
 
 # =============================================================================
 # Path Configuration
@@ -439,6 +446,85 @@ def test_batch_design_flow():
         )
 
 
+# =============================================================================
+# Test 6: Split Project Exports — per-storey geometry and forces
+# =============================================================================
+
+
+def _split_by_story(source: Path, out_dir: Path, prefix: str) -> list[Path]:
+    """Write one CSV per storey, keeping the header row in each."""
+    header, *rows = source.read_text(encoding="utf-8-sig").splitlines()
+    story_index = header.split(",").index("Story")
+    by_story: dict[str, list[str]] = {}
+    for row in rows:
+        by_story.setdefault(row.split(",")[story_index], []).append(row)
+    paths = []
+    for story, story_rows in by_story.items():
+        path = out_dir / f"{prefix}_{story}.csv"
+        path.write_text("\n".join([header, *story_rows]) + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.skipif(not FRAMES_GEOMETRY_CSV.exists(), reason="sample data missing")
+def test_project_exports_split_by_story_match_dual_import(tmp_path: Path):
+    """Per-storey artifacts merge into the same batch as the whole-model pair."""
+    defaults = build_import_design_defaults(
+        fck_mpa=25, fy_mpa=500, cover_mm=40, stirrup_dia_mm=8
+    )
+    paths = _split_by_story(FRAMES_GEOMETRY_CSV, tmp_path, "geometry")
+    paths += _split_by_story(BEAM_FORCES_CSV, tmp_path, "forces")
+
+    whole = parse_dual_csv_lossless(
+        FRAMES_GEOMETRY_CSV, BEAM_FORCES_CSV, format_hint="etabs", defaults=defaults
+    )
+    serial = parse_project_exports(
+        paths, format_hint="etabs", defaults=defaults, max_workers=1
+    )
+    parallel = parse_project_exports(
+        paths, format_hint="etabs", defaults=defaults, max_workers=2
+    )
+
+    assert parallel.model_dump() == serial.model_dump()
+    assert parallel.status is ImportStatus.ACCEPTED
+    assert parallel.ledger.totals == whole.ledger.totals
+    assert {beam.id for beam in parallel.batch.beams} == {
+        beam.id for beam in whole.batch.beams
+    }
+    assert [a.sha256 for a in parallel.ledger.artifacts] == [
+        sha256(path.read_bytes()).hexdigest() for path in paths
+    ]
+    assert {row.artifact_index for row in parallel.ledger.rows} == set(
+        range(len(paths))
+    )
+
+
+@pytest.mark.skipif(not BEAM_FORCES_CSV.exists(), reason="sample data missing")
+def test_project_exports_block_records_repeated_across_artifacts(tmp_path: Path):
+    """The same member exported in two force artifacts is never merged."""
+    defaults = build_import_design_defaults(
+        fck_mpa=25, fy_mpa=500, cover_mm=40, stirrup_dia_mm=8
+    )
+    copy = tmp_path / "beam_forces_copy.csv"
+    copy.write_bytes(BEAM_FORCES_CSV.read_bytes())
+
+    result = parse_project_exports(
+        [FRAMES_GEOMETRY_CSV, BEAM_FORCES_CSV, copy],
+        format_hint="etabs",
+        defaults=defaults,
+        max_workers=1,
+    )
+
+    assert result.status is ImportStatus.BLOCKED
+    assert result.batch is None
+    duplicates = [
+        issue
+        for issue in result.issues
+        if issue.code is ImportIssueCode.DUPLICATE_RECORD_ID
+    ]
+    assert {issue.artifact_index for issue in duplicates} == {1, 2}
+
+
 # =============================================================================
 # Test Summary
 # =============================================================================
@@ -922,6 +922,36 @@ def test_dxf_title_block(sample_design_results_file, tmp_path):
     assert any("Beam Sheet" in text for text in texts)
 
 
+def test_dxf_sheet_size_writes_sheet_set(sample_design_results_file, tmp_path):
+    """--sheet-size splits a schedule into sheets, an index and a zip."""
+    from structural_lib.services import dxf_export
+
+    if not dxf_export.EZDXF_AVAILABLE:
+        pytest.skip("ezdxf not installed")
+
+    data = json.loads(sample_design_results_file.read_text(encoding="utf-8"))
+    data["beams"] = [{**data["beams"][0], "beam_id": f"B{i}"} for i in range(1, 4)]
+    sample_design_results_file.write_text(json.dumps(data), encoding="utf-8")
+    output_file = tmp_path / "sheets" / "beams.dxf"
+
+    rc = cli_main.main(
+        [
+            "dxf",
+            str(sample_design_results_file),
+            "-o",
+            str(output_file),
+            "--sheet-size",
+            "2",
+            "--workers",
+            "1",
+        ]
+    )
+
+    assert rc == 0
+    written = sorted(p.name for p in output_file.parent.iterdir())
+    assert written == ["beams.zip", "beams_01.dxf", "beams_02.dxf", "beams_index.dxf"]
+
+
 def test_dxf_without_ezdxf(sample_design_results_file, tmp_path, monkeypatch):
     """Test dxf command when ezdxf is not available."""
     from structural_lib.services import dxf_export
@@ -1075,6 +1105,44 @@ def test_job_execution(sample_job_file, tmp_path):
     assert len(csv_files) > 0 or len(json_files) > 0
 
 
+def test_job_rejects_run_dir_options_for_a_single_job(
+    sample_job_file, tmp_path, capsys
+):
+    """Extra positionals, --workers and --force only apply to run-dir."""
+    output_dir = tmp_path / "job_output"
+
+    rc = cli_main.main(
+        [
+            "job",
+            str(sample_job_file),
+            "extra",
+            "-o",
+            str(output_dir),
+            "--workers",
+            "4",
+            "--force",
+        ]
+    )
+
+    assert rc == 1
+    assert (
+        "'extra', --workers, --force only apply to run-dir" in capsys.readouterr().err
+    )
+    assert not output_dir.exists()
+
+
+def test_job_run_dir(sample_job_file, tmp_path, capsys):
+    """run-dir runs every job of a folder and skips unchanged ones."""
+    output_dir = tmp_path / "runs"
+    args = ["job", "run-dir", str(tmp_path), "-o", str(output_dir), "--workers", "1"]
+
+    assert cli_main.main(args) == 0
+    assert (output_dir / "job" / "design" / "design_results.json").exists()
+    assert cli_main.main(args) == 0
+    assert "0 ran, 1 skipped" in capsys.readouterr().err
+    assert cli_main.main(["job", "run-dir", "-o", str(output_dir)]) == 1
+
+
 def test_validate_job_auto(sample_job_file):
     """Validate job.json with auto detection."""
     rc = cli_main.main(["validate", str(sample_job_file)])
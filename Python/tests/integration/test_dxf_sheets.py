@@ -0,0 +1,92 @@
+"""BLOCK reuse and sheet sets for multi-beam DXF drawings."""
+
+import zipfile
+
+import pytest
+
+from structural_lib.detailing import create_beam_detailing
+from structural_lib.services import dxf_export
+
+pytestmark = pytest.mark.skipif(
+    not dxf_export.EZDXF_AVAILABLE, reason="ezdxf is not installed"
+)
+
+
+def _beam(beam_id: str, span: float):
+    return create_beam_detailing(
+        beam_id=beam_id,
+        story="S1",
+        b=300,
+        D=500,
+        span=span,
+        cover=40,
+        fck=25,
+        fy=500,
+        ast_start=900,
+        ast_mid=700,
+        ast_end=900,
+        asc_start=400,
+        asc_mid=400,
+        asc_end=400,
+    )
+
+
+def test_identical_details_share_one_block(tmp_path):
+    import ezdxf
+
+    beams = [_beam("B1", 5000), _beam("B2", 6000), _beam("B3", 5000), _beam("B4", 5000)]
+    blocks_path = tmp_path / "blocks.dxf"
+    flat_path = tmp_path / "flat.dxf"
+
+    dxf_export.generate_multi_beam_dxf(beams, str(blocks_path), use_blocks=True)
+    dxf_export.generate_multi_beam_dxf(beams, str(flat_path))
+
+    doc = ezdxf.readfile(blocks_path)
+    inserts = [e.dxf.name for e in doc.modelspace().query("INSERT")]
+    assert inserts == ["BEAM_TYPE_1", "BEAM_TYPE_2", "BEAM_TYPE_1", "BEAM_TYPE_1"]
+    assert len(doc.blocks.get("BEAM_TYPE_1").query("LINE")) > 0
+    # Annotations stay in modelspace, so bar marks still reconcile
+    assert dxf_export.extract_bar_marks_from_dxf(
+        blocks_path
+    ) == dxf_export.extract_bar_marks_from_dxf(flat_path)
+    assert blocks_path.stat().st_size < flat_path.stat().st_size
+
+
+def test_sheet_set_writes_sheets_index_and_bundle(tmp_path):
+    import ezdxf
+
+    beams = [_beam(f"B{i}", 4000 + 500 * (i % 2)) for i in range(1, 6)]
+
+    sheet_set = dxf_export.generate_multi_beam_dxf_sheets(
+        beams,
+        tmp_path / "out",
+        stem="level1",
+        beams_per_sheet=2,
+        max_workers=1,
+        include_title_block=True,
+    )
+
+    assert [p.name for p in sheet_set.sheets] == [
+        "level1_01.dxf",
+        "level1_02.dxf",
+        "level1_03.dxf",
+    ]
+    assert sheet_set.sheet_beams == (("B1", "B2"), ("B3", "B4"), ("B5",))
+    sheet = ezdxf.readfile(sheet_set.sheets[2])
+    texts = [t.dxf.text for t in sheet.modelspace().query("TEXT")]
+    assert "RC BEAM DETAIL SHEET - SHEET 3 OF 3" in texts
+    index_texts = [
+        t.dxf.text
+        for t in ezdxf.readfile(sheet_set.index_path).modelspace().query("TEXT")
+    ]
+    assert "B3 to B4" in index_texts
+    with zipfile.ZipFile(sheet_set.bundle_path) as archive:
+        assert sorted(archive.namelist()) == [
+            "level1_01.dxf",
+            "level1_02.dxf",
+            "level1_03.dxf",
+            "level1_index.dxf",
+        ]
+
+    with pytest.raises(ValueError, match="beams_per_sheet"):
+        dxf_export.generate_multi_beam_dxf_sheets(beams, tmp_path, beams_per_sheet=0)
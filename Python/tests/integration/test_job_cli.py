@@ -73,3 +73,25 @@ def test_job_cli_module_executes_main(monkeypatch, tmp_path):
     assert exc.value.code == 0
     assert called["job_path"] == "job.json"
     assert called["out_dir"] == str(tmp_path)
+
+
+def test_job_cli_run_dir_reports_failures(monkeypatch, tmp_path, capsys):
+    called = {}
+
+    def _fake_run_job_dir(**kwargs):
+        called.update(kwargs)
+        return {"ran": 3, "skipped": 2, "failed": 1, "manifest": "m.json"}
+
+    monkeypatch.setattr(job_cli.job_runner, "run_job_dir", _fake_run_job_dir)
+
+    rc = job_cli.main(
+        ["run-dir", "--jobs", "jobs", "--out", str(tmp_path), "--workers", "2"]
+    )
+    assert rc == 1
+    assert called == {
+        "jobs_dir": "jobs",
+        "out_dir": str(tmp_path),
+        "max_workers": 2,
+        "force": False,
+    }
+    assert "3 ran, 2 skipped, 1 failed" in capsys.readouterr().out
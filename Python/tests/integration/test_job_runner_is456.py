@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -180,3 +181,70 @@ def test_job_runner_rejects_cases_not_list(tmp_path: Path):
 
     with pytest.raises(ValueError, match="cases must be an array"):
         job_runner.run_job(job_path=job_path, out_dir=tmp_path / "out")
+
+
+_JOB = {
+    "schema_version": 1,
+    "code": "IS456",
+    "units": "IS456",
+    "beam": {
+        "b_mm": 300.0,
+        "D_mm": 500.0,
+        "d_mm": 450.0,
+        "fck_nmm2": 25.0,
+        "fy_nmm2": 500.0,
+    },
+    "cases": [{"case_id": "C1", "mu_knm": 80.0, "vu_kn": 60.0}],
+}
+
+
+def _kill_worker(job_path: str, out_dir: str) -> dict:
+    os._exit(1)
+
+
+def test_run_job_dir_skips_unchanged_jobs_and_survives_failures(tmp_path: Path):
+    jobs_dir = tmp_path / "jobs"
+    jobs_dir.mkdir()
+    for job_id in ("B1", "B2"):
+        _write_job(jobs_dir / f"{job_id}.json", {**_JOB, "job_id": job_id})
+    _write_job(jobs_dir / "bad.json", {**_JOB, "job_id": "bad", "code": "ACI"})
+    out_dir = tmp_path / "out"
+
+    first = job_runner.run_job_dir(jobs_dir=jobs_dir, out_dir=out_dir, max_workers=1)
+
+    assert (first["ran"], first["skipped"], first["failed"]) == (3, 0, 1)
+    assert first["jobs"]["bad.json"]["status"] == "failed"
+    assert "Unsupported code" in first["jobs"]["bad.json"]["error"]
+    assert first["jobs"]["B1.json"]["job_id"] == "B1"
+    assert (out_dir / "B2" / "design" / "design_results.json").exists()
+    manifest = json.loads((out_dir / job_runner.JOB_MANIFEST).read_text())
+    assert manifest["jobs"] == first["jobs"]
+
+    # Only the edited job and the failed one run again
+    _write_job(jobs_dir / "B2.json", {**_JOB, "job_id": "B2", "cases": []})
+    second = job_runner.run_job_dir(jobs_dir=jobs_dir, out_dir=out_dir, max_workers=1)
+    assert (second["ran"], second["skipped"]) == (2, 1)
+    assert second["jobs"]["B1.json"] == first["jobs"]["B1.json"]
+
+    forced = job_runner.run_job_dir(
+        jobs_dir=jobs_dir, out_dir=out_dir, max_workers=1, force=True
+    )
+    assert forced["ran"] == 3
+    with pytest.raises(FileNotFoundError, match="Jobs folder"):
+        job_runner.run_job_dir(jobs_dir=tmp_path / "missing", out_dir=out_dir)
+
+
+def test_run_job_dir_records_jobs_lost_with_a_dead_worker(tmp_path: Path, monkeypatch):
+    jobs_dir = tmp_path / "jobs"
+    jobs_dir.mkdir()
+    for job_id in ("B1", "B2"):
+        _write_job(jobs_dir / f"{job_id}.json", {**_JOB, "job_id": job_id})
+    monkeypatch.setattr(job_runner, "_run_job_file", _kill_worker)
+
+    result = job_runner.run_job_dir(
+        jobs_dir=jobs_dir, out_dir=tmp_path / "out", max_workers=2
+    )
+
+    assert (result["ran"], result["failed"]) == (2, 2)
+    for entry in result["jobs"].values():
+        assert entry["error"].startswith("BrokenProcessPool")
@@ -6,11 +6,14 @@ Tests the report data loading, export functions, and critical set export.
 from __future__ import annotations
 
 import json
+import sys
+import types
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from structural_lib.services import report_svg
+from structural_lib.services import report, report_svg
 from structural_lib.services.report import (
     export_critical_csv,
     export_critical_html,
@@ -25,6 +28,7 @@ from structural_lib.services.report import (
     load_report_data,
     render_design_report_single,
     write_design_report_package,
+    write_design_report_pdfs,
 )
 
 # Sample test data matching job output structure
@@ -479,6 +483,160 @@ class TestDesignResultsReport:
         assert (out_dir / "index.html") in written
         assert (out_dir / "beams").is_dir()
 
+    def test_write_design_report_package_is_incremental(
+        self, sample_design_results_path: Path, tmp_path: Path
+    ) -> None:
+        data = load_design_results(sample_design_results_path)
+        out_dir = tmp_path / "report"
+        write_design_report_package(
+            data, output_path=out_dir, batch_threshold=1, max_workers=1
+        )
+        b1 = out_dir / "beams" / "G_B1.html"
+        b2 = out_dir / "beams" / "G_B2.html"
+        assert '<link rel="stylesheet" href="../assets/report.css">' in b1.read_text(
+            encoding="utf-8"
+        )
+        assert (out_dir / "assets" / "report.css").exists()
+        b1.write_text("edited by hand", encoding="utf-8")
+        b2_written = b2.stat().st_mtime_ns
+
+        # A page that no longer matches is rewritten; an untouched one is skipped
+        write_design_report_package(
+            data, output_path=out_dir, batch_threshold=1, max_workers=1
+        )
+        assert "edited by hand" not in b1.read_text(encoding="utf-8")
+        assert b2.stat().st_mtime_ns == b2_written
+
+        # Changed beam data re-renders its page
+        data["beams"][1]["is_ok"] = False
+        write_design_report_package(
+            data, output_path=out_dir, batch_threshold=1, max_workers=1
+        )
+        assert "FAIL" in b2.read_text(encoding="utf-8")
+        manifest = json.loads((out_dir / "report-manifest.json").read_text())
+        assert set(manifest["pages"]) == {
+            "assets/report.css",
+            "index.html",
+            "beams/G_B1.html",
+            "beams/G_B2.html",
+        }
+
+        # A beam that leaves the batch loses its page
+        data["beams"] = data["beams"][:1]
+        written = write_design_report_package(
+            data, output_path=out_dir, batch_threshold=1, max_workers=1
+        )
+        assert written == [out_dir / "index.html", b1]
+        assert not b2.exists()
+
+    def test_write_design_report_package_single_file_streams_same_html(
+        self, sample_design_results_path: Path, tmp_path: Path
+    ) -> None:
+        data = load_design_results(sample_design_results_path)
+        out_file = tmp_path / "report.html"
+        write_design_report_package(data, output_path=out_file, batch_threshold=10)
+
+        assert out_file.read_text(encoding="utf-8") == render_design_report_single(data)
+
+
+class _FakeDocument:
+    def __init__(self, pages: list[str]) -> None:
+        self.pages = pages
+
+    def copy(self, pages: list[str]) -> _FakeDocument:
+        return _FakeDocument(list(pages))
+
+    def write_pdf(self) -> bytes:
+        return "\f".join(self.pages).encode("utf-8")
+
+
+@pytest.fixture
+def fake_weasyprint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[dict[str, list[str]]]:
+    """WeasyPrint stand-in: one page per report, parse calls recorded."""
+    calls: dict[str, list[str]] = {"css": [], "html": []}
+
+    class CSS:
+        def __init__(self, *, string: str, font_config: object) -> None:
+            calls["css"].append(string)
+
+    class HTML:
+        def __init__(self, *, string: str) -> None:
+            calls["html"].append(string)
+            self.string = string
+
+        def render(self, *, stylesheets: list[CSS], font_config: object):
+            assert len(stylesheets) == 2
+            return _FakeDocument(
+                [
+                    part.split("</strong> ", 1)[1].split("<", 1)[0]
+                    for part in self.string.split("<p><strong>Job ID:")[1:]
+                ]
+            )
+
+    fonts = types.ModuleType("weasyprint.text.fonts")
+    fonts.FontConfiguration = object
+    module = types.ModuleType("weasyprint")
+    module.CSS, module.HTML = CSS, HTML
+    monkeypatch.setitem(sys.modules, "weasyprint", module)
+    monkeypatch.setitem(sys.modules, "weasyprint.text", types.ModuleType("text"))
+    monkeypatch.setitem(sys.modules, "weasyprint.text.fonts", fonts)
+    report._get_pdf_renderer.cache_clear()
+    yield calls
+    report._get_pdf_renderer.cache_clear()
+
+
+class TestPdfExport:
+    """Tests for batched PDF export with a warmed renderer."""
+
+    def test_batch_reuses_parsed_stylesheets(
+        self, sample_design_results_path: Path, tmp_path: Path, fake_weasyprint
+    ) -> None:
+        data = load_design_results(sample_design_results_path)
+        data["beams"] = data["beams"] * 3
+        progress: list[tuple[int, int]] = []
+
+        written = write_design_report_pdfs(
+            data,
+            output_path=tmp_path / "pdfs",
+            max_workers=1,
+            chunk_size=4,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert [p.name for p in written][:3] == ["G_B1.pdf", "G_B2.pdf", "G_B1-2.pdf"]
+        assert [p.read_text() for p in written] == ["G/B1", "G/B2"] * 3
+        assert progress == [(4, 6), (6, 6)]
+        # Stylesheets parsed once for six documents, none inlined
+        assert len(fake_weasyprint["css"]) == 2
+        assert len(fake_weasyprint["html"]) == 6
+        assert all("<style>" not in page for page in fake_weasyprint["html"])
+
+    def test_combined_document_is_laid_out_in_chunks(
+        self, sample_design_results_path: Path, tmp_path: Path, fake_weasyprint
+    ) -> None:
+        data = load_design_results(sample_design_results_path)
+        data["beams"] = data["beams"] * 3
+        progress: list[tuple[int, int]] = []
+        out_file = tmp_path / "submission.pdf"
+
+        written = write_design_report_pdfs(
+            data,
+            output_path=out_file,
+            chunk_size=4,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert written == [out_file]
+        assert out_file.read_text().split("\f") == ["G/B1", "G/B2"] * 3
+        assert progress == [(4, 6), (6, 6)]
+        assert len(fake_weasyprint["html"]) == 2
+        with pytest.raises(ValueError, match="chunk_size"):
+            report.export_pdf_batch([], chunk_size=0)
+        with pytest.raises(ValueError, match="No reports"):
+            report.export_pdf_combined([])
+
 
 class TestReportSvg:
     """Tests for SVG rendering helpers."""
@@ -222,6 +222,59 @@ def test_benchmark_batch_design_10_beams(benchmark):
     assert result["is_ok"]
 
 
+# =============================================================================
+# Import Benchmarks
+# =============================================================================
+
+
+def _write_etabs_station_export(path, rows):
+    """Write a synthetic ETABS station-force export with ``rows`` data rows."""
+    lines = ["Story,Label,Output Case,Station,M3,V2,P"]
+    for i in range(rows):
+        beam, station = divmod(i, 5)
+        lines.append(
+            f"Story{beam % 20},B{beam // 20},1.5(DL+LL),{station * 0.25},"
+            f"{(i * 37) % 400 - 200}.5,{(i * 11) % 150 - 75}.25,{i % 7}"
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.performance
+def test_benchmark_columnar_forces_import(benchmark, tmp_path):
+    """Benchmark the columnar ETABS forces import on 50k station rows."""
+    pytest.importorskip("numpy")
+    from structural_lib.services.adapters import ETABSAdapter
+
+    path = _write_etabs_station_export(tmp_path / "forces.csv", 50_000)
+    forces = benchmark(ETABSAdapter().load_forces_columnar, path)
+    assert len(forces) == 10_000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_columnar_forces_import_1m_rows_speedup(tmp_path):
+    """The columnar path beats the row path on a 1M-row export."""
+    pytest.importorskip("numpy")
+    import time
+
+    from structural_lib.services.adapters import ETABSAdapter
+
+    path = _write_etabs_station_export(tmp_path / "forces.csv", 1_000_000)
+    adapter = ETABSAdapter()
+
+    start = time.perf_counter()
+    columnar = adapter.load_forces_columnar(path)
+    columnar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows = adapter.load_forces(path)
+    row_s = time.perf_counter() - start
+
+    assert columnar == rows
+    assert columnar_s < row_s
+
+
 # =============================================================================
 # Integration Benchmarks (Full Workflow)
 # =============================================================================
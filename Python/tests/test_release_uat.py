@@ -17,7 +17,7 @@ def test_release_negative_matrix_and_public_examples_pass() -> None:
     assert receipt["professional_approval"] is False
     inventory = receipt["advertised_entry_points"]
     assert inventory["schema_version"] == "advertised-entry-point-inventory/v1"
-    assert inventory["entry_count"] == 14
+    assert inventory["entry_count"] == 15
     gravity = next(
         entry for entry in inventory["entries"] if entry["id"] == "cli.gravity-v1"
     )
@@ -51,4 +51,5 @@ def test_release_negative_matrix_and_public_examples_pass() -> None:
         "job",
         "report",
         "critical",
+        "serve",
     }
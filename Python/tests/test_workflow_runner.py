@@ -200,3 +200,40 @@ def test_invalid_run_identity_and_oversized_input_fail_closed() -> None:
             inputs={**SAFE_INPUTS, "payload": "x" * 40_000},
             run_id="oversized",
         )
+
+
+class _SharedReplays:
+    def __init__(self) -> None:
+        self.runs: dict[str, tuple[str, dict]] = {}
+
+    def get(self, run_id: str):
+        return self.runs.get(run_id)
+
+    def put(self, run_id: str, fingerprint: str, result: dict):
+        existing = self.runs.get(run_id)
+        if existing is None:
+            self.runs[run_id] = (fingerprint, deepcopy(result))
+        return existing
+
+
+def test_runners_sharing_a_replay_store_replay_each_other() -> None:
+    store = _SharedReplays()
+    definition = get_beam_workflow_template_document()
+    first = WorkflowRunner(replay_store=store).run(
+        definition=definition, inputs=SAFE_INPUTS, run_id="shared"
+    )
+    replay = WorkflowRunner(replay_store=store).run(
+        definition=definition, inputs=SAFE_INPUTS, run_id="shared"
+    )
+
+    assert first["idempotent_replay"] is False
+    assert replay["idempotent_replay"] is True
+    assert store.runs["shared"][1]["idempotent_replay"] is False
+
+    # A run that finishes after another process stored the same run ID
+    # returns the stored result rather than its own.
+    store.get = lambda run_id: None
+    late = WorkflowRunner(replay_store=store).run(
+        definition=definition, inputs=SAFE_INPUTS, run_id="shared"
+    )
+    assert late["idempotent_replay"] is True
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import pickle
 from copy import deepcopy
 from typing import Any
 
@@ -15,6 +16,8 @@ from structural_lib.services.batch import (
     design_beams_iter,
     design_project_beams_iter_v1,
     design_project_beams_v1,
+    prepare_project_beam_member_v1,
+    prepare_project_beam_members_v1,
 )
 from structural_lib.services.project_beam import (
     PROJECT_BEAM_SCHEMA_VERSION,
@@ -433,6 +436,46 @@ def test_strict_iterator_validates_batch_but_calculates_members_lazily(
     assert calls == ["B1"]
 
 
+def test_prepared_members_run_independently_and_out_of_order() -> None:
+    beams = [
+        _canonical_beam(member_id="B1"),
+        _canonical_beam(member_id="B1", mu_knm=150.0),
+        _canonical_beam(member_id="B3"),
+    ]
+
+    deferred = pickle.loads(pickle.dumps(prepare_project_beam_members_v1(beams)))
+    members = [deferred[index]() for index in (2, 0, 1)]
+    expected = list(design_project_beams_iter_v1(beams))
+
+    assert [member.index for member in members] == [2, 0, 1]
+    for member in members:
+        reference = expected[member.index]
+        assert member.member_id == reference.member_id
+        assert member.overall_status is reference.overall_status
+        assert member.issues == reference.issues
+
+
+def test_streamed_members_block_only_later_duplicates() -> None:
+    seen: set[str] = set()
+    payloads = [
+        _canonical_beam(member_id="B1"),
+        None,
+        _canonical_beam(member_id="B1", mu_knm=150.0),
+    ]
+
+    members = [
+        prepare_project_beam_member_v1(payload, index, seen_member_ids=seen)()
+        for index, payload in enumerate(payloads)
+    ]
+
+    assert seen == {"B1"}
+    assert [member.index for member in members] == [0, 1, 2]
+    assert members[0].calculation_status is ProjectBeamCalculationStatus.COMPLETED
+    assert members[1].issues[0].code == "PROJECT_BEAM_INVALID_OBJECT"
+    assert members[2].overall_status is ProjectBeamOverallStatus.BLOCKED
+    assert members[2].issues[-1].code == "PROJECT_BEAM_DUPLICATE_MEMBER_ID"
+
+
 def test_legacy_iterator_does_not_precalculate_entire_batch(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the columnar project bar bending schedule."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from structural_lib.codes.is456.beam.detailing import (  # noqa: E402
+    create_beam_detailing,
+)
+from structural_lib.services import bbs  # noqa: E402
+from structural_lib.services.bbs_columnar import ProjectBBS  # noqa: E402
+
+
+def _project(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    detailings = []
+    for n in range(count):
+        ast = rng.choice([500, 900, 1400, 2200])
+        detailings.append(
+            create_beam_detailing(
+                f"B{n}",
+                rng.choice(["GF", "L1", "L2"]),
+                rng.choice([230, 300, 400]),
+                rng.choice([450, 600, 750]),
+                rng.choice([3000, 4500, 6250]),
+                rng.choice([25, 40]),
+                25,
+                500,
+                ast,
+                ast * 0.7,
+                ast,
+                400,
+                300,
+                400,
+            )
+        )
+    return detailings
+
+
+def test_schedule_matches_per_beam_generation(tmp_path) -> None:
+    detailings = _project(40)
+    # A beam without a mid stirrup zone drops that row, as per beam
+    detailings[3] = replace(detailings[3], stirrups=detailings[3].stirrups[::2])
+    document = bbs.generate_bbs_document(detailings, "P")
+
+    schedule = ProjectBBS.from_detailings(iter(detailings))
+
+    assert len(schedule) == len(document.items)
+    assert list(schedule.iter_items()) == document.items
+    assert schedule.summary() == document.summary
+    assert schedule.to_document("P") == document
+
+    expected_csv = tmp_path / "expected.csv"
+    bbs.export_bbs_to_csv(document.items, str(expected_csv))
+    schedule.write_bbs_csv(tmp_path / "bbs.csv")
+    assert (tmp_path / "bbs.csv").read_bytes() == expected_csv.read_bytes()
+
+    bbs.export_bom_summary_csv(document.summary, str(tmp_path / "expected_bom.csv"))
+    schedule.write_bom_summary_csv(tmp_path / "bom.csv")
+    assert (tmp_path / "bom.csv").read_bytes() == (
+        tmp_path / "expected_bom.csv"
+    ).read_bytes()
+
+
+def test_group_totals_match_summaries_of_each_group() -> None:
+    detailings = _project(30)
+    items_by_member = [bbs.generate_bbs_from_detailing(d) for d in detailings]
+    schedule = ProjectBBS.from_detailings(detailings)
+
+    by_story = schedule.summaries_by("story")
+    assert list(by_story) == ["GF", "L1", "L2"]
+    for story, summary in by_story.items():
+        items = [
+            item
+            for detailing, items in zip(detailings, items_by_member, strict=True)
+            if detailing.story == story
+            for item in items
+        ]
+        assert summary == bbs.calculate_bbs_summary(items, story)
+
+    all_items = [item for items in items_by_member for item in items]
+    by_location = schedule.summaries_by("location")
+    assert list(by_location) == ["bottom", "top", "stirrup"]
+    assert by_location["stirrup"] == bbs.calculate_bbs_summary(
+        [item for item in all_items if item.location == "stirrup"], "stirrup"
+    )
+    by_diameter = schedule.summaries_by("diameter")
+    assert sum(s.total_items for s in by_diameter.values()) == len(all_items)
+    assert schedule.summaries_by("member_id")["B7"] == bbs.calculate_bbs_summary(
+        items_by_member[7], "B7"
+    )
+    with pytest.raises(ValueError, match="Unknown group key"):
+        schedule.summaries_by("shape")  # type: ignore[arg-type]
+
+
+def test_marks_stay_unique_when_member_ids_repeat() -> None:
+    detailings = _project(2)
+    detailings[1] = replace(detailings[1], beam_id="b 0")  # normalizes to B-0
+    detailings[0] = replace(detailings[0], beam_id="B-0")
+
+    schedule = ProjectBBS.from_detailings(detailings)
+    marks = schedule.bar_marks()
+
+    # One global sort numbers both beams' items in one sequence
+    items = bbs.assign_bar_marks(
+        [item for d in detailings for item in bbs.generate_bbs_from_detailing(d)]
+    )
+    assert marks == [item.bar_mark for item in items]
+    assert len(set(marks)) == len(marks)
+    assert len(ProjectBBS.from_detailings([])) == 0
+    assert ProjectBBS.from_detailings([]).summary().total_items == 0
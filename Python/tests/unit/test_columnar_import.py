@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the columnar CSV fast path.
+
+Tests cover:
+- Equivalence with the row adapters for ETABS, SAFE, STAAD and generic exports
+- Identical errors for malformed and non-finite cells
+- Vectorized cell masks and ledger issue codes
+- Lossless import with ``columnar=True``
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from structural_lib.services.adapters import (  # noqa: E402
+    ETABSAdapter,
+    GenericCSVAdapter,
+    ManualInputAdapter,
+    SAFEAdapter,
+    STAADAdapter,
+)
+from structural_lib.services.columnar_import import (  # noqa: E402
+    load_forces_columnar,
+    read_columnar_csv,
+)
+from structural_lib.services.imports import parse_single_csv_lossless  # noqa: E402
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples"
+
+
+def _write_rows(path: Path, headers: list[str], rows: list[list[str]]) -> Path:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return path
+
+
+# =============================================================================
+# Equivalence with the row adapters
+# =============================================================================
+
+
+class TestEquivalence:
+    """Columnar output matches the row-by-row adapters exactly."""
+
+    def test_etabs_station_forces(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "forces.csv",
+            ["Story", "Label", "Output Case", "Station", "M3", "V2", "P"],
+            [
+                ["Ground", "B1", "1.5DL", "0", "50", "80", "10"],
+                ["Ground", "B1", "1.5DL", "0.5", "100", "20", "10"],
+                ["Ground", "B1", "1.5DL", "1", "-60", "-90", "10"],
+                ["Ground", "B2", "1.5DL", "0", "150", "100", "5"],
+                ["Ground", "B2", "DL", "0", "80", "50", "2"],
+                ["First", "B1", "1.5DL", "0", "-75", "40", "1"],
+            ],
+        )
+        adapter = ETABSAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+    def test_etabs_envelope_forces(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "envelope.csv",
+            ["Story", "Label", "Mu_max_kNm", "Mu_min_kNm", "Vu_max_kN"],
+            [
+                ["Ground", "B1", "120", "-80", "95"],
+                ["Ground", "B2", "60", "-140", "70"],
+            ],
+        )
+        adapter = ETABSAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+    @pytest.mark.parametrize(
+        "name",
+        ["ETABS_BeamForces_Example.csv", "sample_etabs_export.csv"],
+    )
+    def test_bundled_etabs_examples(self, name: str):
+        path = EXAMPLES_DIR / name
+        if not path.exists():
+            pytest.skip(f"example {name} not present")
+        adapter = ETABSAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+    def test_safe_skips_unusable_rows(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "safe.csv",
+            ["Story", "Strip", "LoadCombo", "Position", "M22", "V23", "P"],
+            [
+                ["GF", "S1", "C1", "0", "45", "30", ""],
+                ["GF", "S1", "C1", "1", "-90", "x", "0"],
+                ["GF", "S2", "C1", "0", "12", " ", "0"],
+                ["GF", "S2", "C2", "0", "70", "25", "3"],
+            ],
+        )
+        adapter = SAFEAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+    def test_staad_default_case_and_blank_member(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "staad.csv",
+            ["Member", "LC", "Dist", "My", "Fy", "Fx"],
+            [
+                ["1", "", "0", "40", "20", "1"],
+                ["1", "", "2.5", "-85", "-35", "1"],
+                ["", "2", "0", "10", "10", "0"],
+                ["2", "2", "0", "55", "18", "0"],
+            ],
+        )
+        adapter = STAADAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+    def test_generic_blank_cells_are_zero(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "generic.csv",
+            ["BeamID", "Story", "Mu (kN-m)", "Vu (kN)", "Load Case"],
+            [
+                ["B1", "GF", "150", "80", "1.5(DL+LL)"],
+                ["B2", "GF", "", "60", ""],
+            ],
+        )
+        adapter = GenericCSVAdapter()
+        assert adapter.load_forces_columnar(path) == adapter.load_forces(path)
+
+
+# =============================================================================
+# Error parity
+# =============================================================================
+
+
+class TestErrors:
+    """Strict adapters raise the same errors on the columnar path."""
+
+    @pytest.mark.parametrize("bad", ["abc", "nan", "inf"])
+    def test_etabs_bad_moment(self, tmp_path: Path, bad: str):
+        path = _write_rows(
+            tmp_path / "forces.csv",
+            ["Story", "Label", "Output Case", "Station", "M3", "V2", "P"],
+            [
+                ["Ground", "B1", "DL", "0", "50", "80", "0"],
+                ["Ground", "B1", "DL", "1", bad, "80", "0"],
+            ],
+        )
+        adapter = ETABSAdapter()
+        with pytest.raises(ValueError) as row_error:
+            adapter.load_forces(path)
+        with pytest.raises(ValueError) as columnar_error:
+            adapter.load_forces_columnar(path)
+        assert str(columnar_error.value) == str(row_error.value)
+
+    def test_generic_malformed_cell(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "generic.csv",
+            ["BeamID", "Mu (kN-m)", "Vu (kN)"],
+            [["B1", "150", "80"], ["B2", "1,5", "60"]],
+        )
+        adapter = GenericCSVAdapter()
+        with pytest.raises(ValueError) as row_error:
+            adapter.load_forces(path)
+        with pytest.raises(ValueError) as columnar_error:
+            adapter.load_forces_columnar(path)
+        assert str(columnar_error.value) == str(row_error.value)
+
+    def test_missing_file(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            ETABSAdapter().load_forces_columnar(tmp_path / "missing.csv")
+
+    def test_unsupported_adapter_uses_row_path(self, tmp_path: Path, monkeypatch):
+        path = _write_rows(tmp_path / "f.csv", ["BeamID"], [["B1"]])
+        with pytest.raises(NotImplementedError, match="from_dict"):
+            load_forces_columnar(ManualInputAdapter(), path)
+
+        monkeypatch.setattr(
+            ManualInputAdapter, "load_forces", lambda self, source: ["row path"]
+        )
+        assert load_forces_columnar(ManualInputAdapter(), path) == ["row path"]
+
+
+# =============================================================================
+# Frame masks
+# =============================================================================
+
+
+class TestColumnarFrame:
+    """Typed arrays, categorical encoding and cell masks."""
+
+    def test_masks_and_categories(self, tmp_path: Path):
+        path = _write_rows(
+            tmp_path / "frame.csv",
+            ["Label", "M3", "V2"],
+            [
+                ["B2", "10", ""],
+                ["B1", "abc", "5"],
+                ["B2", "inf", " "],
+            ],
+        )
+        frame = read_columnar_csv(
+            path,
+            column_map={"label": "Label", "mu": "M3", "vu": "V2"},
+            numeric_fields=["mu", "vu"],
+            categorical_fields=["label"],
+        )
+
+        assert frame.row_count == 3
+        label = frame.categorical["label"]
+        assert label.categories == ("B2", "B1")
+        assert label.codes.tolist() == [0, 1, 0]
+
+        mu = frame.numeric["mu"]
+        assert mu.malformed.tolist() == [False, True, False]
+        assert mu.non_finite.tolist() == [False, False, True]
+        assert mu.bad_text[1] == "abc"
+        vu = frame.numeric["vu"]
+        assert vu.missing.tolist() == [True, False, True]
+        assert vu.padded.tolist() == [False, False, True]
+        assert vu.filled(0.0).tolist() == [0.0, 5.0, 0.0]
+
+
+# =============================================================================
+# Lossless import
+# =============================================================================
+
+
+def test_lossless_import_columnar_matches_row_path(tmp_path: Path):
+    path = _write_rows(
+        tmp_path / "combined.csv",
+        ["BeamID", "Story", "b (mm)", "D (mm)", "Span (mm)", "Mu (kN-m)", "Vu (kN)"],
+        [
+            ["B1", "GF", "300", "500", "5000", "150", "80"],
+            ["B2", "GF", "300", "450", "4500", "120", "60"],
+        ],
+    )
+
+    row_result = parse_single_csv_lossless(path, format_hint="generic")
+    columnar_result = parse_single_csv_lossless(
+        path, format_hint="generic", columnar=True
+    )
+
+    assert columnar_result.model_dump() == row_result.model_dump()
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the compact, lazily materialized import row ledger."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from structural_lib.services.compact_ledger import CompactRowLedger, LedgerColumn
+from structural_lib.services.import_ledger import (
+    ImportFieldAction,
+    ImportIssueCode,
+    ImportStatus,
+)
+from structural_lib.services.imports import (
+    build_import_design_defaults,
+    parse_dual_csv_compact,
+    parse_single_csv_compact,
+    parse_single_csv_lossless,
+)
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+FRAMES_GEOMETRY_CSV = WORKSPACE_ROOT / "Etabs_CSV" / "frames_geometry.csv"
+BEAM_FORCES_CSV = WORKSPACE_ROOT / "Etabs_CSV" / "beam_forces.csv"
+
+COMBINED = """
+BeamID,Story,b (mm),D (mm),Span (mm),Mu (kN-m),Vu (kN),fck,fy,Cover (mm),Ast_req
+B1,GF,300,500,5000,150,80,25,500,40,
+B2,GF,250,450,4000,abc,60,25,500,40,
+B2,GF,250,450,4000,inf,60,25,500,40,
+B4,GF,250,450,4000,90,,25,500,40,1,extra
+"""
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text.strip() + "\n", encoding="utf-8")
+    return path
+
+
+def _canonical(value: object) -> str:
+    return json.dumps(value, sort_keys=True, allow_nan=False, separators=(",", ":"))
+
+
+def test_materialized_rows_match_lossless_result(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+
+    compact = parse_single_csv_compact(combined, format_hint="generic")
+    lossless = parse_single_csv_lossless(combined, format_hint="generic")
+
+    assert compact.to_result().model_dump() == lossless.model_dump()
+    assert len(compact.rows) == lossless.ledger.totals.source_rows
+    assert compact.rows.row(1) == lossless.ledger.rows[1]
+
+
+def test_streamed_ledger_json_is_canonical(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+
+    compact = parse_single_csv_compact(combined, format_hint="generic")
+
+    streamed = "".join(compact.iter_ledger_json())
+    assert streamed == _canonical(compact.ledger().model_dump(mode="json"))
+    assert "rows" not in compact.ledger_summary()
+
+
+@pytest.mark.skipif(not FRAMES_GEOMETRY_CSV.exists(), reason="sample data missing")
+def test_dual_import_pages_in_ledger_order() -> None:
+    compact = parse_dual_csv_compact(
+        FRAMES_GEOMETRY_CSV,
+        BEAM_FORCES_CSV,
+        format_hint="etabs",
+        defaults=build_import_design_defaults(
+            fck_mpa=25, fy_mpa=500, cover_mm=40, stirrup_dia_mm=8
+        ),
+    )
+    rows = compact.ledger().rows
+
+    assert compact.rows.page(5, 10) == list(rows[5:15])
+    assert compact.rows.page(len(rows), 10) == []
+    assert {row.artifact_role for row in compact.rows.page(len(rows) - 1, 1)} == {
+        "forces"
+    }
+
+
+def test_status_filter_materializes_only_blocked_rows(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+
+    rows = parse_single_csv_compact(combined, format_hint="generic").rows
+    blocked = rows.page(0, 10, status=ImportStatus.BLOCKED)
+
+    assert [row.source_row_number for row in blocked] == [3, 4, 5]
+    assert blocked[0].issue_codes == (
+        ImportIssueCode.DUPLICATE_RECORD_ID,
+        ImportIssueCode.MALFORMED_NUMBER,
+    )
+    mu = next(field for field in blocked[0].fields if field.canonical_field == "mu_knm")
+    assert (mu.action, mu.parsed_value) == (ImportFieldAction.REJECTED, None)
+    assert rows.accepted_count == 1
+    with pytest.raises(IndexError):
+        rows.row(len(rows))
+
+
+def test_round_trip_and_inconsistent_payload(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+    rows = parse_single_csv_compact(combined, format_hint="generic").rows
+
+    restored = CompactRowLedger.from_dict(json.loads(json.dumps(rows.to_dict())))
+
+    assert restored.to_rows() == rows.to_rows()
+    payload = rows.to_dict()
+    payload["record_ids"] = payload["record_ids"][:-1]
+    with pytest.raises(ValueError, match="inconsistent"):
+        CompactRowLedger.from_dict(payload)
+
+
+def test_append_requires_artifact_and_add_issue_code_blocks() -> None:
+    ledger = CompactRowLedger()
+    with pytest.raises(ValueError, match="begin_artifact"):
+        ledger.append(
+            source_row_number=2,
+            source_record_id="B1",
+            cells=["B1"],
+            status=ImportStatus.ACCEPTED,
+        )
+
+    ledger.begin_artifact(
+        role="geometry",
+        columns=[
+            LedgerColumn(
+                "BeamID", "beam_id", None, ImportFieldAction.NORMALIZED, "text"
+            )
+        ],
+    )
+    index = ledger.append(
+        source_row_number=2,
+        source_record_id="B1",
+        cells=["B1"],
+        status=ImportStatus.ACCEPTED,
+    )
+    ledger.add_issue_code(index, ImportIssueCode.DUPLICATE_RECORD_ID)
+
+    row = ledger.row(index)
+    assert row.status is ImportStatus.BLOCKED
+    assert row.issue_codes == (ImportIssueCode.DUPLICATE_RECORD_ID,)
+    assert row.fields[0].parsed_value == "B1"
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the range-based Excel UDFs."""
+
+from __future__ import annotations
+
+from structural_lib.services import excel_bridge as xb
+
+
+def test_array_udfs_match_scalar_udfs_row_by_row() -> None:
+    b = [[230], [300], [300], [400]]
+    d = [[400], [450], [450], [650]]
+    mu = [[60], [120], [400], [250]]
+
+    assert xb.IS456_AstRequired_Array(b, d, mu, 25, 500) == [
+        [xb.IS456_AstRequired(bi[0], di[0], mi[0], 25, 500)]
+        for bi, di, mi in zip(b, d, mu, strict=True)
+    ]
+    assert xb.IS456_AstRequired_Array(b, d, mu, 25, 500)[2] == ["Over-Reinforced"]
+    # A row range (one row, many columns) works like a column range
+    assert xb.IS456_MuLim_Array([[230, 300]], [[400, 450]], [[25]], 500) == [
+        [xb.IS456_MuLim(230, 400, 25, 500)],
+        [xb.IS456_MuLim(300, 450, 25, 500)],
+    ]
+    assert xb.IS456_ShearSpacing_Array([[120], [80]], 300, 450, 25, 500, 8, 0.5) == [
+        [xb.IS456_ShearSpacing(120, 300, 450, 25, 500, 8, 0.5)],
+        [xb.IS456_ShearSpacing(80, 300, 450, 25, 500, 8, 0.5)],
+    ]
+    assert xb.IS456_Ld_Array([[16], [20]], 25, 500) == [
+        [xb.IS456_Ld(16, 25, 500)],
+        [xb.IS456_Ld(20, 25, 500)],
+    ]
+    assert xb.IS456_BarCallout_Array([[5], [3]], 16) == [
+        [xb.IS456_BarCallout(5, 16)],
+        [xb.IS456_BarCallout(3, 16)],
+    ]
+    assert xb.IS456_StirrupCallout_Array(2, 8, [[150], [200]]) == [
+        [xb.IS456_StirrupCallout(2, 8, 150)],
+        [xb.IS456_StirrupCallout(2, 8, 200)],
+    ]
+
+
+def test_array_udfs_report_errors_per_cell() -> None:
+    result = xb.IS456_MuLim_Array([[300], [None], [0], [""], ["wide"]], 450, 25, 500)
+
+    assert result[0] == [xb.IS456_MuLim(300, 450, 25, 500)]
+    assert result[1] == [""] and result[3] == [""]
+    assert result[2][0].startswith("Error: ") and "Cl. 38.1" in result[2][0]
+    assert result[4][0].startswith("Error: ")
+    assert xb.IS456_Ld_Array([[16], [20]], [[25], [30], [35]], 500) == [
+        ["Error: Input ranges must have the same number of cells"]
+    ]
@@ -14,6 +14,7 @@ from structural_lib.core.excel_workbook import (
     ExcelWorkbookRunRequestV1,
     ExcelWorkbookSelectionV1,
 )
+from structural_lib.services import excel_workbench
 from structural_lib.services.beam_api import design_beam_is456
 from structural_lib.services.excel_workbench import (
     ExcelReviewBundleConflictError,
@@ -329,6 +330,52 @@ def test_run_and_review_bundle_are_deterministic() -> None:
     assert first.bundle_hash in render_excel_review_bundle_markdown_v1(first)
 
 
+def test_rerun_designs_only_edited_rows_and_repeats_once(monkeypatch) -> None:
+    designed: list[float] = []
+
+    def _counting_design(**kwargs):
+        designed.append(kwargs["mu_knm"])
+        return design_beam_is456(**kwargs)
+
+    monkeypatch.setattr(excel_workbench, "design_beam_is456", _counting_design)
+    rows = (
+        _derived_row(),
+        _explicit_row(),
+        _derived_row(row_id="R3", beam_id="B3"),  # same inputs as R1
+    )
+    first = run_excel_workbook_v1(_run_request(rows))
+    assert len(designed) == 2
+    assert first.row_ledger[2].result == first.row_ledger[0].result
+    assert first.row_ledger[2].passport.row_id == "R3"
+
+    edited = list(_explicit_row())
+    edited[3] = 151.0
+    blank = tuple(None for _ in HEADERS)
+    rows = (blank, rows[0], tuple(edited), rows[2])
+    designed.clear()
+    rerun = run_excel_workbook_v1(_run_request(rows), previous=first)
+
+    assert designed == [151.0]
+    assert rerun == run_excel_workbook_v1(_run_request(rows))
+    assert rerun.row_ledger[1].source_row_number == 3
+
+    # Evidence from another selection is never reused
+    other = first.model_copy(update={"workbook_selection_hash": "0" * 64})
+    designed.clear()
+    run_excel_workbook_v1(_run_request(rows), previous=other)
+    assert len(designed) == 2
+
+
+def test_parallel_row_design_matches_in_process_run(monkeypatch) -> None:
+    rows = tuple(
+        _derived_row(row_id=f"R{n}", beam_id=f"B{n}", vu_kn=80.0 + n) for n in range(6)
+    ) + (_explicit_row(),)
+    serial = run_excel_workbook_v1(_run_request(rows), max_workers=1)
+    monkeypatch.setattr(excel_workbench, "_MIN_ROWS_PER_WORKER", 1)
+
+    assert run_excel_workbook_v1(_run_request(rows), max_workers=2) == serial
+
+
 def test_complete_review_bundle_and_file_bytes_are_deterministic() -> None:
     request = _export_request((_derived_row(), _explicit_row()))
 
@@ -445,3 +492,24 @@ def test_cli_requires_preview_hash_and_matches_python_result(tmp_path) -> None:
     cli_result = json.loads(result_path.read_text(encoding="utf-8"))
     python_result = run_excel_workbook_v1(_run_request(preview_request.rows))
     assert cli_result == python_result.model_dump(mode="json")
+
+    rerun_path = tmp_path / "rerun.json"
+    assert (
+        main(
+            [
+                "excel-v1",
+                "run",
+                str(input_path),
+                "--mapping-hash",
+                preview["mapping_hash"],
+                "--previous",
+                str(result_path),
+                "--workers",
+                "1",
+                "-o",
+                str(rerun_path),
+            ]
+        )
+        == 0
+    )
+    assert json.loads(rerun_path.read_text(encoding="utf-8")) == cli_result
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Import-time budget for the package root and the CLI entry point.
+
+Each check runs in a fresh interpreter with ``python -X importtime`` so
+modules already imported by the test session do not hide regressions.
+Budgets are generous multiples of the measured cost; what they catch is an
+eager import of the design stack (or numpy/ezdxf/jinja2) creeping back in.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import structural_lib
+
+# Cumulative microseconds, as reported by -X importtime.
+ROOT_BUDGET_US = 500_000
+CLI_BUDGET_US = 750_000
+
+HEAVY_MODULES = (
+    "numpy",
+    "ezdxf",
+    "jinja2",
+    "weasyprint",
+    "pydantic",
+    "structural_lib.services.api",
+)
+
+
+def _import_profile(module: str) -> tuple[int, list[str]]:
+    """Import ``module`` in a fresh interpreter.
+
+    Returns its cumulative import time in microseconds and the heavy
+    modules it executed. The import log is used rather than ``sys.modules``
+    because the CLI registers lazy modules there before they are loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    cumulative = None
+    loaded = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if name == module:
+            cumulative = int(cumulative_us)
+        elif name in HEAVY_MODULES:
+            loaded.append(name)
+    assert cumulative is not None, result.stderr[-2000:]
+    return cumulative, loaded
+
+
+@pytest.mark.parametrize(
+    ("module", "budget_us"),
+    [
+        ("structural_lib", ROOT_BUDGET_US),
+        ("structural_lib.__main__", CLI_BUDGET_US),
+    ],
+)
+def test_import_stays_within_budget_without_heavy_stacks(module, budget_us):
+    cumulative_us, loaded = _import_profile(module)
+
+    assert loaded == []
+    assert cumulative_us < budget_us, (
+        f"import {module} took {cumulative_us / 1000:.0f} ms "
+        f"(budget {budget_us / 1000:.0f} ms)"
+    )
+
+
+def test_lazy_exports_resolve():
+    for name in structural_lib.__all__:
+        assert getattr(structural_lib, name) is not None or name in {
+            "dxf_export",
+            "reports",
+        }
+    assert set(structural_lib.__all__) <= set(dir(structural_lib))
+
+    with pytest.raises(AttributeError):
+        structural_lib.no_such_export  # noqa: B018
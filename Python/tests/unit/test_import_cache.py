@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the parsed-import cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from structural_lib.services.import_cache import (
+    ImportResultCache,
+    import_cache_key,
+)
+from structural_lib.services.imports import (
+    build_import_design_defaults,
+    parse_dual_csv_lossless,
+    parse_single_csv_lossless,
+)
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+FRAMES_GEOMETRY_CSV = WORKSPACE_ROOT / "Etabs_CSV" / "frames_geometry.csv"
+BEAM_FORCES_CSV = WORKSPACE_ROOT / "Etabs_CSV" / "beam_forces.csv"
+
+COMBINED = """
+BeamID,Story,b (mm),D (mm),Span (mm),Mu (kN-m),Vu (kN),fck,fy,Cover (mm)
+B1,GF,300,500,5000,150,80,25,500,40
+B2,1F,250,450,4000,100,60,25,500,40
+"""
+
+
+def _defaults(cover_mm: float = 40):
+    return build_import_design_defaults(
+        fck_mpa=25, fy_mpa=500, cover_mm=cover_mm, stirrup_dia_mm=8
+    )
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text.strip() + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.skipif(not FRAMES_GEOMETRY_CSV.exists(), reason="sample data missing")
+def test_reupload_reapplies_only_defaults() -> None:
+    cache = ImportResultCache()
+    parse_dual_csv_lossless(
+        FRAMES_GEOMETRY_CSV,
+        BEAM_FORCES_CSV,
+        format_hint="etabs",
+        defaults=_defaults(40),
+        cache=cache,
+    )
+    cached = parse_dual_csv_lossless(
+        FRAMES_GEOMETRY_CSV,
+        BEAM_FORCES_CSV,
+        format_hint="etabs",
+        defaults=_defaults(30),
+        cache=cache,
+    )
+    uncached = parse_dual_csv_lossless(
+        FRAMES_GEOMETRY_CSV,
+        BEAM_FORCES_CSV,
+        format_hint="etabs",
+        defaults=_defaults(30),
+    )
+
+    assert cached.model_dump() == uncached.model_dump()
+    assert {beam.section.cover_mm for beam in cached.batch.beams} == {30}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+
+def test_hit_records_current_artifact_name(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+    cache = ImportResultCache()
+
+    parse_single_csv_lossless(combined, format_hint="generic", cache=cache)
+    renamed = parse_single_csv_lossless(
+        combined, format_hint="generic", artifact_name="upload.csv", cache=cache
+    )
+
+    assert renamed.ledger.geometry_artifact.name == "upload.csv"
+    assert cache.stats().hits == 1
+
+
+def test_blocked_import_is_cached_unchanged(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED.replace("150", "abc"))
+    cache = ImportResultCache()
+
+    first = parse_single_csv_lossless(combined, format_hint="generic", cache=cache)
+    second = parse_single_csv_lossless(combined, format_hint="generic", cache=cache)
+
+    assert second.model_dump() == first.model_dump()
+    assert second.batch is None
+
+
+def test_lru_eviction_and_key_components(tmp_path: Path) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+    cache = ImportResultCache(max_entries=1)
+
+    parse_single_csv_lossless(combined, format_hint="generic", cache=cache)
+    parse_single_csv_lossless(combined, format_hint="auto", cache=cache)
+
+    stats = cache.stats()
+    assert (stats.misses, stats.evictions, stats.entries) == (2, 1, 1)
+    key = {
+        "kind": "single",
+        "artifact_hashes": ["a" * 64],
+        "artifact_suffixes": [".csv"],
+        "format_hint": "generic",
+        "columnar": False,
+    }
+    assert import_cache_key(**key) == import_cache_key(
+        **{**key, "format_hint": " GENERIC "}
+    )
+    assert import_cache_key(**key) != import_cache_key(**{**key, "columnar": True})
+
+
+def test_disk_tier_survives_restart_and_rejects_corrupt_entries(
+    tmp_path: Path,
+) -> None:
+    combined = _write(tmp_path / "beams.csv", COMBINED)
+    directory = tmp_path / "cache"
+
+    first = parse_single_csv_lossless(
+        combined, format_hint="generic", cache=ImportResultCache(directory=directory)
+    )
+    restarted = ImportResultCache(directory=directory)
+    second = parse_single_csv_lossless(combined, format_hint="generic", cache=restarted)
+
+    assert second.model_dump() == first.model_dump()
+    assert restarted.stats().disk_hits == 1
+
+    (entry,) = directory.glob("*.json")
+    entry.write_text("{not json", encoding="utf-8")
+    fresh = ImportResultCache(directory=directory)
+    parse_single_csv_lossless(combined, format_hint="generic", cache=fresh)
+    assert fresh.stats().misses == 1
+    assert fresh.stats().disk_hits == 0
+
+
+def test_rejects_non_positive_capacity() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        ImportResultCache(max_entries=0)
@@ -18,6 +18,7 @@ from structural_lib.services.imports import (
     LosslessImportBlockedError,
     parse_dual_csv,
     parse_dual_csv_lossless,
+    parse_project_exports,
     parse_single_csv_lossless,
     validate_import,
 )
@@ -440,3 +441,44 @@ def test_etabs_lossless_ledger_requires_case_station_and_section_identity(
     assert "geometry.headers.section_name" in missing_paths
     assert "forces.headers.case_id" in missing_paths
     assert "forces.headers.station" in missing_paths
+
+
+def test_project_exports_block_unclassified_artifact(tmp_path: Path) -> None:
+    geometry_csv = tmp_path / "geometry.csv"
+    forces_csv = tmp_path / "forces.csv"
+    notes_csv = tmp_path / "notes.csv"
+    _write_csv(
+        geometry_csv,
+        """
+BeamID,b (mm),D (mm),Span (mm),fck,fy,Cover (mm)
+B1,300,500,5000,25,500,40
+""",
+    )
+    _write_csv(forces_csv, "BeamID,Mu (kN-m),Vu (kN)\nB1,150,80")
+    _write_csv(notes_csv, "BeamID,Remark\nB1,checked")
+
+    accepted = parse_project_exports(
+        [geometry_csv, forces_csv], format_hint="generic", max_workers=1
+    )
+    blocked = parse_project_exports(
+        [geometry_csv, forces_csv, notes_csv], format_hint="generic", max_workers=1
+    )
+
+    assert accepted.status is ImportStatus.ACCEPTED
+    assert [artifact.name for artifact in accepted.ledger.artifacts] == [
+        "geometry.csv",
+        "forces.csv",
+    ]
+    assert blocked.status is ImportStatus.BLOCKED
+    assert blocked.ledger.totals.source_rows == 3
+    unknown = [
+        issue
+        for issue in blocked.issues
+        if issue.code is ImportIssueCode.UNKNOWN_FORMAT
+    ]
+    assert [issue.artifact_index for issue in unknown] == [2]
+
+
+def test_project_exports_require_artifacts() -> None:
+    with pytest.raises(ValueError, match="at least one artifact"):
+        parse_project_exports([])
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the opt-in per-stage timers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from structural_lib.core import instrumentation
+from structural_lib.services.api import design_beam_is456
+
+SAMPLE_CSV = Path(__file__).resolve().parents[2] / "examples" / "sample_beam_design.csv"
+
+
+@pytest.fixture(autouse=True)
+def clean_timings():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+    if was_enabled:
+        instrumentation.enable()
+
+
+def _design() -> None:
+    design_beam_is456(
+        units="IS456",
+        mu_knm=120,
+        vu_kn=80,
+        b_mm=300,
+        D_mm=500,
+        d_mm=450,
+        fck_nmm2=25,
+        fy_nmm2=500,
+    )
+
+
+def test_disabled_stages_share_a_no_op_and_record_nothing():
+    assert instrumentation.stage("a") is instrumentation.stage("b")
+    _design()
+    assert instrumentation.snapshot() == {}
+
+
+def test_enabled_stages_accumulate_design_timings():
+    instrumentation.enable()
+    _design()
+    _design()
+    with pytest.raises(ValueError):
+        design_beam_is456(
+            units="IS456",
+            mu_knm=120,
+            vu_kn=80,
+            b_mm=300,
+            D_mm=500,
+            d_mm=450,
+            fck_nmm2=25,
+            fy_nmm2=500,
+            tu_knm=-1,
+        )
+
+    timings = instrumentation.snapshot()
+    assert list(timings) == [
+        "beam.compliance",
+        "beam.envelope",
+        "beam.evidence",
+        "beam.validate",
+    ]
+    assert timings["beam.validate"].calls == 3
+    assert timings["beam.evidence"].calls == 2
+    evidence = timings["beam.evidence"]
+    assert 0 < evidence.max_seconds <= evidence.total_seconds
+    assert evidence.to_dict()["calls"] == 2
+
+
+def test_cli_profile_prints_stage_table(tmp_path, capsys):
+    from structural_lib.__main__ import main
+
+    output = tmp_path / "results.json"
+    assert main(["--profile", "design", str(SAMPLE_CSV), "-o", str(output)]) == 0
+
+    table = capsys.readouterr().err
+    header = next(line for line in table.splitlines() if line.startswith("stage"))
+    assert header.split()[:2] == ["stage", "calls"]
+    for name in ("cli.parse", "import.parse", "beam.evidence", "cli.serialize"):
+        assert f"\n{name} " in table
+    assert not instrumentation.is_enabled()
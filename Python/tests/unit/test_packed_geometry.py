@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for packed binary building geometry."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from structural_lib.core.models import FrameType  # noqa: E402
+from structural_lib.visualization.geometry_3d import (  # noqa: E402
+    building_to_3d_geometry,
+)
+from structural_lib.visualization.packed_geometry import (  # noqa: E402
+    FRAME_TYPES,
+    pack_building_geometry,
+    unpack_building_geometry,
+)
+
+
+@pytest.fixture()
+def members(make_member):
+    return [
+        make_member(
+            "C1", (0, 0, 0), (0, 0, 3), story="GF", frame_type=FrameType.COLUMN
+        ),
+        make_member("B1", (0, 0, 3), (5, 0, 3)),
+        make_member(
+            "C2", (5, 0, 0), (5, 0, 3), story="GF", frame_type=FrameType.COLUMN
+        ),
+    ]
+
+
+def test_packed_geometry_matches_line_geometry_and_shares_joints(members) -> None:
+    packed = pack_building_geometry(members)
+    lines = building_to_3d_geometry(members)
+
+    assert packed.bounding_box == lines.bounding_box
+    assert packed.origin == (lines.center.x, lines.center.y, lines.center.z)
+    assert packed.member_ids == ("C1", "B1", "C2")
+    assert packed.stories == ("GF", "L1")
+    # Six member ends meet at four joints
+    assert packed.vertex_count == 4
+    for i, line in enumerate(lines.beams):
+        assert FRAME_TYPES[packed.frame_types[i]] == line.frame_type
+        assert packed.stories[packed.story_indices[i]] == line.story
+        start, end = packed.indices[i]
+        for index, point in ((start, line.start), (end, line.end)):
+            assert tuple(packed.positions[index] + packed.origin) == pytest.approx(
+                (point.x, point.y, point.z)
+            )
+
+
+def test_packed_geometry_round_trips_and_filters(members) -> None:
+    packed = pack_building_geometry(members, include_frame_types=("beam",))
+    packed.metadata["note"] = "kept"
+
+    payload = packed.to_bytes()
+    restored = unpack_building_geometry(payload)
+
+    assert len(payload) % 4 == 0
+    assert restored.member_ids == ("B1",)
+    assert restored.stories == ("L1",)
+    assert restored.metadata["note"] == "kept"
+    assert restored.indices.tolist() == packed.indices.tolist()
+    assert restored.positions.tolist() == packed.positions.tolist()
+    assert FRAME_TYPES[restored.frame_types[0]] == "beam"
+
+    with pytest.raises(ValueError, match="Not a packed geometry"):
+        unpack_building_geometry(b"JSON" + payload[4:])
+    with pytest.raises(ValueError, match="No beams"):
+        pack_building_geometry(members, include_frame_types=("brace",))
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for instanced building rebar geometry."""
+
+from __future__ import annotations
+
+import pytest
+
+from structural_lib.codes.is456.beam.detailing import create_beam_detailing
+from structural_lib.visualization.geometry_3d import beam_to_3d_geometry
+from structural_lib.visualization.rebar_instancing import (
+    LOD_BARS,
+    LOD_FULL,
+    LOD_LAYERS,
+    building_rebar_instances,
+)
+
+
+def _detailing(beam_id: str, span: float, ast: float = 800.0):
+    return create_beam_detailing(
+        beam_id, "L1", 300, 500, span, 40, 25, 500, ast, ast * 0.8, ast
+    )
+
+
+def _apply(matrix, x, y, z):
+    return tuple(
+        matrix[i] * x + matrix[4 + i] * y + matrix[8 + i] * z + matrix[12 + i]
+        for i in range(3)
+    )
+
+
+def test_similar_beams_share_a_prototype_placed_by_matrix(make_member) -> None:
+    detailings = [
+        _detailing("B1", 6000),
+        _detailing("B2", 6040),  # same type: spans within ±50 mm
+        _detailing("B3", 6000, ast=1400),
+    ]
+    placements = [
+        make_member("B1", (0, 0, 3), (6, 0, 3)),
+        make_member("B2", (0, 0, 3), (0, 6.04, 3)),
+        make_member("B3", (0, 6, 3), (6, 6, 3)),
+        make_member("C1", (0, 0, 0), (0, 0, 3)),
+    ]
+
+    geometry = building_rebar_instances(detailings, placements)
+
+    assert geometry.type_indices == [0, 0, 1]
+    assert [p.instance_count for p in geometry.prototypes] == [2, 1]
+    prototype = geometry.prototypes[0]
+    reference = beam_to_3d_geometry(detailings[0])
+    assert len(prototype.bars) == len(reference.rebars)
+    assert len(prototype.stirrup_positions) == len(reference.stirrups)
+    assert sum(layer.count for layer in prototype.layers) == len(prototype.bars)
+
+    # B2 runs along +Y: its prototype end maps to the line end, top at z=3000
+    b2 = geometry.matrices[16:32]
+    assert _apply(b2, prototype.span, 0, prototype.D) == pytest.approx(
+        (0.0, 6040.0, 3000.0)
+    )
+    assert _apply(b2, 0, 0, 0) == pytest.approx((0.0, 0.0, 2500.0))
+    assert geometry.to_dict()["instances"]["beamIds"] == ["B1", "B2", "B3"]
+
+
+def test_level_of_detail_by_distance_from_view_point(make_member) -> None:
+    detailings = [_detailing(f"B{i}", 6000) for i in range(3)]
+    placements = [
+        make_member(f"B{i}", (0, 20 * i, 3), (6, 20 * i, 3)) for i in range(3)
+    ]
+
+    geometry = building_rebar_instances(
+        detailings,
+        placements,
+        view_point_mm=(3000.0, 0.0, 3000.0),
+        stirrup_distance_mm=10_000,
+        layer_distance_mm=30_000,
+    )
+
+    assert geometry.lod == [LOD_FULL, LOD_BARS, LOD_LAYERS]
+
+
+def test_invalid_inputs_are_rejected(make_member) -> None:
+    detailings = [_detailing("B1", 6000)]
+
+    with pytest.raises(ValueError, match="No placement"):
+        building_rebar_instances(detailings, [])
+    with pytest.raises(ValueError, match="view_point_mm"):
+        building_rebar_instances(
+            detailings,
+            [make_member("B1", (0, 0, 3), (6, 0, 3))],
+            stirrup_distance_mm=1000,
+        )
+    with pytest.raises(ValueError, match="unique"):
+        building_rebar_instances(detailings * 2, [])
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the building member spatial index."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from structural_lib.core.models import FrameType
+from structural_lib.visualization.geometry_3d import building_to_3d_geometry
+from structural_lib.visualization.spatial_index import (
+    IndexedMember,
+    MemberSpatialIndex,
+)
+
+
+def _random_members(count: int, seed: int = 7) -> list[IndexedMember]:
+    rng = random.Random(seed)
+    members = []
+    for n in range(count):
+        start = tuple(rng.uniform(0, 40_000) for _ in range(3))
+        end = tuple(c + rng.uniform(-5_000, 5_000) for c in start)
+        members.append(IndexedMember(f"M{n}", "L1", "beam", start, end))
+    return members
+
+
+def _distance(point, member: IndexedMember) -> float:
+    # Dense sampling is exact enough to rank well-separated members
+    return min(
+        math.dist(
+            point,
+            [
+                member.start[i] + t / 200 * (member.end[i] - member.start[i])
+                for i in range(3)
+            ],
+        )
+        for t in range(201)
+    )
+
+
+def test_building_bounds_and_index_from_geometry(make_member) -> None:
+    beams = [
+        make_member("C1", (0, 0, 0), (0, 0, 3), frame_type=FrameType.COLUMN),
+        make_member("B1", (5, 2, 3), (-1, 2, 3)),
+    ]
+
+    geometry = building_to_3d_geometry(beams)
+    index = MemberSpatialIndex.from_building(geometry)
+
+    assert geometry.bounding_box == {
+        "min_x": -1000.0,
+        "max_x": 5000.0,
+        "min_y": 0.0,
+        "max_y": 2000.0,
+        "min_z": 0.0,
+        "max_z": 3000.0,
+    }
+    assert index.lower == (-1000.0, 0.0, 0.0)
+    assert index.upper == (5000.0, 2000.0, 3000.0)
+    assert index.cell_size == pytest.approx(4500.0)
+    assert [index.members[i].member_id for i, _ in index.nearest((0, 0, 0))] == ["C1"]
+
+
+def test_queries_match_a_linear_scan() -> None:
+    members = _random_members(800)
+    index = MemberSpatialIndex(members)
+    rng = random.Random(3)
+
+    for _ in range(20):
+        point = tuple(rng.uniform(-5_000, 45_000) for _ in range(3))
+        expected = sorted(
+            range(len(members)), key=lambda i: _distance(point, members[i])
+        )
+        assert [i for i, _ in index.nearest(point, k=3)] == expected[:3]
+
+    lower, upper = (10_000, 10_000, 10_000), (20_000, 15_000, 40_000)
+    inside = index.query_box(lower, upper)
+    for i, member in enumerate(members):
+        samples = [
+            [
+                member.start[a] + t / 200 * (member.end[a] - member.start[a])
+                for a in range(3)
+            ]
+            for t in range(201)
+        ]
+        touches = any(
+            all(lower[a] <= p[a] <= upper[a] for a in range(3)) for p in samples
+        )
+        if touches:
+            assert i in inside
+
+    # Half-space x >= 30 m culls members wholly below it
+    kept = index.query_frustum([(1.0, 0.0, 0.0, -30_000.0)])
+    assert kept == [
+        i for i, m in enumerate(members) if max(m.start[0], m.end[0]) >= 30_000
+    ]
+
+
+def test_adjacent_pairs_find_joints_and_clearance_clashes() -> None:
+    members = [
+        IndexedMember("C1", "GF", "column", (0, 0, 0), (0, 0, 3000)),
+        IndexedMember("B1", "L1", "beam", (0, 0, 3000), (6000, 0, 3000)),
+        # Crosses under B1 with 400 mm clearance
+        IndexedMember("P1", "L1", "beam", (3000, -2000, 2600), (3000, 2000, 2600)),
+        IndexedMember("B2", "L1", "beam", (0, 9000, 3000), (6000, 9000, 3000)),
+    ]
+    index = MemberSpatialIndex(members, cell_size=1000)
+
+    assert index.adjacent_pairs() == [(0, 1)]
+    assert index.adjacent_pairs(500) == [(0, 1), (1, 2)]
+    assert index.nearest((3000, 9000, 0), max_distance=1000) == []
+    with pytest.raises(ValueError, match="No members"):
+        MemberSpatialIndex([])
+    with pytest.raises(ValueError, match="cell_size"):
+        MemberSpatialIndex(members, cell_size=0)
+
+
+def test_long_diagonal_member_indexes_only_the_cells_it_crosses() -> None:
+    members = [
+        # Its bounding box spans 101^3 cells; the line passes through ~300
+        IndexedMember("D1", "L1", "brace", (0, 0, 0), (100_000, 37_000, 81_000)),
+        # Through grid corners only
+        IndexedMember("D2", "L1", "brace", (0, 0, 0), (50_000, 50_000, 50_000)),
+        IndexedMember(
+            "C1", "GF", "column", (50_000, 18_500, 0), (50_000, 18_500, 40_500)
+        ),
+    ]
+    index = MemberSpatialIndex(members, cell_size=1000)
+
+    assert index.cell_count < 500
+    assert index.query_box((49_900, 18_400, 40_400), (50_100, 18_600, 40_600)) == [0, 2]
+    # Inside D1's bounding box, far from its line
+    assert index.query_box((90_000, 1_000, 1_000), (91_000, 2_000, 2_000)) == []
+    assert index.query_box((25_000, 25_000, 25_000), (25_000, 26_000, 26_000)) == [1]
+    assert [i for i, _ in index.nearest((99_000, 37_000, 81_000))] == [0]
+    # C1 ends on D1 and D1 meets D2 at the origin
+    assert index.adjacent_pairs(1.0) == [(0, 1), (0, 2)]
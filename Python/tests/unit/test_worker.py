@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2024-2026 Pravin Surawase
+"""Tests for the resident worker and its thin client."""
+
+from __future__ import annotations
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from structural_lib.__main__ import _worker_request, main
+from structural_lib.services import excel_bridge
+from structural_lib.services.worker import (
+    WorkerClient,
+    WorkerError,
+    _prepare_address,
+    serve,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="tests use a Unix socket address"
+)
+
+
+@pytest.fixture
+def worker_address():
+    # Short path: Unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory() as tmp:
+        address = str(Path(tmp) / "w.sock")
+        ready = threading.Event()
+        thread = threading.Thread(
+            target=serve,
+            args=(address,),
+            kwargs={"preload": False, "ready": ready.set},
+            daemon=True,
+        )
+        thread.start()
+        assert ready.wait(10)
+        yield address
+        if thread.is_alive():
+            with WorkerClient(address) as worker:
+                worker.shutdown()
+        thread.join(10)
+        assert not thread.is_alive()
+
+
+def test_worker_answers_udf_calls_like_the_bridge(worker_address) -> None:
+    with WorkerClient(worker_address) as worker:
+        assert worker.ping()["version"]
+        assert worker.udf("IS456_MuLim", 300, 450, 25, 500) == (
+            excel_bridge.IS456_MuLim(300, 450, 25, 500)
+        )
+        assert worker.udf("IS456_BarCallout", 5, 16) == "5-16φ"
+        # UDF errors stay values, as in Excel
+        assert worker.udf("IS456_Ld", 16, -25, 500) == excel_bridge.IS456_Ld(
+            16, -25, 500
+        )
+        with pytest.raises(WorkerError, match="Unknown UDF"):
+            worker.udf("create_design_sheet")
+        with pytest.raises(WorkerError, match="Unknown method"):
+            worker.call("eval", "1 + 1")
+        # The connection stays usable after an error
+        assert worker.udf("IS456_StirrupCallout", 2, 8, 150) == (
+            excel_bridge.IS456_StirrupCallout(2, 8, 150)
+        )
+
+
+def test_cli_forwarded_to_worker_matches_local_run(
+    worker_address, tmp_path, capsys
+) -> None:
+    assert main(["capabilities", "--json"]) == 0
+    local = capsys.readouterr().out
+
+    assert main(["--worker", worker_address, "capabilities", "--json"]) == 0
+    assert capsys.readouterr().out == local
+
+    # Relative paths resolve against the caller's directory
+    with WorkerClient(worker_address) as worker:
+        result = worker.cli(["design", "missing.csv", "-o", "out.json"], tmp_path)
+        assert result["exit_code"] == 1
+        assert "missing.csv" in result["stderr"]
+        assert worker.cli(["design"])["exit_code"] == 2  # argparse error
+        with pytest.raises(WorkerError, match="serve cannot run"):
+            worker.cli(["serve", "--socket", "x"])
+        with pytest.raises(WorkerError, match="serve cannot run"):
+            worker.cli(["--profile", "serve", "--socket", "x"])
+        with pytest.raises(WorkerError, match="serve cannot run"):
+            worker.cli(["--wor=w.sock", "serve"])
+    json.loads(local)
+
+
+def test_client_and_server_report_address_problems(worker_address, capsys) -> None:
+    with pytest.raises(WorkerError, match="already listening"):
+        serve(worker_address, preload=False)
+    missing = str(Path(worker_address).with_name("missing.sock"))
+    with pytest.raises(WorkerError, match="No worker is listening"):
+        WorkerClient(missing)
+    assert main(["--worker", missing, "capabilities"]) == 1
+    assert "serve --socket" in capsys.readouterr().err
+
+
+def test_only_a_stale_socket_is_replaced(tmp_path) -> None:
+    stale = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(stale)  # Closed without listening, as after a crash
+    _prepare_address(stale)
+    assert not Path(stale).exists()
+
+    regular = tmp_path / "notes.txt"
+    regular.write_text("keep me")
+    with pytest.raises(WorkerError, match="not a socket"):
+        serve(str(regular), preload=False)
+    assert regular.read_text() == "keep me"
+
+
+def test_worker_option_is_split_off_before_the_command() -> None:
+    assert _worker_request(["--profile", "--worker", "w.sock", "design", "a.csv"]) == (
+        "w.sock",
+        ["--profile", "design", "a.csv"],
+    )
+    assert _worker_request(["--worker=w.sock", "bbs", "r.json"]) == (
+        "w.sock",
+        ["bbs", "r.json"],
+    )
+    # serve runs here, and --worker after the command belongs to the command
+    assert _worker_request(["--worker", "w.sock", "serve", "--socket", "x"]) is None
+    assert _worker_request(["design", "--worker", "w.sock"]) is None
+    assert _worker_request(["--worker"]) is None
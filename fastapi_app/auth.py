@@ -21,11 +21,14 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import os
 import time
-from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any
 
 from fastapi import Depends, HTTPException, Query, Request, Response, WebSocket, status
@@ -35,6 +38,7 @@ from jwt.exceptions import PyJWTError
 from pydantic import BaseModel
 
 from fastapi_app.config import is_insecure_jwt_secret
+from fastapi_app.state import InProcessStateBackend, StateBackend, get_state_backend
 
 auth_logger = logging.getLogger("auth.events")
 
@@ -262,19 +266,38 @@ async def verify_ws_token(
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter using sliding window.
-
-    In production, use Redis for distributed rate limiting.
+    Token-bucket rate limiter keyed by client IP.
+
+    Each client has a bucket of ``requests_per_window`` tokens that refills
+    evenly over ``window_seconds``. A request spends its route's cost, one
+    token unless a path prefix in ``route_costs`` says otherwise. A bucket is
+    two numbers, so every check is O(1). A bucket left idle for a whole window
+    is full again, so it expires from the backend and the backend's sweeper
+    drops it.
+
+    Buckets live in a ``StateBackend`` under ``namespace``. The default is a
+    private in-process backend; limiters given the same shared backend and
+    namespace enforce one limit across worker processes.
     """
 
     def __init__(
         self,
         requests_per_window: int = RATE_LIMIT_REQUESTS,
         window_seconds: int = RATE_LIMIT_WINDOW_SECONDS,
+        *,
+        backend: StateBackend | None = None,
+        namespace: str = "rate_limit",
+        route_costs: Mapping[str, int] | None = None,
     ):
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self.requests: dict[str, list[float]] = defaultdict(list)
+        self.backend = backend if backend is not None else InProcessStateBackend()
+        self.namespace = namespace
+        # Longest prefix first, so the most specific route cost wins.
+        self.route_costs = sorted(
+            (route_costs or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._refill_per_second = requests_per_window / window_seconds
 
     def _get_client_key(self, request: Request) -> str:
         """Get unique key for rate limiting (IP-based)."""
@@ -283,46 +306,68 @@ class RateLimiter:
             return forwarded.split(",")[0].strip()
         return request.client.host if request.client else "unknown"
 
-    def _cleanup_old_requests(self, key: str) -> None:
-        """Remove requests outside the sliding window."""
+    def cost_for(self, path: str) -> int:
+        """Tokens a request to ``path`` spends, capped at the bucket size."""
+        for prefix, cost in self.route_costs:
+            if path.startswith(prefix):
+                return max(1, min(cost, self.requests_per_window))
+        return 1
+
+    def _spend(
+        self, cost: int, bucket: list[float] | None
+    ) -> tuple[list[float], tuple[bool, float, float]]:
+        """Refill the bucket for the time elapsed and take ``cost`` if there."""
         now = time.time()
-        cutoff = now - self.window_seconds
-        self.requests[key] = [t for t in self.requests[key] if t > cutoff]
-
-    def is_allowed(self, request: Request) -> tuple[bool, dict[str, Any]]:
+        if bucket is None:
+            tokens = float(self.requests_per_window)
+        else:
+            tokens = min(
+                float(self.requests_per_window),
+                bucket[0] + (now - bucket[1]) * self._refill_per_second,
+            )
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        return [tokens, now], (allowed, tokens, now)
+
+    def is_allowed(
+        self, request: Request, cost: int | None = None
+    ) -> tuple[bool, dict[str, Any]]:
         """
         Check if request is allowed under rate limit.
 
+        Args:
+            request: Incoming request; its path selects the route cost
+            cost: Tokens to spend instead of the route cost
+
         Returns:
             (allowed: bool, headers: dict with rate limit info)
         """
-        key = self._get_client_key(request)
-        self._cleanup_old_requests(key)
-
-        current_count = len(self.requests[key])
-        remaining = max(0, self.requests_per_window - current_count)
+        if cost is None:
+            cost = self.cost_for(request.url.path) if self.route_costs else 1
+        allowed, tokens, now = self.backend.update(
+            self.namespace,
+            self._get_client_key(request),
+            partial(self._spend, cost),
+            ttl_seconds=self.window_seconds,
+        )
 
         headers = {
             "X-RateLimit-Limit": str(self.requests_per_window),
-            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Remaining": str(int(tokens)),
             "X-RateLimit-Window": str(self.window_seconds),
         }
 
-        if current_count >= self.requests_per_window:
-            # Calculate reset time
-            oldest = min(self.requests[key]) if self.requests[key] else time.time()
-            reset_at = oldest + self.window_seconds
-            headers["X-RateLimit-Reset"] = str(int(reset_at))
+        if not allowed:
+            wait = (cost - tokens) / self._refill_per_second
+            headers["X-RateLimit-Reset"] = str(math.ceil(now + wait))
             return False, headers
 
-        # Allow request
-        self.requests[key].append(time.time())
-        headers["X-RateLimit-Remaining"] = str(remaining - 1)
         return True, headers
 
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+rate_limiter = RateLimiter(backend=get_state_backend(), namespace="rate_limit:route")
 
 
 async def check_rate_limit(request: Request, response: Response) -> None:
@@ -334,7 +379,7 @@ async def check_rate_limit(request: Request, response: Response) -> None:
         async def endpoint(rate_limit: None = Depends(check_rate_limit)):
             ...
     """
-    allowed, headers = rate_limiter.is_allowed(request)
+    allowed, headers = await asyncio.to_thread(rate_limiter.is_allowed, request)
     response.headers.update(headers)
 
     if not allowed:
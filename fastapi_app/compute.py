@@ -0,0 +1,448 @@
+"""
+Shared compute executor for CPU-bound API routes.
+
+structural_lib calculations are synchronous. Running them inside ``async def``
+handlers blocks the event loop for every client, including ``/health``. This
+module runs them in one process-wide pool instead:
+
+- ``ComputeExecutor`` owns a thread or process pool with a bounded queue.
+  When the pool and queue are full, or a route reaches its own concurrency
+  limit, new work is rejected at once rather than queued without bound.
+- ``ComputeRoute`` is an ``APIRoute`` class. Routers created with
+  ``route_class=ComputeRoute`` run every plain ``def`` handler on the shared
+  executor. ``async def`` handlers that must await I/O call
+  ``run_compute()`` around their synchronous work instead.
+- ``LocalComputeRoute`` and ``run_compute_local()`` always use the thread
+  pool, for handlers that read or mutate process-local state (caches, job
+  stores, workflow runners) or pass non-picklable objects.
+- Rejections become ``503 Service Unavailable`` with a ``Retry-After``
+  estimate. Per-route queue-time and compute-time counters are served at
+  ``GET /health/compute``.
+
+Process pools need picklable handler arguments and results; the thread pool
+(default) has no such restriction. Both pools share one admission budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import math
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Literal, TypeVar
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+
+from fastapi_app.config import get_settings
+from fastapi_app.response_cache import cached_route_handler
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+_OFFLOADED_MARKER = "__compute_offloaded__"
+_MAX_RETRY_AFTER_SECONDS = 60
+
+
+class ComputeSaturatedError(RuntimeError):
+    """Raised when the executor or a route has no free capacity."""
+
+    def __init__(self, route: str, retry_after_seconds: int, reason: str):
+        self.route = route
+        self.retry_after_seconds = retry_after_seconds
+        self.reason = reason
+        super().__init__(f"Compute capacity exhausted for {route!r}: {reason}")
+
+
+@dataclass
+class RouteComputeStats:
+    """Counters for one route on the shared executor."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    pending: int = 0
+    queue_ms_total: float = 0.0
+    queue_ms_max: float = 0.0
+    compute_ms_total: float = 0.0
+    compute_ms_max: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible view with mean queue and compute times."""
+        finished = self.completed + self.failed
+        return {
+            **asdict(self),
+            "queue_ms_mean": (
+                round(self.queue_ms_total / finished, 3) if finished else 0.0
+            ),
+            "compute_ms_mean": (
+                round(self.compute_ms_total / finished, 3) if finished else 0.0
+            ),
+        }
+
+
+@dataclass(frozen=True)
+class _RemoteHTTPError:
+    """HTTPException carried back from a worker process.
+
+    Starlette's HTTPException cannot be unpickled, so process workers return
+    its fields and the caller raises it again.
+    """
+
+    status_code: int
+    detail: Any
+    headers: dict[str, str] | None
+
+
+def _invoke(
+    fn: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    in_process: bool,
+) -> tuple[float, float, BaseException | _RemoteHTTPError | None, Any]:
+    """Run ``fn`` in a worker and report when it started and finished."""
+
+    started = time.monotonic()
+    try:
+        result = fn(*args, **kwargs)
+    except HTTPException as exc:
+        error: BaseException | _RemoteHTTPError = (
+            _RemoteHTTPError(exc.status_code, exc.detail, exc.headers)
+            if in_process
+            else exc
+        )
+        return started, time.monotonic(), error, None
+    except Exception as exc:
+        return started, time.monotonic(), exc, None
+    return started, time.monotonic(), None, result
+
+
+class ComputeExecutor:
+    """Process-wide pool for synchronous route work with bounded admission.
+
+    Args:
+        kind: ``"thread"`` or ``"process"`` pool
+        max_workers: Pool size; None uses the ``concurrent.futures`` default
+        max_queue: Admitted calls allowed to wait for a free worker
+        route_limit: Default cap on admitted calls per route; None is no cap
+        route_limits: Per-route caps keyed by route name, overriding
+            ``route_limit``
+
+    Raises:
+        ValueError: If a size or limit is not positive
+    """
+
+    def __init__(
+        self,
+        *,
+        kind: ExecutorKind = "thread",
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        route_limit: int | None = None,
+        route_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown compute executor kind {kind!r}")
+        if max_workers is None:
+            cpus = os.cpu_count() or 1
+            max_workers = cpus if kind == "process" else min(32, cpus + 4)
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue >= 0")
+        limits = dict(route_limits or {})
+        if route_limit is not None and route_limit < 1:
+            raise ValueError("route_limit must be at least 1")
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError("route_limits values must be at least 1")
+        self.kind: ExecutorKind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.route_limit = route_limit
+        self.route_limits = limits
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._routes: dict[str, RouteComputeStats] = {}
+
+    @property
+    def capacity(self) -> int:
+        """Calls that may be running or queued at once."""
+        return self.max_workers + self.max_queue
+
+    def limit_for(self, route: str) -> int | None:
+        """Admission cap for ``route``, or None when only the pool bounds it."""
+        return self.route_limits.get(route, self.route_limit)
+
+    async def run(self, route: str, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            ComputeSaturatedError: If the pool queue or ``route`` is full
+        """
+        return await self._run(route, fn, args, kwargs, local=False)
+
+    async def run_local(
+        self, route: str, fn: Callable[..., T], /, *args, **kwargs
+    ) -> T:
+        """Like :meth:`run`, but always on a thread of this process."""
+        return await self._run(route, fn, args, kwargs, local=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool settings, occupancy and per-route counters."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "routes": {
+                    route: stats.to_dict()
+                    for route, stats in sorted(self._routes.items())
+                },
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the pools; the next call starts fresh ones."""
+        with self._lock:
+            pools = (self._thread_pool, self._process_pool)
+            self._thread_pool = self._process_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _run(
+        self,
+        route: str,
+        fn: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        local: bool,
+    ) -> T:
+        in_process = self.kind == "process" and not local
+        self._admit(route)
+        submitted = time.monotonic()
+        try:
+            future = self._get_pool(in_process).submit(
+                _invoke, fn, args, kwargs, in_process
+            )
+        except BaseException:
+            self._release(route, None, submitted)
+            raise
+        # The slot is released when the worker finishes, not when the caller
+        # stops waiting, so a cancelled request still counts until it ends.
+        future.add_done_callback(
+            functools.partial(self._on_done, route, submitted=submitted)
+        )
+        _, _, error, result = await asyncio.wrap_future(future)
+        if isinstance(error, _RemoteHTTPError):
+            raise HTTPException(error.status_code, error.detail, error.headers)
+        if error is not None:
+            raise error
+        return result
+
+    def _get_pool(self, in_process: bool) -> Executor:
+        with self._lock:
+            if in_process:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers
+                    )
+                return self._process_pool
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="compute"
+                )
+            return self._thread_pool
+
+    def _admit(self, route: str) -> None:
+        with self._lock:
+            stats = self._routes.setdefault(route, RouteComputeStats())
+            limit = self.limit_for(route)
+            if self._pending >= self.capacity:
+                reason = "compute queue is full"
+            elif limit is not None and stats.pending >= limit:
+                reason = f"route concurrency limit {limit} reached"
+            else:
+                self._pending += 1
+                stats.pending += 1
+                stats.submitted += 1
+                return
+            stats.rejected += 1
+            retry_after = self._retry_after(stats)
+        raise ComputeSaturatedError(route, retry_after, reason)
+
+    def _retry_after(self, stats: RouteComputeStats) -> int:
+        # Time for the pool to drain the work ahead, from the route's mean.
+        finished = stats.completed + stats.failed
+        mean_s = stats.compute_ms_total / finished / 1000.0 if finished else 1.0
+        waves = math.ceil(self._pending / self.max_workers) or 1
+        return max(1, min(_MAX_RETRY_AFTER_SECONDS, math.ceil(mean_s * waves)))
+
+    def _on_done(self, route: str, future: Future, *, submitted: float) -> None:
+        self._release(route, future, submitted)
+
+    def _release(self, route: str, future: Future | None, submitted: float) -> None:
+        timing = None
+        if future is not None and not future.cancelled():
+            try:
+                started, finished, error, _ = future.result()
+            except BaseException:
+                pass
+            else:
+                timing = (started, finished, error is None)
+        with self._lock:
+            self._pending -= 1
+            stats = self._routes[route]
+            stats.pending -= 1
+            if timing is None:
+                stats.failed += 1
+                return
+            started, finished, ok = timing
+            queue_ms = max(0.0, started - submitted) * 1000.0
+            compute_ms = (finished - started) * 1000.0
+            stats.queue_ms_total += queue_ms
+            stats.queue_ms_max = max(stats.queue_ms_max, queue_ms)
+            stats.compute_ms_total += compute_ms
+            stats.compute_ms_max = max(stats.compute_ms_max, compute_ms)
+            if ok:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+
+
+@lru_cache(maxsize=1)
+def get_compute_executor() -> ComputeExecutor:
+    """Process-wide compute executor, sized from settings."""
+
+    settings = get_settings()
+    return ComputeExecutor(
+        kind=settings.compute_executor,
+        max_workers=settings.compute_max_workers,
+        max_queue=settings.compute_max_queue,
+        route_limit=settings.compute_route_limit,
+        route_limits=settings.compute_route_limits,
+    )
+
+
+def saturated_http_exception(exc: ComputeSaturatedError) -> HTTPException:
+    """Map a rejection to 503 with a ``Retry-After`` header."""
+
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "code": "COMPUTE_SATURATED",
+            "message": "Server is busy; retry after the indicated delay",
+            "route": exc.route,
+            "reason": exc.reason,
+        },
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
+async def run_compute(route: str, fn: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run synchronous work on the shared executor from an async handler.
+
+    Raises:
+        HTTPException: 503 with ``Retry-After`` when capacity is exhausted
+    """
+
+    try:
+        return await get_compute_executor().run(route, fn, *args, **kwargs)
+    except ComputeSaturatedError as exc:
+        raise saturated_http_exception(exc) from exc
+
+
+async def run_compute_local(route: str, fn: Callable[..., T], /, *args, **kwargs) -> T:
+    """Like :func:`run_compute`, but always on a thread of this process."""
+
+    try:
+        return await get_compute_executor().run_local(route, fn, *args, **kwargs)
+    except ComputeSaturatedError as exc:
+        raise saturated_http_exception(exc) from exc
+
+
+def offload(
+    fn: Callable[..., Any], *, route: str, local: bool = False
+) -> Callable[..., Any]:
+    """Wrap a synchronous handler so it runs on the shared executor.
+
+    The wrapper keeps ``fn``'s signature (via ``__wrapped__``), so FastAPI
+    resolves parameters and dependencies exactly as for ``fn``.
+    """
+
+    if getattr(fn, _OFFLOADED_MARKER, False):
+        return fn
+    run = run_compute_local if local else run_compute
+
+    @functools.wraps(fn)
+    async def handler(*args: Any, **kwargs: Any) -> Any:
+        return await run(route, fn, *args, **kwargs)
+
+    setattr(handler, _OFFLOADED_MARKER, True)
+    return handler
+
+
+class ComputeRoute(APIRoute):
+    """Route class that runs plain ``def`` handlers on the compute executor.
+
+    ``async def`` handlers are left on the event loop; they should wrap their
+    synchronous work in :func:`run_compute`.
+    """
+
+    local = False
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        if not (
+            inspect.iscoroutinefunction(endpoint)
+            or inspect.isasyncgenfunction(endpoint)
+            or inspect.isgeneratorfunction(endpoint)
+        ):
+            endpoint = offload(
+                endpoint,
+                route=kwargs.get("name") or endpoint.__name__,
+                local=self.local,
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        """Serve repeated requests to cached routes from the response cache."""
+        return cached_route_handler(self.name, super().get_route_handler())
+
+
+class LocalComputeRoute(ComputeRoute):
+    """:class:`ComputeRoute` whose handlers always run on a local thread."""
+
+    local = True
+
+
+__all__ = [
+    "ComputeExecutor",
+    "ComputeRoute",
+    "ComputeSaturatedError",
+    "LocalComputeRoute",
+    "RouteComputeStats",
+    "get_compute_executor",
+    "offload",
+    "run_compute",
+    "run_compute_local",
+    "saturated_http_exception",
+]
@@ -6,6 +6,8 @@ Settings can be overridden via environment variables or .env file.
 """
 
 from functools import lru_cache
+from typing import Literal
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
@@ -67,17 +69,107 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 120  # Global API rate limit per client IP
     rate_limit_enabled: bool = True  # Set to False in tests or dev
+    # Tokens a request spends from the global limit, by path prefix (longest
+    # match wins); other paths cost one. Limits refill evenly, so a cost of
+    # 10 at 120/min means one such request every five seconds once a
+    # client's burst is spent.
+    rate_limit_route_costs: dict[str, int] = {
+        "/api/v1/import/batch-design": 10,
+        "/stream/batch-design": 10,
+        "/stream/bulk-design": 10,
+        "/api/v1/optimization/beam": 5,
+        "/api/v1/export": 5,
+    }
+
+    # Shared State
+    # Rate-limit buckets and workflow replay live in this backend. "memory"
+    # suits one worker; with ``uvicorn --workers N`` use "sqlite" and a
+    # STATE_PATH every worker can open. SSE batch jobs also use STATE_PATH
+    # unless STREAM_JOB_STORE_PATH is set.
+    state_backend: Literal["memory", "sqlite"] = "memory"
+    state_path: str | None = None
 
     # Batch Processing
     max_batch_size: int = 500
+    # SSE batch jobs and their events live in SQLite. None keeps them in
+    # memory; a file path keeps finished jobs replayable across restarts.
+    # Finished jobs are evicted after the TTL, oldest-accessed first beyond
+    # the job cap, whenever a job starts and every sweep interval (0 turns
+    # the periodic sweep off).
+    stream_job_store_path: str | None = None
+    stream_job_ttl_seconds: int = 3600
+    stream_job_max_jobs: int = 256
+    stream_job_sweep_interval_seconds: float = 300
+    # Streams send progress after the first member, then every N members or
+    # T milliseconds, whichever comes first, and after the last member.
+    stream_progress_every: int = 25
+    stream_progress_interval_ms: int = 250
+    # /stream/bulk-design reads NDJSON incrementally and is not bound by
+    # max_batch_size; these cap one request and one member line.
+    bulk_design_max_members: int = 100_000
+    bulk_design_max_line_bytes: int = 64 * 1024
 
     # Bounded workflow execution remains unreachable unless a local/test process
     # opts in explicitly. This is not enabled by the production compose profile.
     workflow_runner_enabled: bool = False
 
+    # Compute Executor
+    # CPU-bound route handlers run on one shared pool. Work beyond
+    # workers + queue, or beyond a route's limit, is rejected with 503.
+    # Route limits are keyed by route name (the handler function name).
+    compute_executor: Literal["thread", "process"] = "thread"
+    compute_max_workers: int | None = None
+    compute_max_queue: int = 64
+    compute_route_limit: int | None = None
+    compute_route_limits: dict[str, int] = {}
+
+    # Live Design WebSocket
+    # design_beam messages are latest-wins per session: a message that
+    # arrives while another waits or computes replaces it, and results of
+    # superseded messages are dropped. The debounce gathers a burst before
+    # the first calculation starts.
+    ws_design_debounce_ms: int = 10
+
+    # Response Cache
+    # Successful responses of these routes (handler function names) are
+    # cached in memory by canonical request hash and served with ETags.
+    # Only list routes whose response depends on nothing but the request
+    # and the installed library.
+    response_cache_enabled: bool = True
+    response_cache_routes: list[str] = [
+        "design_beam",
+        "check_beam",
+        "design_beam_torsion",
+        "compliance_report",
+        "design_column",
+        "design_column_uniaxial",
+        "pm_interaction_curve",
+        "biaxial_check",
+    ]
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+    response_cache_max_entry_bytes: int = 1024 * 1024
+    response_cache_control: str = "private, no-cache"
+
+    # Metrics
+    # GET /metrics serves Prometheus text; enabling it also turns on
+    # structural_lib stage timers in this process.
+    metrics_enabled: bool = True
+
     # Upload Limits
     max_upload_size_bytes: int = 10 * 1024 * 1024  # 10 MB
 
+    # Import Cache
+    # Parsed import ledgers keyed by artifact SHA-256. The directory, when set,
+    # must be private to this service; entries survive restarts.
+    import_cache_max_entries: int = 32
+    import_cache_dir: str | None = None
+    # Compact ledgers kept for /import/ledgers/{hash}/rows pagination.
+    import_ledger_store_entries: int = 16
+
+    # Geometry Index
+    # Building spatial indexes kept for /geometry/building/index/{hash} queries.
+    geometry_index_store_entries: int = 16
+
     # Logging
     log_level: str = "INFO"
 
@@ -0,0 +1,285 @@
+"""
+Append-only SQLite store for streamed batch jobs.
+
+``/stream/batch-design`` jobs run in the background and write every SSE
+event here. Clients replay a job from any point with ``Last-Event-ID``, so
+a dropped connection costs neither the job nor a recomputation.
+
+- ``batch_jobs`` holds one row of counters per job.
+- ``batch_job_events`` holds the events of each job in sequence order.
+  Events are only ever appended.
+
+Finished jobs are evicted after a TTL, and least recently accessed first
+once the job cap is reached. Running jobs are never evicted. Several worker
+processes on one host may share a store file: each job records the process
+that runs it, and opening the store marks jobs whose process has exited as
+``interrupted``.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    held INTEGER NOT NULL DEFAULT 0,
+    blocked INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    started_at TEXT NOT NULL,
+    completed_at TEXT,
+    accessed REAL NOT NULL,
+    owner_pid INTEGER
+);
+CREATE INDEX IF NOT EXISTS batch_jobs_accessed ON batch_jobs (accessed);
+CREATE TABLE IF NOT EXISTS batch_job_events (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+) WITHOUT ROWID;
+"""
+
+_COUNTERS = ("completed", "passed", "failed", "held", "blocked", "error_count")
+
+RUNNING = "running"
+
+
+class BatchJobStore:
+    """SQLite-backed job counters and append-only SSE event log.
+
+    Args:
+        path: Database file, or None for a private in-memory database
+        ttl_seconds: Age after last access at which finished jobs expire
+        max_jobs: Jobs kept before the least recently accessed finished
+            jobs are evicted
+
+    Raises:
+        ValueError: If ``ttl_seconds`` or ``max_jobs`` is not positive
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl_seconds: float = 3600,
+        max_jobs: int = 256,
+    ) -> None:
+        if ttl_seconds <= 0 or max_jobs < 1:
+            raise ValueError("ttl_seconds and max_jobs must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            ":memory:" if path is None else str(path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if path is not None:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(batch_jobs)")
+            }
+            if "owner_pid" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE batch_jobs ADD COLUMN owner_pid INTEGER"
+                )
+            orphaned = [
+                (row[0],)
+                for row in self._conn.execute(
+                    "SELECT job_id, owner_pid FROM batch_jobs WHERE status = ?",
+                    (RUNNING,),
+                )
+                if not _runs_elsewhere(row[1])
+            ]
+            self._conn.executemany(
+                "UPDATE batch_jobs SET status = 'interrupted' WHERE job_id = ?",
+                orphaned,
+            )
+
+    def create(self, job_id: str, total: int) -> None:
+        """Start a running job, evicting expired jobs first."""
+        self.sweep(headroom=1)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO batch_jobs"
+                " (job_id, status, total, started_at, accessed, owner_pid)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, RUNNING, total, _utc_now(), time.time(), os.getpid()),
+            )
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return the job's counters and mark it recently accessed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM batch_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE batch_jobs SET accessed = ? WHERE job_id = ?",
+                (time.time(), job_id),
+            )
+        job = dict(row)
+        job["id"] = job.pop("job_id")
+        del job["accessed"]
+        return job
+
+    def running_elsewhere(self, job_id: str) -> bool:
+        """Return whether another live process is still running the job."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT owner_pid FROM batch_jobs WHERE job_id = ? AND status = ?",
+                (job_id, RUNNING),
+            ).fetchone()
+        return row is not None and _runs_elsewhere(row[0])
+
+    def increment(self, job_id: str, **counters: int) -> dict[str, Any] | None:
+        """Add to the named counters; complete the job once all items are in.
+
+        Raises:
+            ValueError: If a counter name is unknown
+        """
+        unknown = set(counters) - set(_COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown job counters: {sorted(unknown)}")
+        assignments = ", ".join(f"{name} = {name} + ?" for name in counters)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            updated = self._conn.execute(
+                f"UPDATE batch_jobs SET {assignments}, accessed = ?"  # nosec B608
+                " WHERE job_id = ?",
+                (*counters.values(), time.time(), job_id),
+            ).rowcount
+            if not updated:
+                return None
+            self._conn.execute(
+                "UPDATE batch_jobs SET status = 'complete', completed_at = ?"
+                " WHERE job_id = ? AND status = ? AND completed >= total",
+                (_utc_now(), job_id, RUNNING),
+            )
+        return self.get(job_id)
+
+    def finish(self, job_id: str, status: str) -> None:
+        """Mark a job that stopped before completing all its items."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE batch_jobs SET status = ?, completed_at = ?"
+                " WHERE job_id = ? AND status = ?",
+                (status, _utc_now(), job_id, RUNNING),
+            )
+
+    def append_event(self, job_id: str, event: str, data: str) -> int:
+        """Append one SSE event and return its sequence number.
+
+        Raises:
+            KeyError: If the job does not exist
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "UPDATE batch_jobs SET event_count = event_count + 1"
+                " WHERE job_id = ? RETURNING event_count",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                raise KeyError(job_id)
+            seq = row[0] - 1
+            self._conn.execute(
+                "INSERT INTO batch_job_events (job_id, seq, event, data)"
+                " VALUES (?, ?, ?, ?)",
+                (job_id, seq, event, data),
+            )
+        return seq
+
+    def events_after(
+        self, job_id: str, seq: int, *, limit: int = 256
+    ) -> list[tuple[int, str, str]]:
+        """Return up to ``limit`` ``(seq, event, data)`` entries after ``seq``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, event, data FROM batch_job_events"
+                " WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, seq, limit),
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def sweep(self, *, max_age_seconds: float | None = None, headroom: int = 0) -> int:
+        """Evict expired finished jobs, then trim to ``max_jobs - headroom``.
+
+        Returns:
+            Number of jobs evicted
+        """
+        cutoff = time.time() - (
+            self.ttl_seconds if max_age_seconds is None else max_age_seconds
+        )
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            expired = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT job_id FROM batch_jobs WHERE status != ? AND accessed < ?",
+                    (RUNNING, cutoff),
+                )
+            ]
+            self._delete(expired)
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM batch_jobs").fetchone()
+            overflow = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT job_id FROM batch_jobs WHERE status != ?"
+                    " ORDER BY accessed LIMIT ?",
+                    (RUNNING, max(0, count - self.max_jobs + headroom)),
+                )
+            ]
+            self._delete(overflow)
+        return len(expired) + len(overflow)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, job_ids: Iterable[str]) -> None:
+        rows = [(job_id,) for job_id in job_ids]
+        self._conn.executemany("DELETE FROM batch_job_events WHERE job_id = ?", rows)
+        self._conn.executemany("DELETE FROM batch_jobs WHERE job_id = ?", rows)
+
+
+def _runs_elsewhere(pid: int | None) -> bool:
+    # A reused PID equal to ours cannot own an older job: this process
+    # records its own jobs only after opening the store.
+    if pid is None or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+__all__ = ["BatchJobStore"]
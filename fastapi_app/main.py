@@ -16,6 +16,7 @@ API Docs:
     - OpenAPI JSON: http://localhost:8000/openapi.json
 """
 
+import asyncio
 import logging
 import traceback
 import uuid
@@ -32,9 +33,12 @@ from starlette.responses import JSONResponse as StarletteJSONResponse
 
 from fastapi_app import __version__
 from fastapi_app.auth import RateLimiter
+from fastapi_app.compute import get_compute_executor
 from fastapi_app.config import get_settings
+from fastapi_app.metrics import MetricsMiddleware
 from fastapi_app.models.metadata import APIInfoResponse
 from fastapi_app.models.response import ProblemResponse, error_response
+from fastapi_app.state import get_state_backend
 from fastapi_app.routers import (
     analysis,
     building_gravity,
@@ -54,6 +58,7 @@ from fastapi_app.routers import (
     imports,
     insights,
     library_core,
+    metrics,
     optimization,
     rebar,
     staircase,
@@ -63,6 +68,7 @@ from fastapi_app.routers import (
     websocket,
     workflows,
 )
+from structural_lib import instrumentation
 
 logger = logging.getLogger(__name__)
 
@@ -346,13 +352,30 @@ app.add_middleware(AuthMiddleware)
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Global rate limiter — applies to all non-health endpoints."""
 
-    SKIP_PREFIXES = ("/health", "/docs", "/openapi.json", "/redoc", "/ws/")
+    SKIP_PREFIXES = (
+        "/health",
+        "/metrics",
+        "/docs",
+        "/openapi.json",
+        "/redoc",
+        "/ws/",
+    )
 
-    def __init__(self, app, requests_per_minute: int = 120, enabled: bool = True):
+    def __init__(
+        self,
+        app,
+        requests_per_minute: int = 120,
+        enabled: bool = True,
+        route_costs: dict[str, int] | None = None,
+    ):
         super().__init__(app)
         self.enabled = enabled
         self.limiter = RateLimiter(
-            requests_per_window=requests_per_minute, window_seconds=60
+            requests_per_window=requests_per_minute,
+            window_seconds=60,
+            backend=get_state_backend(),
+            namespace="rate_limit:global",
+            route_costs=route_costs,
         )
 
     async def dispatch(self, request: Request, call_next):
@@ -363,7 +386,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if path.startswith(self.SKIP_PREFIXES):
             return await call_next(request)
 
-        allowed, headers = self.limiter.is_allowed(request)
+        # A SQLite state backend can block on its write lock; keep that off the loop.
+        allowed, headers = await asyncio.to_thread(self.limiter.is_allowed, request)
 
         if not allowed:
             return JSONResponse(
@@ -388,6 +412,7 @@ app.add_middleware(
     RateLimitMiddleware,
     requests_per_minute=_settings.rate_limit_per_minute,
     enabled=_settings.rate_limit_enabled,
+    route_costs=_settings.rate_limit_route_costs,
 )
 
 # =============================================================================
@@ -423,6 +448,14 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(RequestIDMiddleware)
 
+# =============================================================================
+# Metrics Middleware — outermost, so rejected requests are timed too
+# =============================================================================
+
+if _settings.metrics_enabled:
+    instrumentation.enable()
+    app.add_middleware(MetricsMiddleware)
+
 # =============================================================================
 # Global Exception Handlers for structural_lib errors
 # =============================================================================
@@ -586,6 +619,7 @@ async def generic_exception_handler(request: Request, exc: Exception):
 
 # Health check first (priority routing)
 app.include_router(health.router)
+app.include_router(metrics.router)
 
 # API routers under /api/v1 prefix
 API_V1_PREFIX = "/api/v1"
@@ -732,6 +766,12 @@ async def startup_event():
             "AUTH_ENABLED=False — all endpoints are PUBLIC. "
             "Set AUTH_ENABLED=True for production."
         )
+    if settings.stream_job_sweep_interval_seconds > 0:
+        app.state.job_sweeper = asyncio.create_task(
+            streaming.job_manager.sweep_periodically(
+                settings.stream_job_sweep_interval_seconds
+            )
+        )
 
 
 @app.on_event("shutdown")
@@ -742,4 +782,7 @@ async def shutdown_event():
     Cleans up resources and connections.
     """
     # Future: Close database connections, flush caches, etc.
-    pass
+    sweeper = getattr(app.state, "job_sweeper", None)
+    if sweeper is not None:
+        sweeper.cancel()
+    get_compute_executor().shutdown(wait=False)
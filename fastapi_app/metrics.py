@@ -0,0 +1,276 @@
+"""
+Prometheus metrics for the API process.
+
+``MetricsMiddleware`` times every HTTP request and records it in a
+process-wide :class:`RequestMetrics` registry:
+
+- Latency is a fixed-bucket histogram per route and method, measured until
+  the response headers are sent. Streaming routes therefore report time to
+  first byte, not stream duration.
+- Routes are labelled by name (the handler function name), the same key
+  used for compute limits and the response cache. Requests that match no
+  route share the ``unmatched`` label, so label cardinality stays bounded.
+- Batch routes add the number of members they designed, for throughput.
+
+:func:`render_exposition` turns these, and any other metric families, into
+the Prometheus text exposition format served at ``GET /metrics``. No client
+library is needed; the format is written directly.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# Upper bounds in seconds; +Inf is implicit.
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class _RouteLatency:
+    """Histogram and status counts for one (route, method) pair."""
+
+    buckets: list[int]
+    count: int = 0
+    sum_seconds: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class MetricFamily:
+    """One metric family ready for exposition.
+
+    Attributes:
+        name: Metric name, e.g. ``structural_http_requests_total``
+        kind: ``counter``, ``gauge`` or ``histogram``
+        help: One-line description
+        samples: ``(sample name, labels, value)`` triples; the sample name
+            carries any ``_bucket``/``_sum``/``_count`` suffix
+    """
+
+    name: str
+    kind: str
+    help: str
+    samples: Sequence[tuple[str, Mapping[str, str], float]]
+
+
+class RequestMetrics:
+    """Thread-safe request latency and batch throughput registry.
+
+    Args:
+        buckets: Ascending histogram upper bounds in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], _RouteLatency] = {}
+        self._batch_members: dict[str, int] = {}
+
+    def observe(self, route: str, method: str, status: int, seconds: float) -> None:
+        """Record one finished request."""
+        status_class = f"{status // 100}xx"
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            entry = self._routes.get((route, method))
+            if entry is None:
+                entry = _RouteLatency(buckets=[0] * len(self.buckets))
+                self._routes[(route, method)] = entry
+            if index < len(self.buckets):
+                entry.buckets[index] += 1
+            entry.count += 1
+            entry.sum_seconds += seconds
+            entry.statuses[status_class] = entry.statuses.get(status_class, 0) + 1
+
+    def record_batch_members(self, endpoint: str, count: int = 1) -> None:
+        """Add ``count`` designed members to ``endpoint``'s throughput counter."""
+        with self._lock:
+            self._batch_members[endpoint] = self._batch_members.get(endpoint, 0) + count
+
+    def reset(self) -> None:
+        """Discard all recorded requests and batch counts."""
+        with self._lock:
+            self._routes.clear()
+            self._batch_members.clear()
+
+    def families(self) -> list[MetricFamily]:
+        """Return latency, request count and batch throughput families."""
+        with self._lock:
+            routes = sorted(self._routes.items())
+            latency: list[tuple[str, Mapping[str, str], float]] = []
+            requests: list[tuple[str, Mapping[str, str], float]] = []
+            for (route, method), entry in routes:
+                labels = {"route": route, "method": method}
+                cumulative = 0
+                for bound, count in zip(self.buckets, entry.buckets, strict=True):
+                    cumulative += count
+                    latency.append(
+                        (
+                            "structural_http_request_duration_seconds_bucket",
+                            {**labels, "le": _format_value(bound)},
+                            cumulative,
+                        )
+                    )
+                latency.append(
+                    (
+                        "structural_http_request_duration_seconds_bucket",
+                        {**labels, "le": "+Inf"},
+                        entry.count,
+                    )
+                )
+                latency.append(
+                    (
+                        "structural_http_request_duration_seconds_sum",
+                        labels,
+                        entry.sum_seconds,
+                    )
+                )
+                latency.append(
+                    (
+                        "structural_http_request_duration_seconds_count",
+                        labels,
+                        entry.count,
+                    )
+                )
+                for status_class, count in sorted(entry.statuses.items()):
+                    requests.append(
+                        (
+                            "structural_http_requests_total",
+                            {**labels, "status": status_class},
+                            count,
+                        )
+                    )
+            members = [
+                ("structural_batch_members_total", {"endpoint": endpoint}, count)
+                for endpoint, count in sorted(self._batch_members.items())
+            ]
+        return [
+            MetricFamily(
+                "structural_http_request_duration_seconds",
+                "histogram",
+                "Time from request start to response headers, by route.",
+                latency,
+            ),
+            MetricFamily(
+                "structural_http_requests_total",
+                "counter",
+                "Finished HTTP requests by route, method and status class.",
+                requests,
+            ),
+            MetricFamily(
+                "structural_batch_members_total",
+                "counter",
+                "Members designed by batch and streaming endpoints.",
+                members,
+            ),
+        ]
+
+
+@lru_cache
+def get_request_metrics() -> RequestMetrics:
+    """Process-wide request metrics registry."""
+
+    return RequestMetrics()
+
+
+def route_label(request: Request) -> str:
+    """Return the matched route's name, or ``unmatched``."""
+    route = request.scope.get("route")
+    return getattr(route, "name", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Record the latency and status of every HTTP request."""
+
+    async def dispatch(self, request: Request, call_next):
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            get_request_metrics().observe(
+                route_label(request),
+                request.method,
+                status,
+                time.perf_counter() - started,
+            )
+
+
+# =============================================================================
+# Text Exposition
+# =============================================================================
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def render_exposition(families: Iterable[MetricFamily]) -> str:
+    """Render ``families`` in the Prometheus text format (version 0.0.4).
+
+    Families without samples are omitted.
+    """
+    lines: list[str] = []
+    for family in families:
+        if not family.samples:
+            continue
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.kind}")
+        for sample_name, labels, value in family.samples:
+            if labels:
+                rendered = ",".join(
+                    f'{key}="{_escape(str(label))}"' for key, label in labels.items()
+                )
+                lines.append(f"{sample_name}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{sample_name} {_format_value(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "MetricFamily",
+    "MetricsMiddleware",
+    "RequestMetrics",
+    "UNMATCHED_ROUTE",
+    "get_request_metrics",
+    "render_exposition",
+    "route_label",
+]
@@ -285,6 +285,82 @@ class BuildingGeometryRequest(BaseModel):
         return self
 
 
+class BuildingIndexResponse(BaseModel):
+    """Receipt for a spatial index built over building geometry."""
+
+    index_hash: str = Field(description="SHA-256 of the canonical request")
+    member_count: int = Field(ge=1, description="Members in the index")
+    cell_size_mm: float = Field(gt=0, description="Grid cell edge (mm)")
+    occupied_cells: int = Field(ge=1, description="Grid cells holding members")
+    bounding_box: BuildingBoundingBox = Field(description="Indexed bounds")
+    cached: bool = Field(description="Whether the index was already built")
+
+
+class BuildingIndexQuery(BaseModel):
+    """One region query against a stored building index; set exactly one."""
+
+    model_config = ConfigDict(extra="forbid", allow_inf_nan=False)
+
+    box: BuildingBoundingBox | None = Field(
+        default=None, description="Members whose line touches this box (mm)"
+    )
+    near: Point3DModel | None = Field(
+        default=None, description="Members nearest this point (mm)"
+    )
+    k: int = Field(default=1, ge=1, le=1000, description="Members to return for near")
+    max_distance_mm: float | None = Field(
+        default=None, ge=0, description="Optional search radius for near (mm)"
+    )
+    frustum: list[tuple[float, float, float, float]] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=16,
+        description=(
+            "Planes (nx, ny, nz, constant), inside where n.p + constant >= 0, "
+            "as in three.js Frustum.planes"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_single_query(self) -> "BuildingIndexQuery":
+        """Require one query shape and an ordered box."""
+        given = [name for name in ("box", "near", "frustum") if getattr(self, name)]
+        if len(given) != 1:
+            raise ValueError("set exactly one of box, near or frustum")
+        box = self.box
+        if box and (
+            box.min_x > box.max_x or box.min_y > box.max_y or box.min_z > box.max_z
+        ):
+            raise ValueError("box minimum must not exceed its maximum")
+        return self
+
+    @property
+    def kind(self) -> Literal["box", "near", "frustum"]:
+        if self.box:
+            return "box"
+        return "near" if self.near else "frustum"
+
+
+class BuildingIndexQueryResponse(BaseModel):
+    """Members matched by a building index query, in input order or by distance."""
+
+    index_hash: str = Field(description="Index that answered the query")
+    query: Literal["box", "near", "frustum"] = Field(description="Query shape")
+    beams: list[BuildingBeamModel] = Field(description="Matched members")
+    distances_mm: list[float] | None = Field(
+        default=None, description="Distance per member, for near queries (mm)"
+    )
+
+
+class BuildingAdjacencyResponse(BaseModel):
+    """Member pairs whose lines come within a tolerance."""
+
+    index_hash: str = Field(description="Index that answered the query")
+    tolerance_mm: float = Field(ge=0, description="Clearance tested (mm)")
+    pair_count: int = Field(ge=0, description="Number of pairs")
+    pairs: list[tuple[str, str]] = Field(description="Member id pairs")
+
+
 # =============================================================================
 # Cross-Section Geometry Models
 # =============================================================================
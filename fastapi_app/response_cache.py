@@ -0,0 +1,347 @@
+"""
+Response cache for deterministic design routes.
+
+Design handlers are pure functions of their request and of the installed
+structural_lib code. The same beam posted twice, for example when the UI
+toggles views, should not be designed twice. ``ComputeRoute`` consults this
+cache for the routes named in ``RESPONSE_CACHE_ROUTES``:
+
+- The key is a SHA-256 over the route, method, path, sorted query string and
+  canonical JSON body. Whitespace and key order in the body do not matter.
+- Successful responses are kept in an in-memory LRU bounded by total bytes.
+  Oversized responses are served but not stored.
+- Every cached or cacheable response carries an ``ETag`` derived from its
+  body and ``Cache-Control``. A matching ``If-None-Match`` gets
+  ``304 Not Modified`` without a body.
+- Time-varying fields (``generated_at``) are re-stamped on every hit. They
+  are left out of the ``ETag``, which is then weak.
+- The cache lives in process memory only. Restarting the server, as any
+  library upgrade requires, starts with an empty cache.
+
+Per-route hit ratios are served at ``GET /health/response-cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from fastapi_app.config import get_settings
+
+_KEY_SCHEMA = "response-cache.v1"
+_CACHED_METHODS = frozenset({"GET", "POST"})
+# Headers worth replaying; everything else is per-request (request IDs, timing).
+_STORED_HEADERS = frozenset({"content-type", "content-language"})
+# JSON keys whose values record when a response was produced, not what it says.
+_TIME_VARYING_FIELDS = frozenset({"generated_at"})
+
+
+@dataclass
+class RouteCacheStats:
+    """Counters for one cached route."""
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    stores: int = 0
+    oversized: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible view including ``hit_ratio``."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with the headers needed to replay it."""
+
+    status_code: int
+    body: bytes
+    headers: tuple[tuple[str, str], ...]
+    etag: str
+
+    @property
+    def size(self) -> int:
+        """Bytes the entry counts against the cache limit."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+class ResponseCache:
+    """Byte-bounded LRU of serialized responses keyed by request hash.
+
+    Args:
+        routes: Route names (handler function names) whose responses are cached
+        max_bytes: Total body and header bytes kept before LRU eviction
+        max_entry_bytes: Largest single response that is stored
+        cache_control: ``Cache-Control`` value sent with cacheable responses
+
+    Raises:
+        ValueError: If a byte limit is negative
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[str],
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        cache_control: str = "private, no-cache",
+    ) -> None:
+        if max_bytes < 0 or max_entry_bytes < 0:
+            raise ValueError("max_bytes and max_entry_bytes must not be negative")
+        self.routes = frozenset(routes)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.cache_control = cache_control
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._stats: dict[str, RouteCacheStats] = {}
+
+    def enabled_for(self, route: str) -> bool:
+        """Return whether responses of ``route`` are cached."""
+        return route in self.routes
+
+    def key(self, route: str, method: str, path: str, query: str, body: bytes) -> str:
+        """Canonical request hash; equal JSON bodies hash equally."""
+        try:
+            canonical = json.dumps(
+                json.loads(body), separators=(",", ":"), sort_keys=True
+            ).encode("utf-8")
+        except (UnicodeDecodeError, ValueError):
+            canonical = body
+        query = "&".join(sorted(query.split("&"))) if query else ""
+        digest = hashlib.sha256()
+        for part in (_KEY_SCHEMA, route, method.upper(), path, query):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(canonical)
+        return digest.hexdigest()
+
+    def get(self, route: str, key: str) -> CachedResponse | None:
+        """Return a cached response and count the hit or miss."""
+        with self._lock:
+            stats = self._stats.setdefault(route, RouteCacheStats())
+            entry = self._entries.get(key)
+            if entry is None:
+                stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            return entry
+
+    def put(
+        self,
+        route: str,
+        key: str,
+        status_code: int,
+        body: bytes,
+        headers: Iterable[tuple[str, str]],
+    ) -> CachedResponse:
+        """Store a response if it fits and return it with its ETag."""
+        entry = CachedResponse(
+            status_code=status_code,
+            body=body,
+            headers=tuple(
+                (name, value)
+                for name, value in headers
+                if name.lower() in _STORED_HEADERS
+            ),
+            etag=_etag(body),
+        )
+        with self._lock:
+            stats = self._stats.setdefault(route, RouteCacheStats())
+            if entry.size > self.max_entry_bytes:
+                stats.oversized += 1
+                return entry
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            stats.stores += 1
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+        return entry
+
+    def record_not_modified(self, route: str) -> None:
+        """Count a 304 answered for ``route``."""
+        with self._lock:
+            self._stats.setdefault(route, RouteCacheStats()).not_modified += 1
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Occupancy and per-route counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entry_bytes": self.max_entry_bytes,
+                "evictions": self._evictions,
+                "routes": {
+                    route: stats.to_dict()
+                    for route, stats in sorted(self._stats.items())
+                },
+            }
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header names ``etag``.
+
+    Uses the weak comparison RFC 7232 prescribes for ``If-None-Match``: the
+    ``W/`` prefix is ignored on both sides and only the opaque tags compared.
+    """
+    if not if_none_match:
+        return False
+    candidates = {item.strip() for item in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    return _opaque_tag(etag) in {_opaque_tag(item) for item in candidates}
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def cached_route_handler(
+    route: str, handler: Callable[[Request], Awaitable[Response]]
+) -> Callable[[Request], Awaitable[Response]]:
+    """Wrap a route handler so the response cache answers repeated requests.
+
+    Whether ``route`` is cached is decided per request, so settings and test
+    overrides of :func:`get_response_cache` apply without rebuilding routes.
+    """
+
+    async def handle(request: Request) -> Response:
+        cache = get_response_cache()
+        if request.method not in _CACHED_METHODS or not cache.enabled_for(route):
+            return await handler(request)
+        key = cache.key(
+            route,
+            request.method,
+            request.url.path,
+            request.url.query,
+            await request.body(),
+        )
+        if_none_match = request.headers.get("if-none-match")
+        entry = cache.get(route, key)
+        if entry is not None:
+            outcome = "HIT"
+        else:
+            response = await handler(request)
+            if (
+                response.status_code != 200
+                or response.background is not None
+                or isinstance(response, StreamingResponse)
+            ):
+                return response
+            entry = cache.put(
+                route,
+                key,
+                response.status_code,
+                bytes(response.body),
+                response.headers.items(),
+            )
+            outcome = "MISS"
+            if not etag_matches(if_none_match, entry.etag):
+                response.headers["ETag"] = entry.etag
+                response.headers["Cache-Control"] = cache.cache_control
+                response.headers["X-Cache"] = outcome
+                return response
+        headers = {
+            "ETag": entry.etag,
+            "Cache-Control": cache.cache_control,
+            "X-Cache": outcome,
+        }
+        if etag_matches(if_none_match, entry.etag):
+            cache.record_not_modified(route)
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=_restamp(entry.body, datetime.now(UTC).isoformat()),
+            status_code=entry.status_code,
+            headers={**dict(entry.headers), **headers},
+        )
+
+    return handle
+
+
+def _restamp(body: bytes, stamp: str) -> bytes:
+    """Return ``body`` with every time-varying JSON field set to ``stamp``."""
+    if not any(f'"{name}"'.encode() in body for name in _TIME_VARYING_FIELDS):
+        return body
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, ValueError):
+        return body
+
+    def stamp_fields(value: Any) -> None:
+        if isinstance(value, dict):
+            for name, item in value.items():
+                if name in _TIME_VARYING_FIELDS and isinstance(item, str):
+                    value[name] = stamp
+                else:
+                    stamp_fields(item)
+        elif isinstance(value, list):
+            for item in value:
+                stamp_fields(item)
+
+    stamp_fields(payload)
+    # Same encoding as fastapi.responses.JSONResponse
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag of ``body``, or a weak one when time fields were ignored."""
+    stable = _restamp(body, "")
+    tag = f'"{hashlib.sha256(stable).hexdigest()[:32]}"'
+    return tag if stable == body else f"W/{tag}"
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Process-wide response cache, configured from settings."""
+
+    settings = get_settings()
+    return ResponseCache(
+        settings.response_cache_routes if settings.response_cache_enabled else (),
+        max_bytes=settings.response_cache_max_bytes,
+        max_entry_bytes=settings.response_cache_max_entry_bytes,
+        cache_control=settings.response_cache_control,
+    )
+
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "RouteCacheStats",
+    "cached_route_handler",
+    "etag_matches",
+    "get_response_cache",
+]
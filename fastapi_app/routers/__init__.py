@@ -20,6 +20,7 @@ from fastapi_app.routers import (
     imports,
     insights,
     library_core,
+    metrics,
     optimization,
     rebar,
     staircase,
@@ -46,6 +47,7 @@ __all__ = [
     "imports",
     "insights",
     "library_core",
+    "metrics",
     "optimization",
     "rebar",
     "staircase",
@@ -9,6 +9,7 @@ import logging
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.analysis import (
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/analysis",
     tags=["analysis"],
+    route_class=ComputeRoute,
 )
 
 
@@ -44,7 +46,7 @@ router = APIRouter(
     description="Compute BMD and SFD for a beam with UDL and/or point loads. "
     "Returns discretized diagrams + critical points (max moment, max shear).",
 )
-async def analyze_loads(request: LoadAnalysisRequest):
+def analyze_loads(request: LoadAnalysisRequest):
     """Compute bending moment and shear force diagrams.
 
     Supports simply supported and cantilever beams with UDL / point loads.
@@ -130,7 +132,7 @@ async def analyze_loads(request: LoadAnalysisRequest):
     summary="Smart Beam Analysis",
     description="Get AI-assisted analysis with suggestions for beam design.",
 )
-async def smart_analyze_beam(
+def smart_analyze_beam(
     request: SmartAnalysisRequest,
 ):
     """
@@ -291,7 +293,7 @@ async def smart_analyze_beam(
     summary="Get Code Clause References",
     description="Get IS 456 clause references for common checks.",
 )
-async def get_code_clauses():
+def get_code_clauses():
     """
     Get IS 456:2000 code clause references.
 
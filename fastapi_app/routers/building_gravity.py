@@ -6,8 +6,8 @@ import logging
 
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
-from starlette.concurrency import run_in_threadpool
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from structural_lib.services.gravity_calculation_book import (
@@ -20,7 +20,9 @@ from structural_lib.services.gravity_workflow import GravityWorkflowRequestV1
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/building-gravity/v1", tags=["building-gravity"])
+router = APIRouter(
+    prefix="/building-gravity/v1", tags=["building-gravity"], route_class=ComputeRoute
+)
 
 
 @router.get(
@@ -28,7 +30,7 @@ router = APIRouter(prefix="/building-gravity/v1", tags=["building-gravity"])
     response_model=APIResponse[GravityWorkflowDefinitionV1],
     summary="Discover the bounded Building Gravity Workflow V1 contract",
 )
-async def get_building_gravity_definition_v1():
+def get_building_gravity_definition_v1():
     return success_response(get_gravity_workflow_definition_v1())
 
 
@@ -37,11 +39,11 @@ async def get_building_gravity_definition_v1():
     response_model=APIResponse[GravityWorkflowRunBundleV1],
     summary="Run the bounded one-storey dead/live gravity workflow",
 )
-async def run_building_gravity_v1(request: GravityWorkflowRequestV1):
+def run_building_gravity_v1(request: GravityWorkflowRequestV1):
     """Validate one accepted model/load identity and return its review dossier."""
 
     try:
-        bundle = await run_in_threadpool(run_gravity_workflow_with_book_v1, request)
+        bundle = run_gravity_workflow_with_book_v1(request)
         return success_response(bundle)
     except (TypeError, ValueError) as exc:
         return JSONResponse(
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.models.capabilities import IS456CapabilityDocumentModel
 from fastapi_app.models.response import APIResponse, success_response
 
-router = APIRouter(prefix="/library", tags=["library"])
+router = APIRouter(prefix="/library", tags=["library"], route_class=ComputeRoute)
 
 
 @router.get(
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/library", tags=["library"])
     response_model=APIResponse[IS456CapabilityDocumentModel],
     summary="Discover supported and held IS 456 capabilities",
 )
-async def get_library_capabilities():
+def get_library_capabilities():
     """Return the same canonical document exposed by Python and the CLI."""
     from structural_lib.services.api import get_supported_is456_capability_document
 
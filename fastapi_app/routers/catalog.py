@@ -7,10 +7,11 @@ import hashlib
 from fastapi import APIRouter, Query, Response
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import LocalComputeRoute
 from fastapi_app.models.catalog import WorkflowCatalogDocumentModel
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
-router = APIRouter(prefix="/catalog", tags=["catalog"])
+router = APIRouter(prefix="/catalog", tags=["catalog"], route_class=LocalComputeRoute)
 
 
 @router.get(
@@ -18,7 +19,7 @@ router = APIRouter(prefix="/catalog", tags=["catalog"])
     response_model=APIResponse[WorkflowCatalogDocumentModel],
     summary="Discover approved application workflows",
 )
-async def get_workflow_catalog(
+def get_workflow_catalog(
     response: Response,
     version: str | None = Query(default=None),
 ):
@@ -11,6 +11,7 @@ from dataclasses import asdict
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_float
 from fastapi_app.models.column import (
     AdditionalMomentRequest,
@@ -48,6 +49,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/design/column",
     tags=["column"],
+    route_class=ComputeRoute,
 )
 
 
@@ -66,7 +68,7 @@ router = APIRouter(
         "for seven standard end-condition cases."
     ),
 )
-async def calculate_effective_length(
+def calculate_effective_length(
     request: EffectiveLengthRequest,
 ):
     """
@@ -116,7 +118,7 @@ async def calculate_effective_length(
         "le/D per IS 456:2000 Cl. 25.1.2. Short columns have le/D < 12."
     ),
 )
-async def classify_column(request: ColumnClassifyRequest):
+def classify_column(request: ColumnClassifyRequest):
     """
     Classify a column as short or slender.
 
@@ -163,7 +165,7 @@ async def classify_column(request: ColumnClassifyRequest):
         "Cl. 25.4: e_min = max(l/500 + D/30, 20 mm)."
     ),
 )
-async def column_eccentricity(
+def column_eccentricity(
     request: ColumnEccentricityRequest,
 ):
     """
@@ -209,7 +211,7 @@ async def column_eccentricity(
         "Pu = 0.4·fck·Ac + 0.67·fy·Asc."
     ),
 )
-async def column_axial_capacity(
+def column_axial_capacity(
     request: ColumnAxialRequest,
 ):
     """
@@ -271,7 +273,7 @@ async def column_axial_capacity(
         "(Pu, Mu) lies within it."
     ),
 )
-async def design_column_uniaxial(
+def design_column_uniaxial(
     request: ColumnUniaxialRequest,
 ):
     """
@@ -344,7 +346,7 @@ async def design_column_uniaxial(
         "key points (pure axial, balanced, pure bending)."
     ),
 )
-async def pm_interaction_curve(
+def pm_interaction_curve(
     request: PMInteractionRequest,
 ):
     """
@@ -409,7 +411,7 @@ async def pm_interaction_curve(
         "ratio (Mux/Mux1)^αn + (Muy/Muy1)^αn and safety status."
     ),
 )
-async def biaxial_check(
+def biaxial_check(
     request: BiaxialCheckRequest,
 ):
     """
@@ -479,7 +481,7 @@ async def biaxial_check(
         "per Cl 39.7.1.1."
     ),
 )
-async def additional_moment(request: AdditionalMomentRequest):
+def additional_moment(request: AdditionalMomentRequest):
     """Calculate additional moment for slender columns."""
     try:
         from structural_lib.services.api import calculate_additional_moment_is456
@@ -522,7 +524,7 @@ async def additional_moment(request: AdditionalMomentRequest):
         "k-factor reduction, and checks biaxial interaction."
     ),
 )
-async def design_long_column(request: LongColumnRequest):
+def design_long_column(request: LongColumnRequest):
     """
     Design a long (slender) column per IS 456 Cl 39.7.
 
@@ -578,7 +580,7 @@ async def design_long_column(request: LongColumnRequest):
         "per IS 456 Cl 39.4."
     ),
 )
-async def helical_check(request: HelicalCheckRequest):
+def helical_check(request: HelicalCheckRequest):
     """
     Check helical reinforcement per IS 456 Cl 39.4.
 
@@ -623,7 +625,7 @@ async def helical_check(request: HelicalCheckRequest):
         "bending capacity per the appropriate IS 456 clause."
     ),
 )
-async def design_column(request: ColumnDesignRequest):
+def design_column(request: ColumnDesignRequest):
     """
     Unified column design per IS 456.
 
@@ -692,7 +694,7 @@ async def design_column(request: ColumnDesignRequest):
         "reinforcement spacing, confinement zone length, and confining bar area."
     ),
 )
-async def column_ductile_detailing(request: ColumnDuctileDetailingRequest):
+def column_ductile_detailing(request: ColumnDuctileDetailingRequest):
     """Check column ductile detailing per IS 13920:2016 Cl 7."""
     try:
         from structural_lib import check_column_ductility_is13920
@@ -723,7 +725,7 @@ async def column_ductile_detailing(request: ColumnDuctileDetailingRequest):
         "requirements for a column section per IS 456:2000 Cl. 26.5.3."
     ),
 )
-async def column_detailing(
+def column_detailing(
     request: ColumnDetailingRequest,
 ):
     """
@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.combined_footing_api as combined_footing_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.combined_footing import (
     SymmetricCombinedFootingRequest,
@@ -16,7 +17,11 @@ from fastapi_app.models.combined_footing import (
 )
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
-router = APIRouter(prefix="/design/combined-footing", tags=["combined-footing"])
+router = APIRouter(
+    prefix="/design/combined-footing",
+    tags=["combined-footing"],
+    route_class=ComputeRoute,
+)
 
 
 def _service_input(
@@ -32,7 +37,7 @@ def _service_input(
     response_model=APIResponse[SymmetricCombinedFootingResponse],
     summary="Design a bounded symmetric two-column combined footing",
 )
-async def design_symmetric_combined_footing(
+def design_symmetric_combined_footing(
     request: SymmetricCombinedFootingRequest,
 ):
     """Validate transport input and delegate every calculation to the service."""
@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.deep_beam_api as deep_beam_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.deep_beam import (
     SimplySupportedDeepBeamRequest,
@@ -16,7 +17,9 @@ from fastapi_app.models.deep_beam import (
 )
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
-router = APIRouter(prefix="/design/deep-beam", tags=["deep-beam"])
+router = APIRouter(
+    prefix="/design/deep-beam", tags=["deep-beam"], route_class=ComputeRoute
+)
 
 
 def _side_face_payload(result: Any) -> dict[str, object]:
@@ -93,7 +96,7 @@ def _result_payload(
     response_model=APIResponse[SimplySupportedDeepBeamResponse],
     summary="Check a bounded Clause 29 simply supported deep beam",
 )
-async def design_simply_supported_deep_beam(
+def design_simply_supported_deep_beam(
     request: SimplySupportedDeepBeamRequest,
 ):
     """Validate transport input and delegate all calculation to the service."""
@@ -9,6 +9,7 @@ import logging
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import (
     sanitize_error,
     sanitize_error_string,
@@ -63,6 +64,7 @@ _sanitize_float = sanitize_float
 router = APIRouter(
     prefix="/design",
     tags=["design"],
+    route_class=ComputeRoute,
 )
 
 
@@ -80,7 +82,7 @@ router = APIRouter(
         "shear, and optional torsion."
     ),
 )
-async def design_beam(request: BeamDesignRequest):
+def design_beam(request: BeamDesignRequest):
     """
     Design a rectangular beam section for flexure, shear, and optional torsion.
 
@@ -371,7 +373,7 @@ async def design_beam(request: BeamDesignRequest):
     summary="Check Beam Adequacy",
     description="Check if a beam with given reinforcement is adequate for the applied loads.",
 )
-async def check_beam(request: BeamCheckRequest):
+def check_beam(request: BeamCheckRequest):
     """
     Check adequacy of a beam section with provided reinforcement.
 
@@ -484,7 +486,7 @@ async def check_beam(request: BeamCheckRequest):
     summary="Get Design Limits",
     description="Get IS 456 design limits and constraints.",
 )
-async def get_design_limits():
+def get_design_limits():
     """
     Get IS 456 design limits and typical values.
 
@@ -545,7 +547,7 @@ async def get_design_limits():
     summary="Design Beam for Torsion",
     description="Design a beam for combined torsion, shear, and bending per IS 456 Cl 41.",
 )
-async def design_beam_torsion(
+def design_beam_torsion(
     request: TorsionDesignRequest,
 ):
     """
@@ -650,7 +652,7 @@ async def design_beam_torsion(
         "of the face of support."
     ),
 )
-async def enhanced_shear(
+def enhanced_shear(
     request: EnhancedShearRequest,
 ):
     """
@@ -731,7 +733,7 @@ async def enhanced_shear(
         "and confinement spacing (Cl 6.3.5)."
     ),
 )
-async def check_ductility(
+def check_ductility(
     request: DuctilityCheckRequest,
 ):
     """Check beam ductility per IS 13920 for seismic design."""
@@ -798,7 +800,7 @@ async def check_ductility(
         "Verifies slenderness ratio l_eff/b against code limits."
     ),
 )
-async def check_slenderness(
+def check_slenderness(
     request: SlendernessCheckRequest,
 ):
     """Check beam slenderness / lateral stability per IS 456 Cl 23.3."""
@@ -865,7 +867,7 @@ async def check_slenderness(
         "Compares actual L/d against allowable ratios with modification factors."
     ),
 )
-async def check_deflection(
+def check_deflection(
     request: DeflectionCheckRequest,
 ):
     """Check deflection via span/depth ratio per IS 456 Cl 23.2."""
@@ -930,7 +932,7 @@ async def check_deflection(
         "Computes estimated crack width and compares against exposure-class limits."
     ),
 )
-async def check_crack_width_endpoint(
+def check_crack_width_endpoint(
     request: CrackWidthCheckRequest,
 ):
     """Check crack width per IS 456 Annex F."""
@@ -998,7 +1000,7 @@ async def check_crack_width_endpoint(
         "and identifies the governing case."
     ),
 )
-async def compliance_report(
+def compliance_report(
     request: ComplianceReportRequest,
 ):
     """Run multi-case IS 456 compliance report."""
@@ -9,6 +9,7 @@ import logging
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.beam import (
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/detailing",
     tags=["detailing"],
+    route_class=ComputeRoute,
 )
 
 
@@ -43,7 +45,7 @@ router = APIRouter(
     summary="Detail Beam Reinforcement",
     description="Generate reinforcement detailing for a beam section.",
 )
-async def detail_beam(request: BeamDetailingRequest):
+def detail_beam(request: BeamDetailingRequest):
     """
     Generate reinforcement detailing for a beam.
 
@@ -226,7 +228,7 @@ async def detail_beam(request: BeamDetailingRequest):
     summary="Get Standard Bar Areas",
     description="Get cross-sectional areas for standard reinforcement bars.",
 )
-async def get_bar_areas():
+def get_bar_areas():
     """
     Get standard reinforcement bar areas.
 
@@ -259,7 +261,7 @@ async def get_bar_areas():
     summary="Calculate Development Length",
     description="Calculate development length for a specific bar diameter.",
 )
-async def calculate_development_length(
+def calculate_development_length(
     bar_diameter: int,
     fck: float = 25.0,
     fy: float = 500.0,
@@ -358,7 +360,7 @@ async def calculate_development_length(
         "Verifies that development length is adequate beyond the face of support."
     ),
 )
-async def check_anchorage(
+def check_anchorage(
     request: AnchorageCheckRequest,
 ):
     """Check anchorage of bottom bars at simple supports per IS 456 Cl 26.2.3.3."""
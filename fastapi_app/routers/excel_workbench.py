@@ -7,8 +7,8 @@ import hashlib
 
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse, Response
-from starlette.concurrency import run_in_threadpool
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from structural_lib.services.excel_workbench import (
@@ -32,7 +32,9 @@ from structural_lib.services.excel_workbench import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/excel-workbench/v1", tags=["excel-workbench"])
+router = APIRouter(
+    prefix="/excel-workbench/v1", tags=["excel-workbench"], route_class=ComputeRoute
+)
 
 
 @router.get(
@@ -40,7 +42,7 @@ router = APIRouter(prefix="/excel-workbench/v1", tags=["excel-workbench"])
     response_model=APIResponse[ExcelWorkbenchDefinitionV1],
     summary="Discover the bounded Excel Routine Workbench V1 contract",
 )
-async def get_excel_workbench_definition():
+def get_excel_workbench_definition():
     return success_response(get_excel_workbench_definition_v1())
 
 
@@ -49,7 +51,7 @@ async def get_excel_workbench_definition():
     response_model=APIResponse[ExcelMappingPreviewV1],
     summary="Preview and hash the selected Excel table mapping",
 )
-async def preview_excel_workbook_mapping(request: ExcelWorkbookPreviewRequestV1):
+def preview_excel_workbook_mapping(request: ExcelWorkbookPreviewRequestV1):
     return success_response(build_excel_mapping_preview_v1(request))
 
 
@@ -58,9 +60,9 @@ async def preview_excel_workbook_mapping(request: ExcelWorkbookPreviewRequestV1)
     response_model=APIResponse[ExcelWorkbookRunResultV1],
     summary="Run a reviewed selected-table rectangular-beam batch",
 )
-async def run_excel_workbook(request: ExcelWorkbookRunRequestV1):
+def run_excel_workbook(request: ExcelWorkbookRunRequestV1):
     try:
-        result = await run_in_threadpool(run_excel_workbook_v1, request)
+        result = run_excel_workbook_v1(request)
         return success_response(result)
     except (TypeError, ValueError) as exc:
         return JSONResponse(
@@ -80,7 +82,7 @@ async def run_excel_workbook(request: ExcelWorkbookRunRequestV1):
     response_model=APIResponse[ExcelFreshnessCheckV1],
     summary="Compare retained Excel evidence with the current selected table",
 )
-async def check_excel_workbook_freshness(request: ExcelFreshnessRequestV1):
+def check_excel_workbook_freshness(request: ExcelFreshnessRequestV1):
     return success_response(check_excel_workbook_freshness_v1(request))
 
 
@@ -89,9 +91,9 @@ async def check_excel_workbook_freshness(request: ExcelFreshnessRequestV1):
     response_model=ExcelReviewBundleV1,
     summary="Export complete current Excel evidence for qualified review",
 )
-async def export_excel_review_bundle(request: ExcelReviewBundleExportRequestV1):
+def export_excel_review_bundle(request: ExcelReviewBundleExportRequestV1):
     try:
-        bundle = await run_in_threadpool(build_excel_review_bundle_v1, request)
+        bundle = build_excel_review_bundle_v1(request)
         payload = serialize_excel_review_bundle_v1(bundle)
         file_sha256 = hashlib.sha256(payload).hexdigest()
         result_hash = bundle.result.bundle_hash
@@ -15,6 +15,7 @@ from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, model_validator
 
+from fastapi_app.compute import LocalComputeRoute
 from fastapi_app.models.beam import BeamCrackWidthParams
 
 
@@ -36,6 +37,7 @@ def sanitize_filename(name: str) -> str:
 router = APIRouter(
     prefix="/export",
     tags=["export"],
+    route_class=LocalComputeRoute,
 )
 
 
@@ -211,7 +213,7 @@ def _run_detailing(req: ExportBeamRequest):
     description="Generate BBS from beam parameters and return as CSV download.",
     response_class=StreamingResponse,
 )
-async def export_bbs(request: ExportBeamRequest):
+def export_bbs(request: ExportBeamRequest):
     """Generate and download a Bar Bending Schedule as CSV."""
     try:
         from structural_lib.services.bbs import (
@@ -265,7 +267,7 @@ async def export_bbs(request: ExportBeamRequest):
     description="Generate beam DXF drawing and return as download.",
     response_class=StreamingResponse,
 )
-async def export_dxf(request: ExportBeamRequest):
+def export_dxf(request: ExportBeamRequest):
     """Generate and download a DXF drawing of the beam."""
     try:
         from structural_lib.services.dxf_export import quick_dxf_bytes
@@ -302,7 +304,7 @@ async def export_dxf(request: ExportBeamRequest):
     description="Generate a design report in HTML or JSON format.",
     response_class=StreamingResponse,
 )
-async def export_report(request: ExportReportRequest):
+def export_report(request: ExportReportRequest):
     """Generate and download a design report."""
     try:
         from structural_lib.services.api import design_beam_is456
@@ -578,7 +580,7 @@ class BatchExportRequest(BaseModel):
     description="Generate a summary report for all beams in a building (HTML, PDF, or CSV).",
     response_class=StreamingResponse,
 )
-async def export_building_summary(request: BatchExportRequest):
+def export_building_summary(request: BatchExportRequest):
     """Generate and download a building-level summary report."""
 
     beams = request.beams
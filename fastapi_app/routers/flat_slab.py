@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.flat_slab_api as flat_slab_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.flat_slab import (
     RegularInteriorFlatSlabRequest,
@@ -16,7 +17,9 @@ from fastapi_app.models.flat_slab import (
 )
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
-router = APIRouter(prefix="/design/flat-slab", tags=["flat-slab"])
+router = APIRouter(
+    prefix="/design/flat-slab", tags=["flat-slab"], route_class=ComputeRoute
+)
 
 
 def _service_input(
@@ -114,7 +117,7 @@ def _result_payload(
     response_model=APIResponse[RegularInteriorFlatSlabResponse],
     summary="Design a bounded regular interior flat-slab panel",
 )
-async def design_regular_interior_flat_slab(
+def design_regular_interior_flat_slab(
     request: RegularInteriorFlatSlabRequest,
 ):
     """Validate transport input and delegate every calculation to the service."""
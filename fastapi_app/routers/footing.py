@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.footing_api as footing_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.footing import (
     ConcentricIsolatedFootingRequest,
@@ -16,7 +17,7 @@ from fastapi_app.models.footing import (
 )
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
-router = APIRouter(prefix="/design/footing", tags=["footing"])
+router = APIRouter(prefix="/design/footing", tags=["footing"], route_class=ComputeRoute)
 
 
 @router.post(
@@ -24,7 +25,7 @@ router = APIRouter(prefix="/design/footing", tags=["footing"])
     response_model=APIResponse[ConcentricIsolatedFootingResponse],
     summary="Design a bounded concentric isolated footing",
 )
-async def design_concentric_isolated_footing(
+def design_concentric_isolated_footing(
     request: ConcentricIsolatedFootingRequest,
 ):
     """Validate transport inputs and delegate all calculation to the service."""
@@ -5,11 +5,19 @@ Endpoints for geometry generation for visualization.
 Uses structural_lib.visualization.geometry_3d for accurate calculations.
 """
 
+import hashlib
+import json
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Literal
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute, LocalComputeRoute
+from fastapi_app.config import get_settings
 from fastapi_app.error_utils import sanitize_error
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.geometry import (
@@ -28,6 +36,10 @@ from fastapi_app.models.geometry import (
     BuildingGeometryRequest,
     BuildingGeometryResponse,
     BuildingBeamModel,
+    BuildingAdjacencyResponse,
+    BuildingIndexQuery,
+    BuildingIndexQueryResponse,
+    BuildingIndexResponse,
     CrossSectionRequest,
     CrossSectionResponse,
 )
@@ -38,6 +50,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/geometry",
     tags=["geometry"],
+    route_class=ComputeRoute,
 )
 
 
@@ -52,7 +65,7 @@ router = APIRouter(
     summary="Generate 3D Beam Geometry",
     description="Generate 3D mesh geometry for beam visualization.",
 )
-async def generate_beam_geometry(
+def generate_beam_geometry(
     request: Geometry3DRequest,
 ):
     """
@@ -261,7 +274,7 @@ This endpoint returns rich geometry data including:
 Ideal for React Three Fiber rendering with cylinder/tube primitives.
 """,
 )
-async def generate_full_beam_geometry(
+def generate_full_beam_geometry(
     request: BeamGeometryRequest,
 ):
     """
@@ -393,7 +406,7 @@ async def generate_full_beam_geometry(
     summary="Get Material Appearance",
     description="Get material colors and properties for visualization.",
 )
-async def get_materials():
+def get_materials():
     """
     Get standard material appearances for visualization.
 
@@ -434,6 +447,9 @@ async def get_materials():
 # =============================================================================
 
 
+PACKED_MEDIA_TYPE = "application/octet-stream"
+
+
 @router.post(
     "/building",
     response_model=APIResponse[BuildingGeometryResponse],
@@ -443,41 +459,47 @@ Generate 3D line geometry for a multi-beam building view.
 
 Returns line segments for all beams/columns suitable for instanced rendering.
 Ideal for React Three Fiber with LineSegments or Tubes.
+
+With `format=packed` or `Accept: application/octet-stream` the geometry is
+returned as a binary payload instead: a JSON header (member ids, stories,
+bounds, metadata) followed by Float32 positions, Uint32 line indices and
+per-member frame-type and story codes, ready for a three.js BufferGeometry.
+See `structural_lib.visualization.packed_geometry` for the layout.
 """,
+    responses={
+        200: {
+            "content": {
+                PACKED_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}
+            }
+        }
+    },
 )
-async def generate_building_geometry(
+def generate_building_geometry(
     request: BuildingGeometryRequest,
+    output_format: Literal["json", "packed"] = Query(
+        "json", alias="format", description="json, or packed binary buffers"
+    ),
+    accept: str | None = Header(None),
 ):
     """
     Generate building-level 3D geometry for visualization.
 
     Uses structural_lib.visualization.geometry_3d.building_to_3d_geometry()
-    to compute line geometry for all structural members.
+    to compute line geometry for all structural members, or
+    structural_lib.visualization.packed_geometry.pack_building_geometry()
+    for the packed binary format.
     """
+    packed = output_format == "packed" or PACKED_MEDIA_TYPE in (accept or "")
     try:
-        from structural_lib.services.api import BeamGeometry, FrameType
-
-        # Pydantic validates every member before this route runs. Conversion is
-        # therefore all-or-nothing: no member can disappear through a skip.
-        beam_objects = [
-            BeamGeometry(
-                id=beam.id,
-                label=beam.label,
-                story=beam.story,
-                frame_type=FrameType(beam.frame_type),
-                point1=beam.point1.model_dump(),
-                point2=beam.point2.model_dump(),
-                section=beam.section.model_dump(),
-            )
-            for beam in request.beams
-        ]
+        beam_objects = _beam_objects(request)
+
+        # Generate geometry
+        include_types = _include_types(request)
+        if packed:
+            return _packed_building_geometry(request, beam_objects, include_types)
 
         from structural_lib.visualization.geometry_3d import building_to_3d_geometry
 
-        # Generate geometry
-        include_types = (
-            tuple(request.include_frame_types) if request.include_frame_types else None
-        )
         geometry = building_to_3d_geometry(
             beam_objects,
             unit_scale=request.unit_scale,
@@ -496,15 +518,7 @@ async def generate_building_geometry(
             for b in geometry.beams
         ]
 
-        metadata = {
-            "contract_scope": "visualization_only",
-            "source_coordinate_basis": "source_units",
-            "output_coordinate_units": "mm",
-            "coordinate_scale_to_mm": request.unit_scale,
-            "input_member_count": len(request.beams),
-            "output_member_count": len(beam_models),
-            "filtered_member_count": len(request.beams) - len(beam_models),
-        }
+        metadata = _building_metadata(request, len(beam_models))
 
         return success_response(
             BuildingGeometryResponse(
@@ -540,6 +554,262 @@ async def generate_building_geometry(
         )
 
 
+def _beam_objects(request: BuildingGeometryRequest) -> list:
+    """Library BeamGeometry per validated request member."""
+    from structural_lib.services.api import BeamGeometry, FrameType
+
+    # Pydantic validates every member before this route runs. Conversion is
+    # therefore all-or-nothing: no member can disappear through a skip.
+    return [
+        BeamGeometry(
+            id=beam.id,
+            label=beam.label,
+            story=beam.story,
+            frame_type=FrameType(beam.frame_type),
+            point1=beam.point1.model_dump(),
+            point2=beam.point2.model_dump(),
+            section=beam.section.model_dump(),
+        )
+        for beam in request.beams
+    ]
+
+
+def _include_types(request: BuildingGeometryRequest) -> tuple[str, ...] | None:
+    return tuple(request.include_frame_types) if request.include_frame_types else None
+
+
+def _building_metadata(request: BuildingGeometryRequest, output_count: int) -> dict:
+    """Coordinate-conversion receipt shared by the JSON and packed formats."""
+    return {
+        "contract_scope": "visualization_only",
+        "source_coordinate_basis": "source_units",
+        "output_coordinate_units": "mm",
+        "coordinate_scale_to_mm": request.unit_scale,
+        "input_member_count": len(request.beams),
+        "output_member_count": output_count,
+        "filtered_member_count": len(request.beams) - output_count,
+    }
+
+
+def _packed_building_geometry(
+    request: BuildingGeometryRequest,
+    beam_objects: list,
+    include_types: tuple[str, ...] | None,
+) -> Response:
+    """Binary response for ``format=packed``; skips per-member response models."""
+    from structural_lib.visualization.packed_geometry import pack_building_geometry
+
+    geometry = pack_building_geometry(
+        beam_objects,
+        unit_scale=request.unit_scale,
+        include_frame_types=include_types,
+    )
+    geometry.metadata = _building_metadata(request, geometry.member_count)
+    return Response(geometry.to_bytes(), media_type=PACKED_MEDIA_TYPE)
+
+
+# =============================================================================
+# Building Spatial Index Endpoints
+# =============================================================================
+
+# Index routes read and write the process-local store, so they stay on the
+# thread pool even when the compute executor uses processes.
+index_router = APIRouter(route_class=LocalComputeRoute)
+
+
+class BuildingIndexStore:
+    """Bounded LRU of building spatial indexes keyed by request hash.
+
+    A viewer posts its building once, then issues many box, nearest and
+    frustum queries against the stored index while the camera moves.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, index_hash: str, index: object) -> None:
+        with self._lock:
+            self._entries[index_hash] = index
+            self._entries.move_to_end(index_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, index_hash: str):
+        with self._lock:
+            index = self._entries.get(index_hash)
+            if index is not None:
+                self._entries.move_to_end(index_hash)
+            return index
+
+
+@lru_cache(maxsize=1)
+def get_building_index_store() -> BuildingIndexStore:
+    """Process-wide store of building spatial indexes, sized from settings."""
+
+    return BuildingIndexStore(get_settings().geometry_index_store_entries)
+
+
+def _request_hash(request: BuildingGeometryRequest) -> str:
+    """SHA-256 of the canonical request JSON; same building, same hash."""
+    canonical = json.dumps(
+        request.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _stored_index(index_hash: str):
+    index = get_building_index_store().get(index_hash)
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Building index not found; re-post the building to /geometry/building/index",
+        )
+    return index
+
+
+def _member_model(member) -> BuildingBeamModel:
+    return BuildingBeamModel(
+        beam_id=member.member_id,
+        story=member.story,
+        frame_type=member.frame_type,
+        start=Point3DModel(x=member.start[0], y=member.start[1], z=member.start[2]),
+        end=Point3DModel(x=member.end[0], y=member.end[1], z=member.end[2]),
+    )
+
+
+@index_router.post(
+    "/building/index",
+    response_model=APIResponse[BuildingIndexResponse],
+    summary="Build Building Spatial Index",
+    description="""
+Build a uniform-grid spatial index over a building's member lines.
+
+The index is kept in this process under the SHA-256 of the canonical request,
+so posting the same building again returns the stored index. Query it with
+`/geometry/building/index/{index_hash}/query` and
+`/geometry/building/index/{index_hash}/adjacency`; a 404 from those means the
+index was evicted and the building should be posted again.
+""",
+)
+def build_building_index(request: BuildingGeometryRequest):
+    """Index building geometry for region, nearest and frustum queries."""
+    index_hash = _request_hash(request)
+    store = get_building_index_store()
+    index = store.get(index_hash)
+    cached = index is not None
+    try:
+        if index is None:
+            from structural_lib.visualization.geometry_3d import (
+                building_to_3d_geometry,
+            )
+            from structural_lib.visualization.spatial_index import (
+                MemberSpatialIndex,
+            )
+
+            geometry = building_to_3d_geometry(
+                _beam_objects(request),
+                unit_scale=request.unit_scale,
+                include_frame_types=_include_types(request),
+            )
+            index = MemberSpatialIndex.from_building(geometry)
+            store.put(index_hash, index)
+    except ValueError as e:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=error_response(sanitize_error(e, "building index")),
+        )
+
+    return success_response(
+        BuildingIndexResponse(
+            index_hash=index_hash,
+            member_count=len(index),
+            cell_size_mm=index.cell_size,
+            occupied_cells=index.cell_count,
+            bounding_box={
+                f"{bound}_{axis}": round(values[i], 3)
+                for i, axis in enumerate("xyz")
+                for bound, values in (("min", index.lower), ("max", index.upper))
+            },
+            cached=cached,
+        )
+    )
+
+
+@index_router.post(
+    "/building/index/{index_hash}/query",
+    response_model=APIResponse[BuildingIndexQueryResponse],
+    summary="Query Building Spatial Index",
+    description=(
+        "Return the members whose line touches a box, the k members nearest a "
+        "point, or the members not wholly outside a camera frustum."
+    ),
+)
+def query_building_index(index_hash: str, query: BuildingIndexQuery):
+    """Answer one region query from a stored building index."""
+    index = _stored_index(index_hash)
+    distances = None
+    if query.box:
+        box = query.box
+        positions = index.query_box(
+            (box.min_x, box.min_y, box.min_z), (box.max_x, box.max_y, box.max_z)
+        )
+    elif query.near:
+        point = query.near
+        ranked = index.nearest(
+            (point.x, point.y, point.z),
+            k=query.k,
+            max_distance=query.max_distance_mm,
+        )
+        positions = [position for position, _ in ranked]
+        distances = [round(distance, 3) for _, distance in ranked]
+    else:
+        positions = index.query_frustum(query.frustum)
+
+    return success_response(
+        BuildingIndexQueryResponse(
+            index_hash=index_hash,
+            query=query.kind,
+            beams=[_member_model(index.members[position]) for position in positions],
+            distances_mm=distances,
+        )
+    )
+
+
+@index_router.get(
+    "/building/index/{index_hash}/adjacency",
+    response_model=APIResponse[BuildingAdjacencyResponse],
+    summary="Find Adjacent Building Members",
+    description=(
+        "List member pairs whose lines come within tolerance_mm: members that "
+        "share a joint at zero tolerance, and near misses or clashes above it. "
+        "Only members sharing grid cells are compared."
+    ),
+)
+def get_building_adjacency(
+    index_hash: str,
+    tolerance_mm: float = Query(0.0, ge=0, le=10_000, description="Clearance (mm)"),
+):
+    """Member pairs within a clearance, from a stored building index."""
+    index = _stored_index(index_hash)
+    pairs = [
+        (index.members[a].member_id, index.members[b].member_id)
+        for a, b in index.adjacent_pairs(tolerance_mm)
+    ]
+    return success_response(
+        BuildingAdjacencyResponse(
+            index_hash=index_hash,
+            tolerance_mm=tolerance_mm,
+            pair_count=len(pairs),
+            pairs=pairs,
+        )
+    )
+
+
+router.include_router(index_router)
+
+
 # =============================================================================
 # Cross-Section Geometry Endpoints
 # =============================================================================
@@ -556,7 +826,7 @@ Returns outline, rebar positions, and stirrup path for visualization.
 Ideal for React SVG or Canvas 2D rendering.
 """,
 )
-async def generate_cross_section_geometry(
+def generate_cross_section_geometry(
     request: CrossSectionRequest,
 ):
     """
@@ -17,6 +17,8 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from fastapi_app import __version__
+from fastapi_app.compute import get_compute_executor
+from fastapi_app.response_cache import get_response_cache
 
 router = APIRouter(
     prefix="/health",
@@ -58,6 +60,58 @@ class SystemInfo(BaseModel):
     )
 
 
+class RouteComputeMetrics(BaseModel):
+    """Queue and compute timings for one route on the compute executor."""
+
+    submitted: int = Field(description="Calls admitted to the executor", ge=0)
+    completed: int = Field(description="Calls that returned normally", ge=0)
+    failed: int = Field(description="Calls that raised or were cancelled", ge=0)
+    rejected: int = Field(description="Calls refused with 503", ge=0)
+    pending: int = Field(description="Calls running or queued now", ge=0)
+    queue_ms_total: float = Field(description="Total time spent queued (ms)")
+    queue_ms_max: float = Field(description="Longest time spent queued (ms)")
+    queue_ms_mean: float = Field(description="Mean time spent queued (ms)")
+    compute_ms_total: float = Field(description="Total time computing (ms)")
+    compute_ms_max: float = Field(description="Longest single computation (ms)")
+    compute_ms_mean: float = Field(description="Mean computation time (ms)")
+
+
+class ComputeStatus(BaseModel):
+    """Compute executor occupancy and per-route metrics."""
+
+    kind: Literal["thread", "process"] = Field(description="Worker pool type")
+    max_workers: int = Field(description="Pool size", ge=1)
+    max_queue: int = Field(description="Calls allowed to wait for a worker", ge=0)
+    pending: int = Field(description="Calls running or queued now", ge=0)
+    routes: dict[str, RouteComputeMetrics] = Field(
+        description="Metrics keyed by route name"
+    )
+
+
+class RouteCacheMetrics(BaseModel):
+    """Response cache counters for one route."""
+
+    hits: int = Field(description="Requests answered from the cache", ge=0)
+    misses: int = Field(description="Requests that ran the handler", ge=0)
+    not_modified: int = Field(description="Requests answered with 304", ge=0)
+    stores: int = Field(description="Responses added to the cache", ge=0)
+    oversized: int = Field(description="Responses too large to store", ge=0)
+    hit_ratio: float = Field(description="hits / (hits + misses)", ge=0, le=1)
+
+
+class ResponseCacheStatus(BaseModel):
+    """Response cache occupancy and per-route hit ratios."""
+
+    entries: int = Field(description="Responses currently cached", ge=0)
+    bytes: int = Field(description="Bytes currently cached", ge=0)
+    max_bytes: int = Field(description="Byte limit before LRU eviction", ge=0)
+    max_entry_bytes: int = Field(description="Largest response stored", ge=0)
+    evictions: int = Field(description="Entries evicted for space", ge=0)
+    routes: dict[str, RouteCacheMetrics] = Field(
+        description="Metrics keyed by route name"
+    )
+
+
 # =============================================================================
 # Module State
 # =============================================================================
@@ -205,3 +259,29 @@ async def system_info() -> SystemInfo:
         api_version=__version__,
         structural_lib_available=_check_structural_lib(),
     )
+
+
+@router.get(
+    "/compute",
+    response_model=ComputeStatus,
+    summary="Compute Executor Metrics",
+    description="Returns compute pool occupancy and per-route queue/compute times.",
+)
+async def compute_status() -> ComputeStatus:
+    """
+    Get compute executor metrics.
+
+    Served from the event loop, so it answers even when the pool is full.
+    """
+    return ComputeStatus.model_validate(get_compute_executor().stats())
+
+
+@router.get(
+    "/response-cache",
+    response_model=ResponseCacheStatus,
+    summary="Response Cache Metrics",
+    description="Returns response cache occupancy and per-route hit ratios.",
+)
+async def response_cache_status() -> ResponseCacheStatus:
+    """Get response cache metrics."""
+    return ResponseCacheStatus.model_validate(get_response_cache().stats())
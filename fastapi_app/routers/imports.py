@@ -10,9 +10,11 @@ from __future__ import annotations
 
 import csv
 import hashlib
-import json
 import logging
 import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -29,19 +31,112 @@ from fastapi import (
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from fastapi_app.compute import LocalComputeRoute, run_compute_local
 from fastapi_app.config import get_settings
+from fastapi_app.metrics import get_request_metrics
 from fastapi_app.models.beam import EvidenceEnvelopeResponse
 from fastapi_app.models.metadata import ImportFormatsResponse
 from fastapi_app.models.response import APIResponse, error_response, success_response
+from structural_lib.services.compact_ledger import CompactLosslessImport
+from structural_lib.services.import_cache import ImportResultCache
+from structural_lib.services.import_ledger import ImportStatus
 
 router = APIRouter(
     prefix="/import",
     tags=["import"],
+    route_class=LocalComputeRoute,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_import_cache() -> ImportResultCache:
+    """Process-wide cache of parsed import ledgers, sized from settings."""
+
+    settings = get_settings()
+    return ImportResultCache(
+        max_entries=settings.import_cache_max_entries,
+        directory=settings.import_cache_dir,
+    )
+
+
+class ImportLedgerStore:
+    """Bounded LRU of compact import ledgers keyed by ledger hash.
+
+    Imports requested with ``ledger_rows=paginated`` return only the ledger
+    summary; their rows stay here, compact, for the paginated rows endpoint.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, CompactLosslessImport] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, ledger_hash: str, result: CompactLosslessImport) -> None:
+        with self._lock:
+            self._entries[ledger_hash] = result
+            self._entries.move_to_end(ledger_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, ledger_hash: str) -> CompactLosslessImport | None:
+        with self._lock:
+            result = self._entries.get(ledger_hash)
+            if result is not None:
+                self._entries.move_to_end(ledger_hash)
+            return result
+
+
+@lru_cache(maxsize=1)
+def get_ledger_store() -> ImportLedgerStore:
+    """Process-wide store of paginated import ledgers, sized from settings."""
+
+    return ImportLedgerStore(get_settings().import_ledger_store_entries)
+
+
+def _ledger_hash(import_result: CompactLosslessImport) -> str:
+    """SHA-256 of the canonical ledger JSON, streamed one row at a time."""
+
+    digest = hashlib.sha256()
+    for chunk in import_result.iter_ledger_json():
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _ledger_payload(
+    import_result: CompactLosslessImport,
+    *,
+    ledger_hash: str,
+    ledger_rows: Literal["inline", "paginated"],
+) -> dict[str, Any]:
+    """Return the inline ledger, or its summary with rows left in the store."""
+
+    if ledger_rows == "inline":
+        return import_result.ledger().model_dump(mode="json")
+    get_ledger_store().put(ledger_hash, import_result)
+    return {**import_result.ledger_summary(), "ledger_hash": ledger_hash}
+
+
+def _blocked_import_detail(
+    import_result: CompactLosslessImport,
+    *,
+    ledger_rows: Literal["inline", "paginated"],
+) -> dict[str, Any]:
+    """422 detail for a blocked import."""
+
+    return {
+        "schema_version": "lossless-import-result-v1",
+        "status": import_result.status.value,
+        "issues": [issue.model_dump(mode="json") for issue in import_result.issues],
+        "normalization_ledger": _ledger_payload(
+            import_result,
+            ledger_hash=_ledger_hash(import_result),
+            ledger_rows=ledger_rows,
+        ),
+    }
+
+
 def _required_sample_text(
     row: dict[str, str | None],
     field: str,
@@ -143,6 +238,32 @@ class SampleDataResponse(BaseModel):
     dataset: SampleDatasetEvidence
 
 
+class ImportCacheStatsResponse(BaseModel):
+    """Counters for the parsed-import cache."""
+
+    hits: int
+    misses: int
+    memory_hits: int
+    disk_hits: int
+    stores: int
+    evictions: int
+    entries: int
+    max_entries: int
+    disk_enabled: bool
+    hit_ratio: float = Field(..., ge=0, le=1)
+
+
+class ImportLedgerRowsPage(BaseModel):
+    """One page of a stored import row ledger."""
+
+    ledger_hash: str
+    status: ImportStatus | None = None
+    offset: int = Field(..., ge=0)
+    limit: int = Field(..., ge=0)
+    total: int = Field(..., ge=0, description="Rows matching the status filter")
+    rows: list[dict[str, Any]]
+
+
 class CSVImportResponse(BaseModel):
     """Response from CSV import endpoint."""
 
@@ -160,36 +281,23 @@ class CSVImportResponse(BaseModel):
 
 def _lossless_import_response(
     *,
-    import_result: Any,
+    import_result: CompactLosslessImport,
     stirrup_diameter_mm: float,
     tension_bar_diameter_mm: float,
+    ledger_rows: Literal["inline", "paginated"] = "inline",
 ) -> APIResponse[CSVImportResponse]:
     """Map one accepted lossless import into the public preview model."""
 
     if import_result.batch is None:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={
-                "schema_version": import_result.schema_version,
-                "status": import_result.status.value,
-                "issues": [
-                    issue.model_dump(mode="json") for issue in import_result.issues
-                ],
-                "normalization_ledger": import_result.ledger.model_dump(mode="json"),
-            },
+            detail=_blocked_import_detail(import_result, ledger_rows=ledger_rows),
         )
-    ledger_payload = import_result.ledger.model_dump(mode="json")
-    ledger_hash = hashlib.sha256(
-        json.dumps(
-            ledger_payload,
-            allow_nan=False,
-            separators=(",", ":"),
-            sort_keys=True,
-        ).encode("utf-8")
-    ).hexdigest()
-    detected = (
-        import_result.ledger.adapter_selection.selected_format or "BLOCKED"
-    ).upper()
+    ledger_hash = _ledger_hash(import_result)
+    ledger_payload = _ledger_payload(
+        import_result, ledger_hash=ledger_hash, ledger_rows=ledger_rows
+    )
+    detected = (import_result.adapter_selection.selected_format or "BLOCKED").upper()
     forces_by_id = {force.id: force for force in import_result.batch.forces}
     beams = [
         BeamRow(
@@ -206,7 +314,7 @@ def _lossless_import_response(
             cover_mm=beam.section.cover_mm,
             source_metadata={
                 "source_record_identity": beam.source_id or beam.id,
-                "artifact_sha256": import_result.ledger.geometry_artifact.sha256,
+                "artifact_sha256": import_result.geometry_artifact.sha256,
                 "normalization_ledger_hash": ledger_hash,
                 "adapter": detected,
                 "effective_depth_basis": {
@@ -300,6 +408,13 @@ async def import_csv(
     format_hint: Literal["auto", "etabs", "safe", "staad", "generic"] = Query(
         "auto", description="Optional format override for CSV import"
     ),
+    ledger_rows: Literal["inline", "paginated"] = Query(
+        "inline",
+        description=(
+            "inline returns every ledger row; paginated returns the ledger "
+            "summary and serves rows from /import/ledgers/{ledger_hash}/rows"
+        ),
+    ),
 ):
     """
     Import beam data from CSV file.
@@ -351,33 +466,38 @@ async def import_csv(
 
         from structural_lib.services.imports import (
             build_import_design_defaults,
-            parse_single_csv_lossless,
+            parse_single_csv_compact,
         )
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as strict_tmp:
-            strict_tmp.write(text)
-            strict_path = strict_tmp.name
-        try:
-            import_result = parse_single_csv_lossless(
-                strict_path,
-                format_hint=format_hint,
-                defaults=build_import_design_defaults(
-                    fck_mpa=fck_mpa,
-                    fy_mpa=fy_mpa,
-                    cover_mm=cover_mm,
-                    stirrup_dia_mm=stirrup_diameter_mm,
-                ),
-                artifact_name=file.filename,
-            )
-            return _lossless_import_response(
-                import_result=import_result,
-                stirrup_diameter_mm=stirrup_diameter_mm,
-                tension_bar_diameter_mm=tension_bar_diameter_mm,
-            )
-        finally:
-            os.unlink(strict_path)
+        def parse_and_respond():
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".csv", delete=False, encoding="utf-8"
+            ) as strict_tmp:
+                strict_tmp.write(text)
+                strict_path = strict_tmp.name
+            try:
+                import_result = parse_single_csv_compact(
+                    strict_path,
+                    format_hint=format_hint,
+                    defaults=build_import_design_defaults(
+                        fck_mpa=fck_mpa,
+                        fy_mpa=fy_mpa,
+                        cover_mm=cover_mm,
+                        stirrup_dia_mm=stirrup_diameter_mm,
+                    ),
+                    artifact_name=file.filename,
+                    cache=get_import_cache(),
+                )
+                return _lossless_import_response(
+                    import_result=import_result,
+                    stirrup_diameter_mm=stirrup_diameter_mm,
+                    tension_bar_diameter_mm=tension_bar_diameter_mm,
+                    ledger_rows=ledger_rows,
+                )
+            finally:
+                os.unlink(strict_path)
+
+        return await run_compute_local("import_csv", parse_and_respond)
 
     except HTTPException:
         raise
@@ -406,6 +526,13 @@ async def import_dual_csv(
     format_hint: Literal["auto", "etabs", "safe", "staad", "generic"] = Query(
         "auto", description="Optional format override for dual CSV import"
     ),
+    ledger_rows: Literal["inline", "paginated"] = Query(
+        "inline",
+        description=(
+            "inline returns every ledger row; paginated returns the ledger "
+            "summary and serves rows from /import/ledgers/{ledger_hash}/rows"
+        ),
+    ),
 ):
     """
     Import beam data from two CSV files (geometry + forces).
@@ -431,7 +558,7 @@ async def import_dual_csv(
 
         from structural_lib.services.imports import (
             build_import_design_defaults,
-            parse_dual_csv_lossless,
+            parse_dual_csv_compact,
         )
 
         settings = get_settings()
@@ -460,9 +587,6 @@ async def import_dual_csv(
                 detail=f"Forces file too large. Maximum size: {max_size // (1024 * 1024)}MB",
             )
 
-        geometry_path = None
-        forces_path = None
-
         geometry_content = await geometry_file.read(max_size + 1)
         if len(geometry_content) > max_size:
             logger.warning(
@@ -489,129 +613,127 @@ async def import_dual_csv(
         geometry_text = geometry_content.decode("utf-8-sig")
         forces_text = forces_content.decode("utf-8-sig")
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as geom_tmp:
-            geom_tmp.write(geometry_text)
-            geometry_path = geom_tmp.name
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False, encoding="utf-8"
-        ) as force_tmp:
-            force_tmp.write(forces_text)
-            forces_path = force_tmp.name
-
-        try:
-            import_result = parse_dual_csv_lossless(
-                geometry_path,
-                forces_path,
-                format_hint=format_hint,
-                defaults=build_import_design_defaults(
-                    fck_mpa=fck_mpa,
-                    fy_mpa=fy_mpa,
-                    cover_mm=cover_mm,
-                    stirrup_dia_mm=stirrup_diameter_mm,
-                ),
-                geometry_artifact_name=geometry_file.filename,
-                forces_artifact_name=forces_file.filename,
-            )
-            if import_result.batch is None:
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail={
-                        "schema_version": import_result.schema_version,
-                        "status": import_result.status.value,
-                        "issues": [
-                            issue.model_dump(mode="json")
-                            for issue in import_result.issues
-                        ],
-                        "normalization_ledger": import_result.ledger.model_dump(
-                            mode="json"
+        def parse_and_respond():
+            geometry_path = None
+            forces_path = None
+
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".csv", delete=False, encoding="utf-8"
+            ) as geom_tmp:
+                geom_tmp.write(geometry_text)
+                geometry_path = geom_tmp.name
+
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".csv", delete=False, encoding="utf-8"
+            ) as force_tmp:
+                force_tmp.write(forces_text)
+                forces_path = force_tmp.name
+
+            try:
+                import_result = parse_dual_csv_compact(
+                    geometry_path,
+                    forces_path,
+                    format_hint=format_hint,
+                    defaults=build_import_design_defaults(
+                        fck_mpa=fck_mpa,
+                        fy_mpa=fy_mpa,
+                        cover_mm=cover_mm,
+                        stirrup_dia_mm=stirrup_diameter_mm,
+                    ),
+                    geometry_artifact_name=geometry_file.filename,
+                    forces_artifact_name=forces_file.filename,
+                    cache=get_import_cache(),
+                )
+                if import_result.batch is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail=_blocked_import_detail(
+                            import_result, ledger_rows=ledger_rows
                         ),
-                    },
+                    )
+                batch = import_result.batch
+                normalization_ledger_hash = _ledger_hash(import_result)
+                ledger_payload = _ledger_payload(
+                    import_result,
+                    ledger_hash=normalization_ledger_hash,
+                    ledger_rows=ledger_rows,
                 )
-            batch = import_result.batch
-            ledger_payload = import_result.ledger.model_dump(mode="json")
-            normalization_ledger_hash = hashlib.sha256(
-                json.dumps(
-                    ledger_payload,
-                    allow_nan=False,
-                    separators=(",", ":"),
-                    sort_keys=True,
-                ).encode("utf-8")
-            ).hexdigest()
-            detected = (
-                import_result.ledger.adapter_selection.selected_format or "BLOCKED"
-            ).upper()
-
-            forces_by_id = {f.id: f for f in batch.forces}
-            beams_out: list[BeamWith3D] = []
-
-            for beam in batch.beams:
-                forces = forces_by_id[beam.id]
-                beams_out.append(
-                    BeamWith3D(
-                        id=beam.id,
-                        source_id=beam.source_id or beam.id,
-                        story=beam.story,
-                        width_mm=beam.section.width_mm,
-                        depth_mm=beam.section.depth_mm,
-                        span_mm=beam.length_m * 1000.0,
-                        mu_knm=forces.mu_knm,
-                        vu_kn=forces.vu_kn,
-                        fck_mpa=beam.section.fck_mpa,
-                        fy_mpa=beam.section.fy_mpa,
-                        cover_mm=beam.section.cover_mm,
-                        source_metadata={
-                            "source_record_identity": beam.source_id or beam.id,
-                            "geometry_artifact_sha256": (
-                                import_result.ledger.geometry_artifact.sha256
+                detected = (
+                    import_result.adapter_selection.selected_format or "BLOCKED"
+                ).upper()
+
+                forces_by_id = {f.id: f for f in batch.forces}
+                beams_out: list[BeamWith3D] = []
+
+                for beam in batch.beams:
+                    forces = forces_by_id[beam.id]
+                    beams_out.append(
+                        BeamWith3D(
+                            id=beam.id,
+                            source_id=beam.source_id or beam.id,
+                            story=beam.story,
+                            width_mm=beam.section.width_mm,
+                            depth_mm=beam.section.depth_mm,
+                            span_mm=beam.length_m * 1000.0,
+                            mu_knm=forces.mu_knm,
+                            vu_kn=forces.vu_kn,
+                            fck_mpa=beam.section.fck_mpa,
+                            fy_mpa=beam.section.fy_mpa,
+                            cover_mm=beam.section.cover_mm,
+                            source_metadata={
+                                "source_record_identity": beam.source_id or beam.id,
+                                "geometry_artifact_sha256": (
+                                    import_result.geometry_artifact.sha256
+                                ),
+                                "forces_artifact_sha256": (
+                                    import_result.forces_artifact.sha256
+                                ),
+                                "normalization_ledger_hash": normalization_ledger_hash,
+                                "adapter": detected,
+                                "effective_depth_basis": {
+                                    "clear_cover_mm": beam.section.cover_mm,
+                                    "stirrup_diameter_mm": stirrup_diameter_mm,
+                                    "tension_bar_diameter_mm": (
+                                        tension_bar_diameter_mm
+                                    ),
+                                },
+                            },
+                            point1=Point3D(
+                                x=beam.point1.x,
+                                y=beam.point1.y,
+                                z=beam.point1.z,
                             ),
-                            "forces_artifact_sha256": (
-                                import_result.ledger.forces_artifact.sha256
+                            point2=Point3D(
+                                x=beam.point2.x,
+                                y=beam.point2.y,
+                                z=beam.point2.z,
                             ),
-                            "normalization_ledger_hash": normalization_ledger_hash,
-                            "adapter": detected,
-                            "effective_depth_basis": {
-                                "clear_cover_mm": beam.section.cover_mm,
-                                "stirrup_diameter_mm": stirrup_diameter_mm,
-                                "tension_bar_diameter_mm": (tension_bar_diameter_mm),
-                            },
-                        },
-                        point1=Point3D(
-                            x=beam.point1.x,
-                            y=beam.point1.y,
-                            z=beam.point1.z,
-                        ),
-                        point2=Point3D(
-                            x=beam.point2.x,
-                            y=beam.point2.y,
-                            z=beam.point2.z,
-                        ),
+                        )
                     )
-                )
 
-            return success_response(
-                DualCSVImportResponse(
-                    success=True,
-                    message=f"Imported {len(beams_out)} beams from dual CSV files",
-                    beam_count=len(beams_out),
-                    beams=beams_out,
-                    format_detected=detected,
-                    warnings=[],
-                    unmatched_beams=[],
-                    unmatched_forces=[],
-                    normalization_ledger=ledger_payload,
-                    issues=[],
+                return success_response(
+                    DualCSVImportResponse(
+                        success=True,
+                        message=f"Imported {len(beams_out)} beams from dual CSV files",
+                        beam_count=len(beams_out),
+                        beams=beams_out,
+                        format_detected=detected,
+                        warnings=[],
+                        unmatched_beams=[],
+                        unmatched_forces=[],
+                        normalization_ledger=ledger_payload,
+                        issues=[],
+                    )
                 )
-            )
-        finally:
-            import os
+            finally:
+                import os
 
-            if geometry_path:
-                os.unlink(geometry_path)
-            if forces_path:
-                os.unlink(forces_path)
+                if geometry_path:
+                    os.unlink(geometry_path)
+                if forces_path:
+                    os.unlink(forces_path)
+
+        return await run_compute_local("import_dual_csv", parse_and_respond)
 
     except HTTPException:
         raise
@@ -684,7 +806,7 @@ async def import_csv_text(
     summary="Design Canonical Project Beams",
     description="Validate and design canonical project-beam/v1 payloads.",
 )
-async def design_project_beams(
+def design_project_beams(
     beams: list[dict[str, Any]],
 ) -> APIResponse[dict[str, Any]]:
     """Delegate canonical transport input to the strict service command."""
@@ -710,7 +832,7 @@ async def design_project_beams(
     description="Deprecated compatibility transport delegating to the strict service.",
     deprecated=True,
 )
-async def batch_design(
+def batch_design(
     beams: list[dict[str, Any]],
     response: Response,
 ) -> APIResponse[dict[str, Any]]:
@@ -731,7 +853,9 @@ async def batch_design(
         )
     from structural_lib.services.batch import design_beams
 
-    return success_response(design_beams(beams))
+    result = design_beams(beams)
+    get_request_metrics().record_batch_members("batch_design", len(beams))
+    return success_response(result)
 
 
 @router.get(
@@ -741,7 +865,7 @@ async def batch_design(
     summary="Get Supported Formats",
     description="Get list of supported CSV import formats.",
 )
-async def get_supported_formats():
+def get_supported_formats():
     """Get information about supported CSV formats."""
     return success_response(
         {
@@ -791,13 +915,71 @@ async def get_supported_formats():
     )
 
 
+@router.get(
+    "/cache/stats",
+    response_model=APIResponse[ImportCacheStatsResponse],
+    summary="Get Import Cache Statistics",
+    description=(
+        "Hit, miss and eviction counters for the parsed-import cache. "
+        "Re-uploads of identical CSV bytes reuse the cached ledger and only "
+        "re-apply the submitted design defaults."
+    ),
+)
+def get_import_cache_stats():
+    """Report parsed-import cache counters."""
+    return success_response(
+        ImportCacheStatsResponse(**get_import_cache().stats().to_dict())
+    )
+
+
+@router.get(
+    "/ledgers/{ledger_hash}/rows",
+    response_model=APIResponse[ImportLedgerRowsPage],
+    summary="Get Import Ledger Rows",
+    description=(
+        "Page through the row ledger of an import requested with "
+        "ledger_rows=paginated. Rows are materialized only for the requested "
+        "page; filter by status=BLOCKED to list the rows that carry issues."
+    ),
+)
+def get_import_ledger_rows(
+    ledger_hash: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    row_status: ImportStatus | None = Query(None, alias="status"),
+):
+    """Return one page of a stored import row ledger."""
+    import_result = get_ledger_store().get(ledger_hash)
+    if import_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import ledger not found; re-import with ledger_rows=paginated",
+        )
+    total = (
+        len(import_result.rows)
+        if row_status is None
+        else len(import_result.rows.indexes(row_status))
+    )
+    rows = import_result.rows.page(offset, limit, status=row_status)
+    return success_response(
+        ImportLedgerRowsPage(
+            ledger_hash=ledger_hash,
+            status=row_status,
+            offset=offset,
+            limit=limit,
+            total=total,
+            rows=[row.model_dump(mode="json") for row in rows],
+        )
+    )
+
+
 @router.get(
     "/sample",
     response_model=APIResponse[SampleDataResponse],
     summary="Get Sample Data with 3D Geometry",
     description="Load the bundled ETABS sample building with 3D positions for visualization.",
 )
-async def get_sample_data():
+def get_sample_data():
     """
     Load sample building data from actual ETABS export CSV files.
 
@@ -15,6 +15,7 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.models.boq import (
     BOQEvidenceResponse,
     ConcreteSummaryResponse,
@@ -31,6 +32,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/insights",
     tags=["insights"],
+    route_class=ComputeRoute,
 )
 
 
@@ -194,7 +196,7 @@ class RebarSuggestResponse(BaseModel):
     summary="Generate Dashboard Summary",
     description="Generate aggregated statistics from multiple beam design results.",
 )
-async def generate_dashboard(request: DashboardRequest):
+def generate_dashboard(request: DashboardRequest):
     """
     Generate an aggregated dashboard from beam design results.
 
@@ -260,7 +262,7 @@ async def generate_dashboard(request: DashboardRequest):
     summary="Live IS 456 Code Checks",
     description="Perform fast code checks for real-time UI updates during editing.",
 )
-async def code_checks_live(request: CodeChecksRequest):
+def code_checks_live(request: CodeChecksRequest):
     """
     Perform live IS 456 code checks on a beam.
 
@@ -332,7 +334,7 @@ async def code_checks_live(request: CodeChecksRequest):
     summary="Suggest Rebar Optimizations",
     description="Generate optimized rebar configuration suggestions for a beam.",
 )
-async def suggest_rebar_options(request: RebarSuggestRequest):
+def suggest_rebar_options(request: RebarSuggestRequest):
     """
     Suggest optimized rebar configurations for a beam.
 
@@ -404,7 +406,7 @@ async def suggest_rebar_options(request: RebarSuggestRequest):
     summary="Project Bill of Quantities",
     description="Aggregate project BOQ from beam metadata with steel/concrete costs.",
 )
-async def project_boq(request: ProjectBOQRequest):
+def project_boq(request: ProjectBOQRequest):
     """Aggregate project Bill of Quantities from beam metadata.
 
     Calculates total steel weight, concrete volume, and costs
@@ -9,6 +9,7 @@ from fastapi import APIRouter, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error
 from fastapi_app.models.library_core import (
     BuiltinContinuousOneWaySlabDesignRequest,
@@ -28,7 +29,7 @@ from fastapi_app.models.response import APIResponse, error_response, success_res
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/design", tags=["footing", "slab"])
+router = APIRouter(prefix="/design", tags=["footing", "slab"], route_class=ComputeRoute)
 
 
 @router.post(
@@ -36,7 +37,7 @@ router = APIRouter(prefix="/design", tags=["footing", "slab"])
     response_model=APIResponse[FootingLoadTransferResponse],
     summary="Check isolated-footing load transfer",
 )
-async def check_footing_load_transfer(request: FootingLoadTransferRequest):
+def check_footing_load_transfer(request: FootingLoadTransferRequest):
     """Validate a request, call the public library service, and map its result."""
     try:
         from structural_lib.services.api import check_isolated_footing_load_transfer
@@ -61,7 +62,7 @@ async def check_footing_load_transfer(request: FootingLoadTransferRequest):
     response_model=APIResponse[OneWaySlabDesignResponse],
     summary="Design a simply supported one-way slab strip",
 )
-async def design_one_way_slab(request: OneWaySlabDesignRequest):
+def design_one_way_slab(request: OneWaySlabDesignRequest):
     """Validate a request, call the public slab service, and map its result."""
     try:
         from structural_lib.services.api import design_one_way_slab_is456
@@ -86,7 +87,7 @@ async def design_one_way_slab(request: OneWaySlabDesignRequest):
     response_model=APIResponse[CompleteOneWaySlabDesignResponse],
     summary="Design a complete bounded simply supported one-way slab strip",
 )
-async def design_complete_one_way_slab(request: CompleteOneWaySlabDesignRequest):
+def design_complete_one_way_slab(request: CompleteOneWaySlabDesignRequest):
     """Add ordinary shear and strict reviewed-limit serviceability."""
     try:
         from structural_lib.services.api import design_complete_one_way_slab_is456
@@ -111,7 +112,7 @@ async def design_complete_one_way_slab(request: CompleteOneWaySlabDesignRequest)
     response_model=APIResponse[ContinuousOneWaySlabDesignResponse],
     summary="Design a coefficient-method continuous one-way slab strip",
 )
-async def design_continuous_one_way_slab(
+def design_continuous_one_way_slab(
     request: ContinuousOneWaySlabDesignRequest,
 ):
     """Validate coefficient provenance/domain and call the public service."""
@@ -142,7 +143,7 @@ async def design_continuous_one_way_slab(
     response_model=APIResponse[ContinuousOneWaySlabDesignResponse],
     summary="Design a continuous one-way slab using built-in IS 456 coefficients",
 )
-async def design_continuous_one_way_slab_builtin(
+def design_continuous_one_way_slab_builtin(
     request: BuiltinContinuousOneWaySlabDesignRequest,
 ):
     """Resolve Tables 12/13 and call the bounded public workflow."""
@@ -175,7 +176,7 @@ async def design_continuous_one_way_slab_builtin(
     response_model=APIResponse[TwoWaySlabPanelDesignResponse],
     summary="Design a common oriented two-way solid slab panel",
 )
-async def design_two_way_slab_panel(request: TwoWaySlabPanelDesignRequest):
+def design_two_way_slab_panel(request: TwoWaySlabPanelDesignRequest):
     """Run topology, external coefficients, strips, torsion, shear and bars."""
     try:
         from structural_lib.services.api import design_two_way_slab_panel_is456
@@ -200,7 +201,7 @@ async def design_two_way_slab_panel(request: TwoWaySlabPanelDesignRequest):
     response_model=APIResponse[TwoWaySlabPanelDesignResponse],
     summary="Design a two-way slab panel using built-in IS 456 coefficients",
 )
-async def design_two_way_slab_panel_builtin(
+def design_two_way_slab_panel_builtin(
     request: BuiltinTwoWaySlabPanelDesignRequest,
 ):
     """Resolve Table 26/27 with bounded interpolation and run the panel workflow."""
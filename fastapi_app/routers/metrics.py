@@ -0,0 +1,236 @@
+"""
+Metrics Router.
+
+Serves ``GET /metrics`` in the Prometheus text exposition format:
+
+- Request latency histograms and status counts per route
+- Compute executor queue depth and per-route queue/compute time
+- Response cache and import cache hit ratios
+- Batch and streaming member throughput
+- structural_lib per-stage timers (parse, validation, compliance, evidence,
+  envelope). These are recorded in the API process only, so with
+  ``COMPUTE_EXECUTOR=process`` stages run in workers are not included.
+
+Disabled with ``METRICS_ENABLED=false``, in which case the route answers 404.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Response
+
+from fastapi_app.compute import get_compute_executor
+from fastapi_app.config import get_settings
+from fastapi_app.metrics import MetricFamily, get_request_metrics, render_exposition
+from fastapi_app.response_cache import get_response_cache
+from fastapi_app.routers.imports import get_import_cache
+from structural_lib import instrumentation
+
+router = APIRouter(tags=["health"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _compute_families() -> list[MetricFamily]:
+    stats = get_compute_executor().stats()
+    routes = sorted(stats["routes"].items())
+    return [
+        MetricFamily(
+            "structural_compute_pending",
+            "gauge",
+            "Calls running or queued on the compute executor.",
+            [("structural_compute_pending", {}, stats["pending"])],
+        ),
+        MetricFamily(
+            "structural_compute_capacity",
+            "gauge",
+            "Calls the compute executor admits at once (workers + queue).",
+            [
+                (
+                    "structural_compute_capacity",
+                    {},
+                    stats["max_workers"] + stats["max_queue"],
+                )
+            ],
+        ),
+        MetricFamily(
+            "structural_compute_route_pending",
+            "gauge",
+            "Calls running or queued now, by route.",
+            [
+                ("structural_compute_route_pending", {"route": name}, route["pending"])
+                for name, route in routes
+            ],
+        ),
+        MetricFamily(
+            "structural_compute_calls_total",
+            "counter",
+            "Compute executor calls by route and outcome.",
+            [
+                (
+                    "structural_compute_calls_total",
+                    {"route": name, "outcome": outcome},
+                    route[outcome],
+                )
+                for name, route in routes
+                for outcome in ("completed", "failed", "rejected")
+            ],
+        ),
+        MetricFamily(
+            "structural_compute_queue_seconds_total",
+            "counter",
+            "Time calls spent waiting for a worker, by route.",
+            [
+                (
+                    "structural_compute_queue_seconds_total",
+                    {"route": name},
+                    route["queue_ms_total"] / 1000.0,
+                )
+                for name, route in routes
+            ],
+        ),
+        MetricFamily(
+            "structural_compute_seconds_total",
+            "counter",
+            "Time calls spent computing, by route.",
+            [
+                (
+                    "structural_compute_seconds_total",
+                    {"route": name},
+                    route["compute_ms_total"] / 1000.0,
+                )
+                for name, route in routes
+            ],
+        ),
+    ]
+
+
+def _cache_families() -> list[MetricFamily]:
+    response_stats = get_response_cache().stats()
+    routes = sorted(response_stats["routes"].items())
+    import_stats = get_import_cache().stats()
+    return [
+        MetricFamily(
+            "structural_response_cache_requests_total",
+            "counter",
+            "Response cache lookups by route and result.",
+            [
+                (
+                    "structural_response_cache_requests_total",
+                    {"route": name, "result": result},
+                    route[result],
+                )
+                for name, route in routes
+                for result in ("hits", "misses", "not_modified")
+            ],
+        ),
+        MetricFamily(
+            "structural_response_cache_hit_ratio",
+            "gauge",
+            "Response cache hits / (hits + misses), by route.",
+            [
+                (
+                    "structural_response_cache_hit_ratio",
+                    {"route": name},
+                    route["hit_ratio"],
+                )
+                for name, route in routes
+            ],
+        ),
+        MetricFamily(
+            "structural_response_cache_bytes",
+            "gauge",
+            "Bytes held by the response cache.",
+            [("structural_response_cache_bytes", {}, response_stats["bytes"])],
+        ),
+        MetricFamily(
+            "structural_import_cache_requests_total",
+            "counter",
+            "Parsed-import cache lookups by result.",
+            [
+                (
+                    "structural_import_cache_requests_total",
+                    {"result": "hits"},
+                    import_stats.hits,
+                ),
+                (
+                    "structural_import_cache_requests_total",
+                    {"result": "misses"},
+                    import_stats.misses,
+                ),
+            ],
+        ),
+        MetricFamily(
+            "structural_import_cache_hit_ratio",
+            "gauge",
+            "Parsed-import cache hits / (hits + misses).",
+            [("structural_import_cache_hit_ratio", {}, import_stats.hit_ratio)],
+        ),
+    ]
+
+
+def _stage_families() -> list[MetricFamily]:
+    timings = sorted(instrumentation.snapshot().items())
+    return [
+        MetricFamily(
+            "structural_lib_stage_calls_total",
+            "counter",
+            "structural_lib stage executions.",
+            [
+                ("structural_lib_stage_calls_total", {"stage": name}, timing.calls)
+                for name, timing in timings
+            ],
+        ),
+        MetricFamily(
+            "structural_lib_stage_seconds_total",
+            "counter",
+            "Wall-clock time spent in each structural_lib stage.",
+            [
+                (
+                    "structural_lib_stage_seconds_total",
+                    {"stage": name},
+                    timing.total_seconds,
+                )
+                for name, timing in timings
+            ],
+        ),
+        MetricFamily(
+            "structural_lib_stage_max_seconds",
+            "gauge",
+            "Longest single execution of each structural_lib stage.",
+            [
+                (
+                    "structural_lib_stage_max_seconds",
+                    {"stage": name},
+                    timing.max_seconds,
+                )
+                for name, timing in timings
+            ],
+        ),
+    ]
+
+
+@router.get(
+    "/metrics",
+    # Plain text on success; errors keep the shared JSON problem contract,
+    # which a text response_class would re-document as text/plain.
+    response_class=Response,
+    response_model=None,
+    summary="Prometheus Metrics",
+    description="Returns request, compute, cache and stage metrics for scraping.",
+    responses={200: {"content": {"text/plain": {"schema": {"type": "string"}}}}},
+)
+async def metrics() -> Response:
+    """
+    Render all metric families in the Prometheus text format.
+
+    Served from the event loop, so it answers even when the pool is full.
+    """
+    if not get_settings().metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    families = [
+        *get_request_metrics().families(),
+        *_compute_families(),
+        *_cache_families(),
+        *_stage_families(),
+    ]
+    return Response(render_exposition(families), media_type=CONTENT_TYPE)
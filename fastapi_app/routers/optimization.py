@@ -9,6 +9,7 @@ import logging
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_float
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.optimization import (
@@ -27,6 +28,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/optimization",
     tags=["optimization"],
+    route_class=ComputeRoute,
 )
 
 
@@ -41,7 +43,7 @@ router = APIRouter(
     summary="Optimize Beam Cost",
     description="Find the most cost-effective beam section for given loading.",
 )
-async def optimize_beam_cost(
+def optimize_beam_cost(
     request: CostOptimizationRequest,
 ):
     """
@@ -202,7 +204,7 @@ def _parse_optimal_design(data: dict, rank: int):
     summary="Get Default Cost Rates",
     description="Get default material and labor cost rates.",
 )
-async def get_cost_rates():
+def get_cost_rates():
     """
     Get default cost rates for optimization.
 
@@ -252,7 +254,7 @@ async def get_cost_rates():
     summary="Pareto Multi-Objective Beam Optimization",
     description="Find Pareto-optimal beam designs balancing cost, weight, and utilization using NSGA-II inspired algorithm.",
 )
-async def optimize_beam_pareto(
+def optimize_beam_pareto(
     request: ParetoRequest,
 ):
     """
@@ -13,6 +13,7 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.response import APIResponse, error_response, success_response
 
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/rebar",
     tags=["rebar"],
+    route_class=ComputeRoute,
 )
 
 
@@ -123,7 +125,7 @@ Returns validation results with errors, warnings, and computed spacing.
 Use this before applying configuration to check for issues.
 """,
 )
-async def validate_rebar(request: RebarValidateRequest):
+def validate_rebar(request: RebarValidateRequest):
     """
     Validate rebar configuration against geometry and code requirements.
 
@@ -204,7 +206,7 @@ Validates first, then computes:
 Returns geometry suitable for React Three Fiber rendering.
 """,
 )
-async def apply_rebar(request: RebarApplyRequest):
+def apply_rebar(request: RebarApplyRequest):
     """
     Apply rebar configuration and generate 3D geometry.
 
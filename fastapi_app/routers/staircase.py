@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.staircase_api as staircase_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.staircase import (
@@ -16,7 +17,9 @@ from fastapi_app.models.staircase import (
     StraightFlightStaircaseResponse,
 )
 
-router = APIRouter(prefix="/design/staircase", tags=["staircase"])
+router = APIRouter(
+    prefix="/design/staircase", tags=["staircase"], route_class=ComputeRoute
+)
 
 
 @router.post(
@@ -24,7 +27,7 @@ router = APIRouter(prefix="/design/staircase", tags=["staircase"])
     response_model=APIResponse[StraightFlightStaircaseResponse],
     summary="Design a bounded straight-flight waist-slab staircase",
 )
-async def design_straight_flight_staircase(
+def design_straight_flight_staircase(
     request: StraightFlightStaircaseRequest,
 ):
     """Validate transport inputs and delegate all calculation to the service."""
@@ -9,6 +9,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.strap_footing_api as strap_footing_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.strap_footing import (
@@ -16,7 +17,9 @@ from fastapi_app.models.strap_footing import (
     PropertyLineStrapFootingResponse,
 )
 
-router = APIRouter(prefix="/design/strap-footing", tags=["strap-footing"])
+router = APIRouter(
+    prefix="/design/strap-footing", tags=["strap-footing"], route_class=ComputeRoute
+)
 
 
 def _service_input(
@@ -32,7 +35,7 @@ def _service_input(
     response_model=APIResponse[PropertyLineStrapFootingResponse],
     summary="Design a bounded property-line strap footing",
 )
-async def design_property_line_strap_footing(
+def design_property_line_strap_footing(
     request: PropertyLineStrapFootingRequest,
 ) -> dict[str, object] | JSONResponse:
     """Validate transport input and delegate every calculation to the service."""
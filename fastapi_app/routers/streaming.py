@@ -3,7 +3,12 @@ Server-Sent Events (SSE) Router for Batch Processing.
 
 This module provides SSE endpoints for streaming batch operations:
 - /stream/batch-design - Stream design results for multiple beams
-- /stream/progress/{job_id} - Stream job progress updates
+- /stream/bulk-design - NDJSON in, NDJSON out, for batches of any size
+- /stream/job/{job_id}/events - Replay and follow a job's events
+- /stream/job/{job_id} - Poll job progress
+
+Jobs run in the background and every event is stored, so a dropped
+connection can resume with ``Last-Event-ID`` without recomputation.
 
 Week 3 Priority 3 Implementation (V3 Migration)
 
@@ -21,17 +26,35 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
+import threading
+import time
 import uuid
+from collections import Counter, deque
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Mapping
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Mapping,
+)
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from structural_lib.services import batch
 from fastapi_app.auth import check_rate_limit
+from fastapi_app.compute import ComputeSaturatedError, get_compute_executor
 from fastapi_app.config import get_settings
+from fastapi_app.job_store import BatchJobStore
+from fastapi_app.metrics import get_request_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -80,37 +103,116 @@ def _job_engineering_status(job: Mapping[str, Any]) -> dict[str, bool | None | s
 
 
 # =============================================================================
-# Job Tracking (In-Memory for Demo)
+# Job Tracking
 # =============================================================================
 
+_TERMINAL_EVENTS = frozenset({"complete", "error"})
 
-class BatchJobManager:
+BatchFrames = Literal["member", "batched"]
+
+
+async def _when_admitted(submit: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``submit()``, submitting again while the executor is saturated.
+
+    A stream has already answered 200, so a busy pool delays the work
+    instead of failing the job.
     """
-    Manages batch job state for progress tracking.
+    while True:
+        try:
+            return await submit()
+        except ComputeSaturatedError as exc:
+            await asyncio.sleep(exc.retry_after_seconds)
+
+
+async def _design_member(member: Callable[[], Any]) -> Any:
+    """Design one prepared beam on the compute executor, waiting out saturation."""
+    executor = get_compute_executor()
+    return await _when_admitted(lambda: executor.run("stream_batch_design", member))
+
+
+def _member_result(member: Any) -> dict[str, Any]:
+    """Flatten one project-beam member into the ``design_result`` payload."""
+    result_data = member.to_dict()
+    result_data["beam_id"] = member.member_id
+    result_data["design_succeeded"] = member.calculation_status.value == "COMPLETED"
+    result_data["is_safe"] = member.overall_status.value == "PASS"
+    result_data["status"] = member.overall_status.value
+    if member.calculation is not None:
+        result_data.update(member.calculation)
+    return result_data
+
+
+def _job_counts(job: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "total": job["total"],
+        "completed": job["completed"],
+        "passed": job["passed"],
+        "failed": job["failed"],
+        "held": job["held"],
+        "blocked": job["blocked"],
+        **_job_engineering_status(job),
+    }
+
+
+def _job_duration_seconds(job: Mapping[str, Any]) -> float | None:
+    if not job.get("completed_at"):
+        return None
+    return (
+        datetime.fromisoformat(job["completed_at"].replace("Z", "+00:00"))
+        - datetime.fromisoformat(job["started_at"].replace("Z", "+00:00"))
+    ).total_seconds()
+
 
-    In production, use Redis or database for persistence.
+def _parse_event_id(value: str | None) -> tuple[str | None, int]:
+    """Split a ``Last-Event-ID`` of the form ``<job_id>:<seq>`` or ``<seq>``."""
+    if not value:
+        return None, -1
+    job_id, _, seq = value.strip().rpartition(":")
+    try:
+        return job_id or None, int(seq)
+    except ValueError:
+        return None, -1
+
+
+class BatchJobManager:
+    """
+    Runs batch jobs in the background and records their SSE events.
+
+    Counters and events live in a ``BatchJobStore``, so a job outlives the
+    connection that started it and any client can replay it from an event
+    ID. Jobs run as tasks on the server event loop; each beam is designed on
+    the shared compute executor. Store reads and writes from the loop run in
+    a thread (``asyncio.to_thread``), because a write may wait on another
+    worker's lock on a shared store file. Workers sharing a store file follow
+    each other's jobs by polling the store.
     """
 
-    def __init__(self) -> None:
-        self.jobs: dict[str, dict[str, Any]] = {}
+    def __init__(self, store: BatchJobStore | None = None) -> None:
+        self._store = store
+        self._store_lock = threading.Lock()
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._wakeups: dict[str, set[asyncio.Event]] = {}
+
+    @property
+    def store(self) -> BatchJobStore:
+        """Job store, opened from settings on first use."""
+        with self._store_lock:
+            if self._store is None:
+                settings = get_settings()
+                path = settings.stream_job_store_path
+                if path is None and settings.state_backend == "sqlite":
+                    path = settings.state_path
+                self._store = BatchJobStore(
+                    path,
+                    ttl_seconds=settings.stream_job_ttl_seconds,
+                    max_jobs=settings.stream_job_max_jobs,
+                )
+            return self._store
 
     def create_job(self, total_items: int) -> str:
         """Create a new batch job and return its ID."""
-        job_id = str(uuid.uuid4())[:8]
-        self.jobs[job_id] = {
-            "id": job_id,
-            "status": "running",
-            "total": total_items,
-            "completed": 0,
-            "passed": 0,
-            "failed": 0,
-            "held": 0,
-            "blocked": 0,
-            "results": [],
-            "errors": [],
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": None,
-        }
+        job_id = uuid.uuid4().hex[:8]
+        self.store.create(job_id, total_items)
         return job_id
 
     def update_progress(
@@ -121,48 +223,222 @@ class BatchJobManager:
         error: str | None = None,
     ) -> None:
         """Update job progress."""
-        if job_id not in self.jobs:
-            return
-
-        job = self.jobs[job_id]
-        job["completed"] += 1
-
+        counters = {"completed": 1}
         if result:
-            job["results"].append(result)
             overall_status = result.get("overall_status")
             if overall_status == "PASS":
-                job["passed"] += 1
+                counters["passed"] = 1
             elif overall_status == "FAIL":
-                job["failed"] += 1
+                counters["failed"] = 1
             else:
-                job["held"] += 1
+                counters["held"] = 1
                 if overall_status == "BLOCKED":
-                    job["blocked"] += 1
+                    counters["blocked"] = 1
         elif error:
-            job["failed"] += 1
-            job["errors"].append(error)
-
-        if job["completed"] >= job["total"]:
-            job["status"] = "complete"
-            job["completed_at"] = datetime.now(timezone.utc).isoformat()
+            counters["failed"] = 1
+            counters["error_count"] = 1
+        self.store.increment(job_id, **counters)
 
     def get_job(self, job_id: str) -> dict | None:
         """Get job status."""
-        return self.jobs.get(job_id)
+        return self.store.get(job_id)
 
     def cleanup_old_jobs(self, max_age_seconds: int = 3600) -> None:
-        """Remove jobs older than max_age_seconds."""
-        now = datetime.now(timezone.utc)
-        to_remove = []
-        for job_id, job in self.jobs.items():
-            if job.get("completed_at"):
-                completed = datetime.fromisoformat(
-                    job["completed_at"].replace("Z", "+00:00")
+        """Remove finished jobs not accessed for max_age_seconds."""
+        self.store.sweep(max_age_seconds=max_age_seconds)
+
+    async def sweep_periodically(self, interval_seconds: float) -> None:
+        """Evict expired jobs every ``interval_seconds`` until cancelled.
+
+        Creating a job sweeps too, but an idle server creates none, so
+        without this finished jobs and their events would stay stored.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.store.sweep)
+            except Exception:
+                logger.exception("Batch job sweep failed")
+
+    async def start(
+        self, beam_list: list[Any], *, frames: BatchFrames = "member"
+    ) -> str:
+        """Create a job, record its start event and design it in the background.
+
+        ``frames="batched"`` replaces per-member ``design_result`` events with
+        ``design_results`` events whose data is NDJSON, one member per line.
+        """
+        job_id = await asyncio.to_thread(self.create_job, len(beam_list))
+        await self._append(
+            job_id,
+            "start",
+            json.dumps(
+                {
+                    "job_id": job_id,
+                    "total": len(beam_list),
+                    "frames": frames,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+            ),
+        )
+        task = asyncio.get_running_loop().create_task(
+            self._run(job_id, beam_list, frames)
+        )
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._on_task_done(job_id))
+        return job_id
+
+    async def events(
+        self, job_id: str, after: int = -1
+    ) -> AsyncGenerator[dict[str, str], None]:
+        """Yield the job's events after sequence ``after``, then follow it."""
+        wakeup = asyncio.Event()
+        self._wakeups.setdefault(job_id, set()).add(wakeup)
+        try:
+            while True:
+                wakeup.clear()
+                entries = await asyncio.to_thread(
+                    self.store.events_after, job_id, after
+                )
+                for seq, event, data in entries:
+                    yield {"id": f"{job_id}:{seq}", "event": event, "data": data}
+                    after = seq
+                    if event in _TERMINAL_EVENTS:
+                        return
+                if entries:
+                    continue
+                if job_id not in self._tasks and not await asyncio.to_thread(
+                    self.store.running_elsewhere, job_id
+                ):
+                    job = await asyncio.to_thread(self.get_job, job_id)
+                    message = (
+                        "Job not found or expired"
+                        if job is None
+                        else "Job is no longer running"
+                    )
+                    yield {
+                        "event": "error",
+                        "data": json.dumps({"job_id": job_id, "message": message}),
+                    }
+                    return
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeups.get(job_id, set()).discard(wakeup)
+
+    async def _run(
+        self, job_id: str, beam_list: list[Any], frames: BatchFrames
+    ) -> None:
+        settings = get_settings()
+        executor = get_compute_executor()
+        # Members are designed concurrently in a bounded window and emitted
+        # in input order. Progress, and batched result frames, are flushed
+        # after the first member, every N members or T ms, and at the end.
+        window: asyncio.Queue[asyncio.Future[Any]] = asyncio.Queue(
+            maxsize=2 * executor.max_workers
+        )
+
+        async def produce(members: list[Callable[[], Any]]) -> None:
+            for member in members:
+                await window.put(asyncio.ensure_future(_design_member(member)))
+
+        producer: asyncio.Task[None] | None = None
+        try:
+            members = await _when_admitted(
+                lambda: executor.run_local(
+                    "stream_batch_design",
+                    batch.prepare_project_beam_members_v1,
+                    beam_list,
+                    units="IS456",
+                )
+            )
+            producer = asyncio.ensure_future(produce(members))
+            pending_results: list[dict[str, Any]] = []
+            since_flush = 0
+            last_flush = -math.inf
+            for index in range(len(members)):
+                result_data = _member_result(await (await window.get()))
+                get_request_metrics().record_batch_members("stream_batch_design")
+                await asyncio.to_thread(
+                    self.update_progress,
+                    job_id,
+                    design_succeeded=result_data["design_succeeded"],
+                    result=result_data,
                 )
-                if (now - completed).total_seconds() > max_age_seconds:
-                    to_remove.append(job_id)
-        for job_id in to_remove:
-            del self.jobs[job_id]
+                if frames == "batched":
+                    pending_results.append(result_data)
+                else:
+                    await self._append(job_id, "design_result", json.dumps(result_data))
+                since_flush += 1
+                now = time.monotonic()
+                if not (
+                    index == len(members) - 1
+                    or since_flush >= settings.stream_progress_every
+                    or (now - last_flush) * 1000 >= settings.stream_progress_interval_ms
+                ):
+                    continue
+                if pending_results:
+                    await self._append(
+                        job_id,
+                        "design_results",
+                        "\n".join(json.dumps(result) for result in pending_results),
+                    )
+                    pending_results.clear()
+                job = await asyncio.to_thread(self.get_job, job_id)
+                if job is not None:
+                    percent = round(job["completed"] / job["total"] * 100, 1)
+                    await self._append(
+                        job_id,
+                        "progress",
+                        json.dumps({**_job_counts(job), "percent": percent}),
+                    )
+                since_flush = 0
+                last_flush = now
+            await producer
+        except Exception:
+            logger.exception("Batch job %s failed", job_id)
+            await asyncio.to_thread(self.store.finish, job_id, "failed")
+            await self._append(
+                job_id,
+                "error",
+                json.dumps({"job_id": job_id, "message": "Batch job failed"}),
+            )
+            return
+        finally:
+            if producer is not None:
+                producer.cancel()
+            while not window.empty():
+                window.get_nowait().cancel()
+
+        job = await asyncio.to_thread(self.get_job, job_id)
+        if job is not None:
+            await self._append(
+                job_id,
+                "complete",
+                json.dumps(
+                    {
+                        "job_id": job_id,
+                        **_job_counts(job),
+                        "duration_seconds": _job_duration_seconds(job),
+                    }
+                ),
+            )
+
+    async def _append(self, job_id: str, event: str, data: str) -> None:
+        await asyncio.to_thread(self.store.append_event, job_id, event, data)
+        self._wake(job_id)
+
+    def _wake(self, job_id: str) -> None:
+        for wakeup in self._wakeups.get(job_id, ()):
+            wakeup.set()
+
+    def _on_task_done(self, job_id: str) -> None:
+        self._tasks.pop(job_id, None)
+        self._wake(job_id)
+        if not self._wakeups.get(job_id, True):
+            del self._wakeups[job_id]
 
 
 # Global job manager
@@ -174,11 +450,20 @@ job_manager = BatchJobManager()
 # =============================================================================
 
 
-def _stream_batch_response(
+async def _stream_batch_response(
     request: Request,
     beam_list: list[Any],
+    frames: BatchFrames = "member",
 ) -> EventSourceResponse:
-    """Build one SSE response after the transport has decoded the beam list."""
+    """Build one SSE response after the transport has decoded the beam list.
+
+    A ``Last-Event-ID`` naming a known job resumes that job's events instead
+    of starting a new job, so ``EventSource`` reconnects never recompute.
+    """
+    resume_job_id, resume_seq = _parse_event_id(request.headers.get("last-event-id"))
+    if resume_job_id is not None:
+        return EventSourceResponse(job_manager.events(resume_job_id, resume_seq))
+
     if not isinstance(beam_list, list) or len(beam_list) == 0:
 
         async def error_generator():
@@ -204,99 +489,8 @@ def _stream_batch_response(
 
         return EventSourceResponse(error_response())
 
-    async def event_generator() -> AsyncGenerator[dict, None]:
-        """Generate SSE events for batch design."""
-        job_id = job_manager.create_job(len(beam_list))
-
-        # Send start event
-        yield {
-            "event": "start",
-            "data": json.dumps(
-                {
-                    "job_id": job_id,
-                    "total": len(beam_list),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            ),
-        }
-
-        for member in batch.design_project_beams_iter_v1(beam_list, units="IS456"):
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info(f"Client disconnected during batch job {job_id}")
-                break
-
-            result_data = member.to_dict()
-            result_data["beam_id"] = member.member_id
-            result_data["design_succeeded"] = (
-                member.calculation_status.value == "COMPLETED"
-            )
-            result_data["is_safe"] = member.overall_status.value == "PASS"
-            result_data["status"] = member.overall_status.value
-            if member.calculation is not None:
-                result_data.update(member.calculation)
-            job_manager.update_progress(
-                job_id,
-                design_succeeded=result_data["design_succeeded"],
-                result=result_data,
-            )
-            yield {"event": "design_result", "data": json.dumps(result_data)}
-
-            # Send progress update
-            job = job_manager.get_job(job_id)
-            if job is not None:
-                engineering_status = _job_engineering_status(job)
-                yield {
-                    "event": "progress",
-                    "data": json.dumps(
-                        {
-                            "completed": job["completed"],
-                            "total": job["total"],
-                            "passed": job["passed"],
-                            "failed": job["failed"],
-                            "held": job["held"],
-                            "blocked": job["blocked"],
-                            **engineering_status,
-                            "percent": round(job["completed"] / job["total"] * 100, 1),
-                        }
-                    ),
-                }
-
-            await asyncio.sleep(0)
-
-        # Send complete event
-        job = job_manager.get_job(job_id)
-        if job is not None:
-            engineering_status = _job_engineering_status(job)
-            yield {
-                "event": "complete",
-                "data": json.dumps(
-                    {
-                        "job_id": job_id,
-                        "total": job["total"],
-                        "completed": job["completed"],
-                        "passed": job["passed"],
-                        "failed": job["failed"],
-                        "held": job["held"],
-                        "blocked": job["blocked"],
-                        **engineering_status,
-                        "duration_seconds": (
-                            (
-                                datetime.fromisoformat(
-                                    job["completed_at"].replace("Z", "+00:00")
-                                )
-                                - datetime.fromisoformat(
-                                    job["started_at"].replace("Z", "+00:00")
-                                )
-                            ).total_seconds()
-                            if job.get("completed_at")
-                            else None
-                        ),
-                    }
-                ),
-            }
-
-    return EventSourceResponse(event_generator())
+    job_id = await job_manager.start(beam_list, frames=frames)
+    return EventSourceResponse(job_manager.events(job_id))
 
 
 @router.get(
@@ -309,6 +503,13 @@ def _stream_batch_response(
 async def stream_batch_design(
     request: Request,
     beams: str = Query(..., description="JSON array of beam parameters"),
+    frames: BatchFrames = Query(
+        "member",
+        description=(
+            "member sends one design_result event per beam; batched sends "
+            "design_results events with NDJSON data, one beam per line"
+        ),
+    ),
     _: None = Depends(check_rate_limit),
 ) -> EventSourceResponse:
     """Deprecated query transport delegating to the canonical project command."""
@@ -329,7 +530,7 @@ async def stream_batch_design(
         )
         return response
 
-    response = _stream_batch_response(request, beam_list)
+    response = await _stream_batch_response(request, beam_list, frames)
     response.headers["Deprecation"] = "true"
     response.headers["Warning"] = (
         '299 - "Deprecated GET transport; use POST /stream/batch-design"'
@@ -341,10 +542,187 @@ async def stream_batch_design(
 async def stream_batch_design_post(
     request: Request,
     beams: list[dict[str, Any]],
+    frames: BatchFrames = Query(
+        "member",
+        description=(
+            "member sends one design_result event per beam; batched sends "
+            "design_results events with NDJSON data, one beam per line"
+        ),
+    ),
     _: None = Depends(check_rate_limit),
 ) -> EventSourceResponse:
     """Canonical project-beam stream using a POST request body."""
-    return _stream_batch_response(request, beams)
+    return await _stream_batch_response(request, beams, frames)
+
+
+class _BulkRequestTooLarge(ValueError):
+    """Raised when an NDJSON request exceeds a line or member limit."""
+
+
+async def _ndjson_payloads(request: Request, max_line_bytes: int) -> AsyncIterator[Any]:
+    """Yield one decoded value per non-blank line as the body arrives.
+
+    Lines that are not valid JSON yield None, which validation reports as a
+    blocked member, so member indexes always match request lines.
+    """
+    buffer = bytearray()
+
+    def decode(line: bytes) -> Any:
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    async for chunk in request.stream():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = bytes(buffer[start:end]).strip()
+            start = end + 1
+            if len(line) > max_line_bytes:
+                raise _BulkRequestTooLarge(
+                    f"Request line exceeds {max_line_bytes} bytes"
+                )
+            if line:
+                yield decode(line)
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            raise _BulkRequestTooLarge(f"Request line exceeds {max_line_bytes} bytes")
+    line = bytes(buffer).strip()
+    if line:
+        yield decode(line)
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body iterator reads the request body itself.
+
+    ``StreamingResponse`` listens for client disconnects by calling
+    ``receive()`` alongside the body iterator on servers older than ASGI 2.4,
+    which would swallow the request body chunks the iterator is waiting for.
+    Here a disconnect surfaces through ``request.stream()`` instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+
+
+def _ndjson_line(record: Mapping[str, Any]) -> bytes:
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+async def _bulk_design_lines(request: Request) -> AsyncIterator[bytes]:
+    """Design NDJSON request members in input order with bounded memory.
+
+    At most ``2 * max_workers`` members are held in flight; the request body
+    is read only as fast as results are written back.
+    """
+    settings = get_settings()
+    executor = get_compute_executor()
+    in_flight: deque[asyncio.Future[Any]] = deque()
+    seen_member_ids: set[str] = set()
+    counts: Counter[str] = Counter()
+    started = time.monotonic()
+
+    def result_line(member: Any) -> bytes:
+        result_data = _member_result(member)
+        counts[result_data["status"]] += 1
+        get_request_metrics().record_batch_members("stream_bulk_design")
+        return _ndjson_line({"type": "design_result", **result_data})
+
+    def totals() -> dict[str, int]:
+        completed = counts.total()
+        return {
+            "completed": completed,
+            "passed": counts["PASS"],
+            "failed": counts["FAIL"],
+            "held": completed - counts["PASS"] - counts["FAIL"],
+            "blocked": counts["BLOCKED"],
+        }
+
+    rejected: str | None = None
+    try:
+        try:
+            index = 0
+            async for payload in _ndjson_payloads(
+                request, settings.bulk_design_max_line_bytes
+            ):
+                if index >= settings.bulk_design_max_members:
+                    raise _BulkRequestTooLarge(
+                        f"Request exceeds {settings.bulk_design_max_members} members"
+                    )
+                member = batch.prepare_project_beam_member_v1(
+                    payload, index, seen_member_ids=seen_member_ids, units="IS456"
+                )
+                in_flight.append(asyncio.ensure_future(_design_member(member)))
+                index += 1
+                while in_flight and (
+                    len(in_flight) >= 2 * executor.max_workers or in_flight[0].done()
+                ):
+                    yield result_line(await in_flight.popleft())
+        except _BulkRequestTooLarge as exc:
+            # Members already accepted are still reported before the error.
+            rejected = str(exc)
+        while in_flight:
+            yield result_line(await in_flight.popleft())
+    except ClientDisconnect:
+        return
+    except Exception:
+        logger.exception("Bulk design stream failed")
+        rejected = "Bulk design failed"
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+    if rejected is not None:
+        yield _ndjson_line({"type": "error", "message": rejected, **totals()})
+        return
+    yield _ndjson_line(
+        {
+            "type": "complete",
+            **totals(),
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+    )
+
+
+@router.post(
+    "/bulk-design",
+    response_class=StreamingResponse,
+    summary="Bulk project-beam design over NDJSON",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {
+                        "type": "string",
+                        "description": "One project-beam object per line",
+                    }
+                }
+            },
+        },
+        "responses": {"200": {"content": {"application/x-ndjson": {}}}},
+    },
+)
+async def stream_bulk_design(
+    request: Request,
+    _: None = Depends(check_rate_limit),
+) -> StreamingResponse:
+    """
+    Design project beams sent as NDJSON and stream NDJSON results back.
+
+    Members are validated and designed as their lines arrive, so batches
+    beyond ``max_batch_size`` need no client-side splitting. Each output line
+    is a ``design_result`` in input order; the last line is ``complete`` or
+    ``error``. A repeated member ID blocks only the later occurrence, since
+    the first result may already have been sent.
+    """
+    return _DuplexStreamingResponse(
+        _bulk_design_lines(request), media_type="application/x-ndjson"
+    )
 
 
 @router.get("/job/{job_id}", response_model=BatchJobStatusResponse)
@@ -357,7 +735,7 @@ async def get_job_status(
 
     Returns job progress, results count, and any errors.
     """
-    job = job_manager.get_job(job_id)
+    job = await asyncio.to_thread(job_manager.get_job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -381,6 +759,28 @@ async def get_job_status(
         },
         "started_at": job["started_at"],
         "completed_at": job["completed_at"],
-        "error_count": len(job["errors"]),
+        "error_count": job["error_count"],
         **engineering_status,
     }
+
+
+@router.get("/job/{job_id}/events", response_class=EventSourceResponse)
+async def stream_job_events(
+    job_id: str = Path(..., pattern=r"^[a-f0-9]{8}$", description="Batch job ID"),
+    last_event_id: str | None = Header(
+        None,
+        alias="Last-Event-ID",
+        description="Resume after this event (`<job_id>:<seq>` or `<seq>`)",
+    ),
+    _: None = Depends(check_rate_limit),
+) -> EventSourceResponse:
+    """
+    Replay and follow the events of a batch job.
+
+    Stored events after ``Last-Event-ID`` are sent first, then new events as
+    the job produces them. Finished jobs replay until they expire.
+    """
+    if await asyncio.to_thread(job_manager.get_job, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    _, after = _parse_event_id(last_event_id)
+    return EventSourceResponse(job_manager.events(job_id, after))
@@ -7,11 +7,12 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 import structural_lib.services.wall_api as wall_api
+from fastapi_app.compute import ComputeRoute
 from fastapi_app.error_utils import sanitize_error, sanitize_error_string
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.wall import BracedWallRequest, BracedWallResponse
 
-router = APIRouter(prefix="/design/wall", tags=["wall"])
+router = APIRouter(prefix="/design/wall", tags=["wall"], route_class=ComputeRoute)
 
 
 def _direction_payload(
@@ -79,7 +80,7 @@ def _result_payload(result: wall_api.BracedWallDesignResult) -> dict[str, object
     response_model=APIResponse[BracedWallResponse],
     summary="Check a bounded Clause 32 braced wall",
 )
-async def design_braced_wall(request: BracedWallRequest):
+def design_braced_wall(request: BracedWallRequest):
     """Validate transport inputs and delegate all calculation to the service."""
     try:
         result = wall_api.design_braced_wall_is456(
@@ -4,6 +4,11 @@ WebSocket Router for Live Design Updates.
 This module provides WebSocket endpoints for real-time beam design:
 - /ws/design/{session_id} - Live interactive design
 - Supports bi-directional communication for instant feedback
+- design_beam is latest-wins: while one calculation runs, newer parameters
+  replace any waiting ones and results already superseded are dropped, so a
+  dragged slider never builds a backlog
+- Each session runs one calculation at a time, so a single client holds at
+  most one compute worker
 
 Week 3 Priority 2 Implementation (V3 Migration)
 
@@ -27,6 +32,8 @@ from pydantic import BaseModel, Field, ValidationError
 # See: scripts/discover_api_signatures.py design_beam_is456
 from structural_lib import api
 from fastapi_app.auth import verify_ws_token
+from fastapi_app.compute import ComputeSaturatedError, get_compute_executor
+from fastapi_app.config import get_settings
 from fastapi_app.error_utils import sanitize_error
 
 logger = logging.getLogger(__name__)
@@ -100,12 +107,15 @@ async def design_websocket(
     WebSocket endpoint for live beam design.
 
     Message Types (Client → Server):
-        - design_beam: Design a single beam
+        - design_beam: Design a single beam; latest wins (see
+          :class:`LiveDesignSession`). Optional ``seq`` is echoed back and
+          ``delta: true`` asks for a design_delta
         - check_beam: Check beam compliance
-        - ping: Heartbeat
+        - ping: Heartbeat, answered even while a calculation runs
 
     Message Types (Server → Client):
         - design_result: Design calculation result
+        - design_delta: Changes since the previous result, as a merge patch
         - check_result: Compliance check result
         - pong: Heartbeat response
         - error: Error message
@@ -131,6 +141,9 @@ async def design_websocket(
         return
 
     await manager.connect(session_id, websocket)
+    session = LiveDesignSession(
+        session_id, debounce_seconds=get_settings().ws_design_debounce_ms / 1000
+    )
 
     try:
         while True:
@@ -138,12 +151,15 @@ async def design_websocket(
             data = await websocket.receive_json()
             message_type = data.get("type", "unknown")
 
-            try:
-                if message_type == "design_beam":
-                    await handle_design_beam(session_id, data.get("params", {}))
+            if message_type == "design_beam":
+                # Queued, not awaited: later messages may supersede it
+                session.submit(data)
+                continue
 
-                elif message_type == "check_beam":
-                    await handle_check_beam(session_id, data.get("params", {}))
+            try:
+                if message_type == "check_beam":
+                    async with session.compute_lock:
+                        await handle_check_beam(session_id, data.get("params", {}))
 
                 elif message_type == "ping":
                     await manager.send_json(
@@ -163,23 +179,159 @@ async def design_websocket(
                         },
                     )
 
-            except (ValueError, TypeError) as e:
-                await manager.send_json(
-                    session_id,
-                    {"type": "error", "message": sanitize_error(e, "live design")},
-                )
-            except (RuntimeError, KeyError, AttributeError):
-                logger.exception("WebSocket handler error for session %s", session_id)
-                await manager.send_json(
-                    session_id,
-                    {"type": "error", "message": "Internal error processing request"},
-                )
+            except (ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
+                await manager.send_json(session_id, _handler_error(session_id, e))
 
     except WebSocketDisconnect:
         manager.disconnect(session_id)
     except (RuntimeError, ConnectionError, OSError):
         logger.exception(f"WebSocket error for session {session_id}")
         manager.disconnect(session_id)
+    finally:
+        await session.close()
+
+
+def _handler_error(session_id: str, exc: Exception) -> dict[str, Any]:
+    """Error message for an exception raised while handling a message."""
+    if isinstance(exc, (ValueError, TypeError)):
+        return {"type": "error", "message": sanitize_error(exc, "live design")}
+    logger.error("WebSocket handler error for session %s", session_id, exc_info=exc)
+    return {"type": "error", "message": "Internal error processing request"}
+
+
+# =============================================================================
+# Latest-Wins Design Scheduling
+# =============================================================================
+
+
+class LiveDesignSession:
+    """
+    Latest-wins scheduler for one session's design_beam messages.
+
+    A single task computes one message at a time. A message submitted while
+    another is waiting replaces it; one submitted while a calculation runs
+    marks that calculation stale, and its result is dropped when it finishes.
+    A thread cannot be interrupted mid-calculation, so a stale one still
+    occupies its worker until it ends, but nothing queues behind it.
+
+    Sent results carry ``superseded``, the number of design_beam messages
+    dropped in favour of this one, and echo the message's ``seq`` if given.
+    A message with ``"delta": true`` is answered with a ``design_delta``
+    whose ``data`` is a JSON merge patch (RFC 7386) against the previous
+    result sent on this session; the first result, and any a patch cannot
+    express (see :func:`merge_patch`), is sent complete.
+
+    Args:
+        session_id: Connection to send results to
+        debounce_seconds: Wait before starting a calculation, so a burst of
+            messages is coalesced into its last one
+    """
+
+    def __init__(self, session_id: str, *, debounce_seconds: float = 0.0) -> None:
+        self.session_id = session_id
+        self.debounce_seconds = debounce_seconds
+        # Held by every calculation of this session, design or check
+        self.compute_lock = asyncio.Lock()
+        self._pending: dict[str, Any] | None = None
+        self._superseded = 0
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._last_data: dict[str, Any] | None = None
+
+    def submit(self, message: dict[str, Any]) -> None:
+        """Queue ``message``, replacing any design_beam not yet started."""
+        if self._pending is not None:
+            self._superseded += 1
+        self._pending = message
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop scheduling; a running calculation is abandoned."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            if self.debounce_seconds > 0:
+                await asyncio.sleep(self.debounce_seconds)
+            self._wake.clear()
+            message, self._pending = self._pending, None
+            if message is None:
+                continue
+            try:
+                async with self.compute_lock:
+                    reply = await build_design_result(message.get("params", {}))
+            except Exception as e:
+                # Anything else would end the task and silence the session
+                reply = _handler_error(self.session_id, e)
+            if self._pending is not None:
+                # A newer message arrived while this one computed
+                self._superseded += 1
+                continue
+            try:
+                await manager.send_json(self.session_id, self._finish(message, reply))
+            except (WebSocketDisconnect, RuntimeError, ConnectionError, OSError):
+                return
+
+    def _finish(self, message: dict[str, Any], reply: dict[str, Any]) -> dict[str, Any]:
+        """Add scheduling fields and, if asked for, reduce to a delta."""
+        if reply["type"] == "design_result":
+            reply["superseded"], self._superseded = self._superseded, 0
+            data = reply["data"]
+            if message.get("delta") and self._last_data is not None:
+                try:
+                    reply["data"] = merge_patch(self._last_data, data)
+                    reply["type"] = "design_delta"
+                except ValueError:
+                    pass  # Not expressible as a patch; send the full result
+            self._last_data = data
+        if "seq" in message:
+            reply["seq"] = message["seq"]
+        return reply
+
+
+def merge_patch(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """
+    JSON merge patch (RFC 7386) that turns ``previous`` into ``current``.
+
+    Nested objects are diffed key by key; any other changed value, lists
+    included, is sent whole. Removed keys are sent as null.
+
+    A merge patch reads null as "remove", so it cannot set a member to null.
+    If ``current`` would need that, ``ValueError`` is raised and the caller
+    should send ``current`` whole.
+    """
+    patch: dict[str, Any] = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = merge_patch(old, value)
+            if nested:
+                patch[key] = nested
+        elif key not in previous or old != value:
+            if _holds_null(value):
+                raise ValueError(f"{key!r} is null, which a merge patch cannot set")
+            patch[key] = value
+    for key in previous.keys() - current.keys():
+        patch[key] = None
+    return patch
+
+
+def _holds_null(value: Any) -> bool:
+    """Whether applying ``value`` as a patch would drop a null member."""
+    if value is None:
+        return True
+    if isinstance(value, dict):
+        return any(_holds_null(item) for item in value.values())
+    return False
 
 
 # =============================================================================
@@ -229,9 +381,22 @@ class WSCheckParams(BaseModel):
 # =============================================================================
 
 
-async def handle_design_beam(session_id: str, params: dict[str, Any]) -> None:
+def _busy_message(exc: ComputeSaturatedError) -> dict[str, Any]:
+    """Error message for a calculation rejected by a saturated executor."""
+    return {
+        "type": "error",
+        "message": "Server busy; retry shortly",
+        "retry_after": exc.retry_after_seconds,
+    }
+
+
+async def build_design_result(params: dict[str, Any]) -> dict[str, Any]:
     """
-    Handle design_beam message.
+    Compute the reply to a design_beam message.
+
+    Returns a ``design_result`` message, or an ``error`` message for invalid
+    input or a saturated executor. Sending is left to the caller, which may
+    drop the reply if newer parameters have arrived.
 
     Uses structural_lib.api.design_beam_is456 with correct signature:
     - units: "IS456"
@@ -247,11 +412,7 @@ async def handle_design_beam(session_id: str, params: dict[str, Any]) -> None:
     try:
         validated = WSDesignParams(**params)
     except ValidationError as e:
-        await manager.send_json(
-            session_id,
-            {"type": "error", "message": sanitize_error(e, "live design input")},
-        )
-        return
+        return {"type": "error", "message": sanitize_error(e, "live design input")}
 
     # Use the same declared section inputs as the REST beam route.
     d_dash_mm = (
@@ -259,19 +420,23 @@ async def handle_design_beam(session_id: str, params: dict[str, Any]) -> None:
     )
     d_mm = validated.depth - d_dash_mm
 
-    # Run design calculation in thread pool (non-blocking)
-    result = await asyncio.to_thread(
-        api.design_beam_is456,
-        units="IS456",
-        b_mm=float(validated.width),
-        D_mm=float(validated.depth),
-        d_mm=float(d_mm),
-        mu_knm=float(validated.moment),
-        vu_kn=float(validated.shear),
-        fck_nmm2=float(validated.fck),
-        fy_nmm2=float(validated.fy),
-        d_dash_mm=float(d_dash_mm),
-    )
+    # Run on the shared compute executor; a full pool is reported, not queued
+    try:
+        result = await get_compute_executor().run(
+            "ws_design_beam",
+            api.design_beam_is456,
+            units="IS456",
+            b_mm=float(validated.width),
+            D_mm=float(validated.depth),
+            d_mm=float(d_mm),
+            mu_knm=float(validated.moment),
+            vu_kn=float(validated.shear),
+            fck_nmm2=float(validated.fck),
+            fy_nmm2=float(validated.fy),
+            d_dash_mm=float(d_dash_mm),
+        )
+    except ComputeSaturatedError as exc:
+        return _busy_message(exc)
 
     # Calculate response time
     end_time = datetime.now(timezone.utc)
@@ -311,58 +476,55 @@ async def handle_design_beam(session_id: str, params: dict[str, Any]) -> None:
 
     # Keep the WebSocket payload aligned with the REST BeamDesignResponse.
     # The frontend can then switch transports without silently losing fields.
-    await manager.send_json(
-        session_id,
-        {
-            "type": "design_result",
-            "latency_ms": round(latency_ms, 2),
-            "data": {
-                "success": result.is_ok,
-                "message": (
-                    f"Design complete: Ast = {flexure.Ast_required:.0f} mm²"
-                    if result.is_ok
-                    else f"Design failed: {result.remarks}"
-                ),
-                "flexure": {
-                    "ast_required": flexure.Ast_required,
-                    "ast_min": flexure.Ast_min,
-                    "ast_max": flexure.Ast_max,
-                    "xu": flexure.xu,
-                    "xu_max": flexure.xu_max,
-                    "is_under_reinforced": flexure.xu <= flexure.xu_max,
-                    "moment_capacity": flexure.Mu_lim,
-                    "asc_required": flexure.Asc_required,
-                },
-                "shear": (
-                    {
-                        "tau_v": shear.tau_v,
-                        "tau_c": shear.tau_c,
-                        "tau_c_max": shear.tau_c_max,
-                        "asv_required": (
-                            shear.Vus / (0.87 * validated.fy) * 1000
-                            if shear.Vus > 0
-                            else 0.0
-                        ),
-                        "stirrup_spacing": shear.spacing,
-                        "sv_max": 300.0,
-                        "shear_capacity": (
-                            shear.tau_c * validated.width * d_mm / 1000 + shear.Vus
-                            if shear.Vus > 0
-                            else validated.shear
-                        ),
-                    }
-                    if shear
-                    else None
-                ),
-                "ast_total": flexure.Ast_required,
-                "asc_total": flexure.Asc_required,
-                "utilization_ratio": min(result.governing_utilization, 2.0),
-                "effective_depth_used": d_mm,
-                "warnings": warnings,
-                "evidence": evidence,
+    return {
+        "type": "design_result",
+        "latency_ms": round(latency_ms, 2),
+        "data": {
+            "success": result.is_ok,
+            "message": (
+                f"Design complete: Ast = {flexure.Ast_required:.0f} mm²"
+                if result.is_ok
+                else f"Design failed: {result.remarks}"
+            ),
+            "flexure": {
+                "ast_required": flexure.Ast_required,
+                "ast_min": flexure.Ast_min,
+                "ast_max": flexure.Ast_max,
+                "xu": flexure.xu,
+                "xu_max": flexure.xu_max,
+                "is_under_reinforced": flexure.xu <= flexure.xu_max,
+                "moment_capacity": flexure.Mu_lim,
+                "asc_required": flexure.Asc_required,
             },
+            "shear": (
+                {
+                    "tau_v": shear.tau_v,
+                    "tau_c": shear.tau_c,
+                    "tau_c_max": shear.tau_c_max,
+                    "asv_required": (
+                        shear.Vus / (0.87 * validated.fy) * 1000
+                        if shear.Vus > 0
+                        else 0.0
+                    ),
+                    "stirrup_spacing": shear.spacing,
+                    "sv_max": 300.0,
+                    "shear_capacity": (
+                        shear.tau_c * validated.width * d_mm / 1000 + shear.Vus
+                        if shear.Vus > 0
+                        else validated.shear
+                    ),
+                }
+                if shear
+                else None
+            ),
+            "ast_total": flexure.Ast_required,
+            "asc_total": flexure.Asc_required,
+            "utilization_ratio": min(result.governing_utilization, 2.0),
+            "effective_depth_used": d_mm,
+            "warnings": warnings,
+            "evidence": evidence,
         },
-    )
+    }
 
 
 async def handle_check_beam(session_id: str, params: dict[str, Any]) -> None:
@@ -392,17 +554,22 @@ async def handle_check_beam(session_id: str, params: dict[str, Any]) -> None:
 
     d_mm = validated.depth - validated.cover - 8
 
-    # Run check in thread pool
-    result = await asyncio.to_thread(
-        api.check_beam_is456,
-        units="IS456",
-        cases=validated.cases,
-        b_mm=float(validated.width),
-        D_mm=float(validated.depth),
-        d_mm=float(d_mm),
-        fck_nmm2=float(validated.fck),
-        fy_nmm2=float(validated.fy),
-    )
+    # Run on the shared compute executor; a full pool is reported, not queued
+    try:
+        result = await get_compute_executor().run(
+            "ws_check_beam",
+            api.check_beam_is456,
+            units="IS456",
+            cases=validated.cases,
+            b_mm=float(validated.width),
+            D_mm=float(validated.depth),
+            d_mm=float(d_mm),
+            fck_nmm2=float(validated.fck),
+            fy_nmm2=float(validated.fy),
+        )
+    except ComputeSaturatedError as exc:
+        await manager.send_json(session_id, _busy_message(exc))
+        return
 
     end_time = datetime.now(timezone.utc)
     latency_ms = (end_time - start_time).total_seconds() * 1000
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from starlette.concurrency import run_in_threadpool
 
+from fastapi_app.compute import LocalComputeRoute
 from fastapi_app.config import get_settings
 from fastapi_app.models.response import APIResponse, error_response, success_response
 from fastapi_app.models.workflows import (
@@ -16,9 +18,41 @@ from fastapi_app.models.workflows import (
     WorkflowValidateRequest,
     WorkflowValidationResponse,
 )
+from fastapi_app.state import StateBackend, get_state_backend
 from structural_lib.services.workflow_runner import WorkflowRunner
 
-router = APIRouter(prefix="/workflows", tags=["workflows"])
+# Shared replay entries outlive the in-memory LRU; runs older than this may
+# execute again under the same run ID.
+_REPLAY_TTL_SECONDS = 24 * 3600
+
+router = APIRouter(
+    prefix="/workflows", tags=["workflows"], route_class=LocalComputeRoute
+)
+
+
+class _StateReplayStore:
+    """Workflow replay entries kept in the shared state backend."""
+
+    namespace = "workflow_replay"
+
+    def __init__(self, backend: StateBackend) -> None:
+        self.backend = backend
+
+    def get(self, run_id: str) -> tuple[str, dict[str, Any]] | None:
+        entry = self.backend.get(self.namespace, run_id)
+        return None if entry is None else (entry[0], entry[1])
+
+    def put(
+        self, run_id: str, fingerprint: str, result: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]] | None:
+        def first_wins(entry: list[Any] | None) -> tuple[list[Any], Any]:
+            if entry is None:
+                return [fingerprint, result], None
+            return entry, (entry[0], entry[1])
+
+        return self.backend.update(
+            self.namespace, run_id, first_wins, ttl_seconds=_REPLAY_TTL_SECONDS
+        )
 
 
 def _runner_disabled() -> JSONResponse:
@@ -38,7 +72,7 @@ def _runner_disabled() -> JSONResponse:
     response_model=APIResponse[WorkflowDefinitionModel],
     summary="Discover the approved beam workflow template",
 )
-async def get_beam_workflow_template():
+def get_beam_workflow_template():
     from structural_lib.services.workflow_runner import (
         get_beam_workflow_template_document,
     )
@@ -51,7 +85,7 @@ async def get_beam_workflow_template():
     response_model=APIResponse[WorkflowValidationResponse],
     summary="Validate the bounded beam workflow",
 )
-async def validate_beam_workflow(request: WorkflowValidateRequest):
+def validate_beam_workflow(request: WorkflowValidateRequest):
     if not get_settings().workflow_runner_enabled:
         return _runner_disabled()
 
@@ -94,7 +128,7 @@ async def validate_beam_workflow(request: WorkflowValidateRequest):
     response_model=APIResponse[WorkflowRunResponse],
     summary="Run the bounded beam workflow",
 )
-async def run_beam_workflow(request: WorkflowRunRequest):
+def run_beam_workflow(request: WorkflowRunRequest):
     if not get_settings().workflow_runner_enabled:
         return _runner_disabled()
 
@@ -107,8 +141,7 @@ async def run_beam_workflow(request: WorkflowRunRequest):
 
     runner: WorkflowRunner = _RUNNER
     try:
-        result = await run_in_threadpool(
-            runner.run,
+        result = runner.run(
             definition=request.definition.model_dump(),
             inputs=request.inputs,
             run_id=request.run_id,
@@ -145,6 +178,7 @@ async def run_beam_workflow(request: WorkflowRunRequest):
     summary="Cancel a bounded workflow run",
 )
 async def cancel_beam_workflow(run_id: str):
+    # Stays on the event loop so cancellation is never queued behind runs.
     if not get_settings().workflow_runner_enabled:
         return _runner_disabled()
 
@@ -167,4 +201,12 @@ async def cancel_beam_workflow(run_id: str):
     )
 
 
-_RUNNER = WorkflowRunner()
+# One worker keeps the runner's bounded in-memory replay cache; shared state
+# lets every worker replay runs started by any other.
+_RUNNER = WorkflowRunner(
+    replay_store=(
+        None
+        if get_settings().state_backend == "memory"
+        else _StateReplayStore(get_state_backend())
+    )
+)
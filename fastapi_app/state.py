@@ -0,0 +1,270 @@
+"""
+Shared state backends for API state that must agree across workers.
+
+Rate-limit buckets, SSE batch jobs and workflow idempotent replay live in
+process memory by default. With ``uvicorn --workers N`` each worker would
+then enforce its own limits and see only its own jobs and runs. A
+``StateBackend`` holds that state instead:
+
+- ``InProcessStateBackend`` (``STATE_BACKEND=memory``, the default) keeps it
+  in a dict. It is right for one worker.
+- ``SQLiteStateBackend`` (``STATE_BACKEND=sqlite``) keeps it in one SQLite
+  file in WAL mode at ``STATE_PATH``. Every worker on the host opens the same
+  file, so they share limits, jobs and replay.
+
+Values are JSON-compatible. ``update()`` is the one atomic primitive: it
+reads a value, lets the caller compute the next one and writes it, with no
+other worker in between.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+from fastapi_app.config import get_settings
+
+T = TypeVar("T")
+
+_SWEEP_EVERY_WRITES = 1024
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS state_entries_expiry ON state_entries (expires_at);
+"""
+
+
+class StateBackend(ABC):
+    """Namespaced key-value state with optional expiry and atomic updates.
+
+    Updaters passed to :meth:`update` receive the current value, or None when
+    the key is missing or expired. They must not mutate it and return
+    ``(new_value, result)``; a ``new_value`` of None deletes the key.
+    """
+
+    def __init__(self) -> None:
+        self._writes = 0
+        self._swept_at = time.monotonic()
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Any | None:
+        """Return the stored value, or None when missing or expired."""
+
+    @abstractmethod
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        updater: Callable[[Any | None], tuple[Any | None, T]],
+        *,
+        ttl_seconds: float | None = None,
+    ) -> T:
+        """Atomically replace a value and return the updater's result."""
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """Delete expired entries and return how many were removed."""
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        *,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Store ``value``, replacing any previous one."""
+        self.update(namespace, key, lambda _: (value, None), ttl_seconds=ttl_seconds)
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove ``key`` if present."""
+        self.update(namespace, key, lambda _: (None, None))
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+    def _count_write(self) -> None:
+        # Idle keys expire without a reader, so writers sweep every so many
+        # writes or seconds, whichever comes first.
+        self._writes += 1
+        now = time.monotonic()
+        if (
+            self._writes % _SWEEP_EVERY_WRITES == 0
+            or now - self._swept_at >= _SWEEP_INTERVAL_SECONDS
+        ):
+            self._swept_at = now
+            self.sweep()
+
+
+class InProcessStateBackend(StateBackend):
+    """State in a dict guarded by a lock; visible to one process only."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], tuple[Any, float | None]] = {}
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            return self._live((namespace, key), time.time())
+
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        updater: Callable[[Any | None], tuple[Any | None, T]],
+        *,
+        ttl_seconds: float | None = None,
+    ) -> T:
+        now = time.time()
+        with self._lock:
+            entry = (namespace, key)
+            value, result = updater(self._live(entry, now))
+            if value is None:
+                self._entries.pop(entry, None)
+            else:
+                expires_at = None if ttl_seconds is None else now + ttl_seconds
+                self._entries[entry] = (value, expires_at)
+        self._count_write()
+        return result
+
+    def sweep(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [
+                entry
+                for entry, (_, expires_at) in self._entries.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            for entry in expired:
+                del self._entries[entry]
+        return len(expired)
+
+    def _live(self, entry: tuple[str, str], now: float) -> Any | None:
+        stored = self._entries.get(entry)
+        if stored is None:
+            return None
+        value, expires_at = stored
+        if expires_at is not None and expires_at <= now:
+            del self._entries[entry]
+            return None
+        return value
+
+
+class SQLiteStateBackend(StateBackend):
+    """State in a SQLite WAL file shared by every process that opens it.
+
+    Args:
+        path: Database file; workers that should share state use the same path
+        timeout_seconds: How long a writer waits for another process's lock
+    """
+
+    def __init__(self, path: str | Path, *, timeout_seconds: float = 5.0) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state_entries WHERE namespace = ? AND key = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        updater: Callable[[Any | None], tuple[Any | None, T]],
+        *,
+        ttl_seconds: float | None = None,
+    ) -> T:
+        now = time.time()
+        with self._lock, self._conn:
+            # IMMEDIATE takes the write lock before reading, so no other
+            # process can change the value between the read and the write.
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT value FROM state_entries WHERE namespace = ? AND key = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, now),
+            ).fetchone()
+            value, result = updater(None if row is None else json.loads(row[0]))
+            if value is None:
+                self._conn.execute(
+                    "DELETE FROM state_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO state_entries"
+                    " (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (
+                        namespace,
+                        key,
+                        json.dumps(value, separators=(",", ":")),
+                        None if ttl_seconds is None else now + ttl_seconds,
+                    ),
+                )
+        self._count_write()
+        return result
+
+    def sweep(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM state_entries WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_state_backend() -> StateBackend:
+    """Process-wide state backend selected by settings.
+
+    Raises:
+        ValueError: If ``STATE_BACKEND=sqlite`` is set without ``STATE_PATH``
+    """
+
+    settings = get_settings()
+    if settings.state_backend == "sqlite":
+        if not settings.state_path:
+            raise ValueError("STATE_PATH is required when STATE_BACKEND=sqlite")
+        return SQLiteStateBackend(settings.state_path)
+    return InProcessStateBackend()
+
+
+__all__ = [
+    "InProcessStateBackend",
+    "SQLiteStateBackend",
+    "StateBackend",
+    "get_state_backend",
+]
@@ -8,6 +8,8 @@ import os
 
 # Disable global rate limiter during tests to avoid interference with load tests
 os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# Repeated identical requests must reach the handler; cache tests opt back in
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
 
 import pytest
 from fastapi.testclient import TestClient
@@ -205,6 +205,54 @@ class TestRateLimiter:
         assert not allowed1
         assert allowed2
 
+    def test_bucket_refills_and_idle_clients_expire(self, monkeypatch):
+        """Tokens refill evenly; a bucket idle for a window is dropped."""
+        now = [1_000.0]
+        monkeypatch.setattr("fastapi_app.auth.time.time", lambda: now[0])
+        monkeypatch.setattr("fastapi_app.state.time.time", lambda: now[0])
+        limiter = RateLimiter(requests_per_window=2, window_seconds=60)
+        request = MagicMock()
+        request.headers.get.return_value = None
+        request.client.host = "127.0.0.1"
+
+        limiter.is_allowed(request)
+        limiter.is_allowed(request)
+        allowed, headers = limiter.is_allowed(request)
+        assert not allowed
+        assert headers["X-RateLimit-Reset"] == "1030"
+
+        now[0] += 30
+        assert limiter.is_allowed(request)[0]
+        assert not limiter.is_allowed(request)[0]
+
+        now[0] += 60
+        assert limiter.backend.sweep() == 1
+
+    def test_route_costs_spend_more_tokens(self):
+        """Expensive path prefixes spend their configured cost."""
+        limiter = RateLimiter(
+            requests_per_window=10,
+            window_seconds=60,
+            route_costs={"/api/v1/export": 4, "/api/v1/export/bbs": 20},
+        )
+        request = MagicMock()
+        request.headers.get.return_value = None
+        request.client.host = "127.0.0.1"
+
+        request.url.path = "/api/v1/export/report"
+        _, headers = limiter.is_allowed(request)
+        assert headers["X-RateLimit-Remaining"] == "6"
+
+        request.url.path = "/api/v1/export/bbs"
+        assert limiter.cost_for(request.url.path) == 10
+        allowed, headers = limiter.is_allowed(request)
+        assert not allowed
+        assert headers["X-RateLimit-Remaining"] == "6"
+
+        request.url.path = "/api/v1/design/beam"
+        _, headers = limiter.is_allowed(request)
+        assert headers["X-RateLimit-Remaining"] == "5"
+
 
 # =============================================================================
 # Integration Tests (require FastAPI test client)
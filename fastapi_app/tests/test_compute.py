@@ -0,0 +1,143 @@
+"""Tests for the shared compute executor and its 503 backpressure."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from fastapi_app import compute
+from fastapi_app.compute import (
+    ComputeExecutor,
+    ComputeRoute,
+    ComputeSaturatedError,
+)
+from fastapi_app.routers import health
+
+
+def _not_found() -> None:
+    raise HTTPException(status_code=404, detail="missing")
+
+
+def _hold(executor: ComputeExecutor, route: str) -> threading.Event:
+    """Occupy one executor slot until the returned event is set."""
+    release = threading.Event()
+    threading.Thread(
+        target=asyncio.run, args=(executor.run(route, release.wait),), daemon=True
+    ).start()
+    deadline = time.monotonic() + 5
+    while executor.stats()["pending"] == 0:
+        assert time.monotonic() < deadline, "held call never admitted"
+        time.sleep(0.01)
+    return release
+
+
+def test_full_pool_rejects_with_retry_hint():
+    executor = ComputeExecutor(max_workers=1, max_queue=0)
+    release = _hold(executor, "slow")
+    try:
+        with pytest.raises(ComputeSaturatedError) as exc_info:
+            asyncio.run(executor.run("fast", sum, [1, 2]))
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert exc_info.value.route == "fast"
+    assert exc_info.value.retry_after_seconds >= 1
+    stats = executor.stats()
+    assert stats["pending"] == 0
+    assert stats["routes"]["fast"]["rejected"] == 1
+    assert stats["routes"]["slow"]["completed"] == 1
+
+
+def test_route_limit_leaves_other_routes_admitted():
+    executor = ComputeExecutor(max_workers=2, max_queue=0, route_limits={"slow": 1})
+    release = _hold(executor, "slow")
+    try:
+        with pytest.raises(ComputeSaturatedError, match="route concurrency limit"):
+            asyncio.run(executor.run("slow", sum, [1]))
+        assert asyncio.run(executor.run("fast", sum, [1, 2])) == 3
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_errors_propagate_and_count_as_failed():
+    executor = ComputeExecutor(max_workers=1)
+    try:
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(executor.run("divide", divmod, 1, 0))
+        assert asyncio.run(executor.run("divide", divmod, 7, 2)) == (3, 1)
+    finally:
+        executor.shutdown()
+
+    route = executor.stats()["routes"]["divide"]
+    assert (route["submitted"], route["completed"], route["failed"]) == (2, 1, 1)
+    assert route["compute_ms_mean"] >= 0
+
+
+def test_process_pool_returns_results_and_http_errors():
+    executor = ComputeExecutor(kind="process", max_workers=1)
+    try:
+        assert asyncio.run(executor.run("sum", sum, [1, 2, 3])) == 6
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(executor.run("missing", _not_found))
+        local_thread = asyncio.run(
+            executor.run_local("local", lambda: threading.current_thread().name)
+        )
+    finally:
+        executor.shutdown()
+
+    assert exc_info.value.status_code == 404
+    assert local_thread.startswith("compute")
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError, match="kind"):
+        ComputeExecutor(kind="fiber")
+    with pytest.raises(ValueError, match="route_limits"):
+        ComputeExecutor(route_limits={"a": 0})
+
+
+def test_compute_route_runs_sync_handlers_on_the_pool(monkeypatch):
+    executor = ComputeExecutor(max_workers=1)
+    monkeypatch.setattr(compute, "get_compute_executor", lambda: executor)
+    router = APIRouter(route_class=ComputeRoute)
+
+    @router.get("/thread")
+    def thread_name(label: str) -> dict[str, str]:
+        return {"label": label, "thread": threading.current_thread().name}
+
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as client:
+        body = client.get("/thread", params={"label": "x"}).json()
+    executor.shutdown()
+
+    assert body["label"] == "x"
+    assert body["thread"].startswith("compute")
+    assert executor.stats()["routes"]["thread_name"]["completed"] == 1
+
+
+def test_saturated_route_returns_503_and_health_reports_it(
+    client, monkeypatch, sample_beam_design_request
+):
+    executor = ComputeExecutor(max_workers=1, max_queue=0)
+    monkeypatch.setattr(compute, "get_compute_executor", lambda: executor)
+    monkeypatch.setattr(health, "get_compute_executor", lambda: executor)
+    release = _hold(executor, "hold")
+    try:
+        response = client.post("/api/v1/design/beam", json=sample_beam_design_request)
+        metrics = client.get("/health/compute")
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.json()["error"]["code"] == "COMPUTE_SATURATED"
+    assert metrics.status_code == 200
+    assert metrics.json()["routes"]["hold"]["pending"] == 1
+    assert metrics.json()["routes"]["design_beam"]["rejected"] == 1
@@ -269,6 +269,140 @@ class TestBuildingGeometry:
         assert resp.status_code == 422
         assert "excludes every input member" in resp.text
 
+    @pytest.mark.parametrize(
+        ("params", "headers"),
+        [
+            ({"format": "packed"}, {}),
+            ({}, {"Accept": "application/octet-stream"}),
+        ],
+    )
+    def test_packed_format_is_smaller_binary_buffers(self, client, params, headers):
+        pytest.importorskip("numpy")
+        from structural_lib.visualization.packed_geometry import (
+            unpack_building_geometry,
+        )
+
+        section = {
+            "width_mm": 300,
+            "depth_mm": 500,
+            "fck_mpa": 25,
+            "fy_mpa": 500,
+            "cover_mm": 40,
+        }
+        beams = [
+            {
+                "id": f"B{story}-{i}-{j}",
+                "label": f"B{story}-{i}-{j}",
+                "story": f"L{story}",
+                "frame_type": "beam",
+                "point1": {"x": 6 * i, "y": 6 * j, "z": 3 * story},
+                "point2": {"x": 6 * i + 6, "y": 6 * j, "z": 3 * story},
+                "section": section,
+            }
+            for story in range(1, 4)
+            for i in range(10)
+            for j in range(10)
+        ]
+        url = "/api/v1/geometry/building"
+
+        json_resp = client.post(url, json={"beams": beams})
+        packed_resp = client.post(
+            url, json={"beams": beams}, params=params, headers=headers
+        )
+
+        assert packed_resp.status_code == 200
+        assert packed_resp.headers["content-type"] == "application/octet-stream"
+        assert len(packed_resp.content) * 3 < len(json_resp.content)
+        geometry = unpack_building_geometry(packed_resp.content)
+        data = unwrap(json_resp)
+        assert geometry.member_ids == tuple(beam["beam_id"] for beam in data["beams"])
+        assert geometry.bounding_box == data["bounding_box"]
+        assert geometry.metadata == data["metadata"]
+        assert geometry.vertex_count == 330
+
+    def test_spatial_index_answers_region_queries(self, client):
+        section = {
+            "width_mm": 300,
+            "depth_mm": 500,
+            "fck_mpa": 25,
+            "fy_mpa": 500,
+            "cover_mm": 40,
+        }
+        beams = [
+            {
+                "id": f"C{i}",
+                "label": f"C{i}",
+                "story": "GF",
+                "frame_type": "column",
+                "point1": {"x": 6 * i, "y": 0, "z": 0},
+                "point2": {"x": 6 * i, "y": 0, "z": 3},
+                "section": section,
+            }
+            for i in range(3)
+        ] + [
+            {
+                "id": f"B{i}",
+                "label": f"B{i}",
+                "story": "L1",
+                "frame_type": "beam",
+                "point1": {"x": 6 * i, "y": 0, "z": 3},
+                "point2": {"x": 6 * i + 6, "y": 0, "z": 3},
+                "section": section,
+            }
+            for i in range(2)
+        ]
+        url = "/api/v1/geometry/building/index"
+
+        first = client.post(url, json={"beams": beams})
+        again = client.post(url, json={"beams": beams})
+
+        assert first.status_code == 200
+        index = unwrap(first)
+        assert index["member_count"] == 5
+        assert index["cached"] is False
+        assert unwrap(again)["cached"] is True
+        assert index["bounding_box"]["max_x"] == 12000.0
+        base = f"{url}/{index['index_hash']}"
+
+        box = client.post(
+            f"{base}/query",
+            json={
+                "box": {
+                    "min_x": 5000,
+                    "max_x": 7000,
+                    "min_y": -1,
+                    "max_y": 1,
+                    "min_z": 0,
+                    "max_z": 1000,
+                }
+            },
+        )
+        assert [b["beam_id"] for b in unwrap(box)["beams"]] == ["C1"]
+
+        near = unwrap(
+            client.post(
+                f"{base}/query", json={"near": {"x": 3000, "y": 500, "z": 3000}, "k": 2}
+            )
+        )
+        assert [b["beam_id"] for b in near["beams"]] == ["B0", "C0"]
+        assert near["distances_mm"][0] == 500.0
+
+        # Only x >= 7000 is inside
+        frustum = unwrap(
+            client.post(f"{base}/query", json={"frustum": [[1, 0, 0, -7000]]})
+        )
+        assert [b["beam_id"] for b in frustum["beams"]] == ["C2", "B1"]
+
+        adjacency = unwrap(client.get(f"{base}/adjacency"))
+        assert adjacency["pair_count"] == 5
+        assert ["C1", "B0"] in adjacency["pairs"]
+        assert ["B0", "B1"] in adjacency["pairs"]
+
+        invalid = client.post(f"{base}/query", json={"box": None})
+        assert invalid.status_code == 422
+        missing = client.get(f"{url}/{'0' * 64}/adjacency")
+        assert missing.status_code == 404
+
 
 # =============================================================================
 # Cross-Section Geometry
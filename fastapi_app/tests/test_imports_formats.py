@@ -4,6 +4,8 @@ Tests for import router extended endpoints.
 Covers:
 - GET /api/v1/import/formats
 - POST /api/v1/import/csv/text
+- GET /api/v1/import/cache/stats
+- GET /api/v1/import/ledgers/{ledger_hash}/rows
 """
 
 import pytest
@@ -95,3 +97,121 @@ class TestCSVTextImport:
         )
         # Empty CSV should fail gracefully
         assert resp.status_code in (200, 422)
+
+
+# =============================================================================
+# Import Cache
+# =============================================================================
+
+
+class TestImportCacheStats:
+    """Tests for GET /api/v1/import/cache/stats."""
+
+    CSV = (
+        "BeamID,Story,b (mm),D (mm),Span (mm),Mu (kN-m),Vu (kN),fck,fy,Cover (mm)\n"
+        "B1,GF,300,500,5000,150,80,25,500,40\n"
+    )
+
+    def _upload(self, client, cover_mm: str):
+        return client.post(
+            "/api/v1/import/csv?format_hint=generic",
+            files={"file": ("cache.csv", self.CSV.encode("utf-8"), "text/csv")},
+            data={
+                "fck_mpa": "25",
+                "fy_mpa": "500",
+                "cover_mm": cover_mm,
+                "stirrup_diameter_mm": "8",
+                "tension_bar_diameter_mm": "16",
+            },
+        )
+
+    def test_reupload_hits_cache(self, client):
+        """Re-uploading identical bytes with new defaults is a cache hit."""
+        before = unwrap(client.get("/api/v1/import/cache/stats"))
+
+        first = self._upload(client, "40")
+        second = self._upload(client, "30")
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        after = unwrap(client.get("/api/v1/import/cache/stats"))
+        assert after["hits"] >= before["hits"] + 1
+        assert 0 <= after["hit_ratio"] <= 1
+        assert after["entries"] <= after["max_entries"]
+        assert (
+            unwrap(first)["normalization_ledger"]
+            == unwrap(second)["normalization_ledger"]
+        )
+
+
+# =============================================================================
+# Paginated Import Ledger
+# =============================================================================
+
+
+class TestPaginatedImportLedger:
+    """Tests for ledger_rows=paginated and GET /api/v1/import/ledgers/.../rows."""
+
+    CSV = (
+        "BeamID,Story,b (mm),D (mm),Span (mm),Mu (kN-m),Vu (kN),fck,fy,Cover (mm)\n"
+        "B1,GF,300,500,5000,150,80,25,500,40\n"
+        "B2,GF,300,450,4500,120,60,25,500,40\n"
+        "B3,GF,300,450,4500,110,55,25,500,40\n"
+    )
+    FORM = {
+        "fck_mpa": "25",
+        "fy_mpa": "500",
+        "cover_mm": "40",
+        "stirrup_diameter_mm": "8",
+        "tension_bar_diameter_mm": "16",
+    }
+
+    def _upload(self, client, csv_text: str, ledger_rows: str):
+        return client.post(
+            f"/api/v1/import/csv?format_hint=generic&ledger_rows={ledger_rows}",
+            files={"file": ("paged.csv", csv_text.encode("utf-8"), "text/csv")},
+            data=self.FORM,
+        )
+
+    def test_paginated_ledger_omits_rows_and_pages_them(self, client):
+        """Paginated imports return the summary; rows come back page by page."""
+        inline = unwrap(self._upload(client, self.CSV, "inline"))
+        paged = unwrap(self._upload(client, self.CSV, "paginated"))
+
+        ledger = paged["normalization_ledger"]
+        ledger_hash = ledger["ledger_hash"]
+        assert "rows" not in ledger
+        assert ledger["totals"] == inline["normalization_ledger"]["totals"]
+        assert (
+            paged["beams"][0]["source_metadata"]["normalization_ledger_hash"]
+            == ledger_hash
+        )
+
+        first = unwrap(client.get(f"/api/v1/import/ledgers/{ledger_hash}/rows?limit=2"))
+        second = unwrap(
+            client.get(f"/api/v1/import/ledgers/{ledger_hash}/rows?offset=2&limit=2")
+        )
+        assert first["total"] == 3
+        assert first["rows"] + second["rows"] == inline["normalization_ledger"]["rows"]
+
+    def test_blocked_rows_filter(self, client):
+        """A blocked paginated import serves only the rows with issues."""
+        bad = self.CSV.replace("120", "abc")
+        resp = self._upload(client, bad, "paginated")
+        assert resp.status_code == 422
+        ledger = resp.json()["error"]["details"]["normalization_ledger"]
+        assert "rows" not in ledger
+
+        page = unwrap(
+            client.get(
+                f"/api/v1/import/ledgers/{ledger['ledger_hash']}/rows?status=BLOCKED"
+            )
+        )
+        assert page["total"] == 1
+        assert page["rows"][0]["source_record_id"] == "B2_GF"
+        assert page["rows"][0]["issue_codes"] == ["import.malformed_number"]
+
+    def test_unknown_ledger_is_404(self, client):
+        """Ledgers that were never stored are not found."""
+        resp = client.get(f"/api/v1/import/ledgers/{'0' * 64}/rows")
+        assert resp.status_code == 404
@@ -0,0 +1,72 @@
+"""Tests for the SQLite batch job store."""
+
+import os
+import time
+
+import pytest
+
+from fastapi_app.job_store import BatchJobStore
+
+
+def test_counters_complete_job_and_events_append_in_order():
+    store = BatchJobStore()
+    store.create("job1", total=2)
+
+    assert store.append_event("job1", "start", "{}") == 0
+    assert store.append_event("job1", "design_result", '{"n": 1}') == 1
+    store.increment("job1", completed=1, passed=1)
+    job = store.increment("job1", completed=1, failed=1)
+
+    assert job["status"] == "complete"
+    assert (job["passed"], job["failed"], job["event_count"]) == (1, 1, 2)
+    assert store.events_after("job1", 0) == [(1, "design_result", '{"n": 1}')]
+    with pytest.raises(KeyError):
+        store.append_event("missing", "start", "{}")
+    with pytest.raises(ValueError, match="Unknown job counters"):
+        store.increment("job1", bogus=1)
+
+
+def test_sweep_evicts_expired_and_least_recently_used_finished_jobs():
+    store = BatchJobStore(max_jobs=2)
+    for job_id in ("a", "b"):
+        store.create(job_id, total=1)
+        store.increment(job_id, completed=1)
+    store.create("running", total=5)
+    time.sleep(0.01)
+
+    assert store.get("a") is None
+    assert store.get("b") is not None
+    assert store.sweep(max_age_seconds=0) == 1
+    assert store.get("b") is None
+    assert store.get("running")["status"] == "running"
+    assert store.events_after("a", -1) == []
+
+
+def test_reopened_file_marks_running_jobs_interrupted(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = BatchJobStore(path)
+    store.create("job1", total=3)
+    store.append_event("job1", "start", "{}")
+    store.close()
+
+    reopened = BatchJobStore(path)
+
+    assert reopened.get("job1")["status"] == "interrupted"
+    assert reopened.events_after("job1", -1) == [(0, "start", "{}")]
+
+
+def test_jobs_of_other_live_workers_stay_running(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = BatchJobStore(path)
+    store.create("mine", total=1)
+    store.create("peer", total=1)
+    store._conn.execute(
+        "UPDATE batch_jobs SET owner_pid = ? WHERE job_id = 'peer'", (os.getppid(),)
+    )
+
+    worker = BatchJobStore(path)
+
+    assert worker.get("mine")["status"] == "interrupted"
+    assert worker.get("peer")["status"] == "running"
+    assert worker.running_elsewhere("peer")
+    assert not worker.running_elsewhere("mine")
@@ -0,0 +1,76 @@
+"""Tests for the Prometheus /metrics endpoint."""
+
+import pytest
+
+from fastapi_app import metrics
+from fastapi_app.config import get_settings
+from fastapi_app.metrics import MetricFamily, RequestMetrics, render_exposition
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = RequestMetrics()
+    monkeypatch.setattr(metrics, "get_request_metrics", lambda: registry)
+    monkeypatch.setattr(
+        "fastapi_app.routers.metrics.get_request_metrics", lambda: registry
+    )
+    return registry
+
+
+def test_metrics_expose_route_latency_compute_and_stage_timers(
+    client, registry, sample_beam_design_request
+):
+    client.post("/api/v1/design/beam", json=sample_beam_design_request)
+    client.get("/no-such-route")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE structural_http_request_duration_seconds histogram" in lines
+    assert (
+        'structural_http_request_duration_seconds_count{route="design_beam",'
+        'method="POST"} 1'
+    ) in lines
+    assert (
+        'structural_http_requests_total{route="unmatched",method="GET",status="4xx"} 1'
+    ) in lines
+    assert any(line.startswith("structural_compute_pending ") for line in lines)
+    assert any(
+        line.startswith('structural_lib_stage_calls_total{stage="beam.evidence"}')
+        for line in lines
+    )
+    assert any(line.startswith("structural_import_cache_hit_ratio ") for line in lines)
+
+
+def test_metrics_route_is_404_when_disabled(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "metrics_enabled", False)
+
+    assert client.get("/metrics").status_code == 404
+
+
+def test_histogram_buckets_are_cumulative_and_labels_escaped():
+    registry = RequestMetrics(buckets=(0.1, 1.0))
+    registry.observe("r", "GET", 200, 0.05)
+    registry.observe("r", "GET", 503, 0.5)
+    registry.observe("r", "GET", 200, 3.0)
+    registry.record_batch_members("bulk", 5)
+
+    text = render_exposition(
+        [
+            *registry.families(),
+            MetricFamily("empty", "gauge", "No samples.", []),
+            MetricFamily("quoted", "gauge", "Escapes.", [("quoted", {"v": 'a"b'}, 1)]),
+        ]
+    )
+
+    bucket = 'structural_http_request_duration_seconds_bucket{route="r",method="GET"'
+    assert f'{bucket},le="0.1"}} 1' in text
+    assert f'{bucket},le="1.0"}} 2' in text
+    assert f'{bucket},le="+Inf"}} 3' in text
+    assert (
+        'structural_http_requests_total{route="r",method="GET",status="5xx"} 1' in text
+    )
+    assert 'structural_batch_members_total{endpoint="bulk"} 5' in text
+    assert "empty" not in text
+    assert 'quoted{v="a\\"b"} 1' in text
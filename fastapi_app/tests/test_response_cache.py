@@ -0,0 +1,116 @@
+"""Tests for the ETag response cache on deterministic design routes."""
+
+import json
+
+import pytest
+
+from fastapi_app import response_cache
+from fastapi_app.response_cache import ResponseCache
+from fastapi_app.routers import health
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(["design_beam"])
+    monkeypatch.setattr(response_cache, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(health, "get_response_cache", lambda: cache)
+    return cache
+
+
+def test_repeated_design_is_served_from_cache_with_etag(
+    client, cache, sample_beam_design_request
+):
+    first = client.post("/api/v1/design/beam", json=sample_beam_design_request)
+    reordered = json.dumps(dict(reversed(sample_beam_design_request.items())))
+    second = client.post(
+        "/api/v1/design/beam",
+        content=reordered.encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    revalidated = client.post(
+        "/api/v1/design/beam",
+        json=sample_beam_design_request,
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    metrics = client.get("/health/response-cache").json()
+
+    assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+    # Only the evidence timestamp is re-stamped on a hit
+    first_body, second_body = first.json(), second.json()
+    first_stamp = first_body["data"]["evidence"].pop("generated_at")
+    second_stamp = second_body["data"]["evidence"].pop("generated_at")
+    assert second_stamp >= first_stamp
+    assert second_body == first_body
+    assert first.headers["ETag"].startswith('W/"')
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-type"] == "application/json"
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert metrics["entries"] == 1
+    assert metrics["routes"]["design_beam"] == {
+        "hits": 2,
+        "misses": 1,
+        "not_modified": 1,
+        "stores": 1,
+        "oversized": 0,
+        "hit_ratio": 0.6667,
+    }
+
+
+def test_errors_and_uncached_routes_bypass_the_cache(
+    client, cache, sample_beam_check_request
+):
+    invalid = client.post("/api/v1/design/beam", json={"width": -1})
+    check = client.post("/api/v1/design/beam/check", json=sample_beam_check_request)
+
+    assert invalid.status_code == 422
+    assert "ETag" not in invalid.headers
+    assert "X-Cache" not in check.headers
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = ResponseCache(["r"], max_bytes=150, max_entry_bytes=70)
+    for key in ("a", "b", "c"):
+        assert cache.get("r", key) is None
+        cache.put("r", key, 200, b"x" * 40, [("content-type", "application/json")])
+    cache.put("r", "huge", 200, b"x" * 71, [])
+
+    assert cache.get("r", "a") is None
+    assert cache.get("r", "c").body == b"x" * 40
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+    assert stats["routes"]["r"]["oversized"] == 1
+    assert cache.key("r", "POST", "/p", "b=2&a=1", b'{"y": 1, "x": 2}') == (
+        cache.key("r", "POST", "/p", "a=1&b=2", b'{"x":2,"y":1}')
+    )
+
+
+def test_time_varying_fields_are_restamped_and_left_out_of_the_etag():
+    stamped = b'{"a":[{"generated_at":"2026-01-01T00:00:00+00:00","x":"\xc3\xa9"}]}'
+    restamped = response_cache._restamp(stamped, "2026-02-02T00:00:00+00:00")
+
+    assert json.loads(restamped) == {
+        "a": [{"generated_at": "2026-02-02T00:00:00+00:00", "x": "\u00e9"}]
+    }
+    assert response_cache._etag(restamped) == response_cache._etag(stamped)
+    assert response_cache._etag(stamped).startswith('W/"')
+    assert response_cache._etag(b'{"x":1}').startswith('"')
+    assert response_cache._restamp(b"not json", "now") == b"not json"
+
+
+@pytest.mark.parametrize(
+    ("header", "etag"),
+    [
+        ('"abc"', '"abc"'),
+        ('W/"abc"', '"abc"'),
+        ('"abc"', 'W/"abc"'),
+        ('"other", W/"abc"', 'W/"abc"'),
+        ("*", '"abc"'),
+    ],
+)
+def test_if_none_match_uses_weak_comparison(header, etag):
+    assert response_cache.etag_matches(header, etag)
+    assert not response_cache.etag_matches('"abcd", W/"ab"', etag)
+    assert not response_cache.etag_matches(None, etag)
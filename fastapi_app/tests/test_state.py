@@ -0,0 +1,118 @@
+"""Tests for the shared state backends."""
+
+import multiprocessing
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastapi_app.auth import RateLimiter
+from fastapi_app.routers.workflows import _StateReplayStore
+from fastapi_app.state import InProcessStateBackend, SQLiteStateBackend
+from structural_lib.services.workflow_runner import (
+    WorkflowIdempotencyError,
+    WorkflowRunner,
+    get_beam_workflow_template_document,
+)
+
+
+def _increment(value):
+    return (value or 0) + 1, value
+
+
+def _hammer(path: str, count: int) -> None:
+    backend = SQLiteStateBackend(path)
+    for _ in range(count):
+        backend.update("counters", "hits", _increment)
+    backend.close()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield InProcessStateBackend()
+        return
+    backend = SQLiteStateBackend(tmp_path / "state.sqlite3")
+    yield backend
+    backend.close()
+
+
+def test_update_set_delete_and_expiry(backend):
+    assert backend.update("ns", "k", _increment) is None
+    assert backend.update("ns", "k", _increment) == 1
+    assert backend.get("ns", "k") == 2
+    assert backend.get("other", "k") is None
+
+    backend.set("ns", "doc", {"a": [1, 2]})
+    backend.delete("ns", "k")
+    assert backend.get("ns", "doc") == {"a": [1, 2]}
+    assert backend.get("ns", "k") is None
+
+    backend.set("ns", "brief", 1, ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert backend.get("ns", "brief") is None
+    assert backend.update("ns", "brief", _increment) is None
+    assert backend.sweep() == 0
+
+
+def test_sqlite_updates_are_atomic_across_processes(tmp_path):
+    path = str(tmp_path / "state.sqlite3")
+    SQLiteStateBackend(path).close()
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_hammer, args=(path, 50)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    _hammer(path, 50)
+    for worker in workers:
+        worker.join(timeout=60)
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert SQLiteStateBackend(path).get("counters", "hits") == 200
+
+
+def test_rate_limiters_on_one_backend_share_a_limit(tmp_path):
+    path = tmp_path / "state.sqlite3"
+    workers = [
+        RateLimiter(requests_per_window=3, backend=SQLiteStateBackend(path))
+        for _ in range(2)
+    ]
+    request = MagicMock()
+    request.headers = {}
+    request.client.host = "10.0.0.1"
+
+    outcomes = [workers[i % 2].is_allowed(request) for i in range(4)]
+
+    assert [allowed for allowed, _ in outcomes] == [True, True, True, False]
+    assert outcomes[2][1]["X-RateLimit-Remaining"] == "0"
+    assert "X-RateLimit-Reset" in outcomes[3][1]
+    assert RateLimiter(requests_per_window=3).is_allowed(request)[0]
+
+
+def test_workflow_replay_spans_runners_sharing_a_store(tmp_path):
+    path = tmp_path / "state.sqlite3"
+    first, second = (
+        WorkflowRunner(replay_store=_StateReplayStore(SQLiteStateBackend(path)))
+        for _ in range(2)
+    )
+    definition = get_beam_workflow_template_document()
+    inputs = {
+        "width": 300.0,
+        "depth": 500.0,
+        "moment": 150.0,
+        "shear": 75.0,
+        "fck": 25.0,
+        "fy": 500.0,
+    }
+
+    original = first.run(definition=definition, inputs=inputs, run_id="shared")
+    replay = second.run(definition=definition, inputs=inputs, run_id="shared")
+
+    assert original["idempotent_replay"] is False
+    assert replay["idempotent_replay"] is True
+    assert replay["input_hash"] == original["input_hash"]
+    with pytest.raises(WorkflowIdempotencyError):
+        second.run(
+            definition=definition,
+            inputs={**inputs, "moment": 120.0},
+            run_id="shared",
+        )
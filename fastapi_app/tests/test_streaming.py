@@ -4,11 +4,15 @@ Tests for SSE Streaming Endpoint.
 Week 3 Priority 3: SSE for batch processing tests.
 """
 
+import asyncio
 import json
 
 from fastapi.testclient import TestClient
+from fastapi_app.compute import ComputeSaturatedError, get_compute_executor
+from fastapi_app.config import get_settings
+from fastapi_app.job_store import BatchJobStore
 from fastapi_app.main import app
-from fastapi_app.routers.streaming import job_manager
+from fastapi_app.routers.streaming import BatchJobManager, job_manager
 from structural_lib.services.batch import design_project_beams_v1
 
 
@@ -216,6 +220,26 @@ class TestSSEBatchDesign:
         assert progress_events[-1]["overall_status"] == "PASS"
 
 
+def test_saturated_executor_delays_member_preparation(monkeypatch):
+    """An accepted stream waits for capacity instead of failing the job."""
+    executor = get_compute_executor()
+    run_local = executor.run_local
+    refusals = []
+
+    async def saturated_once(route, fn, *args, **kwargs):
+        if not refusals:
+            refusals.append(route)
+            raise ComputeSaturatedError(route, 0, "test saturation")
+        return await run_local(route, fn, *args, **kwargs)
+
+    monkeypatch.setattr(executor, "run_local", saturated_once)
+    with TestClient(app) as client:
+        records = _run_batch(client, count=2)
+
+    assert refusals == ["stream_batch_design"]
+    assert records[-1]["event"] == "complete"
+
+
 class TestJobStatus:
     """Test job status endpoint."""
 
@@ -281,3 +305,192 @@ class TestJobStatus:
             assert status["status"] == "complete"
             assert status["is_safe"] is True
             assert status["overall_status"] == "PASS"
+
+
+def _sse_records(lines: list[str]) -> list[dict]:
+    """Group SSE lines into ``{"id", "event", "data"}`` records."""
+    records: list[dict] = []
+    current: dict = {}
+    for line in lines:
+        if not line.strip():
+            if current:
+                records.append(current)
+            current = {}
+            continue
+        field, _, value = line.partition(":")
+        if field in current:
+            current[field] += "\n" + value.strip()
+        else:
+            current[field] = value.strip()
+    if current:
+        records.append(current)
+    return records
+
+
+def _run_batch(client: TestClient, count: int = 3, **params: str) -> list[dict]:
+    beams = [_canonical_beam(f"B{index}") for index in range(count)]
+    with client.stream(
+        "POST", "/stream/batch-design", json=beams, params=params
+    ) as response:
+        return _sse_records(list(response.iter_lines()))
+
+
+class TestResumableJobs:
+    """Jobs outlive their connection and replay from Last-Event-ID."""
+
+    def test_replay_after_last_event_id_matches_original_stream(self):
+        with TestClient(app) as client:
+            original = _run_batch(client)
+            job_id = json.loads(original[0]["data"])["job_id"]
+            resume_from = original[2]["id"]
+
+            with client.stream(
+                "GET",
+                f"/stream/job/{job_id}/events",
+                headers={"Last-Event-ID": resume_from},
+            ) as response:
+                replayed = _sse_records(list(response.iter_lines()))
+
+        assert [record["id"] for record in original] == [
+            f"{job_id}:{seq}" for seq in range(len(original))
+        ]
+        assert replayed == original[3:]
+        assert replayed[-1]["event"] == "complete"
+
+    def test_batch_stream_reconnect_resumes_instead_of_recomputing(self):
+        with TestClient(app) as client:
+            original = _run_batch(client)
+            with client.stream(
+                "POST",
+                "/stream/batch-design",
+                json=[_canonical_beam("IGNORED")],
+                headers={"Last-Event-ID": original[-2]["id"]},
+            ) as response:
+                replayed = _sse_records(list(response.iter_lines()))
+
+        assert replayed == original[-1:]
+
+    def test_unknown_job_events_are_not_found(self):
+        client = TestClient(app)
+
+        assert client.get("/stream/job/abcd1234/events").status_code == 404
+
+    def test_idle_server_sweeps_expired_jobs_periodically(self):
+        manager = BatchJobManager(BatchJobStore(ttl_seconds=0.01))
+        job_id = manager.create_job(total_items=1)
+        manager.store.append_event(job_id, "start", "{}")
+        manager.update_progress(job_id, design_succeeded=True, result={})
+        running = manager.create_job(total_items=2)
+
+        async def idle() -> None:
+            sweeper = asyncio.create_task(manager.sweep_periodically(0.02))
+            await asyncio.sleep(0.2)
+            sweeper.cancel()
+
+        asyncio.run(idle())
+
+        assert manager.store.get(job_id) is None
+        assert manager.store.events_after(job_id, -1) == []
+        assert manager.store.get(running)["status"] == "running"
+
+
+class TestCoalescedStream:
+    """Members are designed concurrently but emitted in order."""
+
+    def test_member_frames_keep_input_order_and_coalesce_progress(self):
+        with TestClient(app) as client:
+            events = _run_batch(client, count=60)
+
+        results = [
+            json.loads(record["data"])["beam_id"]
+            for record in events
+            if record.get("event") == "design_result"
+        ]
+        progress = [
+            json.loads(record["data"])
+            for record in events
+            if record.get("event") == "progress"
+        ]
+        assert results == [f"B{index}" for index in range(60)]
+        assert 2 <= len(progress) < 60
+        assert progress[-1]["completed"] == 60
+
+    def test_batched_frames_carry_ndjson_members(self):
+        with TestClient(app) as client:
+            events = _run_batch(client, count=60, frames="batched")
+
+        frames = [
+            record["data"]
+            for record in events
+            if record.get("event") == "design_results"
+        ]
+        members = [json.loads(line) for frame in frames for line in frame.splitlines()]
+        assert not any(record.get("event") == "design_result" for record in events)
+        assert 1 < len(frames) < 60
+        assert [member["beam_id"] for member in members] == [
+            f"B{index}" for index in range(60)
+        ]
+        assert json.loads(events[-1]["data"])["passed"] == 60
+
+
+def _bulk_design(client: TestClient, lines: list[bytes]) -> list[dict]:
+    response = client.post(
+        "/stream/bulk-design",
+        content=iter(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestBulkDesign:
+    """NDJSON bulk design is not bound by max_batch_size."""
+
+    def test_members_stream_back_in_order_beyond_batch_limit(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "max_batch_size", 2)
+        body = b"".join(
+            json.dumps(_canonical_beam(f"B{index}")).encode() + b"\n"
+            for index in range(30)
+        )
+        # Split mid-line to exercise incremental parsing
+        chunks = [body[i : i + 97] for i in range(0, len(body), 97)]
+        chunks += [b"{not json\n", json.dumps(_canonical_beam("B0")).encode()]
+
+        with TestClient(app) as client:
+            records = _bulk_design(client, chunks)
+
+        results = [r for r in records if r["type"] == "design_result"]
+        assert [r["beam_id"] for r in results[:30]] == [f"B{i}" for i in range(30)]
+        assert [r["index"] for r in results] == list(range(32))
+        assert results[30]["status"] == "BLOCKED"
+        assert results[31]["issues"][-1]["code"] == "PROJECT_BEAM_DUPLICATE_MEMBER_ID"
+        assert records[-1]["type"] == "complete"
+        assert (records[-1]["completed"], records[-1]["passed"]) == (32, 30)
+        assert records[-1]["blocked"] == 2
+
+    def test_limits_end_the_stream_with_an_error_line(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "bulk_design_max_members", 2)
+        lines = [
+            json.dumps(_canonical_beam(f"B{i}")).encode() + b"\n" for i in range(3)
+        ]
+
+        with TestClient(app) as client:
+            records = _bulk_design(client, lines)
+            monkeypatch.setattr(get_settings(), "bulk_design_max_line_bytes", 10)
+            oversized = _bulk_design(client, lines)
+
+        assert [r["type"] for r in records] == ["design_result"] * 2 + ["error"]
+        assert records[-1]["message"] == "Request exceeds 2 members"
+        assert records[-1]["completed"] == 2
+        assert oversized == [
+            {
+                "type": "error",
+                "message": "Request line exceeds 10 bytes",
+                "completed": 0,
+                "passed": 0,
+                "failed": 0,
+                "held": 0,
+                "blocked": 0,
+            }
+        ]
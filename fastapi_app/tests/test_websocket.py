@@ -4,8 +4,12 @@ Tests for WebSocket Live Design Endpoint.
 Week 3 Priority 2: WebSocket Live Design Tests
 """
 
+import pytest
 from fastapi.testclient import TestClient
+from fastapi_app.config import get_settings
 from fastapi_app.main import app
+from fastapi_app.routers import websocket as ws_router
+from fastapi_app.routers.websocket import merge_patch
 
 
 def _design_params(**overrides):
@@ -210,3 +214,92 @@ class TestWebSocketDesign:
 
             # Higher moment should require more steel
             assert ast2 > ast1
+
+
+class TestLatestWinsDesign:
+    """design_beam bursts are coalesced into their latest message."""
+
+    def test_burst_is_coalesced_into_latest_message(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "ws_design_debounce_ms", 300)
+        client = TestClient(app)
+        with client.websocket_connect("/ws/design/latest-wins") as websocket:
+            for seq, moment in enumerate((100, 120, 140, 160, 180), start=1):
+                websocket.send_json(
+                    {
+                        "type": "design_beam",
+                        "seq": seq,
+                        "params": _design_params(moment=moment),
+                    }
+                )
+            websocket.send_json({"type": "ping"})
+
+            # Heartbeats are not held up behind the pending design
+            assert websocket.receive_json()["type"] == "pong"
+            response = websocket.receive_json()
+
+        assert response["type"] == "design_result"
+        assert response["seq"] == 5
+        assert response["superseded"] == 4
+
+    def test_delta_sends_only_changed_fields(self):
+        client = TestClient(app)
+        with client.websocket_connect("/ws/design/delta") as websocket:
+            message = {"type": "design_beam", "delta": True}
+            websocket.send_json({**message, "params": _design_params(moment=100)})
+            first = websocket.receive_json()
+            websocket.send_json({**message, "params": _design_params(moment=200)})
+            second = websocket.receive_json()
+
+        assert first["type"] == "design_result"
+        assert second["type"] == "design_delta"
+        patch = second["data"]
+        assert (
+            patch["flexure"]["ast_required"] > first["data"]["flexure"]["ast_required"]
+        )
+        assert "success" not in patch
+        assert "effective_depth_used" not in patch
+        assert "ast_min" not in patch["flexure"]
+
+    def test_unexpected_error_is_reported_and_session_keeps_designing(
+        self, monkeypatch
+    ):
+        real = ws_router.build_design_result
+        calls = []
+
+        async def flaky(params):
+            calls.append(params)
+            if len(calls) == 1:
+                raise ZeroDivisionError("boom")
+            return await real(params)
+
+        monkeypatch.setattr(ws_router, "build_design_result", flaky)
+        client = TestClient(app)
+        with client.websocket_connect("/ws/design/flaky") as websocket:
+            websocket.send_json({"type": "design_beam", "params": _design_params()})
+            failed = websocket.receive_json()
+            websocket.send_json({"type": "design_beam", "params": _design_params()})
+            recovered = websocket.receive_json()
+
+        assert failed["type"] == "error"
+        assert recovered["type"] == "design_result"
+
+
+def test_merge_patch_diffs_nested_objects():
+    previous = {"a": 1, "b": {"x": 1, "y": 2}, "c": [1], "gone": True}
+    current = {"a": 1, "b": {"x": 1, "y": 3}, "c": [1, None], "new": 0}
+
+    assert merge_patch(previous, current) == {
+        "b": {"y": 3},
+        "c": [1, None],
+        "new": 0,
+        "gone": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "current", [{"a": None}, {"a": {"x": None}}, {"b": {"y": None}}]
+)
+def test_merge_patch_refuses_to_set_null(current):
+    # A null in a merge patch removes the member instead of setting it
+    with pytest.raises(ValueError):
+        merge_patch({"a": 1, "b": {"y": 2}}, current)